@@ -0,0 +1,84 @@
+"""Compare column-wise and row-by-row decoding of a synthetic TimeOffice roster.
+
+Run with ``uv run python benchmarks/row_decoding.py [--rows N]``.
+"""
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from scheduling.timeoffice.reading.roster import TimeOfficeRosterRow
+from scheduling.timeoffice.reading.types import decode_rows, validate_rows
+
+
+def synthetic_roster_rows(count: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    month_start = datetime(2024, 11, 1)
+    rows: list[dict[str, Any]] = []
+
+    for _ in range(count):
+        is_work = rng.random() < 0.8
+        absence_shift_id = None if is_work else rng.randint(100, 120)
+
+        rows.append(
+            {
+                "plan_id": rng.randint(1, 50),
+                "employee_id": rng.randint(1, 5_000),
+                "roster_date": month_start + timedelta(days=rng.randrange(30)),
+                "work_shift_id": rng.randint(1, 10) if is_work else None,
+                "work_shift_code": f" {rng.choice('FSNZ')} " if is_work else None,
+                "global_absence_shift_id": absence_shift_id,
+                "absence_shift_id": None,
+                "resolved_absence_shift_id": absence_shift_id,
+                "resolved_absence_code": None if is_work else "U",
+                "planning_unit_id": rng.randint(1, 40),
+            }
+        )
+
+    return rows
+
+
+def _best_of(repeats: int, run: Callable[[], object]) -> float:
+    timings: list[float] = []
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    raw_rows = synthetic_roster_rows(args.rows)
+
+    if decode_rows(TimeOfficeRosterRow, raw_rows) != validate_rows(TimeOfficeRosterRow, raw_rows):
+        raise SystemExit("Decoding paths disagree.")
+
+    validate_seconds = _best_of(args.repeats, lambda: validate_rows(TimeOfficeRosterRow, raw_rows))
+    decode_seconds = _best_of(args.repeats, lambda: decode_rows(TimeOfficeRosterRow, raw_rows))
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "roster_row_decoding",
+                "rows": args.rows,
+                "validate_rows_seconds": round(validate_seconds, 4),
+                "decode_rows_seconds": round(decode_seconds, 4),
+                "speedup": round(validate_seconds / decode_seconds, 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Time model build, solve, audit and legacy export on synthetic hospitals.
+
+Run with ``uv run python benchmarks/solver.py [--sizes 1x30,2x30 --output results.json]``.
+Sizes are ``<planning units>x<employees per unit>``. The results are one JSON
+document with the environment and one record per size and month.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable
+from importlib.metadata import version
+from typing import Any
+
+from pydantic import SecretStr
+
+from scheduling.domain import SchedulingDataset
+from scheduling.settings import Settings
+from scheduling.solver.cp_sat.builder import CpSatModelBuilder, create_cp_sat_model_builder
+from scheduling.solver.cp_sat.inspection import inspect_cp_sat_model
+from scheduling.solver.models import SolutionStatus
+from scheduling.solver.service import SolverService
+from scheduling.synthetic import SyntheticDatasetSpec, generate_datasets
+from scheduling.timeoffice.writing.solution import build_legacy_processed_solution_data
+
+
+def _timed[T](run: Callable[[], T]) -> tuple[T, float]:
+    started = time.perf_counter()
+    result = run()
+    return result, round(time.perf_counter() - started, 4)
+
+
+def benchmark_dataset(dataset: SchedulingDataset, *, settings: Settings) -> dict[str, Any]:
+    model_builder = create_cp_sat_model_builder(model_naming=settings.solver_model_naming)
+    solver_service = SolverService(settings=settings, model_builder=model_builder)
+
+    try:
+        return _benchmark_dataset(dataset, model_builder=model_builder, solver_service=solver_service)
+    finally:
+        solver_service.close()
+
+
+def _benchmark_dataset(
+    dataset: SchedulingDataset,
+    *,
+    model_builder: CpSatModelBuilder,
+    solver_service: SolverService,
+) -> dict[str, Any]:
+    build_result, build_seconds = _timed(lambda: model_builder.build(dataset))
+    solution, solve_seconds = _timed(lambda: solver_service.solve(dataset))
+    inspection = inspect_cp_sat_model(model=build_result.ctx.model)
+    record: dict[str, Any] = {
+        "planning_month": dataset.planning_month.label,
+        "employees": len(dataset.employees),
+        "assignment_variables": len(build_result.ctx.assignment_variables),
+        "variables": inspection.proto_variable_count,
+        "constraints": inspection.proto_constraint_count,
+        "build_seconds": build_seconds,
+        "solve_seconds": solve_seconds,
+        "status": solution.status.value,
+        "assignments": len(solution.assignments),
+        "audit_seconds": None,
+        "audit_findings": None,
+        "legacy_export_seconds": None,
+    }
+
+    if solution.status not in {SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE}:
+        return record
+
+    audit, record["audit_seconds"] = _timed(
+        lambda: solver_service._audit_solution(  # pyright: ignore[reportPrivateUsage]
+            build_result=build_result,
+            dataset=dataset,
+            assignments=solution.assignments,
+        )
+    )
+    record["audit_findings"] = len(audit.findings)
+    _, record["legacy_export_seconds"] = _timed(
+        lambda: build_legacy_processed_solution_data(
+            dataset=dataset,
+            solution=solution,
+            solution_name="benchmark",
+            solution_file_names=["benchmark"],
+        )
+    )
+
+    return record
+
+
+def _spec(size: str, args: argparse.Namespace) -> SyntheticDatasetSpec:
+    planning_units, _, employees_per_unit = size.partition("x")
+
+    return SyntheticDatasetSpec(
+        planning_units=int(planning_units),
+        employees_per_unit=int(employees_per_unit),
+        months=args.months,
+        wish_density=args.wish_density,
+        availability_density=args.availability_density,
+        demand_level=args.demand_level,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1x30,2x30,4x30")
+    parser.add_argument("--months", type=int, default=1)
+    parser.add_argument("--wish-density", type=float, default=0.05)
+    parser.add_argument("--availability-density", type=float, default=0.05)
+    parser.add_argument("--demand-level", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-time-seconds", type=float, default=10)
+    parser.add_argument("--search-workers", type=int, default=8)
+    parser.add_argument("--output", help="Write the results to this file instead of stdout.")
+    args = parser.parse_args()
+
+    settings = Settings(
+        db_server="unused",
+        db_name="unused",
+        db_user="unused",
+        db_password=SecretStr("unused"),
+        solver_max_time_seconds=args.max_time_seconds,
+        solver_num_search_workers=args.search_workers,
+        solver_random_seed=args.seed,
+        solver_warm_start=False,
+    )
+    results: list[dict[str, Any]] = []
+
+    for size in args.sizes.split(","):
+        spec = _spec(size, args)
+
+        for dataset in generate_datasets(spec):
+            results.append({"size": spec.label, **benchmark_dataset(dataset, settings=settings)})
+            print(json.dumps(results[-1]), file=sys.stderr)
+
+    document = json.dumps(
+        {
+            "benchmark": "solver_pipeline",
+            "environment": {
+                "python": platform.python_version(),
+                "ortools": version("ortools"),
+                "cpu_count": os.cpu_count(),
+                "max_time_seconds": args.max_time_seconds,
+                "search_workers": args.search_workers,
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if args.output is None:
+        print(document)
+    else:
+        with open(args.output, "w") as file:
+            file.write(document + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Compare CP-SAT solves with and without interchangeable employee ordering.
+
+Run with ``uv run python benchmarks/symmetry.py [--sizes 1x12,1x18 --output results.json]``.
+Sizes are ``<planning units>x<employees per unit>``. Wishes and availability
+make employees distinguishable, so both densities default to zero. Every
+dataset is solved once with the ordering constraint and once without; the
+results report the time to the first solution, the wall time (the time to
+optimal for OPTIMAL results), the final objective and the bound.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from importlib.metadata import version
+from typing import Any
+
+from ortools.sat.python import cp_model
+
+from scheduling.domain import SchedulingDataset
+from scheduling.solver.config import ConstraintConfig
+from scheduling.solver.cp_sat.builder import CpSatModelBuilder, create_cp_sat_model_builder
+from scheduling.solver.cp_sat.constraints.interchangeable_employee_order import InterchangeableEmployeeOrder
+from scheduling.solver.symmetry import interchangeable_employees
+from scheduling.synthetic import SyntheticDatasetSpec, generate_datasets
+
+
+class _FirstSolution(cp_model.CpSolverSolutionCallback):
+    def __init__(self) -> None:
+        super().__init__()
+        self.seconds: float | None = None
+
+    def on_solution_callback(self) -> None:
+        if self.seconds is None:
+            self.seconds = round(self.wall_time, 4)
+
+
+def _builder(*, ordered: bool) -> CpSatModelBuilder:
+    builder = create_cp_sat_model_builder()
+    constraints = dict(builder.config.constraints)
+    constraints[InterchangeableEmployeeOrder.id] = ConstraintConfig(enabled=ordered)
+
+    return CpSatModelBuilder(
+        constraints=builder.constraints,
+        objectives=builder.objectives,
+        config=builder.config.model_copy(update={"constraints": constraints}),
+    )
+
+
+def benchmark_dataset(dataset: SchedulingDataset, *, ordered: bool, args: argparse.Namespace) -> dict[str, Any]:
+    build_result = _builder(ordered=ordered).build(dataset)
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = args.max_time_seconds
+    solver.parameters.num_search_workers = args.search_workers
+    solver.parameters.random_seed = args.seed
+    first_solution = _FirstSolution()
+
+    started = time.perf_counter()
+    status = solver.solve(build_result.ctx.model, first_solution)
+    solve_seconds = round(time.perf_counter() - started, 4)
+    solved = status in {cp_model.OPTIMAL, cp_model.FEASIBLE}
+
+    return {
+        "planning_month": dataset.planning_month.label,
+        "ordered": ordered,
+        "status": solver.status_name(status),
+        "first_solution_seconds": first_solution.seconds,
+        "solve_seconds": solve_seconds,
+        "objective": solver.objective_value if solved else None,
+        "best_bound": solver.best_objective_bound if solved else None,
+    }
+
+
+def _spec(size: str, args: argparse.Namespace) -> SyntheticDatasetSpec:
+    planning_units, _, employees_per_unit = size.partition("x")
+
+    return SyntheticDatasetSpec(
+        planning_units=int(planning_units),
+        employees_per_unit=int(employees_per_unit),
+        months=args.months,
+        wish_density=args.wish_density,
+        availability_density=args.availability_density,
+        demand_level=args.demand_level,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1x12,1x18")
+    parser.add_argument("--months", type=int, default=1)
+    parser.add_argument("--wish-density", type=float, default=0)
+    parser.add_argument("--availability-density", type=float, default=0)
+    parser.add_argument("--demand-level", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-time-seconds", type=float, default=60)
+    parser.add_argument("--search-workers", type=int, default=8)
+    parser.add_argument("--output", help="Write the results to this file instead of stdout.")
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+
+    for size in args.sizes.split(","):
+        spec = _spec(size, args)
+
+        for dataset in generate_datasets(spec):
+            classes = interchangeable_employees(dataset)
+
+            for ordered in (True, False):
+                results.append(
+                    {
+                        "size": spec.label,
+                        "interchangeable_classes": len(classes),
+                        "interchangeable_employees": sum(len(employee_ids) for employee_ids in classes),
+                        **benchmark_dataset(dataset, ordered=ordered, args=args),
+                    }
+                )
+                print(json.dumps(results[-1]), file=sys.stderr)
+
+    document = json.dumps(
+        {
+            "benchmark": "interchangeable_employee_order",
+            "environment": {
+                "python": platform.python_version(),
+                "ortools": version("ortools"),
+                "cpu_count": os.cpu_count(),
+                "max_time_seconds": args.max_time_seconds,
+                "search_workers": args.search_workers,
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if args.output is None:
+        print(document)
+    else:
+        with open(args.output, "w") as file:
+            file.write(document + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,8 @@ def _solve(
     unit: int,
     start_date: date,
     end_date: date,
+    *,
+    profile_build: bool = False,
 ) -> None:
     planning_month = PlanningMonth(year=start_date.year, month=start_date.month)
 
@@ -42,6 +44,8 @@ def _solve(
         )
 
     settings = get_settings()
+    if profile_build:
+        settings = settings.model_copy(update={"solver_profile_build": True})
     configure_logging(level=settings.log_level)
 
     engine = create_db_engine(settings=settings)
@@ -49,7 +53,7 @@ def _solve(
     timeoffice = TimeOfficeService(
         facts=facts,
         engine=engine,
-        readers=TimeOfficeReaders.create(facts=facts),
+        readers=TimeOfficeReaders.create(facts=facts, roster_chunk_size=settings.timeoffice_roster_chunk_size),
         solution_writer=TimeOfficeSolutionWriter(),
         wish_writer=TimeOfficeWishWriter(
             target_planning_status_id=facts.target_planning_status_id,
@@ -57,10 +61,11 @@ def _solve(
         demand_writer=TimeOfficeDemandWriter(),
         objective_weights_writer=TimeOfficeWeightsWriter(),
         availability_writer=TimeOfficeAvailabilityWriter(),
+        read_workers=settings.timeoffice_read_workers,
     )
     solver = SolverService(
         settings=settings,
-        model_builder=create_cp_sat_model_builder(),
+        model_builder=create_cp_sat_model_builder(model_naming=settings.solver_model_naming),
     )
 
     print(f"Creating staff schedule for planning unit {unit}...")
@@ -80,6 +85,7 @@ def _solve(
     except ValueError as e:
         raise SystemExit(str(e)) from None
     finally:
+        solver.close()
         engine.dispose()
 
     if legacy_solution_paths is not None:
@@ -101,11 +107,16 @@ def main() -> None:
     solve_parser.add_argument("unit", type=int)
     solve_parser.add_argument("start", type=_parse_date)
     solve_parser.add_argument("end", type=_parse_date)
+    solve_parser.add_argument(
+        "--profile-build",
+        action="store_true",
+        help="Log per-component model build time, memory, and proto growth",
+    )
 
     args = parser.parse_args()
 
     if args.command == "solve":
-        _solve(args.unit, args.start, args.end)
+        _solve(args.unit, args.start, args.end, profile_build=args.profile_build)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,17 @@
-import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Annotated
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 
-from scheduling.api.dependencies import ApiRuntime
-from scheduling.api.solve.job_store import InMemorySolveJobStore
+from scheduling.api.dependencies import ApiRuntime, get_api_runtime
+from scheduling.api.solve.executor import ProcessSolveExecutor, create_solve_executor
+from scheduling.api.solve.job_store import create_solve_job_store
+from scheduling.api.solve.queue import SolveQueue, search_workers_per_solve
 from scheduling.api.solve.router import solve_router
+from scheduling.api.solve.runner import SolveJobRunner
 from scheduling.api.web.employee_router import employee_router
 from scheduling.api.web.minimal_staff_router import minimal_staff_router
 from scheduling.api.web.schedule_router import schedule_router
@@ -17,8 +21,11 @@ from scheduling.logging import configure_logging
 from scheduling.settings import get_settings
 from scheduling.solver.cp_sat.builder import create_cp_sat_model_builder
 from scheduling.solver.service import SolverService
+from scheduling.solver.solution_cache import SolutionCache
 from scheduling.timeoffice.database import create_db_engine
+from scheduling.timeoffice.dataset_cache import DatasetCacheStats, TimeOfficeDatasetCache
 from scheduling.timeoffice.facts import TIMEOFFICE_FACTS
+from scheduling.timeoffice.reading.cache import ReferenceCacheStats, TimeOfficeReferenceCache
 from scheduling.timeoffice.reading.container import TimeOfficeReaders
 from scheduling.timeoffice.service import TimeOfficeService
 from scheduling.timeoffice.writing.demand import TimeOfficeDemandWriter
@@ -37,33 +44,86 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     engine = create_db_engine(settings=settings)
     facts = TIMEOFFICE_FACTS
+    reference_cache = (
+        TimeOfficeReferenceCache(ttl_seconds=settings.timeoffice_reference_cache_ttl_seconds)
+        if settings.timeoffice_reference_cache_ttl_seconds > 0
+        else None
+    )
+    dataset_cache = (
+        TimeOfficeDatasetCache(
+            ttl_seconds=settings.timeoffice_dataset_cache_ttl_seconds,
+            max_bytes=settings.timeoffice_dataset_cache_max_mb * 1024 * 1024,
+        )
+        if settings.timeoffice_dataset_cache_ttl_seconds > 0 and settings.timeoffice_dataset_cache_max_mb > 0
+        else None
+    )
 
-    model_builder = create_cp_sat_model_builder()
+    model_builder = create_cp_sat_model_builder(model_naming=settings.solver_model_naming)
 
-    app.state.runtime = ApiRuntime(
-        timeoffice_service=TimeOfficeService(
+    timeoffice_service = TimeOfficeService(
+        facts=facts,
+        engine=engine,
+        readers=TimeOfficeReaders.create(
             facts=facts,
-            engine=engine,
-            readers=TimeOfficeReaders.create(facts=facts),
-            solution_writer=TimeOfficeSolutionWriter(),
-            wish_writer=TimeOfficeWishWriter(
-                target_planning_status_id=facts.target_planning_status_id,
-            ),
-            demand_writer=TimeOfficeDemandWriter(),
-            objective_weights_writer=TimeOfficeWeightsWriter(),
-            availability_writer=TimeOfficeAvailabilityWriter(),
+            reference_cache=reference_cache,
+            roster_chunk_size=settings.timeoffice_roster_chunk_size,
         ),
-        solver_service=SolverService(
-            settings=settings,
-            model_builder=model_builder,
+        solution_writer=TimeOfficeSolutionWriter(),
+        wish_writer=TimeOfficeWishWriter(
+            target_planning_status_id=facts.target_planning_status_id,
         ),
-        solve_job_store=InMemorySolveJobStore(),
-        solve_lock=asyncio.Lock(),
+        demand_writer=TimeOfficeDemandWriter(),
+        objective_weights_writer=TimeOfficeWeightsWriter(),
+        availability_writer=TimeOfficeAvailabilityWriter(),
+        read_workers=settings.timeoffice_read_workers,
+        reference_cache=reference_cache,
+        dataset_cache=dataset_cache,
+    )
+    solver_settings = settings.model_copy(update={"solver_num_search_workers": search_workers_per_solve(settings)})
+    solver_service = SolverService(
+        settings=solver_settings,
+        model_builder=model_builder,
+    )
+    solve_executor = create_solve_executor(solver_settings, solver_service=solver_service)
+    solve_job_store = create_solve_job_store(settings)
+    solve_queue = SolveQueue(
+        job_store=solve_job_store,
+        run=SolveJobRunner(
+            timeoffice=timeoffice_service,
+            solver=solve_executor,
+            job_store=solve_job_store,
+            fingerprint=solver_service.fingerprint,
+            solution_cache=(
+                SolutionCache(
+                    max_entries=settings.solution_cache_max_entries,
+                    directory=settings.solution_cache_dir,
+                )
+                if settings.solution_cache_max_entries > 0
+                else None
+            ),
+        ),
+        workers=settings.solve_workers,
+        max_size=settings.solve_queue_max_size,
+    )
+
+    app.state.runtime = ApiRuntime(
+        timeoffice_service=timeoffice_service,
+        solver_service=solver_service,
+        solve_job_store=solve_job_store,
+        solve_queue=solve_queue,
+        reference_cache=reference_cache,
+        dataset_cache=dataset_cache,
     )
 
+    solve_queue.start()
+
     try:
         yield
     finally:
+        await solve_queue.stop()
+        if isinstance(solve_executor, ProcessSolveExecutor):
+            solve_executor.close()
+        solver_service.close()
         engine.dispose()
 
 
@@ -76,6 +136,22 @@ app.include_router(schedule_router)
 app.include_router(solve_router)
 
 
+@dataclass(frozen=True, slots=True)
+class MetricsResponse:
+    timeoffice_reference_cache: dict[str, ReferenceCacheStats]
+    timeoffice_dataset_cache: DatasetCacheStats | None
+
+
 @app.get("/status")
 async def healthcheck():
     return {"status": "healthy"}
+
+
+@app.get("/metrics")
+def metrics(runtime: Annotated[ApiRuntime, Depends(get_api_runtime)]) -> MetricsResponse:
+    reference_cache_stats = runtime.reference_cache.stats() if runtime.reference_cache is not None else {}
+
+    return MetricsResponse(
+        timeoffice_reference_cache={source.value: stats for source, stats in reference_cache_stats.items()},
+        timeoffice_dataset_cache=runtime.dataset_cache.stats() if runtime.dataset_cache is not None else None,
+    )
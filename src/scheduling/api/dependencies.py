@@ -1,11 +1,13 @@
-import asyncio
 from dataclasses import dataclass
 from typing import Annotated, cast
 
 from fastapi import Depends, Request
 
-from scheduling.api.solve.job_store import InMemorySolveJobStore
+from scheduling.api.solve.job_store import SolveJobStore
+from scheduling.api.solve.queue import SolveQueue
 from scheduling.solver.service import SolverService
+from scheduling.timeoffice.dataset_cache import TimeOfficeDatasetCache
+from scheduling.timeoffice.reading.cache import TimeOfficeReferenceCache
 from scheduling.timeoffice.service import TimeOfficeService
 
 
@@ -13,8 +15,10 @@ from scheduling.timeoffice.service import TimeOfficeService
 class ApiRuntime:
     timeoffice_service: TimeOfficeService
     solver_service: SolverService
-    solve_job_store: InMemorySolveJobStore
-    solve_lock: asyncio.Lock
+    solve_job_store: SolveJobStore
+    solve_queue: SolveQueue
+    reference_cache: TimeOfficeReferenceCache | None
+    dataset_cache: TimeOfficeDatasetCache | None
 
 
 def get_api_runtime(request: Request) -> ApiRuntime:
@@ -34,9 +38,9 @@ def get_solver_service(runtime: Annotated[ApiRuntime, Depends(get_api_runtime)])
     return runtime.solver_service
 
 
-def get_solve_lock(runtime: Annotated[ApiRuntime, Depends(get_api_runtime)]) -> asyncio.Lock:
-    return runtime.solve_lock
+def get_solve_queue(runtime: Annotated[ApiRuntime, Depends(get_api_runtime)]) -> SolveQueue:
+    return runtime.solve_queue
 
 
-def get_solve_job_store(runtime: Annotated[ApiRuntime, Depends(get_api_runtime)]) -> InMemorySolveJobStore:
+def get_solve_job_store(runtime: Annotated[ApiRuntime, Depends(get_api_runtime)]) -> SolveJobStore:
     return runtime.solve_job_store
@@ -0,0 +1,284 @@
+import logging
+import multiprocessing
+import queue
+import resource
+import threading
+import time
+from contextlib import AbstractContextManager, nullcontext
+from multiprocessing.connection import Connection
+from multiprocessing.context import ForkServerContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event
+from typing import Protocol
+
+from scheduling.domain import SchedulingDataset
+from scheduling.settings import Settings
+from scheduling.solver.cancellation import SolveCancellation
+from scheduling.solver.cp_sat.builder import create_cp_sat_model_builder
+from scheduling.solver.models import Neighborhood, Solution, SolveProgress
+from scheduling.solver.service import SolveProgressHandler, SolverService
+
+logger = logging.getLogger(__name__)
+
+_SHUTDOWN = None
+_CANCEL_POLL_SECONDS = 0.1
+
+
+class SolveExecutor(Protocol):
+    """Solve one scheduling dataset synchronously."""
+
+    def solve(
+        self,
+        dataset: SchedulingDataset,
+        *,
+        on_progress: SolveProgressHandler | None = None,
+        cancellation: SolveCancellation | None = None,
+        neighborhood: Neighborhood | None = None,
+    ) -> Solution: ...
+
+
+class SolveWorkerError(RuntimeError):
+    """Raised when a solve worker process crashes or exceeds its limits."""
+
+
+def create_solve_executor(settings: Settings, *, solver_service: SolverService) -> SolveExecutor:
+    """Create the solve executor selected in settings."""
+    if settings.solve_executor == "process":
+        memory_limit_mb = settings.solve_process_memory_limit_mb
+
+        return ProcessSolveExecutor(
+            settings=settings,
+            workers=settings.solve_workers,
+            max_jobs_per_worker=settings.solve_process_max_jobs_per_worker,
+            memory_limit_bytes=memory_limit_mb * 1024 * 1024 if memory_limit_mb is not None else None,
+            timeout_seconds=settings.solve_process_timeout_seconds,
+        )
+
+    return solver_service
+
+
+class ProcessSolveExecutor:
+    """Solve datasets in pre-started worker processes.
+
+    Each solve is sent as dataset JSON to an idle worker and the solution is
+    sent back as JSON, so CP-SAT and model building never hold the API
+    process's GIL or heap. A worker that crashes, runs past
+    ``timeout_seconds`` or hits ``memory_limit_bytes`` is killed and replaced.
+    Workers are also replaced after ``max_jobs_per_worker`` solves to bound
+    memory growth from fragmentation.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: Settings,
+        workers: int,
+        max_jobs_per_worker: int,
+        memory_limit_bytes: int | None = None,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        self._context = multiprocessing.get_context("forkserver")
+        self._settings = settings
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._memory_limit_bytes = memory_limit_bytes
+        self._timeout_seconds = timeout_seconds
+        self._idle: queue.Queue[_SolveProcess] = queue.Queue()
+
+        for _ in range(workers):
+            self._idle.put(self._start_worker())
+
+    def solve(
+        self,
+        dataset: SchedulingDataset,
+        *,
+        on_progress: SolveProgressHandler | None = None,
+        cancellation: SolveCancellation | None = None,
+        neighborhood: Neighborhood | None = None,
+    ) -> Solution:
+        worker = self._idle.get()
+
+        try:
+            ok, payload = worker.solve(
+                dataset.model_dump_json(exclude_computed_fields=True),
+                neighborhood_json=neighborhood.model_dump_json() if neighborhood is not None else None,
+                timeout_seconds=self._timeout_seconds,
+                on_progress=on_progress,
+                cancellation=cancellation,
+            )
+        except BaseException:
+            worker.kill()
+            worker = self._start_worker()
+            raise
+        finally:
+            if worker.jobs >= self._max_jobs_per_worker:
+                logger.info("Recycling solve worker process: pid=%s jobs=%s", worker.pid, worker.jobs)
+                worker.close()
+                worker = self._start_worker()
+
+            self._idle.put(worker)
+
+        if not ok:
+            raise SolveWorkerError(payload)
+
+        return Solution.model_validate_json(payload)
+
+    def close(self) -> None:
+        """Stop all idle worker processes."""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+
+            worker.close()
+
+    def _start_worker(self) -> "_SolveProcess":
+        return _SolveProcess(
+            context=self._context,
+            settings=self._settings,
+            memory_limit_bytes=self._memory_limit_bytes,
+        )
+
+
+class _SolveProcess:
+    def __init__(self, *, context: ForkServerContext, settings: Settings, memory_limit_bytes: int | None) -> None:
+        self._connection, child_connection = context.Pipe()
+        self._cancel_event = context.Event()
+        self._process: BaseProcess = context.Process(
+            target=_serve,
+            args=(child_connection, self._cancel_event, settings, memory_limit_bytes),
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+        self.jobs = 0
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid
+
+    def solve(
+        self,
+        dataset_json: str,
+        *,
+        neighborhood_json: str | None,
+        timeout_seconds: float | None,
+        on_progress: SolveProgressHandler | None,
+        cancellation: SolveCancellation | None,
+    ) -> tuple[bool, str]:
+        """Send one dataset and wait for ``(ok, solution_json_or_error)``.
+
+        Progress messages received in the meantime are forwarded to
+        ``on_progress``. Cancelling signals the worker to stop its search.
+        """
+        self._cancel_event.clear()
+        self._connection.send((dataset_json, neighborhood_json, on_progress is not None))
+        self.jobs += 1
+        deadline = time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+
+        with self._forward_cancel(cancellation):
+            while True:
+                kind, payload = self._receive(deadline, timeout_seconds)
+
+                if kind == "progress":
+                    if on_progress is not None:
+                        on_progress(SolveProgress.model_validate_json(payload))
+                    continue
+
+                return kind == "solution", payload
+
+    def _forward_cancel(self, cancellation: SolveCancellation | None) -> AbstractContextManager[None]:
+        if cancellation is None:
+            return nullcontext()
+
+        return cancellation.on_cancel(self._cancel_event.set)
+
+    def _receive(self, deadline: float | None, timeout_seconds: float | None) -> tuple[str, str]:
+        try:
+            ready = self._connection.poll(max(deadline - time.monotonic(), 0) if deadline is not None else None)
+        except (EOFError, OSError):
+            ready = True
+
+        if not ready:
+            raise SolveWorkerError(f"Solve worker process exceeded time limit of {timeout_seconds} seconds.")
+
+        try:
+            return self._connection.recv()
+        except (EOFError, OSError) as e:
+            self._process.join(timeout=1)
+            raise SolveWorkerError(
+                f"Solve worker process exited unexpectedly: exitcode={self._process.exitcode}"
+            ) from e
+
+    def close(self) -> None:
+        try:
+            self._connection.send(_SHUTDOWN)
+        except (BrokenPipeError, OSError):
+            pass
+
+        self._process.join(timeout=5)
+        if self._process.is_alive():
+            self.kill()
+
+        self._connection.close()
+
+    def kill(self) -> None:
+        self._process.kill()
+        self._process.join()
+        self._connection.close()
+
+
+def _serve(connection: Connection, cancel_event: Event, settings: Settings, memory_limit_bytes: int | None) -> None:
+    if memory_limit_bytes is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+
+    solver = SolverService(
+        settings=settings,
+        model_builder=create_cp_sat_model_builder(model_naming=settings.solver_model_naming),
+    )
+
+    try:
+        _serve_requests(connection, cancel_event, solver)
+    finally:
+        solver.close()
+
+
+def _serve_requests(connection: Connection, cancel_event: Event, solver: SolverService) -> None:
+    def send_progress(progress: SolveProgress) -> None:
+        connection.send(("progress", progress.model_dump_json()))
+
+    while True:
+        request = connection.recv()
+        if request is _SHUTDOWN:
+            return
+
+        dataset_json, neighborhood_json, report_progress = request
+        cancellation = SolveCancellation()
+        finished = threading.Event()
+        watcher = threading.Thread(target=_watch_cancel, args=(cancel_event, finished, cancellation), daemon=True)
+        watcher.start()
+
+        try:
+            solution = solver.solve(
+                SchedulingDataset.model_validate_json(dataset_json),
+                on_progress=send_progress if report_progress else None,
+                cancellation=cancellation,
+                neighborhood=(
+                    Neighborhood.model_validate_json(neighborhood_json) if neighborhood_json is not None else None
+                ),
+            )
+            connection.send(("solution", solution.model_dump_json(exclude_computed_fields=True)))
+        except MemoryError:
+            connection.send(("error", "Solve worker process exceeded its memory limit."))
+        except Exception as e:
+            connection.send(("error", f"{type(e).__name__}: {e}"))
+        finally:
+            finished.set()
+            watcher.join()
+
+
+def _watch_cancel(cancel_event: Event, finished: threading.Event, cancellation: SolveCancellation) -> None:
+    while not finished.wait(_CANCEL_POLL_SECONDS):
+        if cancel_event.is_set():
+            cancellation.cancel()
+            return
@@ -1,14 +1,26 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from enum import StrEnum
 
+from pydantic import Field
+
 from scheduling.domain import PlanningMonth, SchedulingBaseModel
-from scheduling.solver.models import Solution
+from scheduling.solver.models import Solution, SolveProgress
+
+
+class IncrementalSolve(SchedulingBaseModel):
+    """Re-optimize only the neighborhood of an edit to a previous job's schedule."""
+
+    base_job_id: uuid.UUID
+    employee_id: int
+    dates: tuple[date, ...] = ()
+    radius_days: int = Field(default=1, ge=0, le=31)
 
 
 class SolveCommand(SchedulingBaseModel):
     planning_unit_ids: tuple[int, ...]
     planning_month: PlanningMonth
+    incremental: IncrementalSolve | None = None
 
 
 class SolveJobStatus(StrEnum):
@@ -16,6 +28,7 @@ class SolveJobStatus(StrEnum):
     RUNNING = "running"
     SUCCEEDED = "succeeded"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class SolveJob(SchedulingBaseModel):
@@ -26,4 +39,8 @@ class SolveJob(SchedulingBaseModel):
     started_at: datetime | None = None
     finished_at: datetime | None = None
     result: Solution | None = None
+    progress: SolveProgress | None = None
+    fingerprint: str | None = None
+    cache_hit: bool = False
     error: str | None = None
+    queue_position: int | None = None
@@ -1,8 +1,49 @@
 import uuid
-from datetime import UTC, datetime
+import zlib
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Protocol
+
+from sqlalchemy import Engine, RowMapping, create_engine, event, text
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from scheduling.api.solve.job_models import SolveCommand, SolveJob, SolveJobStatus
-from scheduling.solver.models import Solution
+from scheduling.settings import Settings
+from scheduling.solver.models import Solution, SolveProgress
+
+
+class SolveJobStore(Protocol):
+    """Lifecycle storage for solve jobs."""
+
+    def create(self, command: SolveCommand) -> SolveJob: ...
+
+    def get(self, job_id: uuid.UUID) -> SolveJob | None: ...
+
+    def mark_running(self, job_id: uuid.UUID) -> SolveJob: ...
+
+    def mark_succeeded(self, job_id: uuid.UUID, result: Solution) -> SolveJob: ...
+
+    def mark_failed(self, job_id: uuid.UUID, error: str) -> SolveJob: ...
+
+    def mark_cancelled(self, job_id: uuid.UUID, result: Solution | None) -> SolveJob: ...
+
+    def record_progress(self, job_id: uuid.UUID, progress: SolveProgress) -> SolveJob: ...
+
+    def record_fingerprint(self, job_id: uuid.UUID, fingerprint: str, *, cache_hit: bool) -> SolveJob: ...
+
+
+def create_solve_job_store(settings: Settings) -> SolveJobStore:
+    """Create the solve job store selected in settings."""
+    finished_job_ttl = timedelta(seconds=settings.solve_job_ttl_seconds)
+
+    if settings.solve_job_store == "sqlite":
+        return SqliteSolveJobStore(
+            path=settings.solve_job_store_path,
+            finished_job_ttl=finished_job_ttl,
+        )
+
+    return InMemorySolveJobStore(finished_job_ttl=finished_job_ttl)
 
 
 class InMemorySolveJobStore:
@@ -12,11 +53,14 @@ class InMemorySolveJobStore:
     are not shared across multiple Uvicorn workers.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, finished_job_ttl: timedelta | None = None) -> None:
         self._jobs: dict[uuid.UUID, SolveJob] = {}
+        self._finished_job_ttl = finished_job_ttl
 
     def create(self, command: SolveCommand) -> SolveJob:
         """Create an accepted solve job without starting execution."""
+        self._evict_expired()
+
         job = SolveJob(
             job_id=uuid.uuid4(),
             status=SolveJobStatus.ACCEPTED,
@@ -28,6 +72,7 @@ class InMemorySolveJobStore:
 
     def get(self, job_id: uuid.UUID) -> SolveJob | None:
         """Return a job known to this process."""
+        self._evict_expired()
         return self._jobs.get(job_id)
 
     def mark_running(self, job_id: uuid.UUID) -> SolveJob:
@@ -55,6 +100,20 @@ class InMemorySolveJobStore:
             error=error,
         )
 
+    def mark_cancelled(self, job_id: uuid.UUID, result: Solution | None) -> SolveJob:
+        return self._update(
+            job_id,
+            status=SolveJobStatus.CANCELLED,
+            finished_at=datetime.now(UTC),
+            result=result,
+        )
+
+    def record_progress(self, job_id: uuid.UUID, progress: SolveProgress) -> SolveJob:
+        return self._update(job_id, progress=progress)
+
+    def record_fingerprint(self, job_id: uuid.UUID, fingerprint: str, *, cache_hit: bool) -> SolveJob:
+        return self._update(job_id, fingerprint=fingerprint, cache_hit=cache_hit)
+
     def _update(self, job_id: uuid.UUID, **values: object) -> SolveJob:
         job = self._jobs.get(job_id)
 
@@ -64,3 +123,218 @@ class InMemorySolveJobStore:
         updated = job.model_copy(update=values)
         self._jobs[job_id] = updated
         return updated
+
+    def _evict_expired(self) -> None:
+        if self._finished_job_ttl is None:
+            return
+
+        cutoff = datetime.now(UTC) - self._finished_job_ttl
+        expired_job_ids = [
+            job_id for job_id, job in self._jobs.items() if job.finished_at is not None and job.finished_at < cutoff
+        ]
+
+        for job_id in expired_job_ids:
+            del self._jobs[job_id]
+
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS solve_jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    command TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    result BLOB,
+    progress BLOB,
+    fingerprint TEXT,
+    cache_hit INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+)
+"""
+
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_solve_jobs_status_created_at ON solve_jobs (status, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_solve_jobs_finished_at ON solve_jobs (finished_at)",
+)
+
+
+class SqliteSolveJobStore:
+    """SQLite-backed store for solve job state.
+
+    Jobs survive restarts and are visible to every API worker that points at
+    the same database file. The database runs in WAL mode so workers can read
+    job state while another worker writes.
+
+    Solutions and progress snapshots are stored as zlib-compressed JSON.
+    Finished jobs older than ``finished_job_ttl`` are evicted on the next
+    create or lookup.
+    """
+
+    def __init__(self, *, path: Path, finished_job_ttl: timedelta | None = None) -> None:
+        self._engine = _create_sqlite_engine(path)
+        self._finished_job_ttl = finished_job_ttl
+
+        with self._engine.begin() as connection:
+            connection.execute(text(_CREATE_TABLE))
+            for statement in _CREATE_INDEXES:
+                connection.execute(text(statement))
+
+    def create(self, command: SolveCommand) -> SolveJob:
+        """Create an accepted solve job without starting execution."""
+        self._evict_expired()
+
+        job = SolveJob(
+            job_id=uuid.uuid4(),
+            status=SolveJobStatus.ACCEPTED,
+            command=command,
+            created_at=datetime.now(UTC),
+        )
+
+        with self._engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO solve_jobs (job_id, status, command, created_at) "
+                    "VALUES (:job_id, :status, :command, :created_at)"
+                ),
+                {
+                    "job_id": str(job.job_id),
+                    "status": job.status.value,
+                    "command": command.model_dump_json(exclude_computed_fields=True),
+                    "created_at": job.created_at.isoformat(),
+                },
+            )
+
+        return job
+
+    def get(self, job_id: uuid.UUID) -> SolveJob | None:
+        """Return a job from any worker sharing the database."""
+        self._evict_expired()
+        return self._read(job_id)
+
+    def _read(self, job_id: uuid.UUID) -> SolveJob | None:
+        with self._engine.connect() as connection:
+            row = (
+                connection.execute(
+                    text("SELECT * FROM solve_jobs WHERE job_id = :job_id"),
+                    {"job_id": str(job_id)},
+                )
+                .mappings()
+                .one_or_none()
+            )
+
+        if row is None:
+            return None
+
+        return _job_from_row(row)
+
+    def mark_running(self, job_id: uuid.UUID) -> SolveJob:
+        return self._update(
+            job_id,
+            status=SolveJobStatus.RUNNING.value,
+            started_at=datetime.now(UTC).isoformat(),
+            error=None,
+        )
+
+    def mark_succeeded(self, job_id: uuid.UUID, result: Solution) -> SolveJob:
+        return self._update(
+            job_id,
+            status=SolveJobStatus.SUCCEEDED.value,
+            finished_at=datetime.now(UTC).isoformat(),
+            result=_compress_json(result.model_dump_json(exclude_computed_fields=True)),
+            error=None,
+        )
+
+    def mark_failed(self, job_id: uuid.UUID, error: str) -> SolveJob:
+        return self._update(
+            job_id,
+            status=SolveJobStatus.FAILED.value,
+            finished_at=datetime.now(UTC).isoformat(),
+            error=error,
+        )
+
+    def mark_cancelled(self, job_id: uuid.UUID, result: Solution | None) -> SolveJob:
+        return self._update(
+            job_id,
+            status=SolveJobStatus.CANCELLED.value,
+            finished_at=datetime.now(UTC).isoformat(),
+            result=_compress_json(result.model_dump_json(exclude_computed_fields=True)) if result is not None else None,
+        )
+
+    def record_progress(self, job_id: uuid.UUID, progress: SolveProgress) -> SolveJob:
+        return self._update(job_id, progress=_compress_json(progress.model_dump_json()))
+
+    def record_fingerprint(self, job_id: uuid.UUID, fingerprint: str, *, cache_hit: bool) -> SolveJob:
+        return self._update(job_id, fingerprint=fingerprint, cache_hit=cache_hit)
+
+    def _update(self, job_id: uuid.UUID, **values: object) -> SolveJob:
+        assignments = ", ".join(f"{column} = :{column}" for column in values)
+
+        with self._engine.begin() as connection:
+            updated = connection.execute(
+                text(f"UPDATE solve_jobs SET {assignments} WHERE job_id = :job_id"),
+                {**values, "job_id": str(job_id)},
+            )
+
+        if updated.rowcount == 0:
+            raise KeyError(f"Solve job not found: {job_id}")
+
+        job = self._read(job_id)
+        if job is None:
+            raise KeyError(f"Solve job not found: {job_id}")
+
+        return job
+
+    def _evict_expired(self) -> None:
+        if self._finished_job_ttl is None:
+            return
+
+        cutoff = datetime.now(UTC) - self._finished_job_ttl
+
+        with self._engine.begin() as connection:
+            connection.execute(
+                text("DELETE FROM solve_jobs WHERE finished_at IS NOT NULL AND finished_at < :cutoff"),
+                {"cutoff": cutoff.isoformat()},
+            )
+
+
+def _create_sqlite_engine(path: Path) -> Engine:
+    engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": 30})
+
+    @event.listens_for(engine, "connect")
+    def _enable_wal(dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry) -> None:  # pyright: ignore[reportUnusedFunction]
+        del connection_record
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return engine
+
+
+def _job_from_row(row: RowMapping) -> SolveJob:
+    result = row["result"]
+    progress = row["progress"]
+
+    return SolveJob(
+        job_id=uuid.UUID(row["job_id"]),
+        status=SolveJobStatus(row["status"]),
+        command=SolveCommand.model_validate_json(row["command"]),
+        created_at=datetime.fromisoformat(row["created_at"]),
+        started_at=_parse_optional_datetime(row["started_at"]),
+        finished_at=_parse_optional_datetime(row["finished_at"]),
+        result=Solution.model_validate_json(zlib.decompress(result)) if result is not None else None,
+        progress=SolveProgress.model_validate_json(zlib.decompress(progress)) if progress is not None else None,
+        fingerprint=row["fingerprint"],
+        cache_hit=bool(row["cache_hit"]),
+        error=row["error"],
+    )
+
+
+def _compress_json(value: str) -> bytes:
+    return zlib.compress(value.encode())
+
+
+def _parse_optional_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
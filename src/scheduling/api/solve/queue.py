@@ -0,0 +1,209 @@
+import asyncio
+import itertools
+import logging
+import os
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from time import monotonic
+
+from scheduling.api.solve.job_models import SolveCommand, SolveJob
+from scheduling.api.solve.job_store import SolveJobStore
+from scheduling.settings import Settings
+from scheduling.solver.cancellation import SolveCancellation
+from scheduling.solver.models import Solution
+
+logger = logging.getLogger(__name__)
+
+type SolveJobRun = Callable[[uuid.UUID, SolveCommand, SolveCancellation], Solution]
+
+
+class SolveQueueFullError(Exception):
+    """Raised when a solve job is submitted while the queue is at capacity."""
+
+
+@dataclass(frozen=True, order=True, slots=True)
+class _QueuedJob:
+    # Higher priority first, then first come first served.
+    sort_key: tuple[int, int]
+    job_id: uuid.UUID = field(compare=False)
+    command: SolveCommand = field(compare=False)
+
+
+class SolveQueue:
+    """Bounded priority queue of solve jobs drained by a fixed worker pool.
+
+    Each worker solves one job at a time in its own thread, so at most
+    ``workers`` solves run concurrently. Submitting fails fast once
+    ``max_size`` jobs are waiting.
+
+    Cancelling a waiting job frees its queue slot at once. Cancelling a
+    running job stops its search; the job keeps the best solution found.
+    """
+
+    def __init__(
+        self,
+        *,
+        job_store: SolveJobStore,
+        run: SolveJobRun,
+        workers: int,
+        max_size: int,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Solve queue needs at least one worker.")
+
+        self._job_store = job_store
+        self._run = run
+        self._worker_count = workers
+        self._max_size = max_size
+        # Cancelled entries stay in the heap and are skipped once dequeued;
+        # capacity is counted from ``_waiting`` instead.
+        self._queue: asyncio.PriorityQueue[_QueuedJob] = asyncio.PriorityQueue()
+        self._waiting: dict[uuid.UUID, tuple[int, int]] = {}
+        self._running: dict[uuid.UUID, SolveCancellation] = {}
+        self._sequence = itertools.count()
+        self._workers: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"solve-worker-{worker}") for worker in range(self._worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """Stop running searches, cancel all workers and fail jobs that did not finish."""
+        for cancellation in self._running.values():
+            cancellation.cancel()
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for job_id in tuple(self._waiting):
+            del self._waiting[job_id]
+            self._job_store.mark_failed(job_id, "Solver shut down before the job started.")
+
+    def submit(self, command: SolveCommand, *, priority: int = 0) -> SolveJob:
+        """Create a job and enqueue it, or raise if the queue is full."""
+        if len(self._waiting) >= self._max_size:
+            raise SolveQueueFullError("Solve queue is full.")
+
+        job = self._job_store.create(command)
+        sort_key = (-priority, next(self._sequence))
+
+        self._waiting[job.job_id] = sort_key
+        self._queue.put_nowait(_QueuedJob(sort_key=sort_key, job_id=job.job_id, command=command))
+
+        return job
+
+    def position(self, job_id: uuid.UUID) -> int | None:
+        """Return the 1-based position of a waiting job, or None if it is not waiting."""
+        sort_key = self._waiting.get(job_id)
+
+        if sort_key is None:
+            return None
+
+        return 1 + sum(other < sort_key for other in self._waiting.values())
+
+    def cancel(self, job_id: uuid.UUID) -> bool:
+        """Cancel a waiting or running job owned by this queue.
+
+        Returns False if the job is neither waiting nor running here.
+        """
+        if self._waiting.pop(job_id, None) is not None:
+            self._job_store.mark_cancelled(job_id, None)
+            logger.info("Solve job cancelled before start: job_id=%s", job_id)
+            return True
+
+        cancellation = self._running.get(job_id)
+        if cancellation is None:
+            return False
+
+        cancellation.cancel()
+        logger.info("Solve job cancellation requested: job_id=%s", job_id)
+        return True
+
+    @property
+    def waiting_count(self) -> int:
+        return len(self._waiting)
+
+    async def _work(self) -> None:
+        while True:
+            entry = await self._queue.get()
+
+            try:
+                if self._waiting.pop(entry.job_id, None) is not None:
+                    await self._execute(entry)
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, entry: _QueuedJob) -> None:
+        """Run one solve job and persist its lifecycle state."""
+        started = monotonic()
+        cancellation = SolveCancellation()
+        self._running[entry.job_id] = cancellation
+
+        try:
+            self._job_store.mark_running(entry.job_id)
+            logger.info("Solve job started: job_id=%s", entry.job_id)
+
+            result = await asyncio.to_thread(self._run, entry.job_id, entry.command, cancellation)
+
+            if cancellation.cancelled:
+                self._job_store.mark_cancelled(entry.job_id, result)
+                logger.info(
+                    "Solve job cancelled: job_id=%s status=%s duration_seconds=%.2f",
+                    entry.job_id,
+                    result.status.value,
+                    monotonic() - started,
+                )
+                return
+
+            self._job_store.mark_succeeded(entry.job_id, result)
+            logger.info(
+                "Solve job succeeded: job_id=%s duration_seconds=%.2f",
+                entry.job_id,
+                monotonic() - started,
+            )
+
+        except asyncio.CancelledError:
+            # ``stop`` cancelled this worker mid-solve. Persist a final state so
+            # the job does not stay RUNNING in a durable store.
+            logger.warning("Solve job interrupted by shutdown: job_id=%s", entry.job_id)
+            try:
+                self._job_store.mark_failed(entry.job_id, "Solver shut down while the job was running.")
+            except Exception:
+                logger.exception("Failed to mark solve job as failed: job_id=%s", entry.job_id)
+            raise
+
+        except Exception as e:
+            logger.exception(
+                "Solve job failed: job_id=%s duration_seconds=%.2f",
+                entry.job_id,
+                monotonic() - started,
+            )
+            try:
+                self._job_store.mark_failed(entry.job_id, f"{type(e).__name__}: {e}")
+            except Exception:
+                logger.exception("Failed to mark solve job as failed: job_id=%s", entry.job_id)
+
+        finally:
+            del self._running[entry.job_id]
+
+
+def search_workers_per_solve(settings: Settings) -> int | None:
+    """Return the CP-SAT search worker budget for each concurrent solve.
+
+    An explicit ``solver_num_search_workers`` applies to every solve. Otherwise
+    the available cores are split evenly across the solve workers so parallel
+    solves do not oversubscribe the machine.
+    """
+    if settings.solver_num_search_workers is not None:
+        return settings.solver_num_search_workers
+
+    if settings.solve_workers == 1:
+        return None
+
+    return max((os.cpu_count() or 1) // settings.solve_workers, 1)
@@ -1,23 +1,26 @@
 import asyncio
 import logging
 import uuid
-from time import monotonic
+from collections.abc import AsyncIterable
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 
-from scheduling.api.dependencies import get_solve_job_store, get_solve_lock, get_solver_service, get_timeoffice_service
-from scheduling.api.solve.job_models import SolveCommand, SolveJob
-from scheduling.api.solve.job_store import InMemorySolveJobStore
+from scheduling.api.dependencies import get_solve_job_store, get_solve_queue, get_timeoffice_service
+from scheduling.api.solve.job_models import SolveCommand, SolveJob, SolveJobStatus
+from scheduling.api.solve.job_store import SolveJobStore
+from scheduling.api.solve.queue import SolveQueue, SolveQueueFullError
 from scheduling.api.solve.schemas import SolveAcceptedResponse, SolveOptions, SolveRequest
-from scheduling.solver.models import Solution
-from scheduling.solver.service import SolverService
 from scheduling.timeoffice.service import TimeOfficeService
 
 logger = logging.getLogger(__name__)
 
 solve_router = APIRouter(prefix="/solve")
 
+_EVENT_POLL_SECONDS = 1.0
+_FINISHED_STATUSES = frozenset({SolveJobStatus.SUCCEEDED, SolveJobStatus.FAILED, SolveJobStatus.CANCELLED})
+
 
 @solve_router.get("/options")
 def get_solve_options(
@@ -29,114 +32,48 @@ def get_solve_options(
 @solve_router.post("/", status_code=status.HTTP_202_ACCEPTED)
 async def create_solve_task(
     request: SolveRequest,
-    timeoffice: Annotated[TimeOfficeService, Depends(get_timeoffice_service)],
-    solver: Annotated[SolverService, Depends(get_solver_service)],
-    job_store: Annotated[InMemorySolveJobStore, Depends(get_solve_job_store)],
-    solve_lock: Annotated[asyncio.Lock, Depends(get_solve_lock)],
-    background_tasks: BackgroundTasks,
+    solve_queue: Annotated[SolveQueue, Depends(get_solve_queue)],
 ) -> SolveAcceptedResponse:
     command = SolveCommand(
         planning_unit_ids=request.planning_unit_ids,
         planning_month=request.planning_month(),
+        incremental=request.incremental,
     )
 
-    if solve_lock.locked():
+    try:
+        job = solve_queue.submit(command, priority=request.priority)
+    except SolveQueueFullError:
         logger.info(
-            "Solve job rejected because solver is busy: planning_units=%s planning_month=%s",
+            "Solve job rejected because solve queue is full: planning_units=%s planning_month=%s",
             command.planning_unit_ids,
             command.planning_month.label,
         )
         raise HTTPException(
-            status_code=status.HTTP_423_LOCKED,
-            detail="Solver is already working on another solution. Try again later.",
-        )
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Solve queue is full. Try again later.",
+        ) from None
 
-    await solve_lock.acquire()
-
-    job = job_store.create(command)
+    queue_position = solve_queue.position(job.job_id)
     logger.info(
-        "Solve job accepted: job_id=%s planning_units=%s planning_month=%s",
+        "Solve job accepted: job_id=%s planning_units=%s planning_month=%s priority=%s queue_position=%s",
         job.job_id,
         command.planning_unit_ids,
         command.planning_month.label,
+        request.priority,
+        queue_position,
     )
 
-    def kernel(command: SolveCommand) -> Solution:
-        logger.info(
-            "Fetching scheduling dataset for solve job: job_id=%s planning_units=%s planning_month=%s",
-            job.job_id,
-            command.planning_unit_ids,
-            command.planning_month.label,
-        )
-
-        dataset = timeoffice.fetch_dataset(
-            planning_unit_ids=command.planning_unit_ids,
-            planning_month=command.planning_month,
-        )
-
-        logger.info("Solving scheduling dataset for solve job: job_id=%s", job.job_id)
-        solution = solver.solve(dataset)
-
-        start_date = command.planning_month.start.isoformat()
-        end_date = command.planning_month.end.isoformat()
-        for unit in command.planning_unit_ids:
-            solution_name = f"solution_{unit}_{start_date}-{end_date}_wdefault"
-            logger.info(
-                "Writing legacy solution for solve job: job_id=%s solution_name=%s",
-                job.job_id,
-                solution_name,
-            )
-            timeoffice.write_solution_legacy_format(
-                dataset=dataset,
-                solution=solution,
-                solution_name=solution_name,
-            )
-
-        return solution
-
-    async def task() -> None:
-        """Run the accepted solve job and persist its lifecycle state."""
-        started = monotonic()
-
-        try:
-            job_store.mark_running(job.job_id)
-            logger.info("Solve job started: job_id=%s", job.job_id)
-
-            result = await asyncio.to_thread(kernel, command)
-
-            job_store.mark_succeeded(job.job_id, result)
-            logger.info(
-                "Solve job succeeded: job_id=%s duration_seconds=%.2f",
-                job.job_id,
-                monotonic() - started,
-            )
-
-        except Exception as e:
-            logger.exception(
-                "Solve job failed: job_id=%s duration_seconds=%.2f",
-                job.job_id,
-                monotonic() - started,
-            )
-            try:
-                job_store.mark_failed(job.job_id, f"{type(e).__name__}: {e}")
-            except Exception:
-                logger.exception("Failed to mark solve job as failed: job_id=%s", job.job_id)
-
-        finally:
-            solve_lock.release()
-
-    background_tasks.add_task(task)
-
     return SolveAcceptedResponse(
         job_id=job.job_id,
         status=job.status,
+        queue_position=queue_position,
     )
 
 
-@solve_router.get("/jobs/{job_id}")
-async def check_solve_task(
+def _get_solve_job(
     job_id: uuid.UUID,
-    job_store: Annotated[InMemorySolveJobStore, Depends(get_solve_job_store)],
+    job_store: Annotated[SolveJobStore, Depends(get_solve_job_store)],
+    solve_queue: Annotated[SolveQueue, Depends(get_solve_queue)],
 ) -> SolveJob:
     job = job_store.get(job_id)
 
@@ -146,4 +83,77 @@ async def check_solve_task(
             detail="Solve job not found.",
         )
 
+    return job.model_copy(update={"queue_position": solve_queue.position(job_id)})
+
+
+@solve_router.get("/jobs/{job_id}")
+async def check_solve_task(job: Annotated[SolveJob, Depends(_get_solve_job)]) -> SolveJob:
     return job
+
+
+@solve_router.delete("/jobs/{job_id}", status_code=status.HTTP_202_ACCEPTED)
+async def cancel_solve_task(
+    job: Annotated[SolveJob, Depends(_get_solve_job)],
+    job_store: Annotated[SolveJobStore, Depends(get_solve_job_store)],
+    solve_queue: Annotated[SolveQueue, Depends(get_solve_queue)],
+) -> SolveJob:
+    """Cancel a waiting job, or stop a running search and keep its best solution.
+
+    A running job finishes as cancelled shortly after; poll the job or its
+    event stream for the final result.
+    """
+    if job.status in _FINISHED_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Solve job has already finished with status {job.status.value}.",
+        )
+
+    if not solve_queue.cancel(job.job_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Solve job is not managed by this API worker.",
+        )
+
+    cancelled = job_store.get(job.job_id)
+    return cancelled if cancelled is not None else job
+
+
+@solve_router.get("/jobs/{job_id}/events", response_class=EventSourceResponse)
+async def stream_solve_task_events(
+    job: Annotated[SolveJob, Depends(_get_solve_job)],
+    job_store: Annotated[SolveJobStore, Depends(get_solve_job_store)],
+    solve_queue: Annotated[SolveQueue, Depends(get_solve_queue)],
+) -> AsyncIterable[ServerSentEvent]:
+    """Stream status changes and improving solutions until the job finishes.
+
+    Job state is polled from the job store, so the stream works from any API
+    worker that shares the store.
+    """
+    last_status: tuple[SolveJobStatus, int | None] | None = None
+    last_solution_count = 0
+
+    while True:
+        current_status = (job.status, job.queue_position)
+        if current_status != last_status:
+            last_status = current_status
+            yield ServerSentEvent(
+                event="status",
+                data={"status": job.status, "queue_position": job.queue_position},
+            )
+
+        if job.progress is not None and job.progress.solution_count > last_solution_count:
+            last_solution_count = job.progress.solution_count
+            yield ServerSentEvent(event="progress", data=job.progress, id=str(last_solution_count))
+
+        if job.status in _FINISHED_STATUSES:
+            yield ServerSentEvent(event="done", data={"status": job.status, "error": job.error})
+            return
+
+        await asyncio.sleep(_EVENT_POLL_SECONDS)
+
+        # Store reads block (SQLite queries and decoding), so keep them off the event loop.
+        refreshed = await asyncio.to_thread(job_store.get, job.job_id)
+        if refreshed is None:
+            return
+
+        job = refreshed.model_copy(update={"queue_position": solve_queue.position(job.job_id)})
@@ -0,0 +1,140 @@
+import logging
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+
+from scheduling.api.solve.executor import SolveExecutor
+from scheduling.api.solve.job_models import SolveCommand
+from scheduling.api.solve.job_store import SolveJobStore
+from scheduling.domain import SchedulingDataset
+from scheduling.solver.cancellation import SolveCancellation
+from scheduling.solver.models import Neighborhood, Solution, SolutionStatus, SolveProgress
+from scheduling.solver.solution_cache import SolutionCache
+from scheduling.timeoffice.service import TimeOfficeService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SolveJobRunner:
+    """Fetch, solve, and write back one solve job.
+
+    Runs synchronously and is meant to be called from a worker thread. A
+    cancelled job returns its best solution without writing it back.
+
+    Datasets are fingerprinted before solving; when the solution cache already
+    holds a solution for the fingerprint, it is reused without building a model.
+    """
+
+    timeoffice: TimeOfficeService
+    solver: SolveExecutor
+    job_store: SolveJobStore
+    fingerprint: Callable[[SchedulingDataset], str]
+    solution_cache: SolutionCache | None = None
+
+    def __call__(self, job_id: uuid.UUID, command: SolveCommand, cancellation: SolveCancellation) -> Solution:
+        logger.info(
+            "Fetching scheduling dataset for solve job: job_id=%s planning_units=%s planning_month=%s",
+            job_id,
+            command.planning_unit_ids,
+            command.planning_month.label,
+        )
+
+        dataset = self.timeoffice.fetch_dataset(
+            planning_unit_ids=command.planning_unit_ids,
+            planning_month=command.planning_month,
+        )
+
+        neighborhood = self._neighborhood(job_id, command)
+        # Incremental results depend on the base schedule, so they bypass the cache.
+        solution_cache = self.solution_cache if neighborhood is None else None
+
+        fingerprint = self.fingerprint(dataset)
+        cached = solution_cache.get(fingerprint) if solution_cache is not None else None
+        self.job_store.record_fingerprint(job_id, fingerprint, cache_hit=cached is not None)
+
+        if cached is not None:
+            logger.info("Reusing cached solution for solve job: job_id=%s fingerprint=%s", job_id, fingerprint)
+            solution = cached
+        else:
+            logger.info("Solving scheduling dataset for solve job: job_id=%s fingerprint=%s", job_id, fingerprint)
+            solution = self.solver.solve(
+                dataset,
+                on_progress=partial(self._record_progress, job_id),
+                cancellation=cancellation,
+                neighborhood=neighborhood,
+            )
+
+        if cancellation.cancelled:
+            logger.info("Skipping legacy solution write for cancelled solve job: job_id=%s", job_id)
+            return solution
+
+        if (
+            cached is None
+            and solution_cache is not None
+            and solution.status in {SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE}
+        ):
+            solution_cache.put(fingerprint, solution)
+
+        start_date = command.planning_month.start.isoformat()
+        end_date = command.planning_month.end.isoformat()
+        for unit in command.planning_unit_ids:
+            solution_name = f"solution_{unit}_{start_date}-{end_date}_wdefault"
+            logger.info(
+                "Writing legacy solution for solve job: job_id=%s solution_name=%s",
+                job_id,
+                solution_name,
+            )
+            self.timeoffice.write_solution_legacy_format(
+                dataset=dataset,
+                solution=solution,
+                solution_name=solution_name,
+            )
+
+        return solution
+
+    def _neighborhood(self, job_id: uuid.UUID, command: SolveCommand) -> Neighborhood | None:
+        incremental = command.incremental
+
+        if incremental is None:
+            return None
+
+        base = self.job_store.get(incremental.base_job_id)
+
+        if base is None or base.result is None or not base.result.assignments:
+            logger.warning(
+                "Base job of incremental solve has no schedule, solving full model: job_id=%s base_job_id=%s",
+                job_id,
+                incremental.base_job_id,
+            )
+            return None
+
+        if (base.command.planning_unit_ids, base.command.planning_month) != (
+            command.planning_unit_ids,
+            command.planning_month,
+        ):
+            logger.warning(
+                "Base job of incremental solve covers other units or month, solving full model: "
+                "job_id=%s base_job_id=%s",
+                job_id,
+                incremental.base_job_id,
+            )
+            return None
+
+        return Neighborhood(
+            previous_assignments=base.result.assignments,
+            employee_ids=(incremental.employee_id,),
+            dates=incremental.dates,
+            radius_days=incremental.radius_days,
+        )
+
+    def _record_progress(self, job_id: uuid.UUID, progress: SolveProgress) -> None:
+        logger.debug(
+            "Solve job found improving solution: job_id=%s solution_count=%s objective=%s gap=%.4f",
+            job_id,
+            progress.solution_count,
+            progress.objective_value,
+            progress.gap,
+        )
+        self.job_store.record_progress(job_id, progress)
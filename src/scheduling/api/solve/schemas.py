@@ -3,7 +3,7 @@ from typing import Self
 
 from pydantic import Field, model_validator
 
-from scheduling.api.solve.job_models import SolveJobStatus
+from scheduling.api.solve.job_models import IncrementalSolve, SolveJobStatus
 from scheduling.domain import PlanningMonth, PlanningUnit, SchedulingBaseModel
 
 
@@ -15,6 +15,8 @@ class SolveRequest(SchedulingBaseModel):
     planning_unit_ids: tuple[int, ...]
     year: int = Field(ge=2000, le=2100)
     month: int = Field(ge=1, le=12)
+    priority: int = Field(default=0, ge=0, le=9)
+    incremental: IncrementalSolve | None = None
 
     def planning_month(self) -> PlanningMonth:
         return PlanningMonth(year=self.year, month=self.month)
@@ -30,3 +32,4 @@ class SolveRequest(SchedulingBaseModel):
 class SolveAcceptedResponse(SchedulingBaseModel):
     job_id: uuid.UUID
     status: SolveJobStatus
+    queue_position: int | None = None
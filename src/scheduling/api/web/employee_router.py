@@ -21,7 +21,7 @@ async def get_employees(
     timeoffice: Annotated[TimeOfficeService, Depends(get_timeoffice_service)],
 ) -> dict[str, list[dict[str, Any]]]:
     month = PlanningMonth(year=from_date.year, month=from_date.month)
-    employees = timeoffice.fetch_dataset(planning_unit_ids=(planning_unit,), planning_month=month).employees
+    employees = timeoffice.fetch_employees(planning_unit_id=planning_unit, planning_month=month)
     return {"employees": [_employee_to_frontend(employee) for employee in employees]}
 
 
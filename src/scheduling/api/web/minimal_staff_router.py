@@ -52,12 +52,12 @@ async def get_minimal_staff(
 ) -> dict[str, dict[str, dict[str, int]]]:
     month = PlanningMonth(year=from_date.year, month=from_date.month)
 
-    dataset = timeoffice.fetch_dataset(
-        planning_unit_ids=(planning_unit,),
+    demand_requirements = timeoffice.fetch_demand_requirements(
+        planning_unit_id=planning_unit,
         planning_month=month,
     )
 
-    return _minimal_staff_to_frontend(dataset.demand_requirements)
+    return _minimal_staff_to_frontend(demand_requirements)
 
 
 def _minimal_staff_to_frontend(
@@ -22,14 +22,12 @@ async def get_weights(
 ) -> dict[str, int]:
     planning_month = PlanningMonth(year=from_date.year, month=from_date.month)
 
-    dataset = timeoffice.fetch_dataset(
-        planning_unit_ids=(planning_unit,),
-        planning_month=planning_month,
-    )
-
     objective_weights = _objective_weights_for_planning_unit(
         planning_unit_id=planning_unit,
-        objective_weights=dataset.objective_weights,
+        objective_weights=timeoffice.fetch_objective_weights(
+            planning_unit_id=planning_unit,
+            planning_month=planning_month,
+        ),
     )
 
     return _objective_weights_to_frontend(objective_weights)
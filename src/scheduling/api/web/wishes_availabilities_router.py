@@ -25,18 +25,18 @@ async def get_wishes_and_blocked(
     from_date_year, from_date_month = from_date.year, from_date.month
     month = PlanningMonth(year=from_date_year, month=from_date_month)
 
-    dataset = timeoffice.fetch_dataset(
-        planning_unit_ids=(planning_unit,),
+    wishes_and_availability = timeoffice.fetch_wishes_and_availability(
+        planning_unit_id=planning_unit,
         planning_month=month,
     )
 
     employee_wishes_blocked = [
         _wishes_and_availability_to_frontend(
             employee=employee,
-            wishes=dataset.wishes,
-            availability=dataset.availability,
+            wishes=wishes_and_availability.wishes,
+            availability=wishes_and_availability.availability,
         )
-        for employee in dataset.employees
+        for employee in wishes_and_availability.employees
     ]
     logger.warning(
         "DEBUG wishes/availability response: %s",
@@ -1,8 +1,12 @@
 from functools import lru_cache
+from pathlib import Path
+from typing import Literal
 
-from pydantic import SecretStr
+from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from scheduling.solver.cp_sat.naming import ModelNaming
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -18,12 +22,41 @@ class Settings(BaseSettings):
     db_name: str
     db_user: str
     db_password: SecretStr
+    db_pool_size: int = Field(default=5, ge=1)
+    timeoffice_read_workers: int = Field(default=1, ge=1)
+    timeoffice_roster_chunk_size: int = Field(default=10_000, ge=1)
+    timeoffice_reference_cache_ttl_seconds: float = Field(default=300, ge=0)
+    timeoffice_dataset_cache_ttl_seconds: float = Field(default=300, ge=0)
+    timeoffice_dataset_cache_max_mb: int = Field(default=256, ge=0)
 
     # Solver
     solver_max_time_seconds: float = 30
+    solver_incremental_max_time_seconds: float = 5
     solver_num_search_workers: int | None = None
     solver_random_seed: int | None = None
     solver_log_search_progress: bool = False
+    solver_model_naming: ModelNaming = ModelNaming.NAMED
+    solver_profile_build: bool = False
+    solver_progress_assignments: bool = False
+    solver_warm_start: bool = True
+    solver_warm_start_require_complete: bool = False
+    solver_decompose_components: bool = True
+    solver_component_workers: int | None = Field(default=None, ge=1)
+
+    # Solve jobs
+    solve_job_store: Literal["memory", "sqlite"] = "memory"
+    solve_job_store_path: Path = Path("solve_jobs.sqlite3")
+    solve_job_ttl_seconds: float = 7 * 24 * 60 * 60
+    solve_workers: int = Field(default=1, ge=1)
+    solve_queue_max_size: int = Field(default=32, ge=1)
+    solve_executor: Literal["thread", "process"] = "thread"
+    solve_process_max_jobs_per_worker: int = Field(default=20, ge=1)
+    solve_process_memory_limit_mb: int | None = None
+    solve_process_timeout_seconds: float | None = None
+
+    # Solution cache
+    solution_cache_max_entries: int = Field(default=32, ge=0)
+    solution_cache_dir: Path | None = None
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,51 @@
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+
+
+class SolveCancellation:
+    """Thread-safe cancellation signal for one solve.
+
+    Whoever owns a running search registers a stop handler with
+    ``on_cancel``; ``cancel`` may be called from any thread and runs every
+    registered handler once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._handlers: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+
+            self._cancelled = True
+            handlers = tuple(self._handlers)
+
+        for handler in handlers:
+            handler()
+
+    @contextmanager
+    def on_cancel(self, handler: Callable[[], None]) -> Generator[None]:
+        """Call ``handler`` on cancellation while the context is active.
+
+        The handler runs immediately if cancellation was already requested.
+        """
+        with self._lock:
+            already_cancelled = self._cancelled
+            self._handlers.append(handler)
+
+        if already_cancelled:
+            handler()
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._handlers.remove(handler)
@@ -6,10 +6,12 @@ from scheduling.domain import SchedulingBaseModel
 from scheduling.solver.cp_sat.constraints.availabilities_constraint import AvailabilitiesConstraint
 from scheduling.solver.cp_sat.constraints.free_day_after_night_shift_phase import FreeDayAfterNightShiftPhase
 from scheduling.solver.cp_sat.constraints.hierarchy_of_intermediate_shifts import HierarchyOfIntermediateShifts
+from scheduling.solver.cp_sat.constraints.interchangeable_employee_order import InterchangeableEmployeeOrder
 from scheduling.solver.cp_sat.constraints.minimum_staffing import MinimumStaffing
 from scheduling.solver.cp_sat.constraints.one_assignment_per_day import OneAssignmentPerDay
 from scheduling.solver.cp_sat.constraints.rounds_in_early_shift import RoundsInEarlyShift
 from scheduling.solver.cp_sat.constraints.target_working_time import TargetWorkingTime
+from scheduling.solver.cp_sat.naming import ModelNaming
 from scheduling.solver.cp_sat.objectives.every_second_weekend_free import EverySecondWeekendFree
 from scheduling.solver.cp_sat.objectives.fair_preferences import FairPreferencesObjective
 from scheduling.solver.cp_sat.objectives.free_day_after_night_shift_phase import FreeDaysAfterNightShiftPhase
@@ -38,6 +40,7 @@ class ObjectiveConfig(SchedulingBaseModel):
 class SolverConfig(SchedulingBaseModel):
     constraints: dict[str, ConstraintConfig]
     objectives: dict[str, ObjectiveConfig]
+    model_naming: ModelNaming = ModelNaming.NAMED
 
 
 def create_base_solver_config() -> SolverConfig:
@@ -55,6 +58,7 @@ def create_base_solver_config() -> SolverConfig:
             HierarchyOfIntermediateShifts.id: ConstraintConfig(enabled=True),
             OneAssignmentPerDay.id: ConstraintConfig(enabled=True),
             TargetWorkingTime.id: ConstraintConfig(enabled=True),
+            InterchangeableEmployeeOrder.id: ConstraintConfig(enabled=True),
         },
         objectives={
             TemporaryBalanceGeneratedAssignments.id: ObjectiveConfig(
@@ -4,15 +4,18 @@ from typing import Any
 
 from scheduling.domain import SchedulingDataset
 from scheduling.solver.config import SolverConfig, create_base_solver_config
-from scheduling.solver.cp_sat.constraint import Constraint
+from scheduling.solver.cp_sat.constraint import Constraint, SlotExcludingConstraint
 from scheduling.solver.cp_sat.constraints.availabilities_constraint import AvailabilitiesConstraint
 from scheduling.solver.cp_sat.constraints.free_day_after_night_shift_phase import FreeDayAfterNightShiftPhase
 from scheduling.solver.cp_sat.constraints.hierarchy_of_intermediate_shifts import HierarchyOfIntermediateShifts
+from scheduling.solver.cp_sat.constraints.interchangeable_employee_order import InterchangeableEmployeeOrder
 from scheduling.solver.cp_sat.constraints.minimum_staffing import MinimumStaffing
 from scheduling.solver.cp_sat.constraints.one_assignment_per_day import OneAssignmentPerDay
 from scheduling.solver.cp_sat.constraints.rounds_in_early_shift import RoundsInEarlyShift
 from scheduling.solver.cp_sat.constraints.target_working_time import TargetWorkingTime
 from scheduling.solver.cp_sat.context import SolverContext, create_context
+from scheduling.solver.cp_sat.keys import EmployeeDateShiftKey
+from scheduling.solver.cp_sat.naming import ModelNaming
 from scheduling.solver.cp_sat.objective import Objective, WeightedPenalty, minimize_weighted_penalties
 from scheduling.solver.cp_sat.objectives.every_second_weekend_free import EverySecondWeekendFree
 from scheduling.solver.cp_sat.objectives.fair_preferences import FairPreferencesObjective
@@ -26,6 +29,7 @@ from scheduling.solver.cp_sat.objectives.rotate_shits_foward import RotateShifts
 from scheduling.solver.cp_sat.objectives.temporary_balance_generated_assignments import (
     TemporaryBalanceGeneratedAssignments,
 )
+from scheduling.solver.cp_sat.profiling import BuildProfile, BuildProfiler, BuildStep, measure_step
 from scheduling.solver.cp_sat.variables import create_assignment_variables
 
 CP_SAT_CONSTRAINTS: tuple[Constraint, ...] = (
@@ -36,6 +40,7 @@ CP_SAT_CONSTRAINTS: tuple[Constraint, ...] = (
     HierarchyOfIntermediateShifts(),
     OneAssignmentPerDay(),
     TargetWorkingTime(),
+    InterchangeableEmployeeOrder(),
 )
 
 CP_SAT_OBJECTIVES: tuple[Objective, ...] = (
@@ -74,6 +79,7 @@ class CpSatBuildResult:
     objectives: tuple[ResolvedObjective, ...]
     weighted_penalty_count: int
     has_objective: bool
+    profile: BuildProfile | None = None
 
     @property
     def applied_constraint_ids(self) -> tuple[str, ...]:
@@ -92,15 +98,36 @@ class CpSatModelBuilder:
     objectives: tuple[Objective, ...]
     config: SolverConfig
 
-    def build(self, dataset: SchedulingDataset) -> CpSatBuildResult:
-        ctx = create_context(dataset=dataset)
+    @property
+    def separable(self) -> bool:
+        """Whether every enabled objective is separable by planning unit component."""
+        return all(
+            resolved.objective.separable
+            for resolved in resolve_objectives(objectives=self.objectives, config=self.config)
+            if resolved.enabled
+        )
+
+    def build(self, dataset: SchedulingDataset, *, profile: bool = False) -> CpSatBuildResult:
+        ctx = create_context(dataset=dataset, model_naming=self.config.model_naming)
 
-        create_assignment_variables(ctx)
+        profiler = BuildProfiler(model=ctx.model) if profile else None
+        if profiler is not None:
+            profiler.start()
 
         resolved_constraints = resolve_constraints(
             constraints=self.constraints,
             config=self.config,
         )
+
+        with measure_step(profiler, BuildStep.VARIABLES, "assignment_variables"):
+            create_assignment_variables(ctx, excluded_slots=_excluded_slots(ctx, resolved_constraints))
+
+        # Components share the lazily built variable index. Building it here
+        # keeps its cost out of the profile of whichever component touches
+        # it first.
+        with measure_step(profiler, BuildStep.INDEX, "variable_index"):
+            _ = ctx.variable_index
+
         resolved_objectives = resolve_objectives(
             objectives=self.objectives,
             config=self.config,
@@ -112,14 +139,16 @@ class CpSatModelBuilder:
             if not resolved.enabled:
                 continue
 
-            diagnostics = resolved.constraint.add_to_model(ctx, params=resolved.params)
+            with measure_step(profiler, BuildStep.CONSTRAINT, resolved.constraint.id):
+                diagnostics = resolved.constraint.add_to_model(ctx, params=resolved.params)
             ctx.diagnostics.extend(diagnostics)
 
         for resolved in resolved_objectives:
             if not resolved.enabled:
                 continue
 
-            penalties = resolved.objective.add_to_model(ctx, params=resolved.params)
+            with measure_step(profiler, BuildStep.OBJECTIVE, resolved.objective.id):
+                penalties = resolved.objective.add_to_model(ctx, params=resolved.params)
 
             weighted_penalties.extend(
                 WeightedPenalty(
@@ -140,11 +169,12 @@ class CpSatModelBuilder:
             objectives=resolved_objectives,
             weighted_penalty_count=len(weighted_penalties),
             has_objective=has_objective,
+            profile=profiler.finish() if profiler is not None else None,
         )
 
 
-def create_cp_sat_model_builder() -> CpSatModelBuilder:
-    config = create_base_solver_config()
+def create_cp_sat_model_builder(*, model_naming: ModelNaming = ModelNaming.NAMED) -> CpSatModelBuilder:
+    config = create_base_solver_config().model_copy(update={"model_naming": model_naming})
 
     return CpSatModelBuilder(
         constraints=CP_SAT_CONSTRAINTS,
@@ -153,6 +183,19 @@ def create_cp_sat_model_builder() -> CpSatModelBuilder:
     )
 
 
+def _excluded_slots(
+    ctx: SolverContext,
+    resolved_constraints: tuple[ResolvedConstraint, ...],
+) -> set[EmployeeDateShiftKey]:
+    excluded_slots: set[EmployeeDateShiftKey] = set()
+
+    for resolved in resolved_constraints:
+        if resolved.enabled and isinstance(resolved.constraint, SlotExcludingConstraint):
+            excluded_slots.update(resolved.constraint.excluded_slots(ctx, params=resolved.params))
+
+    return excluded_slots
+
+
 def resolve_constraints(
     *,
     constraints: tuple[Constraint, ...],
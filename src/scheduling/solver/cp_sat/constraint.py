@@ -1,8 +1,9 @@
-from collections.abc import Mapping
-from typing import Any, ClassVar, Protocol
+from collections.abc import Collection, Mapping
+from typing import Any, ClassVar, Protocol, runtime_checkable
 
 from scheduling.solver.audit import AuditFinding
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
+from scheduling.solver.cp_sat.keys import EmployeeDateShiftKey
 from scheduling.solver.diagnostics import SolverDiagnostic
 
 
@@ -27,3 +28,21 @@ class Constraint(Protocol):
         ctx: AuditContext,
         params: Mapping[str, Any],
     ) -> tuple[AuditFinding, ...]: ...
+
+
+@runtime_checkable
+class SlotExcludingConstraint(Protocol):
+    """Constraint that rules out whole assignment slots before variables exist.
+
+    The builder asks every enabled constraint implementing this for its
+    excluded (employee, date, shift) slots and creates no variables for them,
+    instead of adding a ``variable == 0`` constraint per slot. ``add_to_model``
+    still has to cover variables created without the exclusions, and
+    ``audit`` still reports assignments in excluded slots.
+    """
+
+    def excluded_slots(
+        self,
+        ctx: SolverContext,
+        params: Mapping[str, Any],
+    ) -> Collection[EmployeeDateShiftKey]: ...
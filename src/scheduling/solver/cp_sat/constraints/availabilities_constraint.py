@@ -1,10 +1,11 @@
 import datetime
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
 from typing import Any, ClassVar
 
 from scheduling.solver.audit import AuditFinding, AuditSeverity
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
+from scheduling.solver.cp_sat.keys import EmployeeDateShiftKey
 from scheduling.solver.diagnostics import SolverDiagnostic
 from scheduling.solver.index import is_night_shift
 
@@ -16,6 +17,9 @@ class AvailabilitiesConstraint:
     """Ensure employees do not work on dates or shifts they are unavailable for.
 
     Also prevents night shifts from spilling over into full-day absences (e.g., vacations).
+
+    Blocked slots are excluded before variable creation, so a normal build
+    adds no constraints here.
     """
 
     id: ClassVar[str] = "employee_availabilities"
@@ -28,35 +32,25 @@ class AvailabilitiesConstraint:
     ) -> tuple[SolverDiagnostic, ...]:
         del params
 
-        blocked_days, allowed_shifts_for_day = _parse_availabilities(ctx)
-
-        for key, variable in ctx.assignment_variables.items():
-            employee_id, _, date, shift_id, _ = key
+        # Only variables created without the exclusions are left to fix.
+        variables_by_slot = ctx.variable_index.by_employee_date_shift
 
-            # Regel 1: Voller Abwesenheitstag (Urlaub, Training, etc.)
-            if (employee_id, date) in blocked_days:
-                ctx.model.add(variable == 0).with_name(
-                    f"avail_blocked_full__emp_{employee_id}_date_{date:%Y%m%d}_shift_{shift_id}"
+        for (employee_id, date, shift_id), reason in _excluded_slot_reasons(ctx).items():
+            for variable in variables_by_slot.get((employee_id, date, shift_id), ()):
+                ctx.names.name_constraint(
+                    ctx.model.add(variable == 0), _constraint_name, reason, employee_id, date, shift_id
                 )
-                continue
 
-            # Regel 2: Partielle Verfügbarkeit (AVAILABLE_ONLY)
-            if (employee_id, date) in allowed_shifts_for_day:
-                if shift_id not in allowed_shifts_for_day[(employee_id, date)]:
-                    ctx.model.add(variable == 0).with_name(
-                        f"avail_blocked_partial__emp_{employee_id}_date_{date:%Y%m%d}_shift_{shift_id}"
-                    )
-                    continue
+        return ()
 
-            # Regel 3: Spillover-Prävention (Nachtschicht vor einem vollen Abwesenheitstag)
-            if is_night_shift(ctx.index.shifts_by_id[shift_id]):
-                tomorrow = date + datetime.timedelta(days=1)
-                if (employee_id, tomorrow) in blocked_days:
-                    ctx.model.add(variable == 0).with_name(
-                        f"avail_blocked_spillover__emp_{employee_id}_date_{date:%Y%m%d}_shift_{shift_id}"
-                    )
+    def excluded_slots(
+        self,
+        ctx: SolverContext,
+        params: Mapping[str, Any],
+    ) -> Collection[EmployeeDateShiftKey]:
+        del params
 
-        return ()
+        return _excluded_slot_reasons(ctx).keys()
 
     def audit(
         self,
@@ -130,6 +124,32 @@ class AvailabilitiesConstraint:
 # --- Helper Functions ---
 
 
+def _excluded_slot_reasons(ctx: SolverContext) -> dict[EmployeeDateShiftKey, str]:
+    """Map every slot blocked by availability to the rule that blocks it."""
+    blocked_days, allowed_shifts_for_day = _parse_availabilities(ctx)
+    shift_ids = tuple(ctx.index.shifts_by_id)
+    night_shift_ids = tuple(shift.shift_id for shift in ctx.index.shifts_by_id.values() if is_night_shift(shift))
+    reasons: dict[EmployeeDateShiftKey, str] = {}
+
+    # Regel 1: Voller Abwesenheitstag (Urlaub, Training, etc.)
+    for employee_id, date in blocked_days:
+        for shift_id in shift_ids:
+            reasons[(employee_id, date, shift_id)] = "full"
+
+    # Regel 2: Partielle Verfügbarkeit (AVAILABLE_ONLY)
+    for (employee_id, date), allowed_shift_ids in allowed_shifts_for_day.items():
+        for shift_id in shift_ids:
+            if shift_id not in allowed_shift_ids:
+                reasons.setdefault((employee_id, date, shift_id), "partial")
+
+    # Regel 3: Spillover-Prävention (Nachtschicht vor einem vollen Abwesenheitstag)
+    for employee_id, date in blocked_days:
+        for shift_id in night_shift_ids:
+            reasons.setdefault((employee_id, date - datetime.timedelta(days=1), shift_id), "spillover")
+
+    return reasons
+
+
 def _parse_availabilities(
     ctx: SolverContext | AuditContext,
 ) -> tuple[set[tuple[int, datetime.date]], dict[tuple[int, datetime.date], set[int]]]:
@@ -152,3 +172,7 @@ def _parse_availabilities(
             blocked_days.add((avail.employee_id, avail.date))
 
     return blocked_days, dict(allowed_shifts)
+
+
+def _constraint_name(reason: str, employee_id: int, date: datetime.date, shift_id: int) -> str:
+    return f"avail_blocked_{reason}__emp_{employee_id}_date_{date:%Y%m%d}_shift_{shift_id}"
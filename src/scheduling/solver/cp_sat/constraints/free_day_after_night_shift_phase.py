@@ -3,8 +3,7 @@ from collections import defaultdict
 from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from ortools.sat.python import cp_model
-
+from scheduling.domain.shift import ShiftType
 from scheduling.solver.audit import AuditFinding, AuditSeverity
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
 from scheduling.solver.diagnostics import SolverDiagnostic
@@ -24,31 +23,24 @@ class FreeDayAfterNightShiftPhase:
     ) -> tuple[SolverDiagnostic, ...]:
         del params
 
-        all_vars_by_emp_date, night_vars_by_emp_date = _group_vars(ctx)
+        vars_by_emp_date = ctx.variable_index.by_employee_date
 
-        for (employee_id, date), night_vars_today in night_vars_by_emp_date.items():
-            if not night_vars_today:
+        for employee_id, date, shift_type in ctx.variable_index.by_employee_date_shift_type:
+            if shift_type != ShiftType.NIGHT:
                 continue
 
             tomorrow = date + datetime.timedelta(days=1)
-            all_vars_tomorrow = all_vars_by_emp_date.get((employee_id, tomorrow), [])
-            night_vars_tomorrow = night_vars_by_emp_date.get((employee_id, tomorrow), [])
+            all_vars_tomorrow = vars_by_emp_date.get((employee_id, tomorrow), [])
 
             if not all_vars_tomorrow:
                 continue
 
-            works_night_today = ctx.model.new_bool_var(f"works_night_emp_{employee_id}_date_{date:%Y%m%d}")
-            ctx.model.add_max_equality(works_night_today, night_vars_today)
-
-            works_night_tomorrow = ctx.model.new_bool_var(f"works_night_emp_{employee_id}_date_{tomorrow:%Y%m%d}")
-            if night_vars_tomorrow:
-                ctx.model.add_max_equality(works_night_tomorrow, night_vars_tomorrow)
-            else:
-                ctx.model.add(works_night_tomorrow == 0)
+            works_night_today = ctx.derived.works_type(employee_id, date, ShiftType.NIGHT)
+            works_night_tomorrow = ctx.derived.works_type(employee_id, tomorrow, ShiftType.NIGHT)
 
             constraint = ctx.model.add(sum(all_vars_tomorrow) == 0)
             constraint.only_enforce_if([works_night_today, works_night_tomorrow.Not()])  # type: ignore
-            constraint.with_name(_constraint_name(employee_id, tomorrow))
+            ctx.names.name_constraint(constraint, _constraint_name, employee_id, tomorrow)
 
         return ()
 
@@ -96,25 +88,6 @@ def _constraint_name(employee_id: int, date_of_free_day: datetime.date) -> str:
     return f"free_day_after_night_shift__emp_{employee_id}__date_{date_of_free_day:%Y%m%d}"
 
 
-def _group_vars(
-    ctx: SolverContext,
-) -> tuple[
-    dict[tuple[int, datetime.date], list[cp_model.IntVar]], dict[tuple[int, datetime.date], list[cp_model.IntVar]]
-]:
-    all_vars: defaultdict[tuple[int, datetime.date], list[cp_model.IntVar]] = defaultdict(list)
-    night_vars: defaultdict[tuple[int, datetime.date], list[cp_model.IntVar]] = defaultdict(list)
-
-    for key, variable in ctx.assignment_variables.items():
-        employee_id, _, assignment_date, shift_id, _ = key
-
-        all_vars[(employee_id, assignment_date)].append(variable)
-
-        if is_night_shift(ctx.index.shifts_by_id[shift_id]):
-            night_vars[(employee_id, assignment_date)].append(variable)
-
-    return dict(all_vars), dict(night_vars)
-
-
 # FIX: list[str] zu list[int] geändert, da shift_id ein int ist
 def _group_actual_shifts(
     ctx: AuditContext,
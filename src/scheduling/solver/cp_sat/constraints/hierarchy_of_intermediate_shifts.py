@@ -7,6 +7,7 @@ from ortools.sat.python import cp_model
 
 from scheduling.solver.audit import AuditFinding, AuditSeverity
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
+from scheduling.solver.cp_sat.keys import IsoWeek
 from scheduling.solver.diagnostics import SolverDiagnostic
 from scheduling.solver.index import is_intermediate_shift
 
@@ -27,11 +28,9 @@ class HierarchyOfIntermediateShifts:
     ) -> tuple[SolverDiagnostic, ...]:
         del params
 
-        vars_by_unit_week_day, active_unit_weeks = _group_vars(ctx)
-
-        for planning_unit_id, (iso_year, iso_week) in active_unit_weeks:
-            days_in_week = vars_by_unit_week_day[planning_unit_id][(iso_year, iso_week)]
+        vars_by_unit_week_day = _group_vars(ctx)
 
+        for (planning_unit_id, iso_week_key), days_in_week in sorted(vars_by_unit_week_day.items()):
             weekdays_exprs: list[cp_model.LinearExpr] = []
             weekends_exprs: list[cp_model.LinearExpr] = []
 
@@ -46,18 +45,10 @@ class HierarchyOfIntermediateShifts:
             if weekdays_exprs and weekends_exprs:
                 max_capacity = len(ctx.assignment_variables)
 
-                max_wd = ctx.model.new_int_var(
-                    0, max_capacity, f"max_wd_u:{planning_unit_id}_y:{iso_year}_w:{iso_week}"
-                )
-                min_wd = ctx.model.new_int_var(
-                    0, max_capacity, f"min_wd_u:{planning_unit_id}_y:{iso_year}_w:{iso_week}"
-                )
-                max_we = ctx.model.new_int_var(
-                    0, max_capacity, f"max_we_u:{planning_unit_id}_y:{iso_year}_w:{iso_week}"
-                )
-                min_we = ctx.model.new_int_var(
-                    0, max_capacity, f"min_we_u:{planning_unit_id}_y:{iso_year}_w:{iso_week}"
-                )
+                max_wd = ctx.names.new_int_var(0, max_capacity, _bound_name, "max_wd", planning_unit_id, iso_week_key)
+                min_wd = ctx.names.new_int_var(0, max_capacity, _bound_name, "min_wd", planning_unit_id, iso_week_key)
+                max_we = ctx.names.new_int_var(0, max_capacity, _bound_name, "max_we", planning_unit_id, iso_week_key)
+                min_we = ctx.names.new_int_var(0, max_capacity, _bound_name, "min_we", planning_unit_id, iso_week_key)
 
                 ctx.model.add_max_equality(max_wd, weekdays_exprs)
                 ctx.model.add_min_equality(min_wd, weekdays_exprs)
@@ -65,16 +56,16 @@ class HierarchyOfIntermediateShifts:
                 ctx.model.add_min_equality(min_we, weekends_exprs)
 
                 constr_dist_wd = ctx.model.add(max_wd - min_wd <= 1)
-                constr_dist_wd.with_name(f"hier_inter_dist_wd__unit_{planning_unit_id}__y_{iso_year}_w_{iso_week}")
+                ctx.names.name_constraint(constr_dist_wd, _constraint_name, "dist_wd", planning_unit_id, iso_week_key)
 
                 constr_dist_we = ctx.model.add(max_we - min_we <= 1)
-                constr_dist_we.with_name(f"hier_inter_dist_we__unit_{planning_unit_id}__y_{iso_year}_w_{iso_week}")
+                ctx.names.name_constraint(constr_dist_we, _constraint_name, "dist_we", planning_unit_id, iso_week_key)
 
                 constr_step_a = ctx.model.add(max_wd <= min_we + 1)
-                constr_step_a.with_name(f"hier_inter_step_a__unit_{planning_unit_id}__y_{iso_year}_w_{iso_week}")
+                ctx.names.name_constraint(constr_step_a, _constraint_name, "step_a", planning_unit_id, iso_week_key)
 
                 constr_step_b = ctx.model.add(min_wd >= max_we)
-                constr_step_b.with_name(f"hier_inter_step_b__unit_{planning_unit_id}__y_{iso_year}_w_{iso_week}")
+                ctx.names.name_constraint(constr_step_b, _constraint_name, "step_b", planning_unit_id, iso_week_key)
 
         return ()
 
@@ -133,29 +124,34 @@ class HierarchyOfIntermediateShifts:
 
 
 # --- Helper Functions ---
+def _bound_name(bound: str, planning_unit_id: int, iso_week_key: IsoWeek) -> str:
+    iso_year, iso_week = iso_week_key
+    return f"{bound}_u:{planning_unit_id}_y:{iso_year}_w:{iso_week}"
+
+
+def _constraint_name(rule: str, planning_unit_id: int, iso_week_key: IsoWeek) -> str:
+    iso_year, iso_week = iso_week_key
+    return f"hier_inter_{rule}__unit_{planning_unit_id}__y_{iso_year}_w_{iso_week}"
+
+
 def _group_vars(
     ctx: SolverContext,
-) -> tuple[
-    dict[int, dict[tuple[int, int], dict[datetime.date, list[cp_model.IntVar]]]], set[tuple[int, tuple[int, int]]]
-]:
-    grouped: defaultdict[int, defaultdict[tuple[int, int], defaultdict[datetime.date, list[cp_model.IntVar]]]] = (
-        defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+) -> dict[tuple[int, tuple[int, int]], dict[datetime.date, list[cp_model.IntVar]]]:
+    grouped: defaultdict[tuple[int, tuple[int, int]], defaultdict[datetime.date, list[cp_model.IntVar]]] = defaultdict(
+        lambda: defaultdict(list)
     )
-    active_weeks: set[tuple[int, tuple[int, int]]] = set()
-
-    for key, variable in ctx.assignment_variables.items():
-        _, planning_unit_id, assignment_date, shift_id, _ = key
+    intermediate_shift_ids = {
+        shift_id for shift_id, shift in ctx.index.shifts_by_id.items() if is_intermediate_shift(shift)
+    }
 
-        if not is_intermediate_shift(ctx.index.shifts_by_id[shift_id]):
+    for (planning_unit_id, iso_week, shift_id), days in ctx.variable_index.by_unit_week_shift.items():
+        if shift_id not in intermediate_shift_ids:
             continue
 
-        iso_year, iso_week = assignment_date.isocalendar()[:2]
-        grouped[planning_unit_id][(iso_year, iso_week)][assignment_date].append(variable)
-        active_weeks.add((planning_unit_id, (iso_year, iso_week)))
-
-    clean_grouped = {p_id: {week: dict(days) for week, days in weeks.items()} for p_id, weeks in grouped.items()}
+        for assignment_date, variables in days.items():
+            grouped[(planning_unit_id, iso_week)][assignment_date].extend(variables)
 
-    return clean_grouped, active_weeks
+    return {unit_week: dict(days) for unit_week, days in grouped.items()}
 
 
 def _group_actual_shifts(
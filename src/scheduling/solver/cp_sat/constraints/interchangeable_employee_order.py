@@ -0,0 +1,136 @@
+import datetime
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Any, ClassVar
+
+from ortools.sat.python import cp_model
+
+from scheduling.domain import EmployeeId, PlanningUnitId, ShiftId, StaffLevel
+from scheduling.solver.audit import AuditFinding
+from scheduling.solver.cp_sat.context import AuditContext, SolverContext
+from scheduling.solver.diagnostics import DiagnosticSeverity, SolverDiagnostic
+from scheduling.solver.symmetry import interchangeable_employees
+
+type Slot = tuple[PlanningUnitId, ShiftId, StaffLevel]
+type DaySlots = dict[datetime.date, dict[Slot, cp_model.IntVar]]
+
+
+class InterchangeableEmployeeOrder:
+    """Break the symmetry between interchangeable employees.
+
+    Interchangeable employees can swap schedules without changing feasibility
+    or objective value, so only one order of their schedules is searched.
+    Each day of an employee reads as the position of the worked slot among
+    the day's slots, or zero when free, and within a class a lower employee
+    id gets the lexicographically larger sequence of days.
+
+    This is not a scheduling rule, so it is optional and never audited.
+    """
+
+    id: ClassVar[str] = "interchangeable_employee_order"
+    required: ClassVar[bool] = False
+
+    def add_to_model(
+        self,
+        ctx: SolverContext,
+        params: Mapping[str, Any],
+    ) -> tuple[SolverDiagnostic, ...]:
+        del params
+
+        days_by_employee: defaultdict[EmployeeId, DaySlots] = defaultdict(lambda: defaultdict(dict))
+
+        for (employee_id, planning_unit_id, day, shift_id, staff_level), variable in ctx.assignment_variables.items():
+            days_by_employee[employee_id][day][(planning_unit_id, shift_id, staff_level)] = variable
+
+        diagnostics: list[SolverDiagnostic] = []
+
+        for employee_ids in interchangeable_employees(ctx.dataset):
+            for before, after in zip(employee_ids, employee_ids[1:], strict=False):
+                before_days = days_by_employee.get(before, {})
+                after_days = days_by_employee.get(after, {})
+
+                if _slot_layout(before_days) != _slot_layout(after_days):
+                    diagnostics.append(
+                        SolverDiagnostic(
+                            code="interchangeable_employee_order.different_slots",
+                            severity=DiagnosticSeverity.INFO,
+                            message=(
+                                "Interchangeable employees have different assignment slots and stay unordered. "
+                                f"employee_ids={before},{after}."
+                            ),
+                        )
+                    )
+                    continue
+
+                _add_lexicographic_order(ctx, before, after, before_days=before_days, after_days=after_days)
+
+        return tuple(diagnostics)
+
+    def audit(
+        self,
+        ctx: AuditContext,
+        params: Mapping[str, Any],
+    ) -> tuple[AuditFinding, ...]:
+        return ()
+
+
+def _slot_layout(days: DaySlots) -> dict[datetime.date, frozenset[Slot]]:
+    return {day: frozenset(slots) for day, slots in days.items() if slots}
+
+
+def _add_lexicographic_order(
+    ctx: SolverContext,
+    before: EmployeeId,
+    after: EmployeeId,
+    *,
+    before_days: DaySlots,
+    after_days: DaySlots,
+) -> None:
+    """Require the days of ``before`` to be lexicographically at least those of ``after``.
+
+    ``equal`` is one while every earlier day was equal; it may only be zero
+    once ``before`` was larger on an earlier day.
+    """
+    equal: cp_model.IntVar | None = None
+    days = sorted(day for day, slots in before_days.items() if slots)
+
+    for position, day in enumerate(days):
+        slots = sorted(before_days[day])
+        slot_count = len(slots)
+        difference = cp_model.LinearExpr.constant(0)
+
+        for value, slot in enumerate(slots, start=1):
+            difference += value * before_days[day][slot] - value * after_days[day][slot]
+
+        if equal is None:
+            ctx.names.name_constraint(ctx.model.add(difference >= 0), _constraint_name, before, after, day)
+        else:
+            ctx.names.name_constraint(
+                ctx.model.add(difference >= slot_count * equal - slot_count), _constraint_name, before, after, day
+            )
+
+        if position == len(days) - 1:
+            break
+
+        next_equal = ctx.names.new_bool_var(_equal_name, before, after, day)
+
+        if equal is None:
+            ctx.names.name_constraint(ctx.model.add(next_equal >= 1 - difference), _equal_name, before, after, day)
+        else:
+            ctx.names.name_constraint(
+                ctx.model.add(next_equal >= (slot_count + 1) * equal - difference - slot_count),
+                _equal_name,
+                before,
+                after,
+                day,
+            )
+
+        equal = next_equal
+
+
+def _constraint_name(before: EmployeeId, after: EmployeeId, day: datetime.date) -> str:
+    return f"interchangeable_employee_order__emp_{before}_{after}__date_{day:%Y%m%d}"
+
+
+def _equal_name(before: EmployeeId, after: EmployeeId, day: datetime.date) -> str:
+    return f"interchangeable_employee_order__equal__emp_{before}_{after}__date_{day:%Y%m%d}"
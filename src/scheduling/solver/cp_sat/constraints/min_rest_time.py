@@ -45,7 +45,7 @@ class MinimumRestTime:
 
             # Entkoppeltes Method-Chaining zur Vermeidung von Linter-Warnungen
             constraint = ctx.model.add(sum_late + sum_early <= 1)
-            constraint.with_name(_constraint_name(employee_id, date))
+            ctx.names.name_constraint(constraint, _constraint_name, employee_id, date)
 
         return ()
 
@@ -95,13 +95,14 @@ def _group_vars(
     late_vars: defaultdict[tuple[int, datetime.date], list[cp_model.IntVar]] = defaultdict(list)
     early_vars: defaultdict[tuple[int, datetime.date], list[cp_model.IntVar]] = defaultdict(list)
 
-    for key, variable in ctx.assignment_variables.items():
-        employee_id, _, assignment_date, shift_id, _ = key
+    late_shift_ids = {shift_id for shift_id, shift in ctx.index.shifts_by_id.items() if is_late_shift(shift)}
+    early_shift_ids = {shift_id for shift_id, shift in ctx.index.shifts_by_id.items() if is_early_shift(shift)}
 
-        if is_late_shift(ctx.index.shifts_by_id[shift_id]):
-            late_vars[(employee_id, assignment_date)].append(variable)
-        elif is_early_shift(ctx.index.shifts_by_id[shift_id]):
-            early_vars[(employee_id, assignment_date)].append(variable)
+    for (employee_id, assignment_date, shift_id), variables in ctx.variable_index.by_employee_date_shift.items():
+        if shift_id in late_shift_ids:
+            late_vars[(employee_id, assignment_date)].extend(variables)
+        elif shift_id in early_shift_ids:
+            early_vars[(employee_id, assignment_date)].extend(variables)
 
     return dict(late_vars), dict(early_vars)
 
@@ -2,11 +2,9 @@ from collections import defaultdict
 from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from ortools.sat.python import cp_model
-
 from scheduling.solver.audit import AuditFinding, AuditSeverity
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
-from scheduling.solver.cp_sat.keys import AssignmentVariableKey, DemandKey
+from scheduling.solver.cp_sat.keys import DemandKey
 from scheduling.solver.diagnostics import DiagnosticSeverity, SolverDiagnostic
 
 
@@ -26,7 +24,7 @@ class MinimumStaffing:
     ) -> tuple[SolverDiagnostic, ...]:
         del params
         diagnostics: list[SolverDiagnostic] = []
-        vars_by_demand = _group_vars_by_demand(ctx)
+        vars_by_demand = ctx.variable_index.by_demand
 
         for demand_key, required_count in ctx.index.required_count_by_demand_key.items():
             variables = vars_by_demand.get(demand_key, [])
@@ -40,7 +38,9 @@ class MinimumStaffing:
                     )
                 )
 
-            ctx.model.add(sum(variables) >= required_count).with_name(_minimum_staffing_constraint_name(demand_key))
+            ctx.names.name_constraint(
+                ctx.model.add(sum(variables) >= required_count), _minimum_staffing_constraint_name, demand_key
+            )
 
         return tuple(diagnostics)
 
@@ -92,22 +92,6 @@ def _minimum_staffing_constraint_name(demand_key: DemandKey) -> str:
     )
 
 
-def _group_vars_by_demand(
-    ctx: SolverContext,
-) -> dict[DemandKey, list[cp_model.IntVar]]:
-    grouped: defaultdict[DemandKey, list[cp_model.IntVar]] = defaultdict(list)
-
-    for key, variable in ctx.assignment_variables.items():
-        grouped[_demand_key_from_assignment_key(key)].append(variable)
-
-    return dict(grouped)
-
-
-def _demand_key_from_assignment_key(key: AssignmentVariableKey) -> DemandKey:
-    _, planning_unit_id, assignment_date, shift_id, staff_level = key
-    return planning_unit_id, assignment_date, shift_id, staff_level
-
-
 def _not_enough_candidates_diagnostic(
     *,
     demand_key: DemandKey,
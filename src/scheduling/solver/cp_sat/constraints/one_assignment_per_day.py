@@ -3,8 +3,6 @@ from collections import defaultdict
 from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from ortools.sat.python import cp_model
-
 from scheduling.solver.audit import AuditFinding, AuditSeverity
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
 from scheduling.solver.diagnostics import SolverDiagnostic
@@ -23,10 +21,12 @@ class OneAssignmentPerDay:
     ) -> tuple[SolverDiagnostic, ...]:
         del params
 
-        vars_by_employee_date = _group_vars_by_employee_date(ctx)
+        vars_by_employee_date = ctx.variable_index.by_employee_date
 
         for (employee_id, assignment_date), variables in vars_by_employee_date.items():
-            ctx.model.add(sum(variables) <= 1).with_name(_constraint_name(employee_id, assignment_date))
+            ctx.names.name_constraint(
+                ctx.model.add(sum(variables) <= 1), _constraint_name, employee_id, assignment_date
+            )
 
         return ()
 
@@ -67,18 +67,6 @@ def _constraint_name(employee_id: int, date: datetime.date) -> str:
     return f"one_assignment_per_day__emp_{employee_id}__date_{date:%Y%m%d}"
 
 
-def _group_vars_by_employee_date(
-    ctx: SolverContext,
-) -> dict[tuple[int, datetime.date], list[cp_model.IntVar]]:
-    grouped: defaultdict[tuple[int, datetime.date], list[cp_model.IntVar]] = defaultdict(list)
-
-    for key, variable in ctx.assignment_variables.items():
-        employee_id, _, assignment_date, _, _ = key
-        grouped[(employee_id, assignment_date)].append(variable)
-
-    return dict(grouped)
-
-
 def _count_actual_assignments_by_employee_date(
     ctx: AuditContext,
 ) -> dict[tuple[int, datetime.date], int]:
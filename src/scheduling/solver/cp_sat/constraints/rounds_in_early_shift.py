@@ -48,7 +48,7 @@ class RoundsInEarlyShift:
 
             # Entkoppeltes Method-Chaining für Linter-Sicherheit
             constraint = ctx.model.add(sum_expr >= 1)
-            constraint.with_name(_constraint_name(date))
+            ctx.names.name_constraint(constraint, _constraint_name, date)
 
         return tuple(diagnostics)
 
@@ -101,17 +101,21 @@ def _group_vars(
     ctx: SolverContext,
 ) -> tuple[dict[datetime.date, list[cp_model.IntVar]], set[datetime.date]]:
     grouped: defaultdict[datetime.date, list[cp_model.IntVar]] = defaultdict(list)
-    active_weekdays: set[datetime.date] = set()
+    variable_index = ctx.variable_index
+
+    # .isoweekday() gibt 1 (Montag) bis 7 (Sonntag) zurück
+    active_weekdays = {
+        assignment_date for _, assignment_date in variable_index.by_employee_date if assignment_date.isoweekday() <= 5
+    }
 
-    for key, variable in ctx.assignment_variables.items():
-        employee_id, _, assignment_date, shift_id, _ = key
+    early_shift_ids = {shift_id for shift_id, shift in ctx.index.shifts_by_id.items() if is_early_shift(shift)}
 
-        # .isoweekday() gibt 1 (Montag) bis 7 (Sonntag) zurück
-        if assignment_date.isoweekday() <= 5:
-            active_weekdays.add(assignment_date)
+    for (employee_id, assignment_date, shift_id), variables in variable_index.by_employee_date_shift.items():
+        if assignment_date not in active_weekdays or shift_id not in early_shift_ids:
+            continue
 
-            if is_early_shift(ctx.index.shifts_by_id[shift_id]) and _is_qualified_for_rounds(ctx, employee_id):
-                grouped[assignment_date].append(variable)
+        if _is_qualified_for_rounds(ctx, employee_id):
+            grouped[assignment_date].extend(variables)
 
     return dict(grouped), active_weekdays
 
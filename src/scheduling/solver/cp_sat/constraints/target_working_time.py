@@ -52,8 +52,12 @@ class TargetWorkingTime:
             upper_limit = target_net + tolerance_more
             lower_limit = target_net - tolerance_less
 
-            ctx.model.add(total_work_expr <= upper_limit).with_name(f"target_work_upper__emp_{employee_id}")
-            ctx.model.add(total_work_expr >= lower_limit).with_name(f"target_work_lower__emp_{employee_id}")
+            ctx.names.name_constraint(
+                ctx.model.add(total_work_expr <= upper_limit), _constraint_name, "upper", employee_id
+            )
+            ctx.names.name_constraint(
+                ctx.model.add(total_work_expr >= lower_limit), _constraint_name, "lower", employee_id
+            )
 
         return ()
 
@@ -111,12 +115,10 @@ def _group_weighted_vars(ctx: SolverContext) -> dict[int, list[cp_model.LinearEx
     # Mapping für schnellen Zugriff auf Schichtdauern
     shift_durations = {s.shift_id: s.net_work_minutes for s in ctx.dataset.shifts}
 
-    for key, variable in ctx.assignment_variables.items():
-        employee_id, _, _, shift_id, _ = key
-
+    for (employee_id, shift_id), variables in ctx.variable_index.by_employee_shift.items():
         # Falls Schicht nicht in Dataset (sollte nicht passieren), Dauer 0
         duration = shift_durations.get(shift_id, 0)
-        exprs[employee_id].append(variable * duration)
+        exprs[employee_id].append(cp_model.LinearExpr.Sum(variables) * duration)  # type: ignore
 
     return dict(exprs)
 
@@ -131,3 +133,7 @@ def _group_actual_durations(ctx: AuditContext) -> dict[int, int]:
             durations[assignment.employee_id] += shift_durations.get(assignment.shift_id, 0)
 
     return dict(durations)
+
+
+def _constraint_name(bound: str, employee_id: int) -> str:
+    return f"target_work_{bound}__emp_{employee_id}"
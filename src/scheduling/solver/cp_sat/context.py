@@ -1,10 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date, timedelta
 
 from ortools.sat.python import cp_model
 
 from scheduling.domain import SchedulingDataset
 from scheduling.domain.assignment import Assignment
-from scheduling.solver.cp_sat.keys import AssignmentVariableKey
+from scheduling.solver.cp_sat.derived import DerivedLiterals
+from scheduling.solver.cp_sat.naming import ModelNames, ModelNaming
+from scheduling.solver.cp_sat.variable_index import AssignmentVariableIndex, build_assignment_variable_index
+from scheduling.solver.cp_sat.variable_store import AssignmentVariableStore
 from scheduling.solver.diagnostics import SolverDiagnostic
 from scheduling.solver.index import SolverIndex, build_schedule_index
 
@@ -14,23 +18,71 @@ class SolverContext:
     dataset: SchedulingDataset
     index: SolverIndex
     model: cp_model.CpModel
-    assignment_variables: dict[AssignmentVariableKey, cp_model.IntVar]
+    assignment_variables: AssignmentVariableStore
     diagnostics: list[SolverDiagnostic]
+    names: ModelNames
+    _variable_index: AssignmentVariableIndex | None = field(default=None, init=False, repr=False)
+    _derived: DerivedLiterals | None = field(default=None, init=False, repr=False)
 
+    @property
+    def variable_index(self) -> AssignmentVariableIndex:
+        """Grouped assignment variables, built on first use and then shared.
 
-def create_context(dataset: SchedulingDataset) -> SolverContext:
+        The index is rebuilt if assignment variables changed after it was
+        materialized, so components never see a stale grouping.
+        """
+        if self._variable_index is None or self._variable_index.revision != self.assignment_variables.revision:
+            self._variable_index = build_assignment_variable_index(
+                assignment_variables=self.assignment_variables,
+                shifts_by_id=self.index.shifts_by_id,
+            )
+
+        return self._variable_index
+
+    @property
+    def derived(self) -> DerivedLiterals:
+        """Shared worked and free literals, created on first request per key.
+
+        The registry starts over when the variable index is rebuilt, so no
+        literal aggregates a stale set of assignment variables.
+        """
+        variable_index = self.variable_index
+
+        if self._derived is None or self._derived.revision != variable_index.revision:
+            self._derived = DerivedLiterals(model=self.model, names=self.names, variable_index=variable_index)
+
+        return self._derived
+
+
+def create_context(
+    dataset: SchedulingDataset,
+    *,
+    model_naming: ModelNaming = ModelNaming.NAMED,
+) -> SolverContext:
     """Create the mutable CP-SAT build context for a scheduling dataset."""
     index = build_schedule_index(dataset)
+    model = cp_model.CpModel()
 
     return SolverContext(
         dataset=dataset,
         index=index,
-        model=cp_model.CpModel(),
-        assignment_variables={},
+        model=model,
+        assignment_variables=AssignmentVariableStore(
+            model=model,
+            dates=_planning_dates(dataset),
+            shift_ids=sorted(index.shifts_by_id),
+        ),
         diagnostics=[],
+        names=ModelNames(model=model, mode=model_naming),
     )
 
 
+def _planning_dates(dataset: SchedulingDataset) -> tuple[date, ...]:
+    day_count = (dataset.planning_month.end - dataset.planning_month.start).days + 1
+
+    return tuple(dataset.planning_month.start + timedelta(days=offset) for offset in range(day_count))
+
+
 @dataclass(frozen=True, slots=True)
 class AuditContext:
     """Post-solve context passed to constraints and objectives for audit."""
@@ -0,0 +1,128 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+
+from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model_helper import Literal
+
+from scheduling.domain import EmployeeId, ShiftId, ShiftType
+from scheduling.solver.cp_sat.keys import EmployeeDateKey, EmployeeDateShiftKey, EmployeeDateShiftTypeKey
+from scheduling.solver.cp_sat.naming import ModelNames
+from scheduling.solver.cp_sat.variable_index import AssignmentVariableIndex
+
+
+@dataclass(slots=True)
+class DerivedLiterals:
+    """Canonical worked and free literals over the assignment variables of one build.
+
+    Each literal is created on first request and then shared, so constraints
+    and objectives that look at the same employee day reuse one literal
+    instead of adding their own aggregation. A group with a single assignment
+    variable is that variable, and an empty group is constant false.
+    """
+
+    model: cp_model.CpModel
+    names: ModelNames
+    variable_index: AssignmentVariableIndex
+    _works: dict[EmployeeDateKey, cp_model.IntVar] = field(
+        default_factory=dict[EmployeeDateKey, cp_model.IntVar], init=False, repr=False
+    )
+    _works_shift: dict[EmployeeDateShiftKey, cp_model.IntVar] = field(
+        default_factory=dict[EmployeeDateShiftKey, cp_model.IntVar], init=False, repr=False
+    )
+    _works_type: dict[EmployeeDateShiftTypeKey, cp_model.IntVar] = field(
+        default_factory=dict[EmployeeDateShiftTypeKey, cp_model.IntVar], init=False, repr=False
+    )
+    _free: dict[EmployeeDateKey, Literal] = field(
+        default_factory=dict[EmployeeDateKey, Literal], init=False, repr=False
+    )
+
+    @property
+    def revision(self) -> int:
+        return self.variable_index.revision
+
+    def works(self, employee_id: EmployeeId, day: date) -> cp_model.IntVar:
+        """One exactly when the employee has any assignment on the day."""
+        key = (employee_id, day)
+        literal = self._works.get(key)
+
+        if literal is None:
+            literal = self._works[key] = self._any(
+                self.variable_index.by_employee_date.get(key, ()),
+                _works_name,
+                employee_id,
+                day,
+            )
+
+        return literal
+
+    def works_shift(self, employee_id: EmployeeId, day: date, shift_id: ShiftId) -> cp_model.IntVar:
+        """One exactly when the employee works the shift on the day, in any planning unit."""
+        key = (employee_id, day, shift_id)
+        literal = self._works_shift.get(key)
+
+        if literal is None:
+            literal = self._works_shift[key] = self._any(
+                self.variable_index.by_employee_date_shift.get(key, ()),
+                _works_shift_name,
+                employee_id,
+                day,
+                shift_id,
+            )
+
+        return literal
+
+    def works_type(self, employee_id: EmployeeId, day: date, shift_type: ShiftType) -> cp_model.IntVar:
+        """One exactly when the employee works a shift of the type on the day."""
+        key = (employee_id, day, shift_type)
+        literal = self._works_type.get(key)
+
+        if literal is None:
+            literal = self._works_type[key] = self._any(
+                self.variable_index.by_employee_date_shift_type.get(key, ()),
+                _works_type_name,
+                employee_id,
+                day,
+                shift_type,
+            )
+
+        return literal
+
+    def free(self, employee_id: EmployeeId, day: date) -> Literal:
+        """Negation of ``works``; needs no variable or constraint of its own."""
+        key = (employee_id, day)
+        literal = self._free.get(key)
+
+        if literal is None:
+            literal = self._free[key] = self.works(employee_id, day).Not()
+
+        return literal
+
+    def _any[*Ts](
+        self,
+        variables: Sequence[cp_model.IntVar],
+        format_name: Callable[[*Ts], str],
+        *args: *Ts,
+    ) -> cp_model.IntVar:
+        if not variables:
+            return self.model.new_constant(0)
+
+        if len(variables) == 1:
+            return variables[0]
+
+        literal = self.names.new_bool_var(format_name, *args)
+        self.names.name_constraint(self.model.add_max_equality(literal, variables), format_name, *args)
+
+        return literal
+
+
+def _works_name(employee_id: EmployeeId, day: date) -> str:
+    return f"works_e{employee_id}_d{day:%Y%m%d}"
+
+
+def _works_shift_name(employee_id: EmployeeId, day: date, shift_id: ShiftId) -> str:
+    return f"works_e{employee_id}_d{day:%Y%m%d}_s{shift_id}"
+
+
+def _works_type_name(employee_id: EmployeeId, day: date, shift_type: ShiftType) -> str:
+    return f"works_e{employee_id}_d{day:%Y%m%d}_t{shift_type}"
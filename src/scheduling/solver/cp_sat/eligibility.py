@@ -1,21 +1,76 @@
+from collections.abc import Collection, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import date
 
+import numpy as np
+import numpy.typing as npt
+
 from scheduling.domain.availability import AvailabilityType
-from scheduling.domain.employee import Employee, StaffLevel
+from scheduling.domain.employee import Employee, EmployeeId, StaffLevel
 from scheduling.domain.planning_unit import PlanningUnitId
 from scheduling.domain.shift import ShiftId
+from scheduling.solver.cp_sat.keys import AssignmentVariableKey, EmployeeDateShiftKey, MembershipKey
 from scheduling.solver.index import SolverIndex
 
+_HARD_BLOCKERS = frozenset(
+    {
+        AvailabilityType.UNAVAILABLE,
+        AvailabilityType.VACATION,
+        AvailabilityType.TRAINING,
+        AvailabilityType.FREE_DAY,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EligibilityMatrix:
+    """Hard eligibility of all generated assignment slots of one build.
 
-def eligible_staff_levels_for_assignment_slot(
+    ``eligible[row, day, shift, level]`` is true when the employee-unit
+    membership row may work the shift on the day under the staff level.
+    Rows are ordered by planning unit, then by employee dataset order.
+    """
+
+    memberships: tuple[MembershipKey, ...]
+    dates: tuple[date, ...]
+    shift_ids: tuple[ShiftId, ...]
+    staff_levels: tuple[StaffLevel, ...]
+    unit_codes: npt.NDArray[np.int64]
+    eligible: npt.NDArray[np.bool_]
+
+    def slots(self) -> Iterator[AssignmentVariableKey]:
+        """Yield eligible slots by planning unit, date, shift, employee, and staff level."""
+        rows, days, shifts, levels = np.nonzero(self.eligible)
+        order = np.lexsort((levels, rows, shifts, days, self.unit_codes[rows]))
+
+        for row, day, shift, level in zip(
+            rows[order].tolist(),
+            days[order].tolist(),
+            shifts[order].tolist(),
+            levels[order].tolist(),
+            strict=True,
+        ):
+            employee_id, planning_unit_id = self.memberships[int(row)]
+
+            yield (
+                employee_id,
+                planning_unit_id,
+                self.dates[day],
+                self.shift_ids[shift],
+                self.staff_levels[level],
+            )
+
+
+def build_eligibility_matrix(
     *,
-    employee: Employee,
-    planning_unit_id: PlanningUnitId,
-    assignment_date: date,
-    shift_id: ShiftId,
+    employees: Sequence[Employee],
+    planning_unit_ids: Sequence[PlanningUnitId],
+    dates: Sequence[date],
+    shift_ids: Sequence[ShiftId],
     index: SolverIndex,
-) -> tuple[StaffLevel, ...]:
-    """Return staff levels under which an employee may work one generated slot.
+    excluded_slots: Collection[EmployeeDateShiftKey] = (),
+) -> EligibilityMatrix:
+    """Compute which staff levels each employee may work in every generated slot.
 
     Temporary migration behavior:
     imported TimeOffice assignments are intentionally ignored by the solver for now.
@@ -25,93 +80,137 @@ def eligible_staff_levels_for_assignment_slot(
     - employee must have an active membership in the planning unit
     - employee must not be blocked by hard availability
     - AVAILABLE_ONLY restrictions must include the target shift
+    - the slot must not be excluded by a constraint (``excluded_slots``)
 
     Future hard rules belong here too:
     - shared/jump-pool eligibility
     - qualifications
     - legal hard constraints that can safely pre-filter slots
     """
-    if _is_blocked_by_availability(
-        employee=employee,
-        assignment_date=assignment_date,
-        shift_id=shift_id,
-        index=index,
-    ):
-        return ()
+    employee_positions = {employee.employee_id: position for position, employee in enumerate(employees)}
+    unit_positions = {planning_unit_id: position for position, planning_unit_id in enumerate(planning_unit_ids)}
+    staff_levels = tuple(sorted(StaffLevel, key=lambda staff_level: staff_level.value))
+
+    memberships = tuple(
+        sorted(
+            (
+                key
+                for key in index.memberships_by_employee_unit
+                if key[0] in employee_positions and key[1] in unit_positions
+            ),
+            key=lambda key: (unit_positions[key[1]], employee_positions[key[0]]),
+        )
+    )
 
-    return _active_membership_staff_levels(
-        employee=employee,
-        planning_unit_id=planning_unit_id,
-        assignment_date=assignment_date,
+    membership_levels = _active_membership_levels(
+        memberships=memberships,
+        dates=dates,
+        staff_levels=staff_levels,
+        index=index,
+    )
+    allowed_shifts = _allowed_shifts(
+        employee_positions=employee_positions,
+        dates=dates,
+        shift_ids=shift_ids,
         index=index,
     )
+    _exclude_slots(
+        allowed_shifts,
+        excluded_slots=excluded_slots,
+        employee_positions=employee_positions,
+        dates=dates,
+        shift_ids=shift_ids,
+    )
+    row_employees = np.array([employee_positions[employee_id] for employee_id, _ in memberships], dtype=np.int64)
+
+    return EligibilityMatrix(
+        memberships=memberships,
+        dates=tuple(dates),
+        shift_ids=tuple(shift_ids),
+        staff_levels=staff_levels,
+        unit_codes=np.array([unit_positions[planning_unit_id] for _, planning_unit_id in memberships], dtype=np.int64),
+        eligible=membership_levels[:, :, np.newaxis, :] & allowed_shifts[row_employees][:, :, :, np.newaxis],
+    )
 
 
-def _active_membership_staff_levels(
+def _active_membership_levels(
     *,
-    employee: Employee,
-    planning_unit_id: PlanningUnitId,
-    assignment_date: date,
+    memberships: Sequence[MembershipKey],
+    dates: Sequence[date],
+    staff_levels: Sequence[StaffLevel],
     index: SolverIndex,
-) -> tuple[StaffLevel, ...]:
-    memberships = index.memberships_by_employee_unit.get(
-        (employee.employee_id, planning_unit_id),
-        [],
-    )
+) -> npt.NDArray[np.bool_]:
+    """Return a ``(row, day, level)`` mask of active membership intervals."""
+    level_positions = {staff_level: position for position, staff_level in enumerate(staff_levels)}
+    day_numbers = np.array([day.toordinal() for day in dates], dtype=np.int64)
+    active_levels = np.zeros((len(memberships), len(dates), len(staff_levels)), dtype=np.bool_)
 
-    staff_levels = {
-        membership.staff_level
-        for membership in memberships
-        if _date_in_interval(
-            assignment_date,
-            valid_from=membership.valid_from,
-            valid_until=membership.valid_until,
-        )
-    }
+    for row, key in enumerate(memberships):
+        for membership in index.memberships_by_employee_unit[key]:
+            active = day_numbers >= membership.valid_from.toordinal()
 
-    return tuple(sorted(staff_levels, key=lambda staff_level: staff_level.value))
+            if membership.valid_until is not None:
+                active &= day_numbers <= membership.valid_until.toordinal()
 
+            active_levels[row, :, level_positions[membership.staff_level]] |= active
 
-def _date_in_interval(
-    target_date: date,
-    *,
-    valid_from: date,
-    valid_until: date | None,
-) -> bool:
-    return target_date >= valid_from and (valid_until is None or target_date <= valid_until)
+    return active_levels
 
 
-def _is_blocked_by_availability(
+def _allowed_shifts(
     *,
-    employee: Employee,
-    assignment_date: date,
-    shift_id: ShiftId,
+    employee_positions: dict[EmployeeId, int],
+    dates: Sequence[date],
+    shift_ids: Sequence[ShiftId],
     index: SolverIndex,
-) -> bool:
-    availability_items = index.availability_by_employee_date.get(
-        (employee.employee_id, assignment_date),
-        [],
-    )
+) -> npt.NDArray[np.bool_]:
+    """Return an ``(employee, day, shift)`` mask of shifts not blocked by availability."""
+    day_positions = {day: position for position, day in enumerate(dates)}
+    shift_id_array = np.array(shift_ids, dtype=np.int64)
+    allowed = np.ones((len(employee_positions), len(dates), len(shift_ids)), dtype=np.bool_)
 
-    hard_blockers = {
-        AvailabilityType.UNAVAILABLE,
-        AvailabilityType.VACATION,
-        AvailabilityType.TRAINING,
-        AvailabilityType.FREE_DAY,
-    }
+    for (employee_id, availability_date), availability_items in index.availability_by_employee_date.items():
+        employee = employee_positions.get(employee_id)
+        day = day_positions.get(availability_date)
 
-    if any(item.availability_type in hard_blockers for item in availability_items):
-        return True
+        if employee is None or day is None:
+            continue
 
-    available_only_items = [
-        item for item in availability_items if item.availability_type == AvailabilityType.AVAILABLE_ONLY
-    ]
+        if any(item.availability_type in _HARD_BLOCKERS for item in availability_items):
+            allowed[employee, day, :] = False
+            continue
 
-    if not available_only_items:
-        return False
+        available_only_items = [
+            item for item in availability_items if item.availability_type == AvailabilityType.AVAILABLE_ONLY
+        ]
 
-    allowed_shift_ids = {
-        allowed_shift_id for item in available_only_items for allowed_shift_id in (item.shift_ids or ())
-    }
+        if not available_only_items:
+            continue
 
-    return shift_id not in allowed_shift_ids
+        allowed_shift_ids = [
+            allowed_shift_id for item in available_only_items for allowed_shift_id in (item.shift_ids or ())
+        ]
+        allowed[employee, day, :] = np.isin(shift_id_array, allowed_shift_ids)
+
+    return allowed
+
+
+def _exclude_slots(
+    allowed: npt.NDArray[np.bool_],
+    *,
+    excluded_slots: Collection[EmployeeDateShiftKey],
+    employee_positions: dict[EmployeeId, int],
+    dates: Sequence[date],
+    shift_ids: Sequence[ShiftId],
+) -> None:
+    """Clear excluded slots in an ``(employee, day, shift)`` mask, ignoring unknown axes."""
+    day_positions = {day: position for position, day in enumerate(dates)}
+    shift_positions = {shift_id: position for position, shift_id in enumerate(shift_ids)}
+
+    for employee_id, excluded_date, shift_id in excluded_slots:
+        employee = employee_positions.get(employee_id)
+        day = day_positions.get(excluded_date)
+        shift = shift_positions.get(shift_id)
+
+        if employee is not None and day is not None and shift is not None:
+            allowed[employee, day, shift] = False
@@ -0,0 +1,52 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+from ortools.sat.python import cp_model
+
+from scheduling.domain import Assignment
+from scheduling.solver.cp_sat.context import SolverContext
+
+type _HintSlot = tuple[int, int | None, date, int]
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentHint:
+    """Assignment variables to hint as worked, plus hint assignments without a variable.
+
+    Unmatched assignments usually mean the employee, shift, or membership
+    changed since the hinted schedule was produced.
+    """
+
+    worked: tuple[cp_model.IntVar, ...]
+    unmatched_count: int
+
+
+def build_assignment_hint(ctx: SolverContext, assignments: Iterable[Assignment]) -> AssignmentHint:
+    """Match hinted assignments to assignment variables.
+
+    Each assignment matches at most one variable; if several staff levels
+    exist for the slot, the first created variable wins.
+    """
+    pending: set[_HintSlot] = {
+        (assignment.employee_id, assignment.planning_unit_id, assignment.date, assignment.shift_id)
+        for assignment in assignments
+    }
+    worked: list[cp_model.IntVar] = []
+
+    for key, variable in ctx.assignment_variables.items():
+        slot = key[:4]
+
+        if slot in pending:
+            pending.remove(slot)
+            worked.append(variable)
+
+    return AssignmentHint(worked=tuple(worked), unmatched_count=len(pending))
+
+
+def add_assignment_hint(ctx: SolverContext, hint: AssignmentHint) -> None:
+    """Hint every assignment variable: worked variables to 1, all others to 0."""
+    worked_indices = {variable.index for variable in hint.worked}
+
+    for variable in ctx.assignment_variables.values():
+        ctx.model.add_hint(variable, variable.index in worked_indices)
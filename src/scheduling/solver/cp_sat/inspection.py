@@ -5,6 +5,8 @@ from typing import Protocol, cast
 
 from ortools.sat.python import cp_model
 
+from scheduling.solver.cp_sat.naming import ModelNames, ModelNaming
+
 
 class _NamedProto(Protocol):
     name: str
@@ -30,36 +32,55 @@ class CpSatInspection:
         return self.validation_error is None
 
 
-def inspect_cp_sat_model(*, model: cp_model.CpModel) -> CpSatInspection:
+def inspect_cp_sat_model(*, model: cp_model.CpModel, names: ModelNames | None = None) -> CpSatInspection:
     """Inspect a built CP-SAT model without logging or mutating it.
 
     OR-Tools exposes CP-SAT protos through cp_model_helper pybind types.
     Those objects do not expose normal protobuf reflection methods like
     WhichOneof(), so constraint type counts are derived from model_stats().
+
+    Models built without names are expected to have unnamed constraints, so
+    they are not counted. KEYED builds resolve names from their side table.
     """
     proto = _model_proto_view(model)
     model_stats = model.model_stats()
 
-    constraint_names = tuple(_constraint_name(constraint) for constraint in proto.constraints)
+    constraint_names = tuple(
+        _constraint_name(constraint_index, constraint, names)
+        for constraint_index, constraint in enumerate(proto.constraints)
+    )
+    expects_names = names is None or names.mode == ModelNaming.NAMED
 
     return CpSatInspection(
         proto_variable_count=len(proto.variables),
         proto_constraint_count=len(proto.constraints),
         constraint_type_counts=_constraint_type_counts_from_model_stats(model_stats),
         constraint_names=constraint_names,
-        unnamed_constraint_count=sum(name == "<unnamed>" for name in constraint_names),
+        unnamed_constraint_count=sum(name == "<unnamed>" for name in constraint_names) if expects_names else 0,
         model_stats=model_stats,
         validation_error=model.validate() or None,
     )
 
 
+def proto_object_counts(model: cp_model.CpModel) -> tuple[int, int]:
+    """Return the number of proto variables and constraints in a model."""
+    proto = _model_proto_view(model)
+    return len(proto.variables), len(proto.constraints)
+
+
 def _model_proto_view(model: cp_model.CpModel) -> _CpModelProtoView:
     raw_proto: object = model.proto
     return cast(_CpModelProtoView, raw_proto)
 
 
-def _constraint_name(constraint: _NamedProto) -> str:
-    return constraint.name or "<unnamed>"
+def _constraint_name(constraint_index: int, constraint: _NamedProto, names: ModelNames | None) -> str:
+    if constraint.name:
+        return constraint.name
+
+    if names is not None:
+        return names.constraint_name(constraint_index) or "<unnamed>"
+
+    return "<unnamed>"
 
 
 def _constraint_type_counts_from_model_stats(model_stats: str) -> dict[str, int]:
@@ -2,11 +2,17 @@ from datetime import date
 
 from scheduling.domain.employee import EmployeeId, StaffLevel
 from scheduling.domain.planning_unit import PlanningUnitId
-from scheduling.domain.shift import ShiftId
+from scheduling.domain.shift import ShiftId, ShiftType
 
 type AssignmentVariableKey = tuple[EmployeeId, PlanningUnitId, date, ShiftId, StaffLevel]
 
 type DemandKey = tuple[PlanningUnitId, date, ShiftId, StaffLevel]
 
 type EmployeeDateKey = tuple[EmployeeId, date]
+type EmployeeShiftKey = tuple[EmployeeId, ShiftId]
+type EmployeeDateShiftKey = tuple[EmployeeId, date, ShiftId]
+type EmployeeDateShiftTypeKey = tuple[EmployeeId, date, ShiftType]
 type MembershipKey = tuple[EmployeeId, PlanningUnitId]
+
+type IsoWeek = tuple[int, int]
+type UnitWeekShiftKey = tuple[PlanningUnitId, IsoWeek, ShiftId]
@@ -0,0 +1,100 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from ortools.sat.python import cp_model
+
+type _NameKey = tuple[Callable[..., str], tuple[object, ...]]
+
+
+class ModelNaming(StrEnum):
+    """How CP-SAT variables and constraints are named during a build.
+
+    NAMED formats a readable name for everything and is meant for development.
+    KEYED leaves the proto unnamed but keeps a side table from proto index to
+    the name formatter and its semantic key, so names can still be resolved
+    for diagnostics. ANONYMOUS skips naming entirely for production builds.
+    """
+
+    NAMED = "named"
+    KEYED = "keyed"
+    ANONYMOUS = "anonymous"
+
+
+@dataclass(slots=True)
+class ModelNames:
+    """Create and name CP-SAT variables and constraints for one build.
+
+    Names are passed as a formatter plus its arguments, so nothing is
+    formatted unless the naming mode needs it.
+    """
+
+    model: cp_model.CpModel
+    mode: ModelNaming = ModelNaming.NAMED
+    _variable_keys: dict[int, _NameKey] = field(default_factory=dict[int, _NameKey], init=False, repr=False)
+    _constraint_keys: dict[int, _NameKey] = field(default_factory=dict[int, _NameKey], init=False, repr=False)
+
+    def new_bool_var[*Ts](self, format_name: Callable[[*Ts], str], *args: *Ts) -> cp_model.IntVar:
+        variable = self.model.new_bool_var(self._format(format_name, args))
+        self._remember(self._variable_keys, variable.index, format_name, args)
+
+        return variable
+
+    def new_int_var[*Ts](
+        self,
+        lower_bound: int,
+        upper_bound: int,
+        format_name: Callable[[*Ts], str],
+        *args: *Ts,
+    ) -> cp_model.IntVar:
+        variable = self.model.new_int_var(lower_bound, upper_bound, self._format(format_name, args))
+        self._remember(self._variable_keys, variable.index, format_name, args)
+
+        return variable
+
+    def name_constraint[*Ts](
+        self,
+        constraint: cp_model.Constraint,
+        format_name: Callable[[*Ts], str],
+        *args: *Ts,
+    ) -> cp_model.Constraint:
+        if self.mode == ModelNaming.NAMED:
+            constraint.with_name(format_name(*args))
+        else:
+            self._remember(self._constraint_keys, constraint.index, format_name, args)
+
+        return constraint
+
+    def variable_name(self, variable_index: int) -> str | None:
+        """Resolve the name of an unnamed variable from the KEYED side table."""
+        return _resolve(self._variable_keys, variable_index)
+
+    def constraint_name(self, constraint_index: int) -> str | None:
+        """Resolve the name of an unnamed constraint from the KEYED side table."""
+        return _resolve(self._constraint_keys, constraint_index)
+
+    def _format[*Ts](self, format_name: Callable[[*Ts], str], args: tuple[*Ts]) -> str:
+        if self.mode != ModelNaming.NAMED:
+            return ""
+
+        return format_name(*args)
+
+    def _remember[*Ts](
+        self,
+        keys: dict[int, _NameKey],
+        proto_index: int,
+        format_name: Callable[[*Ts], str],
+        args: tuple[*Ts],
+    ) -> None:
+        if self.mode == ModelNaming.KEYED:
+            keys[proto_index] = (format_name, args)
+
+
+def _resolve(keys: dict[int, _NameKey], proto_index: int) -> str | None:
+    key = keys.get(proto_index)
+
+    if key is None:
+        return None
+
+    format_name, args = key
+    return format_name(*args)
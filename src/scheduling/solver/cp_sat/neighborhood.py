@@ -0,0 +1,28 @@
+from ortools.sat.python import cp_model
+
+from scheduling.solver.cp_sat.context import SolverContext
+from scheduling.solver.cp_sat.hints import AssignmentHint
+from scheduling.solver.models import Neighborhood
+
+
+def fix_outside_neighborhood(ctx: SolverContext, neighborhood: Neighborhood, hint: AssignmentHint) -> int:
+    """Fix assignment variables outside the neighborhood to their hinted value.
+
+    Fixing narrows the variable domain instead of adding constraints, so
+    presolve removes the fixed part of the model up front. Returns the number
+    of fixed variables.
+    """
+    worked_indices = {variable.index for variable in hint.worked}
+    free_employee_ids = frozenset(neighborhood.employee_ids)
+    free_dates = neighborhood.free_dates()
+    fixed = 0
+
+    for (employee_id, _, assignment_date, _, _), variable in ctx.assignment_variables.items():
+        if employee_id in free_employee_ids or assignment_date in free_dates:
+            continue
+
+        value = int(variable.index in worked_indices)
+        variable.with_domain(cp_model.Domain(value, value))
+        fixed += 1
+
+    return fixed
@@ -27,9 +27,15 @@ class Objective(Protocol):
 
     Objectives may add helper variables/constraints, but they return raw
     penalties. Global weights are applied centrally by the model builder.
+
+    An objective is ``separable`` when its penalties are sums of terms that
+    each depend on one employee or one planning unit. Only then does solving
+    planning units that share no employees as separate models minimize the
+    same objective as a single model.
     """
 
     id: ClassVar[str]
+    separable: ClassVar[bool]
 
     def add_to_model(
         self,
@@ -1,4 +1,3 @@
-from collections import defaultdict
 from collections.abc import Mapping
 from datetime import date, timedelta
 from typing import Any, ClassVar
@@ -20,6 +19,7 @@ class EverySecondWeekendFree:
     """
 
     id: ClassVar[str] = "every_second_weekend_free"
+    separable: ClassVar[bool] = True
 
     def add_to_model(
         self,
@@ -33,23 +33,8 @@ class EverySecondWeekendFree:
         if len(weekends) < 2:
             return ()
 
-        assignment_variables_by_employee_and_date: defaultdict[
-            tuple[int, date],
-            list[cp_model.IntVar],
-        ] = defaultdict(list)
-
-        for (
-            employee_id,
-            _planning_unit_id,
-            assignment_date,
-            _shift_id,
-            _qualification_level,
-        ), variable in ctx.assignment_variables.items():
-            assignment_variables_by_employee_and_date[(employee_id, assignment_date)].append(variable)
-
-        employee_ids = sorted(
-            {employee_id for employee_id, _planning_unit_id, _date, _shift_id, _level in ctx.assignment_variables}
-        )
+        assignment_variables_by_employee_and_date = ctx.variable_index.by_employee_date
+        employee_ids = ctx.variable_index.employee_ids
 
         same_status_variables: list[cp_model.IntVar] = []
 
@@ -57,12 +42,11 @@ class EverySecondWeekendFree:
             weekend_free_variables: list[cp_model.IntVar] = []
 
             for weekend_index, (saturday, sunday) in enumerate(weekends):
-                weekend_assignment_variables = (
-                    assignment_variables_by_employee_and_date[(employee_id, saturday)]
-                    + assignment_variables_by_employee_and_date[(employee_id, sunday)]
-                )
+                weekend_assignment_variables = assignment_variables_by_employee_and_date.get(
+                    (employee_id, saturday), []
+                ) + assignment_variables_by_employee_and_date.get((employee_id, sunday), [])
 
-                weekend_worked = ctx.model.new_bool_var(f"esw_worked_e{employee_id}_w{weekend_index}")
+                weekend_worked = ctx.names.new_bool_var(_weekend_name, "worked", employee_id, weekend_index)
 
                 if weekend_assignment_variables:
                     ctx.model.add_max_equality(
@@ -72,7 +56,7 @@ class EverySecondWeekendFree:
                 else:
                     ctx.model.add(weekend_worked == 0)
 
-                weekend_free = ctx.model.new_bool_var(f"esw_free_e{employee_id}_w{weekend_index}")
+                weekend_free = ctx.names.new_bool_var(_weekend_name, "free", employee_id, weekend_index)
                 ctx.model.add(weekend_free + weekend_worked == 1)
 
                 weekend_free_variables.append(weekend_free)
@@ -81,13 +65,13 @@ class EverySecondWeekendFree:
                 current_weekend_free = weekend_free_variables[weekend_index]
                 next_weekend_free = weekend_free_variables[weekend_index + 1]
 
-                different_status = ctx.model.new_bool_var(f"esw_different_e{employee_id}_w{weekend_index}")
+                different_status = ctx.names.new_bool_var(_weekend_name, "different", employee_id, weekend_index)
                 ctx.model.add_abs_equality(
                     different_status,
                     current_weekend_free - next_weekend_free,
                 )
 
-                same_status = ctx.model.new_bool_var(f"esw_same_e{employee_id}_w{weekend_index}")
+                same_status = ctx.names.new_bool_var(_weekend_name, "same", employee_id, weekend_index)
                 ctx.model.add(same_status + different_status == 1)
 
                 same_status_variables.append(same_status)
@@ -95,11 +79,7 @@ class EverySecondWeekendFree:
         if not same_status_variables:
             return ()
 
-        total = ctx.model.new_int_var(
-            0,
-            len(same_status_variables),
-            "esw_total",
-        )
+        total = ctx.names.new_int_var(0, len(same_status_variables), _total_name)
         ctx.model.add(total == sum(same_status_variables))
 
         return (
@@ -130,3 +110,11 @@ class EverySecondWeekendFree:
 
     def audit(self, ctx: AuditContext, params: Mapping[str, Any]) -> tuple[AuditFinding, ...]:
         return ()
+
+
+def _weekend_name(status: str, employee_id: int, weekend_index: int) -> str:
+    return f"esw_{status}_e{employee_id}_w{weekend_index}"
+
+
+def _total_name() -> str:
+    return "esw_total"
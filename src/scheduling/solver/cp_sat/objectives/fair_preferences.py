@@ -4,6 +4,7 @@ from datetime import date
 from typing import Any, ClassVar
 
 from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model_helper import Literal
 
 from scheduling.domain import WishType
 from scheduling.solver.audit import AuditFinding
@@ -12,7 +13,7 @@ from scheduling.solver.cp_sat.objective import Penalty
 
 type EmployeeDateKey = tuple[int, date]
 type EmployeeDateShiftKey = tuple[int, date, int]
-type WeightedViolation = tuple[cp_model.IntVar, int]
+type WeightedViolation = tuple[Literal, int]
 
 
 class FairPreferencesObjective:
@@ -26,6 +27,7 @@ class FairPreferencesObjective:
     """
 
     id: ClassVar[str] = "fair_preferences"
+    separable: ClassVar[bool] = True
 
     def add_to_model(self, ctx: SolverContext, params: Mapping[str, Any]) -> tuple[Penalty, ...]:
         del params
@@ -33,20 +35,8 @@ class FairPreferencesObjective:
         if not ctx.assignment_variables:
             return ()
 
-        variables_by_employee_date: defaultdict[EmployeeDateKey, list[cp_model.IntVar]] = defaultdict(list)
-
-        variables_by_employee_date_shift: defaultdict[EmployeeDateShiftKey, list[cp_model.IntVar]] = defaultdict(list)
-
-        for (
-            employee_id,
-            _planning_unit_id,
-            assignment_date,
-            shift_id,
-            _staff_level,
-        ), variable in ctx.assignment_variables.items():
-            variables_by_employee_date[(employee_id, assignment_date)].append(variable)
-
-            variables_by_employee_date_shift[(employee_id, assignment_date, shift_id)].append(variable)
+        variables_by_employee_date = ctx.variable_index.by_employee_date
+        variables_by_employee_date_shift = ctx.variable_index.by_employee_date_shift
 
         free_wish_violations = self._free_wish_violations(
             ctx,
@@ -83,9 +73,10 @@ class FairPreferencesObjective:
     ) -> dict[int, list[WeightedViolation]]:
         violations_by_employee: defaultdict[int, list[WeightedViolation]] = defaultdict(list)
 
-        for wish_index, wish in enumerate(ctx.dataset.wishes):
+        for wish in ctx.dataset.wishes:
             assignment_variables: list[cp_model.IntVar]
             strike_count: int
+            shift_id: int | None = None
 
             if wish.type == WishType.FREE_DAY:
                 assignment_variables = variables_by_employee_date.get(
@@ -94,6 +85,7 @@ class FairPreferencesObjective:
                 )
                 strike_count = 3
             elif wish.type == WishType.FREE_SHIFT and wish.shift_id is not None:
+                shift_id = wish.shift_id
                 assignment_variables = variables_by_employee_date_shift.get(
                     (
                         wish.employee_id,
@@ -109,11 +101,7 @@ class FairPreferencesObjective:
             if not assignment_variables:
                 continue
 
-            violation = self._worked_variable(
-                ctx,
-                assignment_variables,
-                name=(f"fair_preferences__free_wish_{wish_index}__violated"),
-            )
+            violation = self._worked_literal(ctx, wish.employee_id, wish.date, shift_id)
 
             violations_by_employee[wish.employee_id].append((violation, strike_count))
 
@@ -128,9 +116,10 @@ class FairPreferencesObjective:
     ) -> dict[int, list[WeightedViolation]]:
         violations_by_employee: defaultdict[int, list[WeightedViolation]] = defaultdict(list)
 
-        for wish_index, wish in enumerate(ctx.dataset.wishes):
+        for wish in ctx.dataset.wishes:
             assignment_variables: list[cp_model.IntVar]
             strike_count: int
+            shift_id: int | None = None
 
             if wish.type == WishType.PREFERRED_DAY:
                 assignment_variables = variables_by_employee_date.get(
@@ -139,6 +128,7 @@ class FairPreferencesObjective:
                 )
                 strike_count = 3
             elif wish.type == WishType.PREFERRED_SHIFT and wish.shift_id is not None:
+                shift_id = wish.shift_id
                 assignment_variables = variables_by_employee_date_shift.get(
                     (
                         wish.employee_id,
@@ -154,15 +144,7 @@ class FairPreferencesObjective:
             if not assignment_variables:
                 continue
 
-            fulfilled = self._worked_variable(
-                ctx,
-                assignment_variables,
-                name=(f"fair_preferences__preferred_wish_{wish_index}__fulfilled"),
-            )
-
-            violation = ctx.model.new_bool_var(f"fair_preferences__preferred_wish_{wish_index}__violated")
-
-            ctx.model.add(violation + fulfilled == 1)
+            violation = self._worked_literal(ctx, wish.employee_id, wish.date, shift_id).Not()
 
             violations_by_employee[wish.employee_id].append((violation, strike_count))
 
@@ -183,10 +165,8 @@ class FairPreferencesObjective:
             if maximum_strikes == 0:
                 continue
 
-            total_strikes = ctx.model.new_int_var(
-                0,
-                maximum_strikes,
-                (f"fair_preferences__{wish_group}__employee_{employee_id}__total_strikes"),
+            total_strikes = ctx.names.new_int_var(
+                0, maximum_strikes, _employee_name, wish_group, employee_id, "total_strikes"
             )
 
             weighted_violations = [violation * strike_count for violation, strike_count in violations]
@@ -196,7 +176,7 @@ class FairPreferencesObjective:
             ctx.model.add(total_strikes == weighted_violation_sum)
 
             tier_variables = [
-                ctx.model.new_bool_var(f"fair_preferences__{wish_group}__employee_{employee_id}__tier_{tier}")
+                ctx.names.new_bool_var(_employee_name, wish_group, employee_id, "tier", tier)
                 for tier in range(1, maximum_strikes + 1)
             ]
 
@@ -221,10 +201,8 @@ class FairPreferencesObjective:
 
             maximum_tier_cost = sum(tier**3 for tier in range(1, maximum_strikes + 1))
 
-            total_tier_cost = ctx.model.new_int_var(
-                0,
-                maximum_tier_cost,
-                (f"fair_preferences__{wish_group}__employee_{employee_id}__total_tier_cost"),
+            total_tier_cost = ctx.names.new_int_var(
+                0, maximum_tier_cost, _employee_name, wish_group, employee_id, "total_tier_cost"
             )
 
             ctx.model.add(total_tier_cost == tier_cost_sum)
@@ -240,15 +218,12 @@ class FairPreferencesObjective:
         return tuple(penalties)
 
     @staticmethod
-    def _worked_variable(
-        ctx: SolverContext, assignment_variables: Sequence[cp_model.IntVar], *, name: str
-    ) -> cp_model.IntVar:
-        worked = ctx.model.new_bool_var(name)
-        ctx.model.add_max_equality(
-            worked,
-            list(assignment_variables),
-        )
-        return worked
+    def _worked_literal(ctx: SolverContext, employee_id: int, day: date, shift_id: int | None) -> Literal:
+        """Shared literal for working the wished day, or the wished shift when given."""
+        if shift_id is None:
+            return ctx.derived.works(employee_id, day)
+
+        return ctx.derived.works_shift(employee_id, day, shift_id)
 
     @staticmethod
     def _sum_linear_expressions(expressions: Sequence[cp_model.LinearExpr]) -> cp_model.LinearExpr:
@@ -264,3 +239,7 @@ class FairPreferencesObjective:
 
     def audit(self, ctx: AuditContext, params: Mapping[str, Any]) -> tuple[AuditFinding, ...]:
         return ()
+
+
+def _employee_name(wish_group: str, employee_id: int, *part: object) -> str:
+    return f"fair_preferences__{wish_group}__employee_{employee_id}__" + "_".join(map(str, part))
@@ -1,5 +1,4 @@
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping
 from datetime import date, timedelta
 from typing import Any, ClassVar
 
@@ -10,8 +9,6 @@ from scheduling.solver.audit import AuditFinding
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
 from scheduling.solver.cp_sat.objective import Penalty
 
-type EmployeeDateKey = tuple[int, date]
-
 
 class FreeDaysAfterNightShiftPhase:
     """Encourage two consecutive free days after a night-shift phase.
@@ -27,6 +24,7 @@ class FreeDaysAfterNightShiftPhase:
     """
 
     id: ClassVar[str] = "free_days_after_night_shift_phase"
+    separable: ClassVar[bool] = True
 
     def add_to_model(self, ctx: SolverContext, params: Mapping[str, Any]) -> tuple[Penalty, ...]:
         del params
@@ -34,48 +32,15 @@ class FreeDaysAfterNightShiftPhase:
         if not ctx.assignment_variables:
             return ()
 
-        night_shift_ids = {shift.shift_id for shift in ctx.dataset.shifts if shift.type == ShiftType.NIGHT}
-
-        if not night_shift_ids:
+        if not any(shift.type == ShiftType.NIGHT for shift in ctx.dataset.shifts):
             return ()
 
-        variables_by_employee_date: defaultdict[
-            EmployeeDateKey,
-            list[cp_model.IntVar],
-        ] = defaultdict(list)
-
-        night_variables_by_employee_date: defaultdict[
-            EmployeeDateKey,
-            list[cp_model.IntVar],
-        ] = defaultdict(list)
-
-        for (
-            employee_id,
-            _planning_unit_id,
-            assignment_date,
-            shift_id,
-            _staff_level,
-        ), variable in ctx.assignment_variables.items():
-            variables_by_employee_date[(employee_id, assignment_date)].append(variable)
-
-            if shift_id in night_shift_ids:
-                night_variables_by_employee_date[(employee_id, assignment_date)].append(variable)
+        variables_by_employee_date_and_type = ctx.variable_index.by_employee_date_shift_type
 
         planning_dates = self._planning_dates(ctx)
         planning_date_set = set(planning_dates)
 
-        employee_ids = sorted(
-            {
-                employee_id
-                for (
-                    employee_id,
-                    _planning_unit_id,
-                    _assignment_date,
-                    _shift_id,
-                    _staff_level,
-                ) in ctx.assignment_variables
-            }
-        )
+        employee_ids = ctx.variable_index.employee_ids
 
         penalties: list[cp_model.IntVar] = []
 
@@ -87,42 +52,14 @@ class FreeDaysAfterNightShiftPhase:
                 if next_date not in planning_date_set or second_next_date not in planning_date_set:
                     continue
 
-                night_variables = night_variables_by_employee_date.get(
-                    (employee_id, current_date),
-                    [],
-                )
-
-                if not night_variables:
+                if (employee_id, current_date, ShiftType.NIGHT) not in variables_by_employee_date_and_type:
                     continue
 
-                worked_night = self._worked_variable(
-                    ctx,
-                    night_variables,
-                    name=(f"fdansp__night_e{employee_id}__d{current_date}"),
-                )
-
-                worked_next_day = self._worked_or_zero(
-                    ctx,
-                    variables_by_employee_date.get(
-                        (employee_id, next_date),
-                        [],
-                    ),
-                    name=(f"fdansp__worked_next_e{employee_id}__d{current_date}"),
-                )
-
-                next_day_free = ctx.model.new_bool_var(f"fdansp__next_free_e{employee_id}__d{current_date}")
-                ctx.model.add(next_day_free + worked_next_day == 1)
+                worked_night = ctx.derived.works_type(employee_id, current_date, ShiftType.NIGHT)
+                next_day_free = ctx.derived.free(employee_id, next_date)
+                worked_second_next_day = ctx.derived.works(employee_id, second_next_date)
 
-                worked_second_next_day = self._worked_or_zero(
-                    ctx,
-                    variables_by_employee_date.get(
-                        (employee_id, second_next_date),
-                        [],
-                    ),
-                    name=(f"fdansp__worked_second_next_e{employee_id}__d{current_date}"),
-                )
-
-                penalty = ctx.model.new_bool_var(f"fdansp__penalty_e{employee_id}__d{current_date}")
+                penalty = ctx.names.new_bool_var(_penalty_name, employee_id, current_date)
 
                 # Boolean minimum is logical AND.
                 ctx.model.add_min_equality(
@@ -139,11 +76,7 @@ class FreeDaysAfterNightShiftPhase:
         if not penalties:
             return ()
 
-        total = ctx.model.new_int_var(
-            0,
-            len(penalties),
-            "fdansp__total",
-        )
+        total = ctx.names.new_int_var(0, len(penalties), _total_name)
         ctx.model.add(total == sum(penalties))
 
         return (
@@ -154,23 +87,6 @@ class FreeDaysAfterNightShiftPhase:
             ),
         )
 
-    @staticmethod
-    def _worked_variable(ctx: SolverContext, variables: Sequence[cp_model.IntVar], *, name: str) -> cp_model.IntVar:
-        worked = ctx.model.new_bool_var(name)
-        ctx.model.add_max_equality(worked, list(variables))
-        return worked
-
-    @classmethod
-    def _worked_or_zero(cls, ctx: SolverContext, variables: Sequence[cp_model.IntVar], *, name: str) -> cp_model.IntVar:
-        worked = ctx.model.new_bool_var(name)
-
-        if variables:
-            ctx.model.add_max_equality(worked, list(variables))
-        else:
-            ctx.model.add(worked == 0)
-
-        return worked
-
     @staticmethod
     def _planning_dates(ctx: SolverContext) -> tuple[date, ...]:
         dates: list[date] = []
@@ -186,3 +102,11 @@ class FreeDaysAfterNightShiftPhase:
 
     def audit(self, ctx: AuditContext, params: Mapping[str, Any]) -> tuple[AuditFinding, ...]:
         return ()
+
+
+def _penalty_name(employee_id: int, day: date) -> str:
+    return f"fdansp__penalty_e{employee_id}__d{day}"
+
+
+def _total_name() -> str:
+    return "fdansp__total"
@@ -1,16 +1,14 @@
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping
 from datetime import date, timedelta
 from typing import Any, ClassVar
 
 from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model_helper import Literal
 
 from scheduling.solver.audit import AuditFinding
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
 from scheduling.solver.cp_sat.objective import Penalty
 
-type EmployeeDateKey = tuple[int, date]
-
 _NEAR_WEEKEND_DAYS = frozenset({1, 5})
 
 
@@ -30,6 +28,7 @@ class FreeDaysNearWeekend:
     """
 
     id: ClassVar[str] = "free_days_near_weekend"
+    separable: ClassVar[bool] = True
 
     def add_to_model(self, ctx: SolverContext, params: Mapping[str, Any]) -> tuple[Penalty, ...]:
         del params
@@ -37,38 +36,13 @@ class FreeDaysNearWeekend:
         if not ctx.assignment_variables:
             return ()
 
-        variables_by_employee_date: defaultdict[
-            EmployeeDateKey,
-            list[cp_model.IntVar],
-        ] = defaultdict(list)
-
-        for (
-            employee_id,
-            _planning_unit_id,
-            assignment_date,
-            _shift_id,
-            _staff_level,
-        ), variable in ctx.assignment_variables.items():
-            variables_by_employee_date[(employee_id, assignment_date)].append(variable)
-
         planning_dates = self._planning_dates(ctx)
         planning_date_set = set(planning_dates)
 
-        employee_ids = sorted(
-            {
-                employee_id
-                for (
-                    employee_id,
-                    _planning_unit_id,
-                    _assignment_date,
-                    _shift_id,
-                    _staff_level,
-                ) in ctx.assignment_variables
-            }
-        )
+        employee_ids = ctx.variable_index.employee_ids
 
-        free_near_weekend_variables: list[cp_model.IntVar] = []
-        free_adjacent_variables: list[cp_model.IntVar] = []
+        free_near_weekend_variables: list[Literal] = []
+        free_adjacent_variables: list[Literal] = []
         free_both_variables: list[cp_model.IntVar] = []
 
         for employee_id in employee_ids:
@@ -81,25 +55,11 @@ class FreeDaysNearWeekend:
                 if adjacent_date not in planning_date_set:
                     continue
 
-                free_near_weekend = self._free_variable(
-                    ctx,
-                    variables_by_employee_date.get(
-                        (employee_id, current_date),
-                        [],
-                    ),
-                    name=(f"fdnw__free_near_e{employee_id}__d{current_date}"),
-                )
+                free_near_weekend = ctx.derived.free(employee_id, current_date)
 
-                free_adjacent = self._free_variable(
-                    ctx,
-                    variables_by_employee_date.get(
-                        (employee_id, adjacent_date),
-                        [],
-                    ),
-                    name=(f"fdnw__free_adjacent_e{employee_id}__d{current_date}"),
-                )
+                free_adjacent = ctx.derived.free(employee_id, adjacent_date)
 
-                free_both = ctx.model.new_bool_var(f"fdnw__free_both_e{employee_id}__d{current_date}")
+                free_both = ctx.names.new_bool_var(_free_both_name, employee_id, current_date)
 
                 ctx.model.add_min_equality(
                     free_both,
@@ -115,11 +75,7 @@ class FreeDaysNearWeekend:
 
         maximum_reward = len(free_near_weekend_variables) + len(free_adjacent_variables) + 4 * len(free_both_variables)
 
-        total_reward = ctx.model.new_int_var(
-            0,
-            maximum_reward,
-            "fdnw__total_reward",
-        )
+        total_reward = ctx.names.new_int_var(0, maximum_reward, _total_reward_name)
 
         ctx.model.add(
             total_reward
@@ -135,25 +91,6 @@ class FreeDaysNearWeekend:
             ),
         )
 
-    @staticmethod
-    def _free_variable(
-        ctx: SolverContext, assignment_variables: Sequence[cp_model.IntVar], *, name: str
-    ) -> cp_model.IntVar:
-        worked = ctx.model.new_bool_var(f"{name}__worked")
-
-        if assignment_variables:
-            ctx.model.add_max_equality(
-                worked,
-                list(assignment_variables),
-            )
-        else:
-            ctx.model.add(worked == 0)
-
-        free = ctx.model.new_bool_var(name)
-        ctx.model.add(free + worked == 1)
-
-        return free
-
     @staticmethod
     def _adjacent_weekend_date(near_weekend_date: date) -> date:
         if near_weekend_date.isoweekday() == 5:
@@ -176,3 +113,11 @@ class FreeDaysNearWeekend:
 
     def audit(self, ctx: AuditContext, params: Mapping[str, Any]) -> tuple[AuditFinding, ...]:
         return ()
+
+
+def _free_both_name(employee_id: int, day: date) -> str:
+    return f"fdnw__free_both_e{employee_id}__d{day}"
+
+
+def _total_reward_name() -> str:
+    return "fdnw__total_reward"
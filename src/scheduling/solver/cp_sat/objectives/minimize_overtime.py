@@ -16,6 +16,7 @@ class MinimizeOvertime:
     """
 
     id: ClassVar[str] = "minimize_overtime"
+    separable: ClassVar[bool] = True
 
     def add_to_model(
         self,
@@ -43,11 +44,13 @@ class MinimizeOvertime:
 
             # O_i: Überstunden-Variable für den jeweiligen Mitarbeiter
             # Upper Bound: 44640 (31 Tage * 24h * 60m) fungiert als sicheres Maximum für einen Monat
-            emp_overtime_var = ctx.model.new_int_var(0, 44640, f"minimize_overtime__emp_{employee_id}")
+            emp_overtime_var = ctx.names.new_int_var(0, 44640, _overtime_name, employee_id)
 
             # Constraint: O_i >= W_i + A_i - T_i
-            ctx.model.add(emp_overtime_var >= total_work_expr + actual_worked - target_minutes).with_name(
-                f"minimize_overtime__bound_emp_{employee_id}"
+            ctx.names.name_constraint(
+                ctx.model.add(emp_overtime_var >= total_work_expr + actual_worked - target_minutes),
+                _bound_name,
+                employee_id,
             )
 
             overtime_vars.append(emp_overtime_var)
@@ -79,11 +82,17 @@ def _group_weighted_vars(ctx: SolverContext) -> dict[int, list[cp_model.LinearEx
     # Mapping für schnellen Zugriff auf Schichtdauern
     shift_durations = {s.shift_id: s.net_work_minutes for s in ctx.dataset.shifts}
 
-    for key, variable in ctx.assignment_variables.items():
-        employee_id, _, _, shift_id, _ = key
-
+    for (employee_id, shift_id), variables in ctx.variable_index.by_employee_shift.items():
         # Falls Schicht nicht im Dataset, Dauer 0
         duration = shift_durations.get(shift_id, 0)
-        exprs[employee_id].append(variable * duration)
+        exprs[employee_id].append(cp_model.LinearExpr.Sum(variables) * duration)  # type: ignore
 
     return dict(exprs)
+
+
+def _overtime_name(employee_id: int) -> str:
+    return f"minimize_overtime__emp_{employee_id}"
+
+
+def _bound_name(employee_id: int) -> str:
+    return f"minimize_overtime__bound_emp_{employee_id}"
@@ -1,20 +1,21 @@
-from collections import defaultdict
 from collections.abc import Mapping
-from datetime import date as Date
-from datetime import timedelta
 from typing import Any, ClassVar
 
 from scheduling.solver.audit import AuditFinding
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
 from scheduling.solver.cp_sat.objective import Penalty
+from scheduling.solver.cp_sat.sequences import add_run_cost
 
 
 class NotTooManyConsecutiveDays:
     """
-    Adds a penalty to the solver for each consecutive day that an employee works.
+    Adds a penalty for every day that extends a run of worked days beyond the limit.
+
+    Every window of ``MAX_CONSECUTIVE_DAYS + 1`` worked days is penalized once.
     """
 
     id: ClassVar[str] = "not_too_many_consecutive_days"
+    separable: ClassVar[bool] = True
 
     # This seems to be a hard coded variable in the legacy version
     MAX_CONSECUTIVE_DAYS: int = 5
@@ -27,32 +28,21 @@ class NotTooManyConsecutiveDays:
         if not ctx.assignment_variables:
             return ()
 
-        # First check which days every employee is assigned to
-        days_by_employee: defaultdict[int, list[Date]] = defaultdict(list)
-        for key, _variable in ctx.assignment_variables.items():
-            employee_id, _, date, _, _ = key
-            days_by_employee[employee_id].append(date)
-
-        # Find out how many times an employee works five days or more consecutively
-        too_many_consecutive_days: int = 0
-        for employee_id in days_by_employee.keys():
-            # Make sure the lsit of days is sorted
-            days_by_employee[employee_id] = sorted(days_by_employee[employee_id])
-            block_length: int = 1
-            for i in range(len(days_by_employee[employee_id]) - 1):
-                if days_by_employee[employee_id][i + 1] - days_by_employee[employee_id][i] == timedelta(days=1):
-                    block_length += 1
-                else:
-                    if block_length > self.MAX_CONSECUTIVE_DAYS:
-                        too_many_consecutive_days += 1
-                    block_length = 1
-
-        total_too_many_consecutive_days = ctx.model.new_int_var(
-            0, too_many_consecutive_days, "not_too_many_consecutive_days"
-        )
+        costs = [
+            add_run_cost(
+                ctx,
+                [ctx.derived.works(employee_id, day) for day in ctx.assignment_variables.dates],
+                lambda run_length: max(run_length - self.MAX_CONSECUTIVE_DAYS, 0),
+                name=f"not_too_many_consecutive_days__e{employee_id}",
+            )
+            for employee_id in ctx.variable_index.employee_ids
+        ]
 
-        ctx.model.add(total_too_many_consecutive_days == too_many_consecutive_days).with_name(
-            "not_too_many_consecutive_days__total_too_many_consecutive_daays"
+        total_too_many_consecutive_days = ctx.names.new_int_var(0, sum(cost.upper_bound for cost in costs), _total_name)
+
+        ctx.names.name_constraint(
+            ctx.model.add(total_too_many_consecutive_days == sum(cost.expression for cost in costs)),
+            _define_total_name,
         )
 
         return (
@@ -69,3 +59,11 @@ class NotTooManyConsecutiveDays:
         params: Mapping[str, Any],
     ) -> tuple[AuditFinding, ...]:
         return ()
+
+
+def _total_name() -> str:
+    return "not_too_many_consecutive_days"
+
+
+def _define_total_name() -> str:
+    return "not_too_many_consecutive_days__total_too_many_consecutive_days"
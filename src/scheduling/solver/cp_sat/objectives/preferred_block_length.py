@@ -1,23 +1,26 @@
-from collections import defaultdict
 from collections.abc import Mapping
-from datetime import date as Date
-from datetime import timedelta
 from typing import Any, ClassVar
 
 from scheduling.solver.audit import AuditFinding
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
 from scheduling.solver.cp_sat.objective import Penalty
+from scheduling.solver.cp_sat.sequences import add_run_cost
 
 
 class PreferredBlockLength:
     """
-    Adds a reward for each time an employee works exactly three days in a row.
+    Penalizes every block of consecutive worked days by its distance from the preferred length.
+
+    Blocks longer than ``MAX_BLOCK_LENGTH`` share the penalty of a block one day
+    longer than that. A block still open at the end of the month is counted.
     """
 
     id: ClassVar[str] = "preferred_block_length"
+    separable: ClassVar[bool] = True
 
     # This seems to be a hard coded variable in the legacy version
     PREFERRED_BLOCK_LENGTH: int = 3
+    MAX_BLOCK_LENGTH: int = 7
 
     def add_to_model(
         self,
@@ -27,30 +30,30 @@ class PreferredBlockLength:
         if not ctx.assignment_variables:
             return ()
 
-        # First check which days every employee is assigned to
-        days_by_employee: defaultdict[int, list[Date]] = defaultdict[int, list[Date]](list)
-        for key, _variable in ctx.assignment_variables.items():
-            employee_id, _, date, _, _ = key
-            days_by_employee[employee_id].append(date)
-
-        # Find out how many times an employee works exactly three days consecutively
-        num_preferred_blocks: int = 0
-        for employee_id in days_by_employee.keys():
-            # Make sure the lsit of days is sorted
-            days_by_employee[employee_id] = sorted(days_by_employee[employee_id])
-            block_length: int = 1
-            for i in range(len(days_by_employee[employee_id]) - 1):
-                if days_by_employee[employee_id][i + 1] - days_by_employee[employee_id][i] == timedelta(days=1):
-                    block_length += 1
-                else:
-                    if block_length == self.PREFERRED_BLOCK_LENGTH:
-                        num_preferred_blocks += 1
-                    block_length = 1
-
-        total_preferred_blocks = ctx.model.new_int_var(0, num_preferred_blocks, "total_preferred_blocks")
-
-        ctx.model.add(total_preferred_blocks == num_preferred_blocks).with_name(
-            "preferred_block_length__total_preferred_blocks"
+        costs = [
+            add_run_cost(
+                ctx,
+                [ctx.derived.works(employee_id, day) for day in ctx.assignment_variables.dates],
+                lambda block_length: abs(min(block_length, self.MAX_BLOCK_LENGTH + 1) - self.PREFERRED_BLOCK_LENGTH),
+                name=f"preferred_block_length__e{employee_id}",
+            )
+            for employee_id in ctx.variable_index.employee_ids
+        ]
+
+        # The window weights alternate in sign, so without these bounds fractional
+        # runs look cheaper than any real schedule and optimality is hard to prove.
+        for cost in costs:
+            ctx.model.add(cost.expression >= cost.lower_bound)
+
+        total_preferred_blocks = ctx.names.new_int_var(
+            sum(cost.lower_bound for cost in costs),
+            sum(cost.upper_bound for cost in costs),
+            _total_name,
+        )
+
+        ctx.names.name_constraint(
+            ctx.model.add(total_preferred_blocks == sum(cost.expression for cost in costs)),
+            _define_total_name,
         )
 
         return (
@@ -58,7 +61,6 @@ class PreferredBlockLength:
                 objective_id=self.id,
                 name="total_preferred_blocks",
                 expression=total_preferred_blocks,
-                multiplier=-1,  # This should make sure that this objective gives a reward instead of a penalty
             ),
         )
 
@@ -68,3 +70,11 @@ class PreferredBlockLength:
         params: Mapping[str, Any],
     ) -> tuple[AuditFinding, ...]:
         return ()
+
+
+def _total_name() -> str:
+    return "total_preferred_blocks"
+
+
+def _define_total_name() -> str:
+    return "preferred_block_length__total_preferred_blocks"
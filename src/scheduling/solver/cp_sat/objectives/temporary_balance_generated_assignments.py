@@ -1,9 +1,6 @@
-from collections import defaultdict
 from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from ortools.sat.python import cp_model
-
 from scheduling.solver.audit import AuditFinding
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
 from scheduling.solver.cp_sat.objective import Penalty
@@ -17,6 +14,8 @@ class TemporaryBalanceGeneratedAssignments:
     """
 
     id: ClassVar[str] = "temporary_balance_generated_assignments"
+    # One maximum over all employees couples every planning unit component.
+    separable: ClassVar[bool] = False
 
     def add_to_model(
         self,
@@ -26,24 +25,16 @@ class TemporaryBalanceGeneratedAssignments:
         if not ctx.assignment_variables:
             return ()
 
-        variables_by_employee: defaultdict[int, list[cp_model.IntVar]] = defaultdict(list)
-
-        for key, variable in ctx.assignment_variables.items():
-            employee_id, _, _, _, _ = key
-            variables_by_employee[employee_id].append(variable)
+        variables_by_employee = ctx.variable_index.by_employee
 
         generated_counts = [sum(variables) for variables in variables_by_employee.values()]
 
-        max_generated_assignments = ctx.model.new_int_var(
-            0,
-            len(ctx.assignment_variables),
-            "temporary_balance_generated_assignments__max_per_employee",
-        )
+        max_generated_assignments = ctx.names.new_int_var(0, len(ctx.assignment_variables), _maximum_name)
 
-        ctx.model.add_max_equality(
-            max_generated_assignments,
-            generated_counts,
-        ).with_name("temporary_balance_generated_assignments__define_max_per_employee")
+        ctx.names.name_constraint(
+            ctx.model.add_max_equality(max_generated_assignments, generated_counts),
+            _define_maximum_name,
+        )
 
         return (
             Penalty(
@@ -59,3 +50,11 @@ class TemporaryBalanceGeneratedAssignments:
         params: Mapping[str, Any],
     ) -> tuple[AuditFinding, ...]:
         return ()
+
+
+def _maximum_name() -> str:
+    return "temporary_balance_generated_assignments__max_per_employee"
+
+
+def _define_maximum_name() -> str:
+    return "temporary_balance_generated_assignments__define_max_per_employee"
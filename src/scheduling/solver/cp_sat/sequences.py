@@ -0,0 +1,199 @@
+"""Linear sliding-window encodings of day sequence rules.
+
+Rules about runs of worked days or about the order of shifts are written as
+sums over short windows of day literals. Every helper literal is bounded by
+plain linear constraints from one side only: a penalty literal from below and
+a reward literal from above. Objectives are minimized with non-negative
+weights, so every optimal solution sets each helper to its exact value, while
+the model stays linear and keeps CP-SAT's feasibility jump search effective.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+from ortools.sat.python import cp_model
+
+from scheduling.solver.cp_sat.context import SolverContext
+
+
+@dataclass(frozen=True, slots=True)
+class SequenceCost:
+    expression: cp_model.LinearExpr
+    lower_bound: int
+    upper_bound: int
+
+
+def run_window_weights(cost: Callable[[int], int], horizon: int) -> dict[int, int]:
+    """Weights per window length whose full windows add up to ``cost`` of every run.
+
+    A run of ``n`` true literals contains ``n - k + 1`` full windows of length
+    ``k``, so weighting length ``k`` by the second difference of ``cost`` at
+    ``k`` charges exactly ``cost(n)`` per maximal run. Lengths with weight zero
+    are left out; a cost that grows linearly from some length on needs no
+    longer windows.
+    """
+
+    def run_cost(length: int) -> int:
+        return cost(length) if length > 0 else 0
+
+    weights = {
+        length: run_cost(length) - 2 * run_cost(length - 1) + run_cost(length - 2) for length in range(1, horizon + 1)
+    }
+
+    return {length: weight for length, weight in weights.items() if weight}
+
+
+def add_run_cost(
+    ctx: SolverContext,
+    literals: Sequence[cp_model.IntVar],
+    cost: Callable[[int], int],
+    *,
+    name: str,
+) -> SequenceCost:
+    """Charge ``cost(n)`` for every maximal run of ``n`` true literals.
+
+    Runs still open at either end of the sequence are charged as they are.
+    Windows of length one need no helper literal; every longer window with a
+    non-zero weight gets one literal and one linear constraint.
+
+    A run of ``n`` has ``n - 1`` full pairs, one fewer than it has literals, so
+    a negative weight on pairs is charged as a penalty on the first literal of
+    every run plus the same weight on every literal. That keeps the starts
+    bounded from below like any other penalty.
+
+    The lower bound is that of the runs, not of the windows: a cost that is
+    never negative gives zero, however far the window sums may drop on their
+    own. Imposing it on the expression keeps the relaxation from rewarding
+    fractional runs.
+    """
+    expression = cp_model.LinearExpr.constant(0)
+    upper_bound = 0
+    weights = run_window_weights(cost, len(literals))
+    start_weight = -weights.pop(2, 0) if weights.get(2, 0) < 0 else 0
+
+    if start_weight:
+        weights[1] = weights.get(1, 0) - start_weight
+
+        for position, literal in enumerate(literals):
+            if position == 0:
+                start = literal
+            else:
+                start = ctx.names.new_bool_var(_start_name, name, position)
+                ctx.model.add(start >= literal - literals[position - 1])
+
+            expression += start_weight * start
+            upper_bound += start_weight
+
+    for length, weight in weights.items():
+        if not weight:
+            continue
+
+        for position in range(len(literals) - length + 1):
+            window = literals[position : position + length]
+
+            if length == 1:
+                full = window[0]
+            else:
+                full = ctx.names.new_bool_var(_window_name, name, length, position)
+                window_sum = cp_model.LinearExpr.constant(0)
+
+                for literal in window:
+                    window_sum += literal
+
+                if weight > 0:
+                    ctx.model.add(full >= window_sum - (length - 1))
+                else:
+                    ctx.model.add(length * full <= window_sum)
+
+            expression += weight * full
+
+            if weight > 0:
+                upper_bound += weight
+
+    lowest = min((cost(length) for length in range(1, len(literals) + 1)), default=0)
+    lower_bound = min(lowest, 0) * ((len(literals) + 1) // 2)
+
+    return SequenceCost(expression=expression, lower_bound=lower_bound, upper_bound=upper_bound)
+
+
+def add_rotation_cost(
+    ctx: SolverContext,
+    days: Sequence[Sequence[cp_model.IntVar]],
+    worked: Sequence[cp_model.IntVar],
+    *,
+    max_gap: int,
+    name: str,
+) -> SequenceCost:
+    """Score every symbol against the previous worked day of a rotation.
+
+    ``days`` holds one literal per symbol and day in rotation order, at most
+    one of which is true per day, and ``worked`` is true on every day with any
+    work at all. A symbol is compared with the closest earlier worked day if at
+    most ``max_gap`` free days lie between them. A step to the next symbol of
+    the rotation scores -1, a step back to any earlier symbol +1.
+
+    Each day gets one penalty literal, since at most one step ends on it, bound
+    by the drop in rotation position from every earlier day in reach. A reward
+    literal per forward step and day is bounded by its second symbol and, for
+    every earlier day in reach, by the first symbol unless a closer day is
+    worked. The farthest day drops the "unless free" term, so that a step needs
+    a worked day in reach.
+    """
+    expression = cp_model.LinearExpr.constant(0)
+    lower_bound = 0
+    upper_bound = 0
+    last = len(days[0]) - 1 if days else 0
+    ranks = [_weighted_sum(enumerate(symbols)) for symbols in days]
+
+    for position in range(1, len(days)):
+        symbols = days[position]
+        earlier = range(position - 1, max(position - max_gap - 1, 0) - 1, -1)
+        on = _weighted_sum((1, literal) for literal in symbols)
+        penalty = ctx.names.new_bool_var(_rotation_name, name, position, 1)
+        closer = cp_model.LinearExpr.constant(0)
+
+        for day in earlier:
+            ctx.model.add(last * penalty >= ranks[day] - ranks[position] - last * (1 - on) - last * closer)
+            closer += worked[day]
+
+        expression += penalty
+        upper_bound += 1
+
+        for symbol in range(1, len(symbols)):
+            reward = ctx.names.new_bool_var(_rotation_name, name, position, -1, symbol)
+            ctx.model.add(reward <= symbols[symbol])
+            closer = cp_model.LinearExpr.constant(0)
+
+            for day in earlier:
+                if day == earlier[-1]:
+                    ctx.model.add(reward <= days[day][symbol - 1] + closer)
+                else:
+                    ctx.model.add(reward <= 1 - worked[day] + days[day][symbol - 1] + closer)
+
+                closer += worked[day]
+
+            expression -= reward
+            lower_bound -= 1
+
+    return SequenceCost(expression=expression, lower_bound=lower_bound, upper_bound=upper_bound)
+
+
+def _weighted_sum(terms: Iterable[tuple[int, cp_model.IntVar]]) -> cp_model.LinearExpr:
+    total = cp_model.LinearExpr.constant(0)
+
+    for weight, literal in terms:
+        total += weight * literal
+
+    return total
+
+
+def _window_name(name: str, length: int, position: int) -> str:
+    return f"{name}_w{length}_p{position}"
+
+
+def _start_name(name: str, position: int) -> str:
+    return f"{name}_start_p{position}"
+
+
+def _rotation_name(name: str, position: int, score: int, *symbol: int) -> str:
+    return "_".join((f"{name}_p{position}_s{score}", *map(str, symbol)))
@@ -0,0 +1,175 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from scheduling.domain import EmployeeId, Shift, ShiftId, ShiftType
+from scheduling.solver.cp_sat.keys import (
+    DemandKey,
+    EmployeeDateKey,
+    EmployeeDateShiftKey,
+    EmployeeDateShiftTypeKey,
+    EmployeeShiftKey,
+    IsoWeek,
+    UnitWeekShiftKey,
+)
+from scheduling.solver.cp_sat.variable_store import AssignmentVariableStore, IntArray
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentVariableIndex:
+    """Pre-grouped views of the assignment variables of one model build.
+
+    Built once from the integer codes of the variable store and shared by
+    every constraint and objective, so components look up their groups
+    instead of re-scanning all assignment variables.
+
+    Groups only contain keys that have at least one variable. Variables whose
+    shift is unknown to the dataset are left out of the shift-type groups.
+    """
+
+    revision: int
+    variable_count: int
+    employee_ids: tuple[EmployeeId, ...]
+    by_employee: dict[EmployeeId, list[cp_model.IntVar]]
+    by_employee_shift: dict[EmployeeShiftKey, list[cp_model.IntVar]]
+    by_employee_date: dict[EmployeeDateKey, list[cp_model.IntVar]]
+    by_employee_date_shift: dict[EmployeeDateShiftKey, list[cp_model.IntVar]]
+    by_employee_date_shift_type: dict[EmployeeDateShiftTypeKey, list[cp_model.IntVar]]
+    by_demand: dict[DemandKey, list[cp_model.IntVar]]
+    by_unit_week_shift: dict[UnitWeekShiftKey, dict[date, list[cp_model.IntVar]]]
+
+
+def build_assignment_variable_index(
+    *,
+    assignment_variables: AssignmentVariableStore,
+    shifts_by_id: Mapping[ShiftId, Shift],
+) -> AssignmentVariableIndex:
+    cells = assignment_variables.cells()
+    variables = cells.variables()
+
+    employee_ids = cells.employee_ids
+    planning_unit_ids = cells.planning_unit_ids
+    dates = cells.dates
+    shift_ids = cells.shift_ids
+    staff_levels = cells.staff_levels
+
+    employee_sizes = len(employee_ids)
+    day_sizes = len(dates)
+    shift_sizes = len(shift_ids)
+
+    by_employee = {
+        employee_ids[employee]: group
+        for (employee,), group in _group_variables(variables, (cells.employee_codes,), (employee_sizes,))
+    }
+    by_employee_shift = {
+        (employee_ids[employee], shift_ids[shift]): group
+        for (employee, shift), group in _group_variables(
+            variables,
+            (cells.employee_codes, cells.shift_codes),
+            (employee_sizes, shift_sizes),
+        )
+    }
+    by_employee_date = {
+        (employee_ids[employee], dates[day]): group
+        for (employee, day), group in _group_variables(
+            variables,
+            (cells.employee_codes, cells.day_codes),
+            (employee_sizes, day_sizes),
+        )
+    }
+    by_employee_date_shift = {
+        (employee_ids[employee], dates[day], shift_ids[shift]): group
+        for (employee, day, shift), group in _group_variables(
+            variables,
+            (cells.employee_codes, cells.day_codes, cells.shift_codes),
+            (employee_sizes, day_sizes, shift_sizes),
+        )
+    }
+    by_demand = {
+        (planning_unit_ids[unit], dates[day], shift_ids[shift], staff_levels[level]): group
+        for (unit, day, shift, level), group in _group_variables(
+            variables,
+            (cells.unit_codes, cells.day_codes, cells.shift_codes, cells.level_codes),
+            (len(planning_unit_ids), day_sizes, shift_sizes, len(staff_levels)),
+        )
+    }
+
+    shift_types = tuple(ShiftType)
+    type_by_shift_code = np.array(
+        [shift_types.index(shifts_by_id[shift_id].type) if shift_id in shifts_by_id else -1 for shift_id in shift_ids],
+        dtype=np.int64,
+    )
+    type_codes = type_by_shift_code[cells.shift_codes]
+    known_type = np.flatnonzero(type_codes >= 0)
+    by_employee_date_shift_type = {
+        (employee_ids[employee], dates[day], shift_types[shift_type]): group
+        for (employee, day, shift_type), group in _group_variables(
+            [variables[position] for position in known_type.tolist()],
+            (cells.employee_codes[known_type], cells.day_codes[known_type], type_codes[known_type]),
+            (employee_sizes, day_sizes, len(shift_types)),
+        )
+    }
+
+    iso_weeks: list[IsoWeek] = []
+    week_by_day_code = np.array([_iso_week_code(iso_weeks, day) for day in dates], dtype=np.int64)
+    by_unit_week_shift: dict[UnitWeekShiftKey, dict[date, list[cp_model.IntVar]]] = {}
+    for (unit, week, shift, day), group in _group_variables(
+        variables,
+        (cells.unit_codes, week_by_day_code[cells.day_codes], cells.shift_codes, cells.day_codes),
+        (len(planning_unit_ids), len(iso_weeks), shift_sizes, day_sizes),
+    ):
+        week_groups = by_unit_week_shift.setdefault((planning_unit_ids[unit], iso_weeks[week], shift_ids[shift]), {})
+        week_groups[dates[day]] = group
+
+    return AssignmentVariableIndex(
+        revision=assignment_variables.revision,
+        variable_count=len(cells),
+        employee_ids=tuple(sorted(by_employee)),
+        by_employee=by_employee,
+        by_employee_shift=by_employee_shift,
+        by_employee_date=by_employee_date,
+        by_employee_date_shift=by_employee_date_shift,
+        by_employee_date_shift_type=by_employee_date_shift_type,
+        by_demand=by_demand,
+        by_unit_week_shift=by_unit_week_shift,
+    )
+
+
+def _group_variables(
+    variables: list[cp_model.IntVar],
+    codes: tuple[IntArray, ...],
+    sizes: tuple[int, ...],
+) -> Iterator[tuple[tuple[int, ...], list[cp_model.IntVar]]]:
+    """Yield each distinct code combination with the variables that carry it.
+
+    Variables keep their original order inside a group. Most groups hold one
+    or a few variables, so the keys are read in one vectorized pass and the
+    groups are sliced from a sorted list instead of split per group.
+    """
+    if len(codes[0]) == 0:
+        return
+
+    group_codes = np.ravel_multi_index(codes, sizes)
+    order = np.argsort(group_codes, kind="stable")
+    starts = np.flatnonzero(np.diff(group_codes[order], prepend=-1))
+    first_positions = order[starts]
+    keys = zip(*(axis_codes[first_positions].tolist() for axis_codes in codes), strict=True)
+    positions: list[int] = order.tolist()
+    ordered = [variables[position] for position in positions]
+    bounds = [*starts.tolist(), len(ordered)]
+
+    for key, start, end in zip(keys, bounds, bounds[1:], strict=False):
+        yield key, ordered[start:end]
+
+
+def _iso_week_code(iso_weeks: list[IsoWeek], day: date) -> int:
+    iso_year, iso_week, _ = day.isocalendar()
+    week = (iso_year, iso_week)
+
+    if week not in iso_weeks:
+        iso_weeks.append(week)
+
+    return iso_weeks.index(week)
@@ -0,0 +1,392 @@
+from collections.abc import Hashable, ItemsView, Iterable, Iterator, MutableMapping, Sequence, ValuesView
+from datetime import date
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+from ortools.sat.python import cp_model
+
+from scheduling.domain import EmployeeId, PlanningUnitId, ShiftId, StaffLevel
+from scheduling.solver.cp_sat.keys import AssignmentVariableKey, MembershipKey
+
+type IntArray = npt.NDArray[np.int64]
+
+_MISSING = -1
+_INITIAL_ROW_CAPACITY = 16
+
+
+class _Axis[T: Hashable]:
+    """Integer coding for the values of one tensor axis."""
+
+    __slots__ = ("values", "positions")
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        self.values: list[T] = []
+        self.positions: dict[T, int] = {}
+
+        for value in values:
+            self.add(value)
+
+    def add(self, value: T) -> int:
+        position = self.positions.get(value)
+
+        if position is None:
+            position = len(self.values)
+            self.positions[value] = position
+            self.values.append(value)
+
+        return position
+
+
+class AssignmentVariableStore(MutableMapping[AssignmentVariableKey, cp_model.IntVar]):
+    """Integer-coded store for CP-SAT assignment variables.
+
+    Behaves like ``dict[AssignmentVariableKey, IntVar]`` but keeps only the
+    CP-SAT proto variable index per slot in a NumPy tensor shaped
+    ``(employee-unit row, day, shift, staff level)``. Unused slots hold -1.
+
+    Employees and planning units share one row axis because memberships are
+    sparse: a dense employee x unit plane would mostly hold empty slots on
+    hospital-wide builds. Each row remembers its employee and unit code, so
+    slicing by either axis stays a vectorized mask.
+
+    ``IntVar`` handles are recreated from the proto index on lookup. They
+    compare and hash like the original variable and can be used anywhere the
+    original could.
+    """
+
+    __slots__ = (
+        "_model",
+        "_rows",
+        "_employees",
+        "_planning_units",
+        "_dates",
+        "_shifts",
+        "_staff_levels",
+        "_row_employee_codes",
+        "_row_unit_codes",
+        "_variable_indices",
+        "_count",
+        "_revision",
+    )
+
+    def __init__(
+        self,
+        *,
+        model: cp_model.CpModel,
+        dates: Iterable[date] = (),
+        shift_ids: Iterable[ShiftId] = (),
+        staff_levels: Iterable[StaffLevel] = tuple(StaffLevel),
+    ) -> None:
+        self._model = model
+        self._rows: _Axis[MembershipKey] = _Axis()
+        self._employees: _Axis[EmployeeId] = _Axis()
+        self._planning_units: _Axis[PlanningUnitId] = _Axis()
+        self._dates: _Axis[date] = _Axis(dates)
+        self._shifts: _Axis[ShiftId] = _Axis(shift_ids)
+        self._staff_levels: _Axis[StaffLevel] = _Axis(staff_levels)
+
+        self._row_employee_codes: IntArray = np.zeros(_INITIAL_ROW_CAPACITY, dtype=np.int64)
+        self._row_unit_codes: IntArray = np.zeros(_INITIAL_ROW_CAPACITY, dtype=np.int64)
+        self._variable_indices: npt.NDArray[np.int32] = np.full(
+            (
+                _INITIAL_ROW_CAPACITY,
+                len(self._dates.values),
+                len(self._shifts.values),
+                len(self._staff_levels.values),
+            ),
+            _MISSING,
+            dtype=np.int32,
+        )
+        self._count = 0
+        self._revision = 0
+
+    @property
+    def model(self) -> cp_model.CpModel:
+        return self._model
+
+    @property
+    def revision(self) -> int:
+        """Counter that changes on every mutation, used to invalidate derived indexes."""
+        return self._revision
+
+    @property
+    def employee_ids(self) -> tuple[EmployeeId, ...]:
+        return tuple(self._employees.values)
+
+    @property
+    def planning_unit_ids(self) -> tuple[PlanningUnitId, ...]:
+        return tuple(self._planning_units.values)
+
+    @property
+    def dates(self) -> tuple[date, ...]:
+        return tuple(self._dates.values)
+
+    @property
+    def shift_ids(self) -> tuple[ShiftId, ...]:
+        return tuple(self._shifts.values)
+
+    @property
+    def staff_levels(self) -> tuple[StaffLevel, ...]:
+        return tuple(self._staff_levels.values)
+
+    @property
+    def variable_indices(self) -> npt.NDArray[np.int32]:
+        """Read-only ``(row, day, shift, level)`` tensor of CP-SAT proto variable indices."""
+        view = self._variable_indices[: len(self._rows.values)]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def valid(self) -> npt.NDArray[np.bool_]:
+        """Validity mask matching ``variable_indices``."""
+        return self.variable_indices != _MISSING
+
+    def cells(self) -> "AssignmentVariableCells":
+        """Return coordinates and proto indices of all stored variables."""
+        valid_positions = np.flatnonzero(self.valid)
+        rows, day_codes, shift_codes, level_codes = np.unravel_index(valid_positions, self.valid.shape)
+        row_count = len(self._rows.values)
+
+        return AssignmentVariableCells(
+            store=self,
+            variable_indices=self._variable_indices[:row_count].reshape(-1)[valid_positions].astype(np.int64),
+            employee_codes=self._row_employee_codes[:row_count][rows],
+            unit_codes=self._row_unit_codes[:row_count][rows],
+            day_codes=day_codes.astype(np.int64),
+            shift_codes=shift_codes.astype(np.int64),
+            level_codes=level_codes.astype(np.int64),
+        )
+
+    def variable(self, variable_index: int) -> cp_model.IntVar:
+        return self._model.get_bool_var_from_proto_index(variable_index)
+
+    def keys_with_value(self, solution: Sequence[int] | npt.NDArray[np.int64]) -> tuple[AssignmentVariableKey, ...]:
+        """Return keys whose variable is 1 in a CP-SAT solution vector."""
+        cells = self.cells()
+        values = np.asarray(solution, dtype=np.int64)[cells.variable_indices]
+
+        return tuple(cells.key(position) for position in np.flatnonzero(values == 1).tolist())
+
+    def __getitem__(self, key: AssignmentVariableKey) -> cp_model.IntVar:
+        position = self._position(key)
+
+        if position is None:
+            raise KeyError(key)
+
+        variable_index = int(self._variable_indices[position])
+        if variable_index == _MISSING:
+            raise KeyError(key)
+
+        return self.variable(variable_index)
+
+    def __setitem__(self, key: AssignmentVariableKey, value: cp_model.IntVar) -> None:
+        position = self._grow_to(key)
+
+        if self._variable_indices[position] == _MISSING:
+            self._count += 1
+
+        self._variable_indices[position] = value.index
+        self._revision += 1
+
+    def __delitem__(self, key: AssignmentVariableKey) -> None:
+        position = self._position(key)
+
+        if position is None or self._variable_indices[position] == _MISSING:
+            raise KeyError(key)
+
+        self._variable_indices[position] = _MISSING
+        self._count -= 1
+        self._revision += 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple):
+            return False
+
+        candidate = cast(tuple[Any, ...], key)
+        if len(candidate) != 5:
+            return False
+
+        position = self._position(candidate)
+        return position is not None and self._variable_indices[position] != _MISSING
+
+    def __iter__(self) -> Iterator[AssignmentVariableKey]:
+        return iter(self.cells().keys())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> ItemsView[AssignmentVariableKey, cp_model.IntVar]:
+        return _AssignmentVariableItems(self)
+
+    def values(self) -> ValuesView[cp_model.IntVar]:
+        return _AssignmentVariableValues(self)
+
+    def _position(self, key: tuple[Any, ...]) -> tuple[int, int, int, int] | None:
+        employee_id, planning_unit_id, assignment_date, shift_id, staff_level = key
+
+        row = self._rows.positions.get((employee_id, planning_unit_id))
+        day = self._dates.positions.get(assignment_date)
+        shift = self._shifts.positions.get(shift_id)
+        level = self._staff_levels.positions.get(staff_level)
+
+        if row is None or day is None or shift is None or level is None:
+            return None
+
+        return row, day, shift, level
+
+    def _grow_to(self, key: AssignmentVariableKey) -> tuple[int, int, int, int]:
+        employee_id, planning_unit_id, assignment_date, shift_id, staff_level = key
+
+        row_count = len(self._rows.values)
+        row = self._rows.add((employee_id, planning_unit_id))
+
+        if row == row_count:
+            self._append_row(
+                row,
+                employee_code=self._employees.add(employee_id),
+                unit_code=self._planning_units.add(planning_unit_id),
+            )
+
+        day = self._dates.add(assignment_date)
+        shift = self._shifts.add(shift_id)
+        level = self._staff_levels.add(staff_level)
+        self._ensure_shape(days=day + 1, shifts=shift + 1, levels=level + 1)
+
+        return row, day, shift, level
+
+    def _append_row(self, row: int, *, employee_code: int, unit_code: int) -> None:
+        capacity = self._variable_indices.shape[0]
+
+        if row >= capacity:
+            extra = max(capacity, 1)
+            self._variable_indices = np.concatenate(
+                (
+                    self._variable_indices,
+                    np.full((extra, *self._variable_indices.shape[1:]), _MISSING, dtype=np.int32),
+                )
+            )
+            self._row_employee_codes = np.concatenate((self._row_employee_codes, np.zeros(extra, dtype=np.int64)))
+            self._row_unit_codes = np.concatenate((self._row_unit_codes, np.zeros(extra, dtype=np.int64)))
+
+        self._row_employee_codes[row] = employee_code
+        self._row_unit_codes[row] = unit_code
+
+    def _ensure_shape(self, *, days: int, shifts: int, levels: int) -> None:
+        _, current_days, current_shifts, current_levels = self._variable_indices.shape
+
+        if days <= current_days and shifts <= current_shifts and levels <= current_levels:
+            return
+
+        self._variable_indices = np.pad(
+            self._variable_indices,
+            (
+                (0, 0),
+                (0, max(days - current_days, 0)),
+                (0, max(shifts - current_shifts, 0)),
+                (0, max(levels - current_levels, 0)),
+            ),
+            constant_values=_MISSING,
+        )
+
+
+class AssignmentVariableCells:
+    """Flat, integer-coded view over the stored variables of one store revision.
+
+    All arrays are aligned: position ``i`` describes one stored variable. The
+    axis values are captured once, so decoding keys does not copy the axes
+    per element.
+    """
+
+    __slots__ = (
+        "store",
+        "employee_ids",
+        "planning_unit_ids",
+        "dates",
+        "shift_ids",
+        "staff_levels",
+        "variable_indices",
+        "employee_codes",
+        "unit_codes",
+        "day_codes",
+        "shift_codes",
+        "level_codes",
+    )
+
+    def __init__(
+        self,
+        *,
+        store: AssignmentVariableStore,
+        variable_indices: IntArray,
+        employee_codes: IntArray,
+        unit_codes: IntArray,
+        day_codes: IntArray,
+        shift_codes: IntArray,
+        level_codes: IntArray,
+    ) -> None:
+        self.store = store
+        self.employee_ids = store.employee_ids
+        self.planning_unit_ids = store.planning_unit_ids
+        self.dates = store.dates
+        self.shift_ids = store.shift_ids
+        self.staff_levels = store.staff_levels
+        self.variable_indices = variable_indices
+        self.employee_codes = employee_codes
+        self.unit_codes = unit_codes
+        self.day_codes = day_codes
+        self.shift_codes = shift_codes
+        self.level_codes = level_codes
+
+    def __len__(self) -> int:
+        return len(self.variable_indices)
+
+    def key(self, position: int) -> AssignmentVariableKey:
+        return (
+            self.employee_ids[int(self.employee_codes[position])],
+            self.planning_unit_ids[int(self.unit_codes[position])],
+            self.dates[int(self.day_codes[position])],
+            self.shift_ids[int(self.shift_codes[position])],
+            self.staff_levels[int(self.level_codes[position])],
+        )
+
+    def keys(self) -> list[AssignmentVariableKey]:
+        """Decode all keys at once, aligned with the arrays."""
+        return [
+            (
+                self.employee_ids[employee],
+                self.planning_unit_ids[unit],
+                self.dates[day],
+                self.shift_ids[shift],
+                self.staff_levels[level],
+            )
+            for employee, unit, day, shift, level in zip(
+                self.employee_codes.tolist(),
+                self.unit_codes.tolist(),
+                self.day_codes.tolist(),
+                self.shift_codes.tolist(),
+                self.level_codes.tolist(),
+                strict=True,
+            )
+        ]
+
+    def variables(self) -> list[cp_model.IntVar]:
+        """Materialize one ``IntVar`` handle per stored variable, aligned with the arrays."""
+        proto = self.store.model.proto
+
+        return [cp_model.IntVar(proto, variable_index) for variable_index in self.variable_indices.tolist()]
+
+
+class _AssignmentVariableItems(ItemsView[AssignmentVariableKey, cp_model.IntVar]):
+    _mapping: AssignmentVariableStore
+
+    def __iter__(self) -> Iterator[tuple[AssignmentVariableKey, cp_model.IntVar]]:
+        cells = self._mapping.cells()
+
+        yield from zip(cells.keys(), cells.variables(), strict=True)
+
+
+class _AssignmentVariableValues(ValuesView[cp_model.IntVar]):
+    _mapping: AssignmentVariableStore
+
+    def __iter__(self) -> Iterator[cp_model.IntVar]:
+        yield from self._mapping.cells().variables()
@@ -1,40 +1,37 @@
+from collections.abc import Collection
 from datetime import date, timedelta
 
 from scheduling.domain import PlanningUnitType, StaffingDemandRole
 from scheduling.solver.cp_sat.context import SolverContext
-from scheduling.solver.cp_sat.eligibility import eligible_staff_levels_for_assignment_slot
-from scheduling.solver.cp_sat.keys import AssignmentVariableKey
+from scheduling.solver.cp_sat.eligibility import build_eligibility_matrix
+from scheduling.solver.cp_sat.keys import AssignmentVariableKey, EmployeeDateShiftKey
 
 
-def create_assignment_variables(ctx: SolverContext) -> None:
+def create_assignment_variables(
+    ctx: SolverContext,
+    *,
+    excluded_slots: Collection[EmployeeDateShiftKey] = (),
+) -> None:
     """Create one boolean variable for every feasible generated assignment slot.
 
+    ``excluded_slots`` are (employee, date, shift) slots that constraints ruled
+    out up front; no variable is created for them in any unit or staff level.
+
     Long-term model direction:
     variables describe the possible schedule space. Demand, wishes, fairness,
     and workload rules are separate constraints/objectives over that space.
     """
-    for planning_unit_id in _assignable_planning_unit_ids(ctx):
-        for assignment_date in _planning_dates(ctx):
-            for shift_id in _assignable_shift_ids(ctx):
-                for employee in ctx.dataset.employees:
-                    staff_levels = eligible_staff_levels_for_assignment_slot(
-                        employee=employee,
-                        planning_unit_id=planning_unit_id,
-                        assignment_date=assignment_date,
-                        shift_id=shift_id,
-                        index=ctx.index,
-                    )
-
-                    for staff_level in staff_levels:
-                        key: AssignmentVariableKey = (
-                            employee.employee_id,
-                            planning_unit_id,
-                            assignment_date,
-                            shift_id,
-                            staff_level,
-                        )
-
-                        ctx.assignment_variables[key] = ctx.model.new_bool_var(_assignment_variable_name(key))
+    eligibility = build_eligibility_matrix(
+        employees=ctx.dataset.employees,
+        planning_unit_ids=_assignable_planning_unit_ids(ctx),
+        dates=_planning_dates(ctx),
+        shift_ids=_assignable_shift_ids(ctx),
+        index=ctx.index,
+        excluded_slots=excluded_slots,
+    )
+
+    for key in eligibility.slots():
+        ctx.assignment_variables[key] = ctx.names.new_bool_var(_assignment_variable_name, key)
 
 
 def _assignable_planning_unit_ids(ctx: SolverContext) -> tuple[int, ...]:
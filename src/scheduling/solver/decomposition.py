@@ -0,0 +1,186 @@
+"""Split multi-unit solves into planning units that share no employees.
+
+Planning units are connected when an employee is a member of both. The
+model of one connected component has no variable or constraint in common
+with another component. When every enabled objective is separable, it has no
+objective term in common either, so components can be built and solved as
+independent models and their solutions merged afterwards. An objective over
+all employees, such as one shared maximum, couples the components; the
+solver then keeps a single model.
+"""
+
+import threading
+from collections.abc import Sequence
+
+from scheduling.domain import EmployeeId, PlanningUnitId, PlanningUnitType, SchedulingDataset
+from scheduling.solver.audit import AuditReport
+from scheduling.solver.index import SolverIndex
+from scheduling.solver.models import Solution, SolutionStatus, SolveProgress
+
+# Merged status of several components; an earlier status wins over a later one.
+_STATUS_PRECEDENCE = (
+    SolutionStatus.ERROR,
+    SolutionStatus.MODEL_INVALID,
+    SolutionStatus.INFEASIBLE,
+    SolutionStatus.UNKNOWN,
+    SolutionStatus.FEASIBLE,
+    SolutionStatus.OPTIMAL,
+)
+
+
+def planning_unit_components(
+    dataset: SchedulingDataset,
+    index: SolverIndex,
+) -> tuple[tuple[PlanningUnitId, ...], ...]:
+    """Connected components of the station units, linked by shared employees.
+
+    Only stations get assignment variables, so other planning units never
+    connect two components. Components are sorted by their smallest unit id.
+    """
+    station_ids = {
+        planning_unit.planning_unit_id
+        for planning_unit in dataset.planning_units
+        if planning_unit.type == PlanningUnitType.STATION
+    }
+    parents = {planning_unit_id: planning_unit_id for planning_unit_id in station_ids}
+    first_unit_by_employee: dict[EmployeeId, PlanningUnitId] = {}
+
+    def find(planning_unit_id: PlanningUnitId) -> PlanningUnitId:
+        while parents[planning_unit_id] != planning_unit_id:
+            parents[planning_unit_id] = parents[parents[planning_unit_id]]
+            planning_unit_id = parents[planning_unit_id]
+
+        return planning_unit_id
+
+    for employee_id, planning_unit_id in index.memberships_by_employee_unit:
+        if planning_unit_id not in station_ids:
+            continue
+
+        first_unit_id = first_unit_by_employee.setdefault(employee_id, planning_unit_id)
+        parents[find(planning_unit_id)] = find(first_unit_id)
+
+    components: dict[PlanningUnitId, list[PlanningUnitId]] = {}
+
+    for planning_unit_id in sorted(station_ids):
+        components.setdefault(find(planning_unit_id), []).append(planning_unit_id)
+
+    return tuple(tuple(component) for component in components.values())
+
+
+def component_dataset(dataset: SchedulingDataset, planning_unit_ids: Sequence[PlanningUnitId]) -> SchedulingDataset:
+    """Restrict a dataset to the planning units of one component and their members.
+
+    Existing assignments are kept when they belong to a member or are booked
+    in one of the units, since both can count towards the component's rules.
+    """
+    unit_ids = set(planning_unit_ids)
+    employee_ids = {
+        membership.employee_id
+        for membership in dataset.planning_unit_memberships
+        if membership.planning_unit_id in unit_ids
+    }
+
+    return dataset.model_copy(
+        update={
+            "planning_units": tuple(unit for unit in dataset.planning_units if unit.planning_unit_id in unit_ids),
+            "plans": tuple(plan for plan in dataset.plans if plan.planning_unit_id in unit_ids),
+            "demand_requirements": tuple(
+                demand for demand in dataset.demand_requirements if demand.planning_unit_id in unit_ids
+            ),
+            "employees": tuple(employee for employee in dataset.employees if employee.employee_id in employee_ids),
+            "planning_unit_memberships": tuple(
+                membership for membership in dataset.planning_unit_memberships if membership.employee_id in employee_ids
+            ),
+            "sunday_work_history": tuple(
+                history for history in dataset.sunday_work_history if history.employee_id in employee_ids
+            ),
+            "wishes": tuple(wish for wish in dataset.wishes if wish.employee_id in employee_ids),
+            "assignments": tuple(
+                assignment
+                for assignment in dataset.assignments
+                if assignment.employee_id in employee_ids or assignment.planning_unit_id in unit_ids
+            ),
+            "availability": tuple(item for item in dataset.availability if item.employee_id in employee_ids),
+            "monthly_work_accounts": tuple(
+                account for account in dataset.monthly_work_accounts if account.employee_id in employee_ids
+            ),
+            "objective_weights": tuple(
+                weights for weights in dataset.objective_weights if weights.planning_unit_id in unit_ids
+            ),
+        }
+    )
+
+
+def merge_solutions(solutions: Sequence[Solution]) -> Solution:
+    """Combine component solutions into one solution of the whole dataset.
+
+    The merged status is the worst component status. Assignments are only
+    kept when every component has a schedule, as for a single model.
+    """
+    status = min(
+        (solution.status for solution in solutions),
+        key=_STATUS_PRECEDENCE.index,
+        default=SolutionStatus.UNKNOWN,
+    )
+    solved = status in {SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE}
+
+    return Solution(
+        status=status,
+        assignments=(
+            tuple(
+                sorted(
+                    (assignment for solution in solutions for assignment in solution.assignments),
+                    key=lambda assignment: (
+                        assignment.planning_unit_id or 0,
+                        assignment.date,
+                        assignment.shift_id,
+                        assignment.employee_id,
+                    ),
+                )
+            )
+            if solved
+            else ()
+        ),
+        diagnostics=tuple(diagnostic for solution in solutions for diagnostic in solution.diagnostics),
+        audit=AuditReport(findings=tuple(finding for solution in solutions for finding in solution.audit.findings)),
+    )
+
+
+class ComponentProgress:
+    """Combine the progress of concurrently solved components.
+
+    Objective values and bounds of independent components add up, so a
+    combined progress is reported once every component has a solution and
+    after each further improvement of any of them. Safe to update from
+    several threads.
+    """
+
+    def __init__(self, component_count: int) -> None:
+        self._component_count = component_count
+        self._lock = threading.Lock()
+        self._latest: dict[int, SolveProgress] = {}
+
+    def update(self, component: int, progress: SolveProgress) -> SolveProgress | None:
+        with self._lock:
+            self._latest[component] = progress
+
+            if len(self._latest) < self._component_count:
+                return None
+
+            latest = tuple(self._latest[index] for index in range(self._component_count))
+
+        objective_value = sum(progress.objective_value for progress in latest)
+        best_objective_bound = sum(progress.best_objective_bound for progress in latest)
+
+        return SolveProgress(
+            solution_count=sum(progress.solution_count for progress in latest),
+            objective_value=objective_value,
+            best_objective_bound=best_objective_bound,
+            gap=abs(objective_value - best_objective_bound) / max(abs(objective_value), 1),
+            wall_time_seconds=max(progress.wall_time_seconds for progress in latest),
+            assignments=(
+                tuple(assignment for progress in latest for assignment in progress.assignments or ())
+                if all(progress.assignments is not None for progress in latest)
+                else None
+            ),
+        )
@@ -0,0 +1,53 @@
+import hashlib
+import json
+from importlib.metadata import version
+from typing import Any, cast
+
+from scheduling.domain import SchedulingDataset
+from scheduling.settings import Settings
+from scheduling.solver.config import SolverConfig
+
+# Bump whenever a constraint or objective encoding changes what the model
+# solves, so cached solutions from older code stop matching.
+MODEL_VERSION = 2
+
+
+def solve_fingerprint(dataset: SchedulingDataset, *, config: SolverConfig, settings: Settings) -> str:
+    """Return a stable SHA-256 hex digest of everything that determines a solve.
+
+    The dataset is canonicalized so that record order from TimeOffice does not
+    change the fingerprint. Settings that only affect diagnostics, such as
+    model naming or build profiling, are left out. The model version and the
+    OR-Tools version are included because the disk tier of the solution cache
+    outlives deploys.
+    """
+    payload = {
+        "model": {"version": MODEL_VERSION, "ortools": version("ortools")},
+        "dataset": _canonical_dataset(dataset),
+        "config": config.model_dump(mode="json", exclude={"model_naming"}),
+        "solver": {
+            "max_time_seconds": settings.solver_max_time_seconds,
+            "num_search_workers": settings.solver_num_search_workers,
+            "random_seed": settings.solver_random_seed,
+            "decompose_components": settings.solver_decompose_components,
+        },
+    }
+
+    return hashlib.sha256(_canonical_json(payload).encode()).hexdigest()
+
+
+def _canonical_dataset(dataset: SchedulingDataset) -> dict[str, Any]:
+    payload = dataset.model_dump(mode="json", exclude_computed_fields=True)
+
+    return {field: _sorted_records(value) for field, value in payload.items()}
+
+
+def _sorted_records(value: object) -> object:
+    if not isinstance(value, list):
+        return value
+
+    return sorted(cast(list[object], value), key=_canonical_json)
+
+
+def _canonical_json(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
@@ -1,3 +1,4 @@
+from datetime import date, timedelta
 from enum import StrEnum
 
 from pydantic import Field
@@ -22,3 +23,39 @@ class Solution(SchedulingBaseModel):
     assignments: tuple[Assignment, ...] = ()
     diagnostics: tuple[SolverDiagnostic, ...] = ()
     audit: AuditReport = Field(default_factory=AuditReport)
+
+
+class SolveProgress(SchedulingBaseModel):
+    """Improving solution reported while the solver is still searching.
+
+    Assignments are only included when requested, since copying every
+    incumbent out of the solver is not free.
+    """
+
+    solution_count: int
+    objective_value: float
+    best_objective_bound: float
+    gap: float
+    wall_time_seconds: float
+    assignments: tuple[Assignment, ...] | None = None
+
+
+class Neighborhood(SchedulingBaseModel):
+    """Part of a previous schedule that an incremental re-solve may change.
+
+    Assignment variables of ``employee_ids`` stay free for the whole month and
+    every employee stays free within ``radius_days`` of each of ``dates``. All
+    other assignment variables are fixed to ``previous_assignments``.
+    """
+
+    previous_assignments: tuple[Assignment, ...]
+    employee_ids: tuple[int, ...]
+    dates: tuple[date, ...] = ()
+    radius_days: int = Field(default=1, ge=0)
+
+    def free_dates(self) -> frozenset[date]:
+        return frozenset(
+            changed_date + timedelta(days=offset)
+            for changed_date in self.dates
+            for offset in range(-self.radius_days, self.radius_days + 1)
+        )
@@ -1,27 +1,115 @@
 import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
+from typing import Protocol, cast
 
 from ortools.sat.python import cp_model
 
-from scheduling.domain import Assignment, AssignmentType, SchedulingDataset
+from scheduling.domain import Assignment, AssignmentType, PlanningUnitId, SchedulingDataset
 from scheduling.settings import Settings
 from scheduling.solver.audit import AuditFinding, AuditReport
+from scheduling.solver.cancellation import SolveCancellation
 from scheduling.solver.cp_sat.builder import CpSatBuildResult, CpSatModelBuilder
 from scheduling.solver.cp_sat.context import AuditContext, SolverContext
+from scheduling.solver.cp_sat.hints import add_assignment_hint, build_assignment_hint
 from scheduling.solver.cp_sat.inspection import CpSatInspection, inspect_cp_sat_model
+from scheduling.solver.cp_sat.neighborhood import fix_outside_neighborhood
+from scheduling.solver.decomposition import (
+    ComponentProgress,
+    component_dataset,
+    merge_solutions,
+    planning_unit_components,
+)
 from scheduling.solver.diagnostics import DiagnosticSeverity, SolverDiagnostic
-from scheduling.solver.models import Solution, SolutionStatus
+from scheduling.solver.fingerprint import solve_fingerprint
+from scheduling.solver.index import build_schedule_index
+from scheduling.solver.models import Neighborhood, Solution, SolutionStatus, SolveProgress
+from scheduling.solver.warm_start import WarmStartCache, planned_assignments
 
 logger = logging.getLogger(__name__)
 
+type SolveProgressHandler = Callable[[SolveProgress], None]
+
+_COMPONENT_POLL_SECONDS = 0.1
+
+
+class _CpSolverResponseView(Protocol):
+    solution: Sequence[int]
+
 
 class SolverService:
     """Build, solve, map, audit, and report CP-SAT scheduling solutions."""
 
-    def __init__(self, settings: Settings, model_builder: CpSatModelBuilder) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        model_builder: CpSatModelBuilder,
+        *,
+        warm_start: WarmStartCache | None = None,
+    ) -> None:
         self._settings = settings
         self._model_builder = model_builder
+        self._warm_start = warm_start if warm_start is not None else WarmStartCache()
+        self._component_pool: _ComponentPool | None = None
+        self._component_pool_lock = threading.Lock()
+
+    def solve(
+        self,
+        dataset: SchedulingDataset,
+        *,
+        on_progress: SolveProgressHandler | None = None,
+        cancellation: SolveCancellation | None = None,
+        neighborhood: Neighborhood | None = None,
+    ) -> Solution:
+        """Solve a dataset, reporting each improving solution to ``on_progress``.
+
+        Cancelling stops the search early; the best solution found so far is
+        still returned as FEASIBLE.
+
+        With a ``neighborhood``, only that part of the previous schedule is
+        re-optimized under the shorter incremental time limit. If the fixed
+        remainder no longer admits a solution, the full model is solved.
+
+        Otherwise planning units that share no employees are built and solved
+        as separate models in parallel, and their solutions are merged. This
+        only happens when every enabled objective is separable, so that the
+        sum of the component objectives is the objective of the single model.
+        """
+        if neighborhood is None and self._settings.solver_decompose_components and self._model_builder.separable:
+            components = planning_unit_components(dataset, build_schedule_index(dataset))
+
+            if len(components) > 1:
+                return self._solve_components(dataset, components, on_progress=on_progress, cancellation=cancellation)
 
-    def solve(self, dataset: SchedulingDataset) -> Solution:
+        return self._solve_model(dataset, on_progress=on_progress, cancellation=cancellation, neighborhood=neighborhood)
+
+    def close(self) -> None:
+        """Stop the component worker processes, if any were started."""
+        with self._component_pool_lock:
+            pool, self._component_pool = self._component_pool, None
+
+        if pool is not None:
+            pool.close()
+
+    def fingerprint(self, dataset: SchedulingDataset) -> str:
+        """Fingerprint of the dataset, solver configuration, and solver parameters."""
+        return solve_fingerprint(dataset, config=self._model_builder.config, settings=self._settings)
+
+    def _solve_model(
+        self,
+        dataset: SchedulingDataset,
+        *,
+        on_progress: SolveProgressHandler | None,
+        cancellation: SolveCancellation | None,
+        neighborhood: Neighborhood | None,
+    ) -> Solution:
         build_result = self._build_model(dataset)
         ctx = build_result.ctx
 
@@ -35,24 +123,56 @@ class SolverService:
                 audit=AuditReport(),
             )
 
-        solver = self._create_solver()
+        if neighborhood is None:
+            max_time_seconds = self._settings.solver_max_time_seconds
+            self._add_warm_start_hint(ctx)
+        else:
+            max_time_seconds = self._settings.solver_incremental_max_time_seconds
+            self._restrict_to_neighborhood(ctx, neighborhood)
+
+        solver = self._create_solver(max_time_seconds=max_time_seconds)
 
         logger.info(
             "Solving CP-SAT model: max_time_seconds=%s search_workers=%s random_seed=%s",
-            self._settings.solver_max_time_seconds,
+            max_time_seconds,
             self._settings.solver_num_search_workers,
             self._settings.solver_random_seed,
         )
 
-        cp_status = solver.solve(ctx.model)
+        callback = (
+            _SolveCallback(
+                ctx=ctx,
+                on_progress=on_progress,
+                cancellation=cancellation,
+                include_assignments=self._settings.solver_progress_assignments,
+            )
+            if on_progress is not None or cancellation is not None
+            else None
+        )
+
+        # ``stop_search`` is a no-op until the search has started, so a cancel
+        # that arrived while the model was built would otherwise be lost.
+        if cancellation is not None and cancellation.cancelled:
+            logger.info("Solve cancelled before the CP-SAT search started.")
+            return Solution(status=SolutionStatus.UNKNOWN, diagnostics=tuple(ctx.diagnostics))
+
+        with _stop_on_cancel(cancellation, solver):
+            cp_status = solver.solve(ctx.model, callback)
         status = self._map_cp_sat_status(cp_status)
 
+        if neighborhood is not None and status == SolutionStatus.INFEASIBLE:
+            logger.warning("Incremental solve is infeasible with the fixed schedule; solving the full model.")
+            return self.solve(dataset, on_progress=on_progress, cancellation=cancellation)
+
         assignments = (
             self._extract_assignments(ctx=ctx, solver=solver)
             if status in {SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE}
             else ()
         )
 
+        if assignments and self._settings.solver_warm_start:
+            self._warm_start.put(dataset, assignments)
+
         audit = (
             self._audit_solution(
                 build_result=build_result,
@@ -84,6 +204,153 @@ class SolverService:
             audit=audit,
         )
 
+    def _solve_components(
+        self,
+        dataset: SchedulingDataset,
+        components: tuple[tuple[PlanningUnitId, ...], ...],
+        *,
+        on_progress: SolveProgressHandler | None,
+        cancellation: SolveCancellation | None,
+    ) -> Solution:
+        datasets = tuple(component_dataset(dataset, planning_unit_ids) for planning_unit_ids in components)
+        workers = min(len(datasets), self._component_pool_size())
+        settings = component_settings(self._settings, concurrent_components=workers)
+        progress = ComponentProgress(len(datasets))
+
+        def report(component: int, component_progress: SolveProgress) -> None:
+            combined = progress.update(component, component_progress)
+
+            if combined is not None and on_progress is not None:
+                on_progress(combined)
+
+        logger.info(
+            "Solving planning unit components separately: components=%s workers=%s search_workers=%s",
+            components,
+            workers,
+            settings.solver_num_search_workers,
+        )
+
+        # Daemonic processes, such as solve executor workers, cannot start
+        # child processes. CP-SAT releases the GIL while searching, so threads
+        # still solve the components in parallel there.
+        solve_components = (
+            self._solve_components_in_threads
+            if multiprocessing.current_process().daemon
+            else self._solve_components_in_processes
+        )
+        solutions = solve_components(
+            datasets,
+            settings=settings,
+            workers=workers,
+            report=report if on_progress is not None else None,
+            cancellation=cancellation,
+        )
+
+        if self._settings.solver_warm_start:
+            for component, solution in zip(datasets, solutions, strict=True):
+                if solution.assignments:
+                    self._warm_start.put(component, solution.assignments)
+
+        solution = merge_solutions(solutions)
+
+        logger.info(
+            "Merged planning unit component solutions: status=%s component_statuses=%s generated_assignments=%s",
+            solution.status.value,
+            tuple(component_solution.status.value for component_solution in solutions),
+            len(solution.assignments),
+        )
+
+        return solution
+
+    def _solve_components_in_threads(
+        self,
+        datasets: tuple[SchedulingDataset, ...],
+        *,
+        settings: Settings,
+        workers: int,
+        report: Callable[[int, SolveProgress], None] | None,
+        cancellation: SolveCancellation | None,
+    ) -> tuple[Solution, ...]:
+        solver = SolverService(settings=settings, model_builder=self._model_builder, warm_start=self._warm_start)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="solve-component") as pool:
+            futures = [
+                pool.submit(
+                    solver._solve_model,
+                    component,
+                    on_progress=partial(report, index) if report is not None else None,
+                    cancellation=cancellation,
+                    neighborhood=None,
+                )
+                for index, component in enumerate(datasets)
+            ]
+
+        return tuple(future.result() for future in futures)
+
+    def _solve_components_in_processes(
+        self,
+        datasets: tuple[SchedulingDataset, ...],
+        *,
+        settings: Settings,
+        workers: int,
+        report: Callable[[int, SolveProgress], None] | None,
+        cancellation: SolveCancellation | None,
+    ) -> tuple[Solution, ...]:
+        pool = self._get_component_pool()
+        progress_queue = pool.manager.Queue() if report is not None else None
+        cancel_event = pool.manager.Event()
+
+        try:
+            with _forward_cancel(cancellation, cancel_event):
+                futures = [
+                    pool.executor.submit(
+                        _solve_component,
+                        settings=settings,
+                        model_builder=self._model_builder,
+                        component=index,
+                        dataset=component,
+                        previous_assignments=(
+                            self._warm_start.get(component) if self._settings.solver_warm_start else None
+                        ),
+                        progress_queue=progress_queue,
+                        cancel_event=cancel_event,
+                    )
+                    for index, component in enumerate(datasets)
+                ]
+                pending = set(futures)
+
+                while pending:
+                    _, pending = wait(pending, timeout=_COMPONENT_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                    _forward_component_progress(progress_queue, report)
+
+            # Progress is sent to the manager synchronously, so all of it has
+            # arrived once the components are done.
+            _forward_component_progress(progress_queue, report)
+
+            return tuple(future.result() for future in futures)
+        except BrokenProcessPool:
+            self._discard_component_pool(pool)
+            raise
+
+    def _component_pool_size(self) -> int:
+        return self._settings.solver_component_workers or os.cpu_count() or 1
+
+    def _get_component_pool(self) -> "_ComponentPool":
+        """The service's component worker processes, started on first use."""
+        with self._component_pool_lock:
+            if self._component_pool is None:
+                self._component_pool = _ComponentPool(workers=self._component_pool_size())
+
+            return self._component_pool
+
+    def _discard_component_pool(self, pool: "_ComponentPool") -> None:
+        with self._component_pool_lock:
+            if self._component_pool is pool:
+                self._component_pool = None
+
+        logger.warning("Component worker process died; starting new workers for the next solve.")
+        pool.close()
+
     def _build_model(self, dataset: SchedulingDataset) -> CpSatBuildResult:
         logger.info(
             "Building CP-SAT model: employees=%s planning_units=%s shifts=%s "
@@ -95,7 +362,7 @@ class SolverService:
             len(dataset.demand_requirements),
         )
 
-        build_result = self._model_builder.build(dataset)
+        build_result = self._model_builder.build(dataset, profile=self._settings.solver_profile_build)
 
         logger.debug(
             "Applied solver components: constraints=%s objectives=%s weighted_penalties=%s has_objective=%s",
@@ -105,10 +372,17 @@ class SolverService:
             build_result.has_objective,
         )
 
+        if build_result.profile is not None:
+            logger.info(
+                "CP-SAT build profile: total_seconds=%.3f\n%s",
+                build_result.profile.total_wall_seconds,
+                build_result.profile.format_table(),
+            )
+
         return build_result
 
     def _inspect_model(self, ctx: SolverContext) -> CpSatInspection:
-        inspection = inspect_cp_sat_model(model=ctx.model)
+        inspection = inspect_cp_sat_model(model=ctx.model, names=ctx.names)
 
         logger.info(
             "Built CP-SAT model: assignment_variables=%s proto_variables=%s "
@@ -140,10 +414,68 @@ class SolverService:
 
         return inspection
 
-    def _create_solver(self) -> cp_model.CpSolver:
+    def _add_warm_start_hint(self, ctx: SolverContext) -> None:
+        """Hint the last solution for the same units and month, else the imported roster."""
+        if not self._settings.solver_warm_start:
+            return
+
+        previous = self._warm_start.get(ctx.dataset)
+        if previous is not None:
+            source, assignments = "previous_solution", previous
+        else:
+            source, assignments = "planned_assignments", planned_assignments(ctx.dataset)
+
+        if not assignments:
+            return
+
+        hint = build_assignment_hint(ctx, assignments)
+
+        if hint.unmatched_count and self._settings.solver_warm_start_require_complete:
+            logger.info(
+                "Skipping incomplete warm-start hint: source=%s unmatched_assignments=%s",
+                source,
+                hint.unmatched_count,
+            )
+            ctx.diagnostics.append(
+                SolverDiagnostic(
+                    code="warm_start.incomplete_hint",
+                    severity=DiagnosticSeverity.INFO,
+                    message=(
+                        f"Warm-start hint from {source} skipped: "
+                        f"{hint.unmatched_count} assignments have no matching variable."
+                    ),
+                )
+            )
+            return
+
+        add_assignment_hint(ctx, hint)
+        logger.info(
+            "Added warm-start hint: source=%s hinted_assignments=%s unmatched_assignments=%s",
+            source,
+            len(hint.worked),
+            hint.unmatched_count,
+        )
+
+    def _restrict_to_neighborhood(self, ctx: SolverContext, neighborhood: Neighborhood) -> None:
+        hint = build_assignment_hint(ctx, neighborhood.previous_assignments)
+        add_assignment_hint(ctx, hint)
+        fixed_count = fix_outside_neighborhood(ctx, neighborhood, hint)
+
+        logger.info(
+            "Restricted CP-SAT model to neighborhood: employees=%s dates=%s radius_days=%s "
+            "fixed_variables=%s free_variables=%s unmatched_assignments=%s",
+            neighborhood.employee_ids,
+            tuple(changed_date.isoformat() for changed_date in neighborhood.dates),
+            neighborhood.radius_days,
+            fixed_count,
+            len(ctx.assignment_variables) - fixed_count,
+            hint.unmatched_count,
+        )
+
+    def _create_solver(self, *, max_time_seconds: float) -> cp_model.CpSolver:
         solver = cp_model.CpSolver()
 
-        solver.parameters.max_time_in_seconds = self._settings.solver_max_time_seconds
+        solver.parameters.max_time_in_seconds = max_time_seconds
         solver.parameters.log_search_progress = self._settings.solver_log_search_progress
 
         if self._settings.solver_num_search_workers is not None:
@@ -175,35 +507,7 @@ class SolverService:
         ctx: SolverContext,
         solver: cp_model.CpSolver,
     ) -> tuple[Assignment, ...]:
-        assignments: list[Assignment] = []
-
-        for key, variable in ctx.assignment_variables.items():
-            if solver.value(variable) != 1:
-                continue
-
-            employee_id, planning_unit_id, assignment_date, shift_id, _ = key
-
-            assignments.append(
-                Assignment(
-                    employee_id=employee_id,
-                    planning_unit_id=planning_unit_id,
-                    date=assignment_date,
-                    shift_id=shift_id,
-                    assignment_type=AssignmentType.GENERATED,
-                )
-            )
-
-        return tuple(
-            sorted(
-                assignments,
-                key=lambda assignment: (
-                    assignment.planning_unit_id,
-                    assignment.date,
-                    assignment.shift_id,
-                    assignment.employee_id,
-                ),
-            )
-        )
+        return _generated_assignments(ctx=ctx, values=_solution_values(solver))
 
     def _audit_solution(
         self,
@@ -270,3 +574,202 @@ class SolverService:
             logger.error(message, *args)
         else:
             logger.warning(message, *args)
+
+
+class _SolveCallback(cp_model.CpSolverSolutionCallback):
+    """Report improving solutions and stop the search once cancelled.
+
+    Cancellation is also handled by ``_stop_on_cancel``; checking here as well
+    covers a cancel that lands before CP-SAT has set up its search.
+    """
+
+    def __init__(
+        self,
+        *,
+        ctx: SolverContext,
+        on_progress: SolveProgressHandler | None,
+        cancellation: SolveCancellation | None,
+        include_assignments: bool,
+    ) -> None:
+        super().__init__()
+        self._ctx = ctx
+        self._on_progress = on_progress
+        self._cancellation = cancellation
+        self._include_assignments = include_assignments
+        self._solution_count = 0
+
+    def on_solution_callback(self) -> None:
+        self._solution_count += 1
+
+        if self._cancellation is not None and self._cancellation.cancelled:
+            self.stop_search()
+
+        if self._on_progress is None:
+            return
+
+        objective_value = self.objective_value
+        best_objective_bound = self.best_objective_bound
+
+        progress = SolveProgress(
+            solution_count=self._solution_count,
+            objective_value=objective_value,
+            best_objective_bound=best_objective_bound,
+            gap=abs(objective_value - best_objective_bound) / max(abs(objective_value), 1),
+            wall_time_seconds=self.wall_time,
+            assignments=(
+                _generated_assignments(ctx=self._ctx, values=_solution_values(self))
+                if self._include_assignments
+                else None
+            ),
+        )
+
+        # Exceptions must not escape into the native solver thread.
+        try:
+            self._on_progress(progress)
+        except Exception:
+            logger.exception("Solve progress handler failed: solution_count=%s", self._solution_count)
+
+
+def component_settings(settings: Settings, *, concurrent_components: int) -> Settings:
+    """Split one solve's CP-SAT search workers evenly across the components solved at the same time.
+
+    Without an explicit ``solver_num_search_workers`` the solve may use every
+    core, like a single CP-SAT solve would.
+    """
+    budget = settings.solver_num_search_workers or os.cpu_count() or 1
+
+    return settings.model_copy(
+        update={"solver_num_search_workers": max(budget // concurrent_components, 1)},
+    )
+
+
+class _ComponentPool:
+    """Forkserver worker processes for component solves, kept for the lifetime of a service.
+
+    Progress queues and cancel events are created per solve by the manager,
+    whose proxies can be sent to the already running workers.
+    """
+
+    def __init__(self, *, workers: int) -> None:
+        context = multiprocessing.get_context("forkserver")
+        self.manager = context.Manager()
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        self.manager.shutdown()
+
+
+def _solve_component(
+    *,
+    settings: Settings,
+    model_builder: CpSatModelBuilder,
+    component: int,
+    dataset: SchedulingDataset,
+    previous_assignments: tuple[Assignment, ...] | None,
+    progress_queue: "queue.Queue[tuple[int, SolveProgress]] | None",
+    cancel_event: threading.Event,
+) -> Solution:
+    """Solve one component in a worker process, seeded with its last solution."""
+    warm_start = WarmStartCache()
+
+    if previous_assignments:
+        warm_start.put(dataset, previous_assignments)
+
+    solver = SolverService(settings=settings, model_builder=model_builder, warm_start=warm_start)
+    cancellation = SolveCancellation()
+    finished = threading.Event()
+    watcher = threading.Thread(target=_watch_component_cancel, args=(cancel_event, finished, cancellation), daemon=True)
+    watcher.start()
+
+    def send_progress(progress: SolveProgress) -> None:
+        if progress_queue is not None:
+            progress_queue.put((component, progress))
+
+    try:
+        return solver.solve(
+            dataset,
+            on_progress=send_progress if progress_queue is not None else None,
+            cancellation=cancellation,
+        )
+    finally:
+        finished.set()
+        watcher.join()
+
+
+def _watch_component_cancel(
+    cancel_event: threading.Event,
+    finished: threading.Event,
+    cancellation: SolveCancellation,
+) -> None:
+    while not finished.wait(_COMPONENT_POLL_SECONDS):
+        if cancel_event.is_set():
+            cancellation.cancel()
+            return
+
+
+def _forward_component_progress(
+    progress_queue: "queue.Queue[tuple[int, SolveProgress]] | None",
+    report: Callable[[int, SolveProgress], None] | None,
+) -> None:
+    if progress_queue is None or report is None:
+        return
+
+    while True:
+        try:
+            component, progress = progress_queue.get_nowait()
+        except queue.Empty:
+            return
+
+        report(component, progress)
+
+
+def _forward_cancel(
+    cancellation: SolveCancellation | None,
+    cancel_event: threading.Event,
+) -> AbstractContextManager[None]:
+    if cancellation is None:
+        return nullcontext()
+
+    return cancellation.on_cancel(cancel_event.set)
+
+
+def _stop_on_cancel(cancellation: SolveCancellation | None, solver: cp_model.CpSolver) -> AbstractContextManager[None]:
+    if cancellation is None:
+        return nullcontext()
+
+    return cancellation.on_cancel(solver.stop_search)
+
+
+def _generated_assignments(*, ctx: SolverContext, values: Sequence[int]) -> tuple[Assignment, ...]:
+    assignments: list[Assignment] = []
+
+    for key in ctx.assignment_variables.keys_with_value(values):
+        employee_id, planning_unit_id, assignment_date, shift_id, _ = key
+
+        assignments.append(
+            Assignment(
+                employee_id=employee_id,
+                planning_unit_id=planning_unit_id,
+                date=assignment_date,
+                shift_id=shift_id,
+                assignment_type=AssignmentType.GENERATED,
+            )
+        )
+
+    return tuple(
+        sorted(
+            assignments,
+            key=lambda assignment: (
+                assignment.planning_unit_id,
+                assignment.date,
+                assignment.shift_id,
+                assignment.employee_id,
+            ),
+        )
+    )
+
+
+def _solution_values(solver: cp_model.CpSolver | cp_model.CpSolverSolutionCallback) -> Sequence[int]:
+    response: object = solver.response_proto
+    return cast(_CpSolverResponseView, response).solution
@@ -0,0 +1,84 @@
+import logging
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from scheduling.solver.models import Solution
+
+logger = logging.getLogger(__name__)
+
+
+class SolutionCache:
+    """Solutions by solve fingerprint, in an in-memory LRU with an optional disk tier.
+
+    Disk entries are zlib-compressed JSON files named after the fingerprint.
+    They survive restarts and are shared by every process that uses the same
+    directory; a disk hit is promoted into memory.
+    """
+
+    def __init__(self, *, max_entries: int, directory: Path | None = None) -> None:
+        self._max_entries = max_entries
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._solutions: OrderedDict[str, Solution] = OrderedDict()
+
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, fingerprint: str) -> Solution | None:
+        with self._lock:
+            solution = self._solutions.get(fingerprint)
+
+            if solution is not None:
+                self._solutions.move_to_end(fingerprint)
+                return solution
+
+        solution = self._read(fingerprint)
+
+        if solution is not None:
+            self._remember(fingerprint, solution)
+
+        return solution
+
+    def put(self, fingerprint: str, solution: Solution) -> None:
+        self._remember(fingerprint, solution)
+        self._write(fingerprint, solution)
+
+    def _remember(self, fingerprint: str, solution: Solution) -> None:
+        with self._lock:
+            self._solutions[fingerprint] = solution
+            self._solutions.move_to_end(fingerprint)
+
+            while len(self._solutions) > self._max_entries:
+                self._solutions.popitem(last=False)
+
+    def _path(self, fingerprint: str) -> Path | None:
+        if self._directory is None:
+            return None
+
+        return self._directory / f"{fingerprint}.json.z"
+
+    def _read(self, fingerprint: str) -> Solution | None:
+        path = self._path(fingerprint)
+
+        if path is None or not path.exists():
+            return None
+
+        try:
+            return Solution.model_validate_json(zlib.decompress(path.read_bytes()))
+        except (OSError, ValueError, zlib.error):
+            logger.warning("Ignoring unreadable cached solution: path=%s", path, exc_info=True)
+            return None
+
+    def _write(self, fingerprint: str, solution: Solution) -> None:
+        path = self._path(fingerprint)
+
+        if path is None:
+            return
+
+        # Write to a temporary file first so readers never see a partial entry.
+        temporary_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary_path.write_bytes(zlib.compress(solution.model_dump_json(exclude_computed_fields=True).encode()))
+        temporary_path.replace(path)
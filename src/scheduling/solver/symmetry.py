@@ -0,0 +1,55 @@
+"""Find employees the scheduling model cannot tell apart.
+
+Two employees are interchangeable when swapping their schedules maps every
+solution to a solution of equal objective value. That holds when everything
+the model reads about them is equal: staff level, capabilities, memberships
+and monthly work accounts, and neither has wishes, availability entries or
+existing assignments.
+"""
+
+from collections import defaultdict
+from collections.abc import Hashable
+
+from scheduling.domain import EmployeeId, SchedulingDataset
+
+
+def interchangeable_employees(dataset: SchedulingDataset) -> tuple[tuple[EmployeeId, ...], ...]:
+    """Classes of at least two interchangeable employees, each sorted by employee id."""
+    distinguished = {
+        *(wish.employee_id for wish in dataset.wishes),
+        *(item.employee_id for item in dataset.availability),
+        *(assignment.employee_id for assignment in dataset.assignments),
+    }
+    memberships: defaultdict[EmployeeId, list[Hashable]] = defaultdict(list)
+    accounts: defaultdict[EmployeeId, list[Hashable]] = defaultdict(list)
+
+    for membership in dataset.planning_unit_memberships:
+        memberships[membership.employee_id].append(
+            (
+                membership.planning_unit_id,
+                membership.valid_from,
+                membership.valid_until,
+                membership.staff_level,
+                membership.is_home,
+                membership.is_replacement,
+            )
+        )
+
+    for account in dataset.monthly_work_accounts:
+        accounts[account.employee_id].append((account.target_minutes, account.actual_minutes))
+
+    classes: defaultdict[Hashable, list[EmployeeId]] = defaultdict(list)
+
+    for employee in dataset.employees:
+        if employee.employee_id in distinguished or employee.employee_id not in memberships:
+            continue
+
+        signature = (
+            employee.staff_level,
+            tuple(sorted(employee.capabilities)),
+            tuple(sorted(memberships[employee.employee_id], key=repr)),
+            tuple(sorted(accounts[employee.employee_id], key=repr)),
+        )
+        classes[signature].append(employee.employee_id)
+
+    return tuple(sorted(tuple(sorted(employee_ids)) for employee_ids in classes.values() if len(employee_ids) > 1))
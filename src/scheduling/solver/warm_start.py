@@ -0,0 +1,54 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from scheduling.domain import Assignment, AssignmentType, PlanningMonth, SchedulingDataset
+
+type WarmStartKey = tuple[tuple[int, ...], PlanningMonth]
+
+
+class WarmStartCache:
+    """Last generated assignments per (planning units, month), least recently used evicted first.
+
+    Safe to use from several threads, which solve independent components.
+    """
+
+    def __init__(self, *, max_entries: int = 64) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._solutions: OrderedDict[WarmStartKey, tuple[Assignment, ...]] = OrderedDict()
+
+    def get(self, dataset: SchedulingDataset) -> tuple[Assignment, ...] | None:
+        key = warm_start_key(dataset)
+
+        with self._lock:
+            assignments = self._solutions.get(key)
+
+            if assignments is not None:
+                self._solutions.move_to_end(key)
+
+        return assignments
+
+    def put(self, dataset: SchedulingDataset, assignments: Sequence[Assignment]) -> None:
+        key = warm_start_key(dataset)
+
+        with self._lock:
+            self._solutions[key] = tuple(assignments)
+            self._solutions.move_to_end(key)
+
+            while len(self._solutions) > self._max_entries:
+                self._solutions.popitem(last=False)
+
+
+def warm_start_key(dataset: SchedulingDataset) -> WarmStartKey:
+    return (
+        tuple(sorted(planning_unit.planning_unit_id for planning_unit in dataset.planning_units)),
+        dataset.planning_month,
+    )
+
+
+def planned_assignments(dataset: SchedulingDataset) -> tuple[Assignment, ...]:
+    """Imported TimeOffice roster of the selected planning units."""
+    return tuple(
+        assignment for assignment in dataset.assignments if assignment.assignment_type == AssignmentType.PLANNED
+    )
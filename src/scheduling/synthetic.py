@@ -0,0 +1,321 @@
+"""Deterministic synthetic scheduling datasets for benchmarks and scaling tests.
+
+The generated hospital uses the TimeOffice reference shifts and the station 77
+demand pattern, so every dataset can be built, solved, audited and exported
+like a real TimeOffice month.
+"""
+
+import random
+from collections import defaultdict
+from datetime import date, timedelta
+
+from pydantic import Field
+
+from scheduling.domain import (
+    Availability,
+    AvailabilityType,
+    Capability,
+    DemandRequirement,
+    Employee,
+    EmployeeSundayWorkHistory,
+    MonthlyWorkAccount,
+    Plan,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingBaseModel,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    SolverObjectiveWeights,
+    StaffingDemandRole,
+    StaffLevel,
+    Wish,
+    WishType,
+)
+from scheduling.timeoffice.facts import (
+    EARLY_SHIFT_ID,
+    INTERMEDIATE_SHIFT_ID,
+    LATE_SHIFT_ID,
+    NIGHT_SHIFT_ID,
+    STATION_77_DEMAND,
+)
+
+SYNTHETIC_SHIFTS = (
+    Shift(
+        shift_id=EARLY_SHIFT_ID,
+        code="F",
+        type=ShiftType.EARLY,
+        staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+        start_minute=6 * 60,
+        end_minute=14 * 60 + 15,
+        net_work_minutes=460,
+    ),
+    Shift(
+        shift_id=INTERMEDIATE_SHIFT_ID,
+        code="Z",
+        type=ShiftType.INTERMEDIATE,
+        staffing_role=StaffingDemandRole.OPTIONAL_COVERAGE,
+        start_minute=9 * 60,
+        end_minute=17 * 60 + 15,
+        net_work_minutes=460,
+    ),
+    Shift(
+        shift_id=LATE_SHIFT_ID,
+        code="S",
+        type=ShiftType.LATE,
+        staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+        start_minute=13 * 60 + 45,
+        end_minute=22 * 60,
+        net_work_minutes=460,
+    ),
+    Shift(
+        shift_id=NIGHT_SHIFT_ID,
+        code="N",
+        type=ShiftType.NIGHT,
+        staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+        start_minute=21 * 60 + 45,
+        end_minute=6 * 60 + 15,
+        net_work_minutes=565,
+    ),
+)
+
+# Repeating staff level pattern per planning unit, roughly the station 77 mix.
+_STAFF_LEVEL_CYCLE = (
+    StaffLevel.PROFESSIONAL,
+    StaffLevel.ASSISTANT,
+    StaffLevel.PROFESSIONAL,
+    StaffLevel.TRAINEE,
+    StaffLevel.PROFESSIONAL,
+    StaffLevel.ASSISTANT,
+)
+_WISH_SHIFT_IDS = (EARLY_SHIFT_ID, LATE_SHIFT_ID, NIGHT_SHIFT_ID)
+_ABSENCE_TYPES = (AvailabilityType.VACATION, AvailabilityType.VACATION, AvailabilityType.TRAINING)
+
+# Targets slightly above the demanded share leave room for absences; exact
+# shares make the target window so tight that CP-SAT rarely finds a schedule.
+_TARGET_SLACK = 1.1
+
+
+class SyntheticDatasetSpec(SchedulingBaseModel):
+    """Size and density of a synthetic hospital.
+
+    Densities are per employee and day. ``demand_level`` scales the station 77
+    minimum staffing of every planning unit.
+    """
+
+    planning_units: int = Field(default=1, ge=1)
+    employees_per_unit: int = Field(default=30, ge=len(_STAFF_LEVEL_CYCLE))
+    months: int = Field(default=1, ge=1)
+    first_month: PlanningMonth = PlanningMonth(year=2024, month=11)
+    wish_density: float = Field(default=0.05, ge=0, le=1)
+    availability_density: float = Field(default=0.05, ge=0, le=1)
+    demand_level: float = Field(default=1.0, ge=0)
+    seed: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.planning_units}x{self.employees_per_unit}"
+
+
+def generate_datasets(spec: SyntheticDatasetSpec) -> tuple[SchedulingDataset, ...]:
+    """Generate one dataset per month; the same spec always yields the same datasets."""
+    rng = random.Random(spec.seed)
+    planning_units = tuple(
+        PlanningUnit(
+            planning_unit_id=planning_unit_id,
+            display_name=f"Synthetic Station {planning_unit_id}",
+            type=PlanningUnitType.STATION,
+        )
+        for planning_unit_id in range(1, spec.planning_units + 1)
+    )
+    memberships = _memberships(spec, planning_units=planning_units)
+    employees = _employees(spec, memberships)
+    sunday_work_history = tuple(
+        EmployeeSundayWorkHistory(employee_id=employee.employee_id, worked_sundays=rng.randint(0, 6))
+        for employee in employees
+    )
+
+    return tuple(
+        _dataset(
+            spec,
+            rng=rng,
+            planning_month=_add_months(spec.first_month, offset),
+            planning_units=planning_units,
+            employees=employees,
+            memberships=memberships,
+            sunday_work_history=sunday_work_history,
+        )
+        for offset in range(spec.months)
+    )
+
+
+def _dataset(
+    spec: SyntheticDatasetSpec,
+    *,
+    rng: random.Random,
+    planning_month: PlanningMonth,
+    planning_units: tuple[PlanningUnit, ...],
+    employees: tuple[Employee, ...],
+    memberships: tuple[PlanningUnitMembership, ...],
+    sunday_work_history: tuple[EmployeeSundayWorkHistory, ...],
+) -> SchedulingDataset:
+    dates = _dates(planning_month)
+    demand_requirements = _demand_requirements(spec, planning_units=planning_units, dates=dates)
+    wishes: list[Wish] = []
+    availability: list[Availability] = []
+
+    for membership in memberships:
+        for day in dates:
+            if rng.random() < spec.availability_density:
+                availability.append(
+                    Availability(
+                        employee_id=membership.employee_id,
+                        date=day,
+                        availability_type=rng.choice(_ABSENCE_TYPES),
+                    )
+                )
+            elif rng.random() < spec.wish_density:
+                wishes.append(_wish(rng, membership=membership, day=day))
+
+    return SchedulingDataset(
+        planning_month=planning_month,
+        planning_units=planning_units,
+        plans=tuple(
+            Plan(plan_id=1_000 + planning_unit.planning_unit_id, planning_unit_id=planning_unit.planning_unit_id)
+            for planning_unit in planning_units
+        ),
+        shifts=SYNTHETIC_SHIFTS,
+        demand_requirements=demand_requirements,
+        employees=employees,
+        planning_unit_memberships=memberships,
+        sunday_work_history=sunday_work_history,
+        wishes=tuple(wishes),
+        availability=tuple(availability),
+        monthly_work_accounts=_monthly_work_accounts(memberships, demand_requirements=demand_requirements),
+        objective_weights=tuple(
+            SolverObjectiveWeights.default_for_planning_unit(planning_unit.planning_unit_id)
+            for planning_unit in planning_units
+        ),
+    )
+
+
+def _memberships(
+    spec: SyntheticDatasetSpec,
+    *,
+    planning_units: tuple[PlanningUnit, ...],
+) -> tuple[PlanningUnitMembership, ...]:
+    return tuple(
+        PlanningUnitMembership(
+            planning_unit_id=planning_unit.planning_unit_id,
+            employee_id=unit_index * spec.employees_per_unit + index + 1,
+            valid_from=spec.first_month.start,
+            staff_level=_STAFF_LEVEL_CYCLE[index % len(_STAFF_LEVEL_CYCLE)],
+            is_home=True,
+            is_replacement=False,
+        )
+        for unit_index, planning_unit in enumerate(planning_units)
+        for index in range(spec.employees_per_unit)
+    )
+
+
+def _employees(spec: SyntheticDatasetSpec, memberships: tuple[PlanningUnitMembership, ...]) -> tuple[Employee, ...]:
+    # The first professional of every staff level cycle can do rounds.
+    return tuple(
+        Employee(
+            employee_id=membership.employee_id,
+            display_name=f"Synthetic Employee {membership.employee_id}",
+            staff_level=membership.staff_level,
+            capabilities=(
+                (Capability.ROUNDS,)
+                if (membership.employee_id - 1) % spec.employees_per_unit % len(_STAFF_LEVEL_CYCLE) == 0
+                else ()
+            ),
+        )
+        for membership in memberships
+    )
+
+
+def _demand_requirements(
+    spec: SyntheticDatasetSpec,
+    *,
+    planning_units: tuple[PlanningUnit, ...],
+    dates: tuple[date, ...],
+) -> tuple[DemandRequirement, ...]:
+    return tuple(
+        DemandRequirement(
+            planning_unit_id=planning_unit.planning_unit_id,
+            date=day,
+            shift_id=shift_id,
+            staff_level=staff_level,
+            required_count=required_count,
+        )
+        for planning_unit in planning_units
+        for day in dates
+        for staff_level, counts_by_shift_id in STATION_77_DEMAND.items()
+        for shift_id, counts in counts_by_shift_id.items()
+        if (required_count := round(counts[day.weekday()] * spec.demand_level)) > 0
+    )
+
+
+def _monthly_work_accounts(
+    memberships: tuple[PlanningUnitMembership, ...],
+    *,
+    demand_requirements: tuple[DemandRequirement, ...],
+) -> tuple[MonthlyWorkAccount, ...]:
+    """Spread the demanded minutes of each unit and staff level over its employees."""
+    net_work_minutes = {shift.shift_id: shift.net_work_minutes for shift in SYNTHETIC_SHIFTS}
+    demanded_minutes: defaultdict[tuple[int, StaffLevel], int] = defaultdict(int)
+    employee_counts: defaultdict[tuple[int, StaffLevel], int] = defaultdict(int)
+
+    for requirement in demand_requirements:
+        key = (requirement.planning_unit_id, requirement.staff_level)
+        demanded_minutes[key] += requirement.required_count * net_work_minutes[requirement.shift_id]
+
+    for membership in memberships:
+        employee_counts[(membership.planning_unit_id, membership.staff_level)] += 1
+
+    return tuple(
+        MonthlyWorkAccount(
+            employee_id=membership.employee_id,
+            target_minutes=_round_to_hour(
+                demanded_minutes[(membership.planning_unit_id, membership.staff_level)]
+                / employee_counts[(membership.planning_unit_id, membership.staff_level)]
+                * _TARGET_SLACK
+            ),
+            actual_minutes=0,
+        )
+        for membership in memberships
+    )
+
+
+def _wish(rng: random.Random, *, membership: PlanningUnitMembership, day: date) -> Wish:
+    wish_type = rng.choice(tuple(WishType))
+
+    return Wish(
+        employee_id=membership.employee_id,
+        planning_unit_id=membership.planning_unit_id,
+        date=day,
+        type=wish_type,
+        shift_id=(
+            rng.choice(_WISH_SHIFT_IDS) if wish_type in {WishType.FREE_SHIFT, WishType.PREFERRED_SHIFT} else None
+        ),
+    )
+
+
+def _dates(planning_month: PlanningMonth) -> tuple[date, ...]:
+    return tuple(
+        planning_month.start + timedelta(days=offset)
+        for offset in range((planning_month.end - planning_month.start).days + 1)
+    )
+
+
+def _add_months(planning_month: PlanningMonth, offset: int) -> PlanningMonth:
+    year, month = divmod(planning_month.year * 12 + planning_month.month - 1 + offset, 12)
+
+    return PlanningMonth(year=year, month=month + 1)
+
+
+def _round_to_hour(minutes: float) -> int:
+    return round(minutes / 60) * 60
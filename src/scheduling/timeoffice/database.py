@@ -21,4 +21,4 @@ def create_db_engine(settings: Settings) -> Engine:
         },
     )
 
-    return create_engine(url)
+    return create_engine(url, pool_size=settings.db_pool_size)
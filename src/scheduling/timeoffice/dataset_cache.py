@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from scheduling.domain import PlanningMonth, SchedulingDataset
+
+type DatasetKey = tuple[tuple[int, ...], PlanningMonth]
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    dataset: SchedulingDataset
+    expires_at: float
+    size_bytes: int
+
+
+class TimeOfficeDatasetCache:
+    """Validated scheduling datasets by (planning units, month).
+
+    Entries expire after ``ttl_seconds``. The least recently used entries are
+    evicted once the cached datasets exceed ``max_bytes``, measured by their
+    serialized JSON size. A fetch that overlaps an invalidation is not stored,
+    so a writeback is never hidden by a dataset read before it.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[DatasetKey, _Entry] = OrderedDict()
+        self._size_bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_or_fetch(
+        self,
+        planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+        fetch: Callable[[], SchedulingDataset],
+    ) -> SchedulingDataset:
+        key = dataset_key(planning_unit_ids, planning_month)
+
+        with self._lock:
+            dataset = self._get(key)
+
+            if dataset is not None:
+                self._hits += 1
+                return dataset
+
+            self._misses += 1
+            generation = self._generation
+
+        dataset = fetch()
+        size_bytes = len(dataset.model_dump_json(exclude_computed_fields=True))
+
+        with self._lock:
+            if self._generation == generation and size_bytes <= self._max_bytes:
+                self._put(key, _Entry(dataset, self._clock() + self._ttl_seconds, size_bytes))
+
+        return dataset
+
+    def peek(self, planning_unit_ids: tuple[int, ...], planning_month: PlanningMonth) -> SchedulingDataset | None:
+        """Return a cached dataset without fetching on a miss."""
+        with self._lock:
+            dataset = self._get(dataset_key(planning_unit_ids, planning_month))
+
+            if dataset is not None:
+                self._hits += 1
+
+            return dataset
+
+    def invalidate(
+        self,
+        *,
+        planning_unit_id: int,
+        planning_month: PlanningMonth | None = None,
+        employee_id: int | None = None,
+    ) -> None:
+        """Drop datasets that include the planning unit, or the employee when given.
+
+        Without ``planning_month`` every month is dropped.
+        """
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if (planning_month is None or key[1] == planning_month)
+                and (
+                    planning_unit_id in key[0]
+                    or any(employee.employee_id == employee_id for employee in entry.dataset.employees)
+                )
+            ]:
+                self._remove(key)
+
+    def stats(self) -> DatasetCacheStats:
+        with self._lock:
+            return DatasetCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def _get(self, key: DatasetKey) -> SchedulingDataset | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.dataset
+
+    def _put(self, key: DatasetKey, entry: _Entry) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = entry
+        self._size_bytes += entry.size_bytes
+
+        while self._size_bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: DatasetKey) -> None:
+        self._size_bytes -= self._entries.pop(key).size_bytes
+
+
+def dataset_key(planning_unit_ids: tuple[int, ...], planning_month: PlanningMonth) -> DatasetKey:
+    return tuple(sorted(set(planning_unit_ids))), planning_month
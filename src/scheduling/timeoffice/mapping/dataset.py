@@ -4,7 +4,7 @@ from scheduling.timeoffice.mapping.demand import map_demand_requirements
 from scheduling.timeoffice.mapping.objective_weights import map_objective_weights
 from scheduling.timeoffice.mapping.personnel import map_employees, map_planning_unit_memberships
 from scheduling.timeoffice.mapping.planning import map_planning_units, map_plans
-from scheduling.timeoffice.mapping.roster import map_assignments, map_availability
+from scheduling.timeoffice.mapping.roster import MappedRoster
 from scheduling.timeoffice.mapping.shifts import map_shifts
 from scheduling.timeoffice.mapping.sunday_work import map_sunday_work_history
 from scheduling.timeoffice.mapping.wishes import map_wishes
@@ -14,7 +14,7 @@ from scheduling.timeoffice.reading.container import TimeOfficeSources
 
 def map_scheduling_dataset(
     *,
-    sources: TimeOfficeSources,
+    sources: TimeOfficeSources[MappedRoster],
     facts: TimeOfficeFacts,
     planning_month: PlanningMonth,
 ) -> SchedulingDataset:
@@ -32,16 +32,8 @@ def map_scheduling_dataset(
             facts=facts,
         ),
         shifts=shifts,
-        assignments=map_assignments(
-            rows=sources.roster_rows,
-            selected_plan_ids={plan.plan_id for plan in plans},
-            selected_planning_unit_ids={planning_unit.planning_unit_id for planning_unit in planning_units},
-            facts=facts,
-        ),
-        availability=map_availability(
-            rows=sources.roster_rows,
-            facts=facts,
-        ),
+        assignments=sources.roster.assignments,
+        availability=sources.roster.availability,
         demand_requirements=map_demand_requirements(
             planning_month=planning_month,
             planning_units=planning_units,
@@ -1,85 +1,114 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import date, datetime
 
 from scheduling.domain import Assignment, AssignmentType, Availability, AvailabilityType
 from scheduling.timeoffice.facts import TimeOfficeFacts
 from scheduling.timeoffice.mapping.shifts import reference_shift_id_for_source_shift
+from scheduling.timeoffice.reading.planning_units import TimeOfficePlanningUnitRow
 from scheduling.timeoffice.reading.roster import TimeOfficeRosterRow
 
 type AssignmentKey = tuple[int, date, int, AssignmentType, int | None]
 
 
-def map_assignments(
+@dataclass(frozen=True, slots=True)
+class MappedRoster:
+    assignments: tuple[Assignment, ...]
+    availability: tuple[Availability, ...]
+
+
+def map_roster(
+    planning_unit_rows: tuple[TimeOfficePlanningUnitRow, ...],
+    row_chunks: Iterable[tuple[TimeOfficeRosterRow, ...]],
     *,
-    rows: tuple[TimeOfficeRosterRow, ...],
-    selected_plan_ids: set[int],
-    selected_planning_unit_ids: set[int],
     facts: TimeOfficeFacts,
-) -> tuple[Assignment, ...]:
+) -> MappedRoster:
+    """Map assignments and availability in one pass over the roster row chunks.
+
+    Only the chunk being mapped is held, never the whole month of rows.
+    """
+    selected_plan_ids = {row.plan_id for row in planning_unit_rows}
+    selected_planning_unit_ids = {row.planning_unit_id for row in planning_unit_rows}
+
     assignments: list[Assignment] = []
     seen_assignment_keys: set[AssignmentKey] = set()
+    availability_items: list[Availability] = []
 
-    for row in rows:
-        if row.work_shift_id is None:
-            continue
+    for rows in row_chunks:
+        for row in rows:
+            assignment = _map_assignment(
+                row,
+                selected_plan_ids=selected_plan_ids,
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                facts=facts,
+            )
 
-        reference_shift_id = reference_shift_id_for_source_shift(
-            source_shift_id=row.work_shift_id,
-            source_shift_code=row.work_shift_code,
-            facts=facts,
-            context=(f"TimeOffice roster work row employee_id={row.employee_id} date={row.roster_date.date()}"),
-        )
+            if assignment is not None and (assignment_key := _assignment_key(assignment)) not in seen_assignment_keys:
+                seen_assignment_keys.add(assignment_key)
+                assignments.append(assignment)
 
-        assignment_type = _assignment_type(
-            plan_id=row.plan_id,
-            planning_unit_id=row.planning_unit_id,
-            selected_plan_ids=selected_plan_ids,
-            selected_planning_unit_ids=selected_planning_unit_ids,
-        )
+            if (availability := _map_availability(row, facts=facts)) is not None:
+                availability_items.append(availability)
 
-        assignment = Assignment(
-            employee_id=row.employee_id,
-            date=row.roster_date.date(),
-            shift_id=reference_shift_id,
-            assignment_type=assignment_type,
-            planning_unit_id=(row.planning_unit_id if assignment_type == AssignmentType.PLANNED else None),
-        )
+    return MappedRoster(assignments=tuple(assignments), availability=tuple(availability_items))
 
-        assignment_key = _assignment_key(assignment)
-        if assignment_key in seen_assignment_keys:
-            continue
 
-        seen_assignment_keys.add(assignment_key)
-        assignments.append(assignment)
+def map_availability(*, rows: Iterable[TimeOfficeRosterRow], facts: TimeOfficeFacts) -> tuple[Availability, ...]:
+    return tuple(availability for row in rows if (availability := _map_availability(row, facts=facts)) is not None)
 
-    return tuple(assignments)
 
+def _map_assignment(
+    row: TimeOfficeRosterRow,
+    *,
+    selected_plan_ids: set[int],
+    selected_planning_unit_ids: set[int],
+    facts: TimeOfficeFacts,
+) -> Assignment | None:
+    if row.work_shift_id is None:
+        return None
 
-def map_availability(*, rows: tuple[TimeOfficeRosterRow, ...], facts: TimeOfficeFacts) -> tuple[Availability, ...]:
-    availability_items: list[Availability] = []
+    reference_shift_id = reference_shift_id_for_source_shift(
+        source_shift_id=row.work_shift_id,
+        source_shift_code=row.work_shift_code,
+        facts=facts,
+        context=(f"TimeOffice roster work row employee_id={row.employee_id} date={row.roster_date.date()}"),
+    )
 
-    for row in rows:
-        if not _has_absence(row):
-            continue
+    assignment_type = _assignment_type(
+        plan_id=row.plan_id,
+        planning_unit_id=row.planning_unit_id,
+        selected_plan_ids=selected_plan_ids,
+        selected_planning_unit_ids=selected_planning_unit_ids,
+    )
 
-        availability_type = _availability_type_for_absence_code(
-            row.resolved_absence_code,
-            facts=facts,
-            employee_id=row.employee_id,
-            roster_date=row.roster_date,
-        )
+    return Assignment(
+        employee_id=row.employee_id,
+        date=row.roster_date.date(),
+        shift_id=reference_shift_id,
+        assignment_type=assignment_type,
+        planning_unit_id=(row.planning_unit_id if assignment_type == AssignmentType.PLANNED else None),
+    )
 
-        if availability_type is None:
-            continue
 
-        availability_items.append(
-            Availability(
-                employee_id=row.employee_id,
-                date=row.roster_date.date(),
-                availability_type=availability_type,
-            )
-        )
+def _map_availability(row: TimeOfficeRosterRow, *, facts: TimeOfficeFacts) -> Availability | None:
+    if not _has_absence(row):
+        return None
+
+    availability_type = _availability_type_for_absence_code(
+        row.resolved_absence_code,
+        facts=facts,
+        employee_id=row.employee_id,
+        roster_date=row.roster_date,
+    )
 
-    return tuple(availability_items)
+    if availability_type is None:
+        return None
+
+    return Availability(
+        employee_id=row.employee_id,
+        date=row.roster_date.date(),
+        availability_type=availability_type,
+    )
 
 
 def _assignment_key(assignment: Assignment) -> AssignmentKey:
@@ -1,6 +1,15 @@
-from scheduling.timeoffice.reading.container import TimeOfficeReaders, TimeOfficeSources
+from scheduling.timeoffice.reading.container import (
+    RosterFold,
+    TimeOfficeEmployeeSources,
+    TimeOfficeReaders,
+    TimeOfficeSources,
+    collect_roster_rows,
+)
 
 __all__ = [
+    "RosterFold",
+    "TimeOfficeEmployeeSources",
     "TimeOfficeReaders",
     "TimeOfficeSources",
+    "collect_roster_rows",
 ]
@@ -0,0 +1,105 @@
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import cast
+
+
+class ReferenceSource(StrEnum):
+    SHIFTS = "shifts"
+    PLANNING_UNIT_OPTIONS = "planning_unit_options"
+    DEMAND = "demand"
+    OBJECTIVE_WEIGHTS = "objective_weights"
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+
+@dataclass(slots=True)
+class _SourceState:
+    generation: int = 0
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class TimeOfficeReferenceCache:
+    """Read-through cache for TimeOffice reference rows that rarely change.
+
+    Entries expire after ``ttl_seconds``. Writers invalidate a source when they
+    replace its rows, and a read that overlaps an invalidation is not stored.
+    Writes by other TimeOffice clients only show up once the entry expires.
+    """
+
+    def __init__(self, *, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[ReferenceSource, Hashable], tuple[float, tuple[object, ...]]] = {}
+        self._states = {source: _SourceState() for source in ReferenceSource}
+
+    def get_or_read[T](
+        self,
+        source: ReferenceSource,
+        key: Hashable,
+        read: Callable[[], tuple[T, ...]],
+    ) -> tuple[T, ...]:
+        entry_key = (source, key)
+        state = self._states[source]
+
+        with self._lock:
+            entry = self._entries.get(entry_key)
+
+            if entry is not None and entry[0] > self._clock():
+                state.hits += 1
+                return cast(tuple[T, ...], entry[1])
+
+            state.misses += 1
+            generation = state.generation
+
+        rows = read()
+
+        with self._lock:
+            if state.generation == generation:
+                self._entries[entry_key] = (self._clock() + self._ttl_seconds, rows)
+
+        return rows
+
+    def invalidate(self, source: ReferenceSource) -> None:
+        with self._lock:
+            state = self._states[source]
+            state.generation += 1
+            state.invalidations += 1
+
+            for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == source]:
+                del self._entries[entry_key]
+
+    def stats(self) -> dict[ReferenceSource, ReferenceCacheStats]:
+        with self._lock:
+            return {
+                source: ReferenceCacheStats(
+                    hits=state.hits,
+                    misses=state.misses,
+                    invalidations=state.invalidations,
+                    entries=sum(1 for entry_source, _ in self._entries if entry_source == source),
+                )
+                for source, state in self._states.items()
+            }
+
+
+def read_through[T](
+    cache: TimeOfficeReferenceCache | None,
+    source: ReferenceSource,
+    key: Hashable,
+    read: Callable[[], tuple[T, ...]],
+) -> tuple[T, ...]:
+    if cache is None:
+        return read()
+
+    return cache.get_or_read(source, key, read)
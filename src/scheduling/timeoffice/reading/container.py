@@ -1,9 +1,16 @@
+import logging
+import time
+from collections.abc import Callable, Iterator, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
+from typing import Protocol
 
-from sqlalchemy import Connection
+from sqlalchemy import Connection, Engine
 
 from scheduling.domain import PlanningMonth
 from scheduling.timeoffice.facts import TimeOfficeFacts
+from scheduling.timeoffice.reading.cache import TimeOfficeReferenceCache
 from scheduling.timeoffice.reading.demand import TimeOfficeDemandReader, TimeOfficeDemandRow
 from scheduling.timeoffice.reading.objective_weights import TimeOfficeObjectiveWeightRow, TimeOfficeWeightsReader
 from scheduling.timeoffice.reading.options import TimeOfficeOptionsReader
@@ -23,10 +30,30 @@ from scheduling.timeoffice.reading.work_accounts import (
     TimeOfficeMonthlyWorkAccountRow,
 )
 
+logger = logging.getLogger(__name__)
+
+# Consumes the roster row chunks while they are read. The chunks hold the
+# result open on the reading connection, so a fold must exhaust them.
+type RosterFold[RosterT] = Callable[
+    [tuple[TimeOfficePlanningUnitRow, ...], Iterator[tuple[TimeOfficeRosterRow, ...]]],
+    RosterT,
+]
+
+
+def collect_roster_rows(
+    planning_unit_rows: tuple[TimeOfficePlanningUnitRow, ...],
+    row_chunks: Iterator[tuple[TimeOfficeRosterRow, ...]],
+) -> tuple[TimeOfficeRosterRow, ...]:
+    """Roster fold that keeps the rows themselves."""
+    return tuple(chain.from_iterable(row_chunks))
+
 
 @dataclass(frozen=True, slots=True)
-class TimeOfficeSources:
-    """TimeOffice source rows for one selected planning month."""
+class TimeOfficeSources[RosterT]:
+    """TimeOffice source rows for one selected planning month.
+
+    ``roster`` is what the caller's roster fold made of the roster rows.
+    """
 
     planning_unit_rows: tuple[TimeOfficePlanningUnitRow, ...]
 
@@ -37,7 +64,7 @@ class TimeOfficeSources:
     planning_unit_membership_rows: tuple[TimeOfficePlanningUnitMembershipRow, ...]
 
     shift_rows: tuple[TimeOfficeShiftRow, ...]
-    roster_rows: tuple[TimeOfficeRosterRow, ...]
+    roster: RosterT
     wish_rows: tuple[TimeOfficeWishRow, ...]
     demand_rows: tuple[TimeOfficeDemandRow, ...]
     sunday_history_rows: tuple[TimeOfficeSundayHistoryRow, ...]
@@ -45,6 +72,31 @@ class TimeOfficeSources:
     objective_weight_rows: tuple[TimeOfficeObjectiveWeightRow, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class TimeOfficeEmployeeSources:
+    """TimeOffice planning-unit and personnel rows, the prefix of every month read."""
+
+    planning_unit_rows: tuple[TimeOfficePlanningUnitRow, ...]
+    plan_personnel_rows: tuple[TimeOfficePlanPersonnelRow, ...]
+    planning_unit_membership_rows: tuple[TimeOfficePlanningUnitMembershipRow, ...]
+    employee_rows: tuple[TimeOfficeEmployeeRow, ...]
+
+    @property
+    def plan_ids(self) -> tuple[int, ...]:
+        return tuple(row.plan_id for row in self.planning_unit_rows)
+
+    @property
+    def planning_unit_ids(self) -> tuple[int, ...]:
+        return tuple(row.planning_unit_id for row in self.planning_unit_rows)
+
+    @property
+    def employee_ids(self) -> tuple[int, ...]:
+        return _collect_relevant_employee_ids(
+            plan_personnel_rows=self.plan_personnel_rows,
+            planning_unit_membership_rows=self.planning_unit_membership_rows,
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class TimeOfficeReaders:
     options: TimeOfficeOptionsReader
@@ -59,29 +111,99 @@ class TimeOfficeReaders:
     weights: TimeOfficeWeightsReader
 
     @classmethod
-    def create(cls, *, facts: TimeOfficeFacts) -> "TimeOfficeReaders":
+    def create(
+        cls,
+        *,
+        facts: TimeOfficeFacts,
+        reference_cache: TimeOfficeReferenceCache | None = None,
+        roster_chunk_size: int = 10_000,
+    ) -> "TimeOfficeReaders":
         return cls(
-            options=TimeOfficeOptionsReader(facts=facts),
+            options=TimeOfficeOptionsReader(facts=facts, reference_cache=reference_cache),
             planning_units=TimeOfficePlanningUnitReader(facts=facts),
             personnel=TimeOfficePersonnelReader(),
-            shifts=TimeOfficeShiftReader(facts=facts),
-            roster=TimeOfficeRosterReader(),
+            shifts=TimeOfficeShiftReader(facts=facts, reference_cache=reference_cache),
+            roster=TimeOfficeRosterReader(chunk_size=roster_chunk_size),
             wishes=TimeOfficeWishReader(),
             sunday_work_history=TimeOfficeSundayWorkHistoryReader(),
             monthly_work_accounts=TimeOfficeMonthlyWorkAccountReader(facts=facts),
-            demand=TimeOfficeDemandReader(),
-            weights=TimeOfficeWeightsReader(),
+            demand=TimeOfficeDemandReader(reference_cache=reference_cache),
+            weights=TimeOfficeWeightsReader(reference_cache=reference_cache),
+        )
+
+    def read_sources[RosterT](
+        self,
+        *,
+        connection: Connection,
+        selected_planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+        fold_roster: RosterFold[RosterT],
+    ) -> TimeOfficeSources[RosterT]:
+        return self._read_sources(
+            _SequentialReads(connection),
+            selected_planning_unit_ids=selected_planning_unit_ids,
+            planning_month=planning_month,
+            fold_roster=fold_roster,
         )
 
-    def read_sources(
+    def read_employee_sources(
         self,
         *,
         connection: Connection,
         selected_planning_unit_ids: tuple[int, ...],
         planning_month: PlanningMonth,
-    ) -> TimeOfficeSources:
-        planning_unit_rows = self.planning_units.read_rows(
-            connection=connection,
+    ) -> TimeOfficeEmployeeSources:
+        """Read only what is needed to know the selected units' employees."""
+        reads = _SequentialReads(connection)
+
+        planning_unit_rows = self._read_planning_unit_rows(
+            reads,
+            selected_planning_unit_ids=selected_planning_unit_ids,
+            planning_month=planning_month,
+        )
+
+        return self._submit_employee_reads(
+            reads,
+            planning_unit_rows=planning_unit_rows,
+            planning_month=planning_month,
+        ).sources()
+
+    def read_sources_concurrently[RosterT](
+        self,
+        *,
+        engine: Engine,
+        max_workers: int,
+        selected_planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+        fold_roster: RosterFold[RosterT],
+    ) -> TimeOfficeSources[RosterT]:
+        """Read the sources with independent queries running on separate pooled connections.
+
+        Queries only wait for the ids they filter by, so the fetch takes about
+        as long as its slowest dependency chain instead of the sum of all
+        queries. The queries do not share a transaction, same as the
+        sequential reads on one autocommitting connection.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="timeoffice-read") as executor:
+            return self._read_sources(
+                _ConcurrentReads(engine, executor),
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+                fold_roster=fold_roster,
+            )
+
+    def _read_sources[RosterT](
+        self,
+        reads: "_SourceReads",
+        *,
+        selected_planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+        fold_roster: RosterFold[RosterT],
+    ) -> TimeOfficeSources[RosterT]:
+        shift_rows = reads.submit("shifts", lambda connection: self.shifts.read_rows(connection=connection))
+
+        planning_unit_rows = self._read_planning_unit_rows(
+            reads,
             selected_planning_unit_ids=selected_planning_unit_ids,
             planning_month=planning_month,
         )
@@ -89,80 +211,211 @@ class TimeOfficeReaders:
         plan_ids = tuple(row.plan_id for row in planning_unit_rows)
         planning_unit_ids = tuple(row.planning_unit_id for row in planning_unit_rows)
 
-        plan_personnel_rows = self.personnel.read_plan_personnel_rows(
-            connection=connection,
-            plan_ids=plan_ids,
+        demand_rows = reads.submit(
+            "demand",
+            lambda connection: self.demand.read_minimal_staffing(
+                connection=connection,
+                planning_unit_ids=planning_unit_ids,
+            ),
         )
 
-        planning_unit_membership_rows = self.personnel.read_membership_rows(
-            connection=connection,
-            planning_unit_ids=planning_unit_ids,
+        objective_weight_rows = reads.submit(
+            "objective_weights",
+            lambda connection: self.weights.read_rows(
+                connection=connection,
+                planning_unit_ids=planning_unit_ids,
+            ),
+        )
+
+        employees = self._submit_employee_reads(
+            reads,
+            planning_unit_rows=planning_unit_rows,
             planning_month=planning_month,
         )
+        employee_ids = employees.employee_ids
 
-        employee_ids = _collect_relevant_employee_ids(
-            plan_personnel_rows=plan_personnel_rows,
-            planning_unit_membership_rows=planning_unit_membership_rows,
+        roster = reads.submit(
+            "roster",
+            lambda connection: fold_roster(
+                planning_unit_rows,
+                self.roster.read_row_chunks(
+                    connection=connection,
+                    employee_ids=employee_ids,
+                    planning_month=planning_month,
+                ),
+            ),
         )
 
-        employee_rows = self.personnel.read_employee_rows(
-            connection=connection,
-            employee_ids=employee_ids,
+        wish_rows = reads.submit(
+            "wishes",
+            lambda connection: self.wishes.read_rows(
+                connection=connection,
+                plan_ids=plan_ids,
+                planning_unit_ids=planning_unit_ids,
+                employee_ids=employee_ids,
+                planning_month=planning_month,
+            ),
         )
 
-        shift_rows = self.shifts.read_rows(connection=connection)
+        sunday_history_rows = reads.submit(
+            "sunday_work_history",
+            lambda connection: self.sunday_work_history.read_rows(
+                connection=connection,
+                employee_ids=employee_ids,
+                planning_month=planning_month,
+            ),
+        )
 
-        roster_rows = self.roster.read_rows(
-            connection=connection,
-            employee_ids=employee_ids,
-            planning_month=planning_month,
+        monthly_work_account_rows = reads.submit(
+            "monthly_work_accounts",
+            lambda connection: self.monthly_work_accounts.read_rows(
+                connection=connection,
+                employee_ids=employee_ids,
+                planning_month=planning_month,
+            ),
         )
 
-        wish_rows = self.wishes.read_rows(
-            connection=connection,
-            plan_ids=plan_ids,
-            planning_unit_ids=planning_unit_ids,
-            employee_ids=employee_ids,
-            planning_month=planning_month,
+        return TimeOfficeSources(
+            planning_unit_rows=planning_unit_rows,
+            plan_personnel_rows=employees.plan_personnel_rows,
+            employee_rows=employees.employee_rows.result(),
+            planning_unit_membership_rows=employees.planning_unit_membership_rows,
+            shift_rows=shift_rows.result(),
+            roster=roster.result(),
+            wish_rows=wish_rows.result(),
+            sunday_history_rows=sunday_history_rows.result(),
+            monthly_work_account_rows=monthly_work_account_rows.result(),
+            demand_rows=demand_rows.result(),
+            objective_weight_rows=objective_weight_rows.result(),
         )
 
-        sunday_history_rows = self.sunday_work_history.read_rows(
-            connection=connection,
-            employee_ids=employee_ids,
-            planning_month=planning_month,
+    def _read_planning_unit_rows(
+        self,
+        reads: "_SourceReads",
+        *,
+        selected_planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> tuple[TimeOfficePlanningUnitRow, ...]:
+        return reads.submit(
+            "planning_units",
+            lambda connection: self.planning_units.read_rows(
+                connection=connection,
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+            ),
+        ).result()
+
+    def _submit_employee_reads(
+        self,
+        reads: "_SourceReads",
+        *,
+        planning_unit_rows: tuple[TimeOfficePlanningUnitRow, ...],
+        planning_month: PlanningMonth,
+    ) -> "_EmployeeReads":
+        """Resolve the employee ids and submit the employee read without waiting for it."""
+        plan_personnel_rows = reads.submit(
+            "plan_personnel",
+            lambda connection: self.personnel.read_plan_personnel_rows(
+                connection=connection,
+                plan_ids=tuple(row.plan_id for row in planning_unit_rows),
+            ),
         )
 
-        monthly_work_account_rows = self.monthly_work_accounts.read_rows(
-            connection=connection,
-            employee_ids=employee_ids,
-            planning_month=planning_month,
+        planning_unit_membership_rows = reads.submit(
+            "planning_unit_memberships",
+            lambda connection: self.personnel.read_membership_rows(
+                connection=connection,
+                planning_unit_ids=tuple(row.planning_unit_id for row in planning_unit_rows),
+                planning_month=planning_month,
+            ),
         )
 
-        demand_rows = self.demand.read_minimal_staffing(
-            connection=connection,
-            planning_unit_ids=planning_unit_ids,
+        employee_ids = _collect_relevant_employee_ids(
+            plan_personnel_rows=plan_personnel_rows.result(),
+            planning_unit_membership_rows=planning_unit_membership_rows.result(),
         )
 
-        objective_weight_rows = self.weights.read_rows(
-            connection=connection,
-            planning_unit_ids=planning_unit_ids,
+        employee_rows = reads.submit(
+            "employees",
+            lambda connection: self.personnel.read_employee_rows(
+                connection=connection,
+                employee_ids=employee_ids,
+            ),
         )
 
-        return TimeOfficeSources(
+        return _EmployeeReads(
             planning_unit_rows=planning_unit_rows,
-            plan_personnel_rows=plan_personnel_rows,
+            plan_personnel_rows=plan_personnel_rows.result(),
+            planning_unit_membership_rows=planning_unit_membership_rows.result(),
+            employee_ids=employee_ids,
             employee_rows=employee_rows,
-            planning_unit_membership_rows=planning_unit_membership_rows,
-            shift_rows=shift_rows,
-            roster_rows=roster_rows,
-            wish_rows=wish_rows,
-            sunday_history_rows=sunday_history_rows,
-            monthly_work_account_rows=monthly_work_account_rows,
-            demand_rows=demand_rows,
-            objective_weight_rows=objective_weight_rows,
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _EmployeeReads:
+    """Employee reads whose ids are known while the employee rows may still be in flight."""
+
+    planning_unit_rows: tuple[TimeOfficePlanningUnitRow, ...]
+    plan_personnel_rows: tuple[TimeOfficePlanPersonnelRow, ...]
+    planning_unit_membership_rows: tuple[TimeOfficePlanningUnitMembershipRow, ...]
+    employee_ids: tuple[int, ...]
+    employee_rows: Future[tuple[TimeOfficeEmployeeRow, ...]]
+
+    def sources(self) -> TimeOfficeEmployeeSources:
+        return TimeOfficeEmployeeSources(
+            planning_unit_rows=self.planning_unit_rows,
+            plan_personnel_rows=self.plan_personnel_rows,
+            planning_unit_membership_rows=self.planning_unit_membership_rows,
+            employee_rows=self.employee_rows.result(),
+        )
+
+
+class _SourceReads(Protocol):
+    def submit[T](self, source: str, read: Callable[[Connection], T]) -> Future[T]: ...
+
+
+class _SequentialReads:
+    """Runs each read immediately on one shared connection."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    def submit[T](self, source: str, read: Callable[[Connection], T]) -> Future[T]:
+        future: Future[T] = Future()
+        future.set_result(_timed_read(source, read, self._connection))
+        return future
+
+
+class _ConcurrentReads:
+    """Runs each read on the executor with its own pooled connection."""
+
+    def __init__(self, engine: Engine, executor: ThreadPoolExecutor) -> None:
+        self._engine = engine
+        self._executor = executor
+
+    def submit[T](self, source: str, read: Callable[[Connection], T]) -> Future[T]:
+        return self._executor.submit(self._read, source, read)
+
+    def _read[T](self, source: str, read: Callable[[Connection], T]) -> T:
+        with self._engine.connect() as connection:
+            return _timed_read(source, read, connection)
+
+
+def _timed_read[T](source: str, read: Callable[[Connection], T], connection: Connection) -> T:
+    started = time.perf_counter()
+    result = read(connection)
+
+    logger.debug(
+        "Read TimeOffice source: source=%s rows=%s elapsed_ms=%.1f",
+        source,
+        len(result) if isinstance(result, Sized) else "folded",
+        (time.perf_counter() - started) * 1000,
+    )
+
+    return result
+
+
 def _collect_relevant_employee_ids(
     *,
     plan_personnel_rows: tuple[TimeOfficePlanPersonnelRow, ...],
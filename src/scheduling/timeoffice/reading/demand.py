@@ -1,6 +1,7 @@
 from sqlalchemy import Connection, text
 
 from scheduling.domain.core import SchedulingBaseModel
+from scheduling.timeoffice.reading.cache import ReferenceSource, TimeOfficeReferenceCache, read_through
 
 
 class TimeOfficeDemandRow(SchedulingBaseModel):
@@ -12,11 +13,27 @@ class TimeOfficeDemandRow(SchedulingBaseModel):
 
 
 class TimeOfficeDemandReader:
+    def __init__(self, *, reference_cache: TimeOfficeReferenceCache | None = None) -> None:
+        self._reference_cache = reference_cache
+
     def read_minimal_staffing(
         self,
         *,
         connection: Connection,
         planning_unit_ids: tuple[int, ...],
+    ) -> tuple[TimeOfficeDemandRow, ...]:
+        return read_through(
+            self._reference_cache,
+            ReferenceSource.DEMAND,
+            planning_unit_ids,
+            lambda: self._read_minimal_staffing(connection=connection, planning_unit_ids=planning_unit_ids),
+        )
+
+    def _read_minimal_staffing(
+        self,
+        *,
+        connection: Connection,
+        planning_unit_ids: tuple[int, ...],
     ) -> tuple[TimeOfficeDemandRow, ...]:
         '''
         self._ensure_minimal_staffing_table_exists(connection=connection)
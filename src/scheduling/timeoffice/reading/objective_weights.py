@@ -1,6 +1,7 @@
 from sqlalchemy import Connection, text
 
 from scheduling.domain.core import SchedulingBaseModel
+from scheduling.timeoffice.reading.cache import ReferenceSource, TimeOfficeReferenceCache, read_through
 
 
 class TimeOfficeObjectiveWeightRow(SchedulingBaseModel):
@@ -10,11 +11,27 @@ class TimeOfficeObjectiveWeightRow(SchedulingBaseModel):
 
 
 class TimeOfficeWeightsReader:
+    def __init__(self, *, reference_cache: TimeOfficeReferenceCache | None = None) -> None:
+        self._reference_cache = reference_cache
+
     def read_rows(
         self,
         *,
         connection: Connection,
         planning_unit_ids: tuple[int, ...],
+    ) -> tuple[TimeOfficeObjectiveWeightRow, ...]:
+        return read_through(
+            self._reference_cache,
+            ReferenceSource.OBJECTIVE_WEIGHTS,
+            planning_unit_ids,
+            lambda: self._read_rows(connection=connection, planning_unit_ids=planning_unit_ids),
+        )
+
+    def _read_rows(
+        self,
+        *,
+        connection: Connection,
+        planning_unit_ids: tuple[int, ...],
     ) -> tuple[TimeOfficeObjectiveWeightRow, ...]:
         '''self._ensure_objective_weights_table_exists(connection=connection)
 
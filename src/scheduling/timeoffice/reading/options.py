@@ -1,23 +1,40 @@
+from dataclasses import dataclass
+
 from sqlalchemy import bindparam, text
 from sqlalchemy.engine import Connection
 
 from scheduling.timeoffice.facts import TimeOfficeFacts
-from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.cache import ReferenceSource, TimeOfficeReferenceCache, read_through
+from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, TimeOfficeSourceRow, decode_rows
 
 
+@dataclass(frozen=True, slots=True)
 class TimeOfficePlanningUnitOptionRow(TimeOfficeSourceRow):
     planning_unit_id: SourceInt
-    planning_unit_code: CleanNullableText = None
+    planning_unit_code: CleanNullableText
 
 
 class TimeOfficeOptionsReader:
-    def __init__(self, *, facts: TimeOfficeFacts) -> None:
+    def __init__(self, *, facts: TimeOfficeFacts, reference_cache: TimeOfficeReferenceCache | None = None) -> None:
         self._facts = facts
+        self._reference_cache = reference_cache
 
     def read_planning_unit_option_rows(
         self,
         *,
         connection: Connection,
+    ) -> tuple[TimeOfficePlanningUnitOptionRow, ...]:
+        return read_through(
+            self._reference_cache,
+            ReferenceSource.PLANNING_UNIT_OPTIONS,
+            (),
+            lambda: self._read_planning_unit_option_rows(connection=connection),
+        )
+
+    def _read_planning_unit_option_rows(
+        self,
+        *,
+        connection: Connection,
     ) -> tuple[TimeOfficePlanningUnitOptionRow, ...]:
         planning_unit_ids = tuple(sorted(self._facts.planning_unit_type_by_id))
 
@@ -45,4 +62,4 @@ class TimeOfficeOptionsReader:
             .all()
         )
 
-        return tuple(TimeOfficePlanningUnitOptionRow.model_validate(row) for row in raw_rows)
+        return decode_rows(TimeOfficePlanningUnitOptionRow, raw_rows)
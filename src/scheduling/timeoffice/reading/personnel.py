@@ -1,39 +1,43 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Self
 
-from pydantic import model_validator
 from sqlalchemy import Connection, bindparam, text
 
 from scheduling.domain import PlanningMonth
-from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, TimeOfficeSourceRow, decode_rows
 
 
+@dataclass(slots=True)
 class TimeOfficePlanPersonnelRow(TimeOfficeSourceRow):
     plan_id: SourceInt
     planning_unit_id: SourceInt
     employee_id: SourceInt
 
 
+@dataclass(slots=True)
 class TimeOfficeEmployeeRow(TimeOfficeSourceRow):
     employee_id: SourceInt
     employee_profession_id: SourceInt
-    employee_profession_code: CleanNullableText = None
-    first_name: CleanNullableText = None
-    last_name: CleanNullableText = None
+    employee_profession_code: CleanNullableText
+    first_name: CleanNullableText
+    last_name: CleanNullableText
 
 
+@dataclass(slots=True)
 class TimeOfficePlanningUnitMembershipRow(TimeOfficeSourceRow):
     planning_unit_id: SourceInt
     employee_id: SourceInt
     membership_profession_id: SourceInt
-    membership_profession_code: CleanNullableText = None
+    membership_profession_code: CleanNullableText
     valid_from: datetime
-    valid_until: datetime | None = None
+    valid_until: datetime | None
     is_home: bool
     is_replacement: bool
 
-    @model_validator(mode="after")
-    def validate_interval(self) -> Self:
+    def __post_init__(self) -> None:
+        self.validate_interval()
+
+    def validate_interval(self) -> None:
         if self.valid_until is not None and self.valid_until < self.valid_from:
             raise ValueError(
                 "Invalid TimeOffice planning-unit membership interval: "
@@ -43,8 +47,6 @@ class TimeOfficePlanningUnitMembershipRow(TimeOfficeSourceRow):
                 f"valid_until={self.valid_until!r}."
             )
 
-        return self
-
 
 class TimeOfficePersonnelReader:
     """Reads TimeOffice personnel source rows used for scheduling."""
@@ -77,7 +79,7 @@ class TimeOfficePersonnelReader:
 
         raw_rows = connection.execute(query, {"plan_ids": plan_ids}).mappings().all()
 
-        return tuple(TimeOfficePlanPersonnelRow.model_validate(row) for row in raw_rows)
+        return decode_rows(TimeOfficePlanPersonnelRow, raw_rows)
 
     def read_membership_rows(
         self,
@@ -131,7 +133,7 @@ class TimeOfficePersonnelReader:
             .all()
         )
 
-        return tuple(TimeOfficePlanningUnitMembershipRow.model_validate(row) for row in raw_rows)
+        return decode_rows(TimeOfficePlanningUnitMembershipRow, raw_rows)
 
     def read_employee_rows(
         self,
@@ -163,7 +165,7 @@ class TimeOfficePersonnelReader:
 
         raw_rows = connection.execute(query, {"employee_ids": employee_ids}).mappings().all()
 
-        rows = tuple(TimeOfficeEmployeeRow.model_validate(row) for row in raw_rows)
+        rows = decode_rows(TimeOfficeEmployeeRow, raw_rows)
         self._validate_all_requested_employees_found(
             requested_employee_ids=employee_ids,
             rows=rows,
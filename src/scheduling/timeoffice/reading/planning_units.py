@@ -1,20 +1,22 @@
-from typing import Self
+from dataclasses import dataclass
 
-from pydantic import model_validator
 from sqlalchemy import Connection, bindparam, text
 
 from scheduling.domain import PlanningMonth
 from scheduling.timeoffice.facts import TimeOfficeFacts
-from scheduling.timeoffice.reading.types import SourceInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.types import SourceInt, TimeOfficeSourceRow, decode_rows
 
 
+@dataclass(slots=True)
 class TimeOfficePlanningUnitRow(TimeOfficeSourceRow):
     planning_unit_id: SourceInt
     plan_id: SourceInt
     plan_planning_unit_id: SourceInt
 
-    @model_validator(mode="after")
-    def validate_plan_reference(self) -> Self:
+    def __post_init__(self) -> None:
+        self.validate_plan_reference()
+
+    def validate_plan_reference(self) -> None:
         if self.plan_planning_unit_id != self.planning_unit_id:
             raise ValueError(
                 "TimeOffice plan row references a different planning unit than the selected unit: "
@@ -23,8 +25,6 @@ class TimeOfficePlanningUnitRow(TimeOfficeSourceRow):
                 f"plan_planning_unit_id={self.plan_planning_unit_id}."
             )
 
-        return self
-
 
 class TimeOfficePlanningUnitReader:
     """Reads selected TimeOffice planning-unit and target-plan source rows."""
@@ -75,7 +75,7 @@ class TimeOfficePlanningUnitReader:
             .all()
         )
 
-        rows = tuple(TimeOfficePlanningUnitRow.model_validate(row) for row in raw_rows)
+        rows = decode_rows(TimeOfficePlanningUnitRow, raw_rows)
         self._validate_requested_units(requested_ids=selected_planning_unit_ids, rows=rows)
 
         return rows
@@ -1,30 +1,41 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Self
+from itertools import chain
 
-from pydantic import model_validator
 from sqlalchemy import Connection, bindparam, text
 
 from scheduling.domain import PlanningMonth
-from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, SourceNullableInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.types import (
+    CleanNullableText,
+    SourceInt,
+    SourceNullableInt,
+    TimeOfficeSourceRow,
+    decode_rows,
+)
 
 
+@dataclass(slots=True)
 class TimeOfficeRosterRow(TimeOfficeSourceRow):
-    plan_id: SourceNullableInt = None
+    plan_id: SourceNullableInt
     employee_id: SourceInt
     roster_date: datetime
 
-    work_shift_id: SourceNullableInt = None
-    work_shift_code: CleanNullableText = None
+    work_shift_id: SourceNullableInt
+    work_shift_code: CleanNullableText
 
-    global_absence_shift_id: SourceNullableInt = None
-    absence_shift_id: SourceNullableInt = None
-    resolved_absence_shift_id: SourceNullableInt = None
-    resolved_absence_code: CleanNullableText = None
+    global_absence_shift_id: SourceNullableInt
+    absence_shift_id: SourceNullableInt
+    resolved_absence_shift_id: SourceNullableInt
+    resolved_absence_code: CleanNullableText
 
-    planning_unit_id: SourceNullableInt = None
+    planning_unit_id: SourceNullableInt
 
-    @model_validator(mode="after")
-    def validate_row_type(self) -> Self:
+    def __post_init__(self) -> None:
+        self.validate_row_type()
+        self.validate_absence_references()
+
+    def validate_row_type(self) -> None:
         has_work_shift = self.work_shift_id is not None
         has_absence = self.global_absence_shift_id is not None or self.absence_shift_id is not None
 
@@ -34,10 +45,7 @@ class TimeOfficeRosterRow(TimeOfficeSourceRow):
                 f"for employee_id={self.employee_id}, roster_date={self.roster_date}."
             )
 
-        return self
-
-    @model_validator(mode="after")
-    def validate_absence_references(self) -> Self:
+    def validate_absence_references(self) -> None:
         if (
             self.global_absence_shift_id is not None
             and self.absence_shift_id is not None
@@ -49,11 +57,16 @@ class TimeOfficeRosterRow(TimeOfficeSourceRow):
                 f"RefDienstAbw={self.absence_shift_id}."
             )
 
-        return self
-
 
 class TimeOfficeRosterReader:
-    """Reads TimeOffice roster source rows from TPlanPersonalKommtGeht."""
+    """Reads TimeOffice roster source rows from TPlanPersonalKommtGeht.
+
+    The result is fetched ``chunk_size`` rows at a time, so only one chunk of
+    driver rows is held while it is decoded.
+    """
+
+    def __init__(self, *, chunk_size: int = 10_000) -> None:
+        self._chunk_size = chunk_size
 
     def read_rows(
         self,
@@ -62,8 +75,31 @@ class TimeOfficeRosterReader:
         employee_ids: tuple[int, ...],
         planning_month: PlanningMonth,
     ) -> tuple[TimeOfficeRosterRow, ...]:
+        return tuple(
+            chain.from_iterable(
+                self.read_row_chunks(
+                    connection=connection,
+                    employee_ids=employee_ids,
+                    planning_month=planning_month,
+                )
+            )
+        )
+
+    def read_row_chunks(
+        self,
+        *,
+        connection: Connection,
+        employee_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> Iterator[tuple[TimeOfficeRosterRow, ...]]:
+        """Yield decoded roster rows chunk by chunk.
+
+        The result stays open on ``connection`` until the iterator is exhausted
+        or closed, so consume it before running another query on the same
+        connection.
+        """
         if not employee_ids:
-            return ()
+            return
 
         query = text(
             """
@@ -104,17 +140,16 @@ class TimeOfficeRosterReader:
             """
         ).bindparams(bindparam("employee_ids", expanding=True))
 
-        raw_rows = (
-            connection.execute(
-                query,
-                {
-                    "employee_ids": employee_ids,
-                    "start": planning_month.start,
-                    "end": planning_month.end,
-                },
-            )
-            .mappings()
-            .all()
+        result = connection.execute(
+            query,
+            {
+                "employee_ids": employee_ids,
+                "start": planning_month.start,
+                "end": planning_month.end,
+            },
+            execution_options={"yield_per": self._chunk_size},
         )
 
-        return tuple(TimeOfficeRosterRow.model_validate(row) for row in raw_rows)
+        with result:
+            for raw_rows in result.mappings().partitions(self._chunk_size):
+                yield decode_rows(TimeOfficeRosterRow, raw_rows)
@@ -1,24 +1,33 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Self
 
-from pydantic import model_validator
 from sqlalchemy import Connection, bindparam, text
 
 from scheduling.timeoffice.facts import TimeOfficeFacts
-from scheduling.timeoffice.reading.types import CleanText, SourceInt, SourceNullableInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.cache import ReferenceSource, TimeOfficeReferenceCache, read_through
+from scheduling.timeoffice.reading.types import (
+    CleanText,
+    SourceInt,
+    SourceNullableInt,
+    TimeOfficeSourceRow,
+    decode_rows,
+)
 
 
+@dataclass(frozen=True, slots=True)
 class TimeOfficeShiftRow(TimeOfficeSourceRow):
     shift_id: SourceInt
     shift_code: CleanText
     shift_type_id: SourceInt
 
-    segment_start: datetime | None = None
-    segment_end: datetime | None = None
-    segment_minutes: SourceNullableInt = None
+    segment_start: datetime | None
+    segment_end: datetime | None
+    segment_minutes: SourceNullableInt
 
-    @model_validator(mode="after")
-    def validate_segment_shape(self) -> Self:
+    def __post_init__(self) -> None:
+        self.validate_segment_shape()
+
+    def validate_segment_shape(self) -> None:
         has_start = self.segment_start is not None
         has_end = self.segment_end is not None
 
@@ -46,16 +55,23 @@ class TimeOfficeShiftRow(TimeOfficeSourceRow):
                 f"segment_minutes={self.segment_minutes!r}."
             )
 
-        return self
-
 
 class TimeOfficeShiftReader:
     """Reads TimeOffice reference-shift source rows."""
 
-    def __init__(self, *, facts: TimeOfficeFacts) -> None:
+    def __init__(self, *, facts: TimeOfficeFacts, reference_cache: TimeOfficeReferenceCache | None = None) -> None:
         self._facts = facts
+        self._reference_cache = reference_cache
 
     def read_rows(self, *, connection: Connection) -> tuple[TimeOfficeShiftRow, ...]:
+        return read_through(
+            self._reference_cache,
+            ReferenceSource.SHIFTS,
+            (),
+            lambda: self._read_rows(connection=connection),
+        )
+
+    def _read_rows(self, *, connection: Connection) -> tuple[TimeOfficeShiftRow, ...]:
         shift_ids = tuple(self._facts.reference_shift_facts_by_id.keys())
 
         if not shift_ids:
@@ -84,4 +100,4 @@ class TimeOfficeShiftReader:
 
         raw_rows = connection.execute(query, {"shift_ids": shift_ids}).mappings().all()
 
-        return tuple(TimeOfficeShiftRow.model_validate(row) for row in raw_rows)
+        return decode_rows(TimeOfficeShiftRow, raw_rows)
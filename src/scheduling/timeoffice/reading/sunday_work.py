@@ -1,18 +1,21 @@
+from dataclasses import dataclass
 from datetime import date
 
 from sqlalchemy import Connection, bindparam, text
 
 from scheduling.domain import PlanningMonth
-from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, TimeOfficeSourceRow, decode_rows
 
 
+@dataclass(slots=True)
 class TimeOfficeSundayAccountRow(TimeOfficeSourceRow):
     account_id: SourceInt
-    account_code: CleanNullableText = None
-    account_name: CleanNullableText = None
-    is_daily_account: bool | None = None
+    account_code: CleanNullableText
+    account_name: CleanNullableText
+    is_daily_account: bool | None
 
 
+@dataclass(slots=True)
 class TimeOfficeSundayHistoryRow(TimeOfficeSourceRow):
     employee_id: SourceInt
     worked_sundays: SourceInt
@@ -72,7 +75,7 @@ class TimeOfficeSundayWorkHistoryReader:
             .all()
         )
 
-        return tuple(TimeOfficeSundayHistoryRow.model_validate(row) for row in raw_rows)
+        return decode_rows(TimeOfficeSundayHistoryRow, raw_rows)
 
     def _read_sunday_account_id(self, connection: Connection) -> int:
         query = text(
@@ -87,14 +90,14 @@ class TimeOfficeSundayWorkHistoryReader:
             """
         )
 
-        rows = tuple(
-            TimeOfficeSundayAccountRow.model_validate(row)
-            for row in connection.execute(
+        rows = decode_rows(
+            TimeOfficeSundayAccountRow,
+            connection.execute(
                 query,
                 {"sunday_account_code": self.SUNDAY_ACCOUNT_CODE},
             )
             .mappings()
-            .all()
+            .all(),
         )
 
         if len(rows) != 1:
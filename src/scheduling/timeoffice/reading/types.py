@@ -1,12 +1,26 @@
-from typing import Annotated, Any
+import types
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from functools import cache
+from operator import itemgetter
+from typing import Annotated, Any, Union, cast, get_args, get_origin, get_type_hints
 
-from pydantic import BaseModel, BeforeValidator, ConfigDict, StrictFloat, StrictInt
+from pydantic import BeforeValidator, ConfigDict, StrictFloat, StrictInt, TypeAdapter
+from pydantic.types import Strict
 
 
-class TimeOfficeSourceRow(BaseModel):
-    """Base class for validated TimeOffice SQL result rows."""
+class TimeOfficeSourceRow:
+    """Base class for validated TimeOffice SQL result rows.
 
-    model_config = ConfigDict(extra="forbid", frozen=True)
+    Subclasses are slotted dataclasses whose fields use the annotated source
+    types below. Invariants across columns go into ``__post_init__``. Rows
+    shared through the reference cache are frozen; rows read per month are
+    not, since frozen construction roughly doubles the cost of decoding them.
+    """
+
+    __slots__ = ()
+    __pydantic_config__ = ConfigDict(extra="forbid")
 
 
 def none_if_blank(value: Any) -> Any | None:
@@ -36,3 +50,148 @@ SourceNullableInt = Annotated[StrictInt | None, BeforeValidator(none_if_blank)]
 
 SourceFloat = StrictFloat
 SourceNullableFloat = Annotated[StrictFloat | None, BeforeValidator(none_if_blank)]
+
+
+def decode_rows[RowT: TimeOfficeSourceRow](
+    row_type: type[RowT],
+    raw_rows: Sequence[Mapping[Any, Any]],
+) -> tuple[RowT, ...]:
+    """Decode a result set column by column.
+
+    Each column is cleaned and type-checked once for the whole result set and
+    the rows are constructed directly. All rows of a result set share their
+    columns. If any column does not match its field exactly, the result set
+    is validated row by row instead, which accepts the same inputs as pydantic
+    and reports errors per row.
+    """
+    columns = _decode_columns(row_type, raw_rows)
+
+    if columns is None:
+        return validate_rows(row_type, raw_rows)
+
+    try:
+        return tuple(map(cast(Callable[..., RowT], row_type), *columns))
+    except ValueError:
+        return validate_rows(row_type, raw_rows)
+
+
+def validate_rows[RowT: TimeOfficeSourceRow](
+    row_type: type[RowT],
+    raw_rows: Sequence[Mapping[Any, Any]],
+) -> tuple[RowT, ...]:
+    """Validate a result set row by row with pydantic."""
+    adapter = _row_adapter(row_type)
+    return tuple(adapter.validate_python(dict(row)) for row in raw_rows)
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnDecoder:
+    name: str
+    clean: Callable[[Any], Any] | None
+    accepted_types: frozenset[type]
+
+
+def _decode_columns(
+    row_type: type[TimeOfficeSourceRow],
+    raw_rows: Sequence[Mapping[Any, Any]],
+) -> list[Sequence[Any]] | None:
+    decoders = _column_decoders(row_type)
+
+    if decoders is None:
+        return None
+
+    names = tuple(decoder.name for decoder in decoders)
+
+    if raw_rows and set(raw_rows[0].keys()) != set(names):
+        return None
+
+    try:
+        columns: list[Sequence[Any]] = [list(map(itemgetter(name), raw_rows)) for name in names]
+    except KeyError:
+        return None
+
+    for index, decoder in enumerate(decoders):
+        values = columns[index]
+
+        # The source validators only change text, so other values must already be accepted as they are.
+        if (clean := decoder.clean) is not None and str in set(map(type, values)):
+            values = columns[index] = [clean(value) if type(value) is str else value for value in values]
+
+        if not set(map(type, values)) <= decoder.accepted_types:
+            return None
+
+    return columns
+
+
+@cache
+def _column_decoders(row_type: type[TimeOfficeSourceRow]) -> tuple[_ColumnDecoder, ...] | None:
+    hints = get_type_hints(row_type, include_extras=True)
+    decoders: list[_ColumnDecoder] = []
+
+    for field in fields(cast(Any, row_type)):
+        decoder = _column_decoder(field.name, hints[field.name])
+
+        if decoder is None:
+            return None
+
+        decoders.append(decoder)
+
+    return tuple(decoders)
+
+
+def _column_decoder(name: str, annotation: Any) -> _ColumnDecoder | None:
+    clean: Callable[[Any], Any] | None = None
+
+    if get_origin(annotation) is Annotated:
+        annotation, *metadata = get_args(annotation)
+
+        for item in metadata:
+            if isinstance(item, BeforeValidator) and clean is None:
+                clean = cast(Callable[[Any], Any], item.func)
+            elif not isinstance(item, Strict):
+                return None
+
+    accepted_types = _accepted_types(annotation)
+
+    if accepted_types is None:
+        return None
+
+    return _ColumnDecoder(name=name, clean=clean, accepted_types=accepted_types)
+
+
+_EXACT_TYPES: frozenset[type] = frozenset({int, float, bool, str, date, datetime, types.NoneType})
+
+
+def _accepted_types(annotation: Any) -> frozenset[type] | None:
+    """Input types that validation passes through unchanged, None if unsupported."""
+    if annotation is None:
+        return frozenset({types.NoneType})
+
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        inner, *metadata = get_args(annotation)
+        return _accepted_types(inner) if all(isinstance(item, Strict) for item in metadata) else None
+
+    if origin in (Union, types.UnionType):
+        accepted: set[type] = set()
+
+        for arg in get_args(annotation):
+            arg_types = _accepted_types(arg)
+
+            if arg_types is None:
+                return None
+
+            accepted |= arg_types
+
+        return frozenset(accepted)
+
+    if annotation in _EXACT_TYPES:
+        return frozenset({annotation})
+
+    return None
+
+
+@cache
+def _row_adapter[RowT: TimeOfficeSourceRow](row_type: type[RowT]) -> TypeAdapter[RowT]:
+    return TypeAdapter(row_type)
@@ -1,34 +1,40 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Self
 
-from pydantic import model_validator
 from sqlalchemy import Connection, bindparam, text
 
 from scheduling.domain import PlanningMonth
-from scheduling.timeoffice.reading.types import CleanNullableText, SourceInt, SourceNullableInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.types import (
+    CleanNullableText,
+    SourceInt,
+    SourceNullableInt,
+    TimeOfficeSourceRow,
+    decode_rows,
+)
 
 
+@dataclass(slots=True)
 class TimeOfficeWishRow(TimeOfficeSourceRow):
     employee_id: SourceInt
     wish_date: datetime
     plan_id: SourceInt
     planning_unit_id: SourceInt
 
-    work_shift_id: SourceNullableInt = None
-    work_shift_code: CleanNullableText = None
-    work_shift_name: CleanNullableText = None
+    work_shift_id: SourceNullableInt
+    work_shift_code: CleanNullableText
+    work_shift_name: CleanNullableText
 
-    global_absence_shift_id: SourceNullableInt = None
-    global_absence_shift_code: CleanNullableText = None
-    global_absence_shift_name: CleanNullableText = None
+    global_absence_shift_id: SourceNullableInt
+    global_absence_shift_code: CleanNullableText
+    global_absence_shift_name: CleanNullableText
 
-    absence_shift_id: SourceNullableInt = None
-    absence_shift_code: CleanNullableText = None
-    absence_shift_name: CleanNullableText = None
+    absence_shift_id: SourceNullableInt
+    absence_shift_code: CleanNullableText
+    absence_shift_name: CleanNullableText
 
-    resolved_absence_shift_id: SourceNullableInt = None
-    resolved_absence_code: CleanNullableText = None
-    resolved_absence_name: CleanNullableText = None
+    resolved_absence_shift_id: SourceNullableInt
+    resolved_absence_code: CleanNullableText
+    resolved_absence_name: CleanNullableText
     """
     @model_validator(mode="after")
     def validate_row_type(self) -> Self:
@@ -51,8 +57,10 @@ class TimeOfficeWishRow(TimeOfficeSourceRow):
 
         return self"""
 
-    @model_validator(mode="after")
-    def validate_absence_references(self) -> Self:
+    def __post_init__(self) -> None:
+        self.validate_absence_references()
+
+    def validate_absence_references(self) -> None:
         if (
             self.global_absence_shift_id is not None
             and self.absence_shift_id is not None
@@ -64,8 +72,6 @@ class TimeOfficeWishRow(TimeOfficeSourceRow):
                 f"RefDienstAbw={self.absence_shift_id}."
             )
 
-        return self
-
 
 class TimeOfficeWishReader:
     """Reads employee wish source rows from TimeOffice."""
@@ -152,4 +158,4 @@ class TimeOfficeWishReader:
             .all()
         )
 
-        return tuple(TimeOfficeWishRow.model_validate(row) for row in raw_rows)
+        return decode_rows(TimeOfficeWishRow, raw_rows)
@@ -1,15 +1,18 @@
+from dataclasses import dataclass
+
 from sqlalchemy import Connection, bindparam, text
 
 from scheduling.domain import PlanningMonth
 from scheduling.timeoffice.facts import TimeOfficeFacts
-from scheduling.timeoffice.reading.types import SourceInt, TimeOfficeSourceRow
+from scheduling.timeoffice.reading.types import SourceInt, TimeOfficeSourceRow, decode_rows
 
 
+@dataclass(slots=True)
 class TimeOfficeMonthlyWorkAccountRow(TimeOfficeSourceRow):
     employee_id: SourceInt
     month: SourceInt
-    target_hours: float | None = None
-    actual_hours: float | None = None
+    target_hours: float | None
+    actual_hours: float | None
 
 
 class TimeOfficeMonthlyWorkAccountReader:
@@ -62,7 +65,7 @@ class TimeOfficeMonthlyWorkAccountReader:
             .all()
         )
 
-        return tuple(TimeOfficeMonthlyWorkAccountRow.model_validate(row) for row in raw_rows)
+        return decode_rows(TimeOfficeMonthlyWorkAccountRow, raw_rows)
 
 
 def _timeoffice_month(planning_month: PlanningMonth) -> int:
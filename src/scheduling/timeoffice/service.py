@@ -1,4 +1,8 @@
 import logging
+import time
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
 from typing import Any
 
 from sqlalchemy import Engine
@@ -7,15 +11,25 @@ from scheduling.api.solve.schemas import SolveOptions
 from scheduling.domain import (
     Availability,
     DemandRequirement,
+    Employee,
     PlanningMonth,
     SchedulingDataset,
     SolverObjectiveWeights,
     Wish,
 )
 from scheduling.solver.models import Solution
+from scheduling.timeoffice.dataset_cache import TimeOfficeDatasetCache
 from scheduling.timeoffice.facts import TimeOfficeFacts
 from scheduling.timeoffice.mapping import map_scheduling_dataset
+from scheduling.timeoffice.mapping.demand import map_demand_requirements
+from scheduling.timeoffice.mapping.objective_weights import map_objective_weights
 from scheduling.timeoffice.mapping.options import map_solve_options
+from scheduling.timeoffice.mapping.personnel import map_employees
+from scheduling.timeoffice.mapping.planning import map_planning_units
+from scheduling.timeoffice.mapping.roster import map_availability, map_roster
+from scheduling.timeoffice.mapping.shifts import map_shifts
+from scheduling.timeoffice.mapping.wishes import map_wishes
+from scheduling.timeoffice.reading.cache import ReferenceSource, TimeOfficeReferenceCache
 from scheduling.timeoffice.reading.container import TimeOfficeReaders
 from scheduling.timeoffice.writing.demand import TimeOfficeDemandWriter
 from scheduling.timeoffice.writing.objective_weights import TimeOfficeWeightsWriter
@@ -27,6 +41,13 @@ from scheduling.validation import validate_scheduling_dataset
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class WishesAndAvailability:
+    employees: tuple[Employee, ...]
+    wishes: tuple[Wish, ...]
+    availability: tuple[Availability, ...]
+
+
 class TimeOfficeService:
     """Application-facing service for TimeOffice reads and allowed writebacks."""
 
@@ -41,6 +62,9 @@ class TimeOfficeService:
         demand_writer: TimeOfficeDemandWriter,
         objective_weights_writer: TimeOfficeWeightsWriter,
         availability_writer: TimeOfficeAvailabilityWriter,
+        read_workers: int = 1,
+        reference_cache: TimeOfficeReferenceCache | None = None,
+        dataset_cache: TimeOfficeDatasetCache | None = None,
     ) -> None:
         self._facts = facts
         self._engine = engine
@@ -50,6 +74,9 @@ class TimeOfficeService:
         self._demand_writer = demand_writer
         self._objective_weights_writer = objective_weights_writer
         self._availability_writer = availability_writer
+        self._read_workers = read_workers
+        self._reference_cache = reference_cache
+        self._dataset_cache = dataset_cache
 
     def get_solve_options(self) -> SolveOptions:
         logger.info("Fetching TimeOffice solve options")
@@ -74,18 +101,59 @@ class TimeOfficeService:
     ) -> SchedulingDataset:
         selected_planning_unit_ids = self._normalize_planning_unit_ids(planning_unit_ids)
 
+        if self._dataset_cache is None:
+            return self._fetch_dataset(
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+            )
+
+        return self._dataset_cache.get_or_fetch(
+            selected_planning_unit_ids,
+            planning_month,
+            partial(
+                self._fetch_dataset,
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+            ),
+        )
+
+    def _fetch_dataset(
+        self,
+        *,
+        selected_planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> SchedulingDataset:
         logger.info(
             "Fetching TimeOffice sources: planning_units=%s planning_month=%s",
             selected_planning_unit_ids,
             planning_month.label,
         )
 
-        with self._engine.connect() as connection:
-            sources = self._readers.read_sources(
-                connection=connection,
+        started = time.perf_counter()
+        fold_roster = partial(map_roster, facts=self._facts)
+
+        if self._read_workers > 1:
+            sources = self._readers.read_sources_concurrently(
+                engine=self._engine,
+                max_workers=self._read_workers,
                 selected_planning_unit_ids=selected_planning_unit_ids,
                 planning_month=planning_month,
+                fold_roster=fold_roster,
             )
+        else:
+            with self._engine.connect() as connection:
+                sources = self._readers.read_sources(
+                    connection=connection,
+                    selected_planning_unit_ids=selected_planning_unit_ids,
+                    planning_month=planning_month,
+                    fold_roster=fold_roster,
+                )
+
+        logger.info(
+            "Read TimeOffice sources: read_workers=%s elapsed_ms=%.1f",
+            self._read_workers,
+            (time.perf_counter() - started) * 1000,
+        )
 
         dataset = map_scheduling_dataset(
             sources=sources,
@@ -115,6 +183,146 @@ class TimeOfficeService:
 
         return validated_dataset
 
+    def fetch_employees(
+        self,
+        *,
+        planning_unit_id: int,
+        planning_month: PlanningMonth,
+    ) -> tuple[Employee, ...]:
+        """Employees of one planning unit, without reading the month's roster or wishes."""
+        selected_planning_unit_ids = self._normalize_planning_unit_ids((planning_unit_id,))
+
+        if (dataset := self._cached_dataset(selected_planning_unit_ids, planning_month)) is not None:
+            return dataset.employees
+
+        with self._engine.connect() as connection:
+            sources = self._readers.read_employee_sources(
+                connection=connection,
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+            )
+
+        return map_employees(sources.employee_rows, facts=self._facts)
+
+    def fetch_wishes_and_availability(
+        self,
+        *,
+        planning_unit_id: int,
+        planning_month: PlanningMonth,
+    ) -> WishesAndAvailability:
+        """Employees of one planning unit with their wishes and availability for the month."""
+        selected_planning_unit_ids = self._normalize_planning_unit_ids((planning_unit_id,))
+
+        if (dataset := self._cached_dataset(selected_planning_unit_ids, planning_month)) is not None:
+            return WishesAndAvailability(
+                employees=dataset.employees,
+                wishes=dataset.wishes,
+                availability=dataset.availability,
+            )
+
+        with self._engine.connect() as connection:
+            sources = self._readers.read_employee_sources(
+                connection=connection,
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+            )
+
+            shift_rows = self._readers.shifts.read_rows(connection=connection)
+
+            availability = map_availability(
+                rows=chain.from_iterable(
+                    self._readers.roster.read_row_chunks(
+                        connection=connection,
+                        employee_ids=sources.employee_ids,
+                        planning_month=planning_month,
+                    )
+                ),
+                facts=self._facts,
+            )
+
+            wish_rows = self._readers.wishes.read_rows(
+                connection=connection,
+                plan_ids=sources.plan_ids,
+                planning_unit_ids=sources.planning_unit_ids,
+                employee_ids=sources.employee_ids,
+                planning_month=planning_month,
+            )
+
+        return WishesAndAvailability(
+            employees=map_employees(sources.employee_rows, facts=self._facts),
+            wishes=map_wishes(rows=wish_rows, shifts=map_shifts(shift_rows, facts=self._facts), facts=self._facts),
+            availability=availability,
+        )
+
+    def fetch_demand_requirements(
+        self,
+        *,
+        planning_unit_id: int,
+        planning_month: PlanningMonth,
+    ) -> tuple[DemandRequirement, ...]:
+        """Minimal staffing of one planning unit, expanded over the month."""
+        selected_planning_unit_ids = self._normalize_planning_unit_ids((planning_unit_id,))
+
+        if (dataset := self._cached_dataset(selected_planning_unit_ids, planning_month)) is not None:
+            return dataset.demand_requirements
+
+        with self._engine.connect() as connection:
+            planning_unit_rows = self._readers.planning_units.read_rows(
+                connection=connection,
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+            )
+
+            rows = self._readers.demand.read_minimal_staffing(
+                connection=connection,
+                planning_unit_ids=tuple(row.planning_unit_id for row in planning_unit_rows),
+            )
+
+        return map_demand_requirements(
+            planning_month=planning_month,
+            planning_units=map_planning_units(planning_unit_rows, facts=self._facts),
+            rows=rows,
+            facts=self._facts,
+        )
+
+    def fetch_objective_weights(
+        self,
+        *,
+        planning_unit_id: int,
+        planning_month: PlanningMonth,
+    ) -> tuple[SolverObjectiveWeights, ...]:
+        selected_planning_unit_ids = self._normalize_planning_unit_ids((planning_unit_id,))
+
+        if (dataset := self._cached_dataset(selected_planning_unit_ids, planning_month)) is not None:
+            return dataset.objective_weights
+
+        with self._engine.connect() as connection:
+            planning_unit_rows = self._readers.planning_units.read_rows(
+                connection=connection,
+                selected_planning_unit_ids=selected_planning_unit_ids,
+                planning_month=planning_month,
+            )
+
+            rows = self._readers.weights.read_rows(
+                connection=connection,
+                planning_unit_ids=tuple(row.planning_unit_id for row in planning_unit_rows),
+            )
+
+        return map_objective_weights(
+            planning_units=map_planning_units(planning_unit_rows, facts=self._facts),
+            rows=rows,
+        )
+
+    def _cached_dataset(
+        self,
+        planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> SchedulingDataset | None:
+        if self._dataset_cache is None:
+            return None
+
+        return self._dataset_cache.peek(planning_unit_ids, planning_month)
+
     def write_solution_dry_run(self, solution: Solution) -> None:
         self._solution_writer.write_dry_run(solution)
 
@@ -181,6 +389,13 @@ class TimeOfficeService:
                 facts=self._facts,
             )
 
+        if self._dataset_cache is not None:
+            self._dataset_cache.invalidate(
+                planning_unit_id=planning_unit_id,
+                planning_month=planning_month,
+                employee_id=employee_id,
+            )
+
     def delete_employee_wishes_and_availability(
         self,
         *,
@@ -203,6 +418,13 @@ class TimeOfficeService:
                 employee_id=employee_id,
             )
 
+        if self._dataset_cache is not None:
+            self._dataset_cache.invalidate(
+                planning_unit_id=planning_unit_id,
+                planning_month=planning_month,
+                employee_id=employee_id,
+            )
+
     def replace_minimal_staffing(
         self,
         *,
@@ -216,6 +438,14 @@ class TimeOfficeService:
                 demand_requirements=demand_requirements,
             )
 
+        # Invalidate only after the commit: a read that ran inside the write
+        # saw the old rows and must not outlive it in the cache.
+        if self._reference_cache is not None:
+            self._reference_cache.invalidate(ReferenceSource.DEMAND)
+
+        if self._dataset_cache is not None:
+            self._dataset_cache.invalidate(planning_unit_id=planning_unit_id)
+
     def replace_objective_weights(
         self,
         *,
@@ -229,6 +459,12 @@ class TimeOfficeService:
                 objective_weights=objective_weights,
             )
 
+        if self._reference_cache is not None:
+            self._reference_cache.invalidate(ReferenceSource.OBJECTIVE_WEIGHTS)
+
+        if self._dataset_cache is not None:
+            self._dataset_cache.invalidate(planning_unit_id=planning_unit_id)
+
     def get_solution_data(
         self,
         *,
@@ -19,6 +19,8 @@ from scheduling.domain import (
 )
 from scheduling.solver.cp_sat.constraints.availabilities_constraint import AvailabilitiesConstraint
 from scheduling.solver.cp_sat.context import create_context
+from scheduling.solver.cp_sat.inspection import inspect_cp_sat_model
+from scheduling.solver.cp_sat.variables import create_assignment_variables
 
 # --- Shared Test Entities ---
 
@@ -186,3 +188,36 @@ def test_feasible_when_early_shift_precedes_blocked_day() -> None:
 
     status = _solve_with_setup(availabilities, [(early_shift_date, EARLY_SHIFT.shift_id)])
     assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+
+def test_blocked_slots_get_no_variables_and_no_constraints() -> None:
+    blocked_date = datetime.date(2024, 11, 6)
+    dataset = SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(PLANNING_UNIT,),
+        plans=(),
+        shifts=(EARLY_SHIFT, NIGHT_SHIFT),
+        employees=(EMPLOYEE,),
+        planning_unit_memberships=(MEMBERSHIP,),
+        availability=(
+            Availability(employee_id=1, date=blocked_date, availability_type=AvailabilityType.VACATION),
+            Availability(
+                employee_id=1,
+                date=datetime.date(2024, 11, 20),
+                availability_type=AvailabilityType.AVAILABLE_ONLY,
+                shift_ids=(EARLY_SHIFT.shift_id,),
+            ),
+        ),
+    )
+    ctx = create_context(dataset=dataset)
+    constraint = AvailabilitiesConstraint()
+
+    create_assignment_variables(ctx, excluded_slots=constraint.excluded_slots(ctx, params={}))
+    constraint.add_to_model(ctx, params={})
+
+    slots = {(date, shift_id) for _, _, date, shift_id, _ in ctx.assignment_variables}
+    assert len(slots) == 30 * 2 - 4
+    assert (datetime.date(2024, 11, 5), EARLY_SHIFT.shift_id) in slots
+    assert (datetime.date(2024, 11, 5), NIGHT_SHIFT.shift_id) not in slots
+    assert (datetime.date(2024, 11, 20), NIGHT_SHIFT.shift_id) not in slots
+    assert inspect_cp_sat_model(model=ctx.model).proto_constraint_count == 0
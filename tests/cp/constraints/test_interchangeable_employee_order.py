@@ -0,0 +1,149 @@
+import datetime
+
+import pytest
+from ortools.sat.python import cp_model
+
+from scheduling.domain import (
+    Availability,
+    AvailabilityType,
+    Employee,
+    MonthlyWorkAccount,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+    Wish,
+    WishType,
+)
+from scheduling.solver.cp_sat.constraints.interchangeable_employee_order import InterchangeableEmployeeOrder
+from scheduling.solver.cp_sat.context import create_context
+from scheduling.solver.cp_sat.variables import create_assignment_variables
+from scheduling.solver.symmetry import interchangeable_employees
+
+# --- Shared Test Entities ---
+
+PLANNING_UNIT = PlanningUnit(planning_unit_id=1, display_name="Station 1", type=PlanningUnitType.STATION)
+
+EARLY_SHIFT = Shift(
+    shift_id=1,
+    code="F",
+    type=ShiftType.EARLY,
+    staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+    start_minute=360,
+    end_minute=820,
+    net_work_minutes=460,
+)
+
+LATE_SHIFT = Shift(
+    shift_id=2,
+    code="S",
+    type=ShiftType.LATE,
+    staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+    start_minute=820,
+    end_minute=1280,
+    net_work_minutes=460,
+)
+
+FIRST_DAY = datetime.date(2024, 11, 1)
+SECOND_DAY = datetime.date(2024, 11, 2)
+
+
+def _dataset(
+    *,
+    staff_levels: tuple[StaffLevel, ...] = (StaffLevel.PROFESSIONAL,) * 3,
+    wishes: tuple[Wish, ...] = (),
+    availability: tuple[Availability, ...] = (),
+    target_minutes: tuple[int, ...] = (9_000,) * 3,
+) -> SchedulingDataset:
+    employee_ids = range(1, len(staff_levels) + 1)
+
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(PLANNING_UNIT,),
+        plans=(),
+        shifts=(EARLY_SHIFT, LATE_SHIFT),
+        employees=tuple(
+            Employee(employee_id=employee_id, display_name=f"Employee {employee_id}", staff_level=staff_level)
+            for employee_id, staff_level in zip(employee_ids, staff_levels, strict=True)
+        ),
+        planning_unit_memberships=tuple(
+            PlanningUnitMembership(
+                planning_unit_id=PLANNING_UNIT.planning_unit_id,
+                employee_id=employee_id,
+                valid_from=FIRST_DAY,
+                staff_level=staff_level,
+                is_home=True,
+                is_replacement=False,
+            )
+            for employee_id, staff_level in zip(employee_ids, staff_levels, strict=True)
+        ),
+        wishes=wishes,
+        availability=availability,
+        monthly_work_accounts=tuple(
+            MonthlyWorkAccount(employee_id=employee_id, target_minutes=minutes)
+            for employee_id, minutes in zip(employee_ids, target_minutes, strict=True)
+        ),
+    )
+
+
+def _solve(dataset: SchedulingDataset, worked: set[tuple[int, datetime.date, int]]) -> cp_model.CpSolverStatus:
+    ctx = create_context(dataset=dataset)
+    create_assignment_variables(ctx)
+
+    for (employee_id, _unit, day, shift_id, _level), variable in ctx.assignment_variables.items():
+        ctx.model.add(variable == ((employee_id, day, shift_id) in worked))
+
+    InterchangeableEmployeeOrder().add_to_model(ctx, params={})
+
+    return cp_model.CpSolver().solve(ctx.model)
+
+
+# --- Tests ---
+
+
+def test_employees_with_equal_model_data_are_interchangeable() -> None:
+    assert interchangeable_employees(_dataset()) == ((1, 2, 3),)
+    assert interchangeable_employees(
+        _dataset(staff_levels=(StaffLevel.PROFESSIONAL, StaffLevel.ASSISTANT, StaffLevel.PROFESSIONAL))
+    ) == ((1, 3),)
+    assert interchangeable_employees(_dataset(target_minutes=(9_000, 9_000, 6_000))) == ((1, 2),)
+
+
+def test_wishes_and_availability_make_employees_distinguishable() -> None:
+    wish = Wish(employee_id=1, planning_unit_id=1, date=FIRST_DAY, type=WishType.FREE_DAY)
+    absence = Availability(employee_id=2, date=FIRST_DAY, availability_type=AvailabilityType.VACATION)
+
+    assert interchangeable_employees(_dataset(wishes=(wish,))) == ((2, 3),)
+    assert interchangeable_employees(_dataset(wishes=(wish,), availability=(absence,))) == ()
+
+
+@pytest.mark.parametrize(
+    ("worked", "expected_status"),
+    [
+        (set[tuple[int, datetime.date, int]](), cp_model.OPTIMAL),
+        ({(1, FIRST_DAY, 1)}, cp_model.OPTIMAL),
+        ({(2, FIRST_DAY, 1)}, cp_model.INFEASIBLE),
+        ({(1, FIRST_DAY, 2), (2, FIRST_DAY, 1)}, cp_model.OPTIMAL),
+        ({(1, FIRST_DAY, 1), (2, FIRST_DAY, 2)}, cp_model.INFEASIBLE),
+        ({(1, FIRST_DAY, 1), (2, FIRST_DAY, 1), (2, SECOND_DAY, 1)}, cp_model.INFEASIBLE),
+        ({(1, FIRST_DAY, 1), (2, FIRST_DAY, 1), (1, SECOND_DAY, 1)}, cp_model.OPTIMAL),
+        ({(1, FIRST_DAY, 1), (2, SECOND_DAY, 2), (3, SECOND_DAY, 1)}, cp_model.OPTIMAL),
+        ({(1, FIRST_DAY, 1), (2, SECOND_DAY, 1), (3, SECOND_DAY, 2)}, cp_model.INFEASIBLE),
+    ],
+)
+def test_interchangeable_schedules_are_ordered_by_employee_id(
+    worked: set[tuple[int, datetime.date, int]],
+    expected_status: cp_model.CpSolverStatus,
+) -> None:
+    assert _solve(_dataset(), worked) == expected_status
+
+
+def test_distinguishable_employees_stay_unordered() -> None:
+    wish = Wish(employee_id=3, planning_unit_id=1, date=SECOND_DAY, type=WishType.FREE_DAY)
+
+    assert _solve(_dataset(wishes=(wish,)), {(3, FIRST_DAY, 1)}) == cp_model.OPTIMAL
@@ -0,0 +1,78 @@
+from datetime import date
+
+from scheduling.domain import (
+    Employee,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+)
+from scheduling.solver.cp_sat.builder import create_cp_sat_model_builder
+from scheduling.solver.cp_sat.inspection import proto_object_counts
+from scheduling.solver.cp_sat.profiling import BuildStep
+
+EMPLOYEE = Employee(employee_id=1, display_name="Employee 1", staff_level=StaffLevel.PROFESSIONAL)
+
+
+def _dataset() -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(PlanningUnit(planning_unit_id=1, display_name="Station 1", type=PlanningUnitType.STATION),),
+        plans=(),
+        shifts=(
+            Shift(
+                shift_id=1,
+                code="F",
+                type=ShiftType.EARLY,
+                staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+                start_minute=360,
+                end_minute=840,
+                net_work_minutes=460,
+            ),
+        ),
+        employees=(EMPLOYEE,),
+        planning_unit_memberships=(
+            PlanningUnitMembership(
+                planning_unit_id=1,
+                employee_id=EMPLOYEE.employee_id,
+                valid_from=date(2024, 11, 1),
+                valid_until=None,
+                staff_level=StaffLevel.PROFESSIONAL,
+                is_home=True,
+                is_replacement=False,
+            ),
+        ),
+    )
+
+
+def test_build_is_not_profiled_by_default() -> None:
+    build_result = create_cp_sat_model_builder().build(_dataset())
+
+    assert build_result.profile is None
+
+
+def test_profile_covers_every_applied_component() -> None:
+    build_result = create_cp_sat_model_builder().build(_dataset(), profile=True)
+    profile = build_result.profile
+
+    assert profile is not None
+    assert [component.component_id for component in profile.components] == [
+        "assignment_variables",
+        "variable_index",
+        *build_result.applied_constraint_ids,
+        *build_result.applied_objective_ids,
+    ]
+    assert profile.components[0].step == BuildStep.VARIABLES
+    assert profile.components[0].added_variables == 30
+    assert profile.components[1].step == BuildStep.INDEX
+    assert profile.components[1].added_variables == profile.components[1].added_constraints == 0
+
+    proto_variables, proto_constraints = proto_object_counts(build_result.ctx.model)
+    assert sum(component.added_variables for component in profile.components) == proto_variables
+    assert sum(component.added_constraints for component in profile.components) <= proto_constraints
+    assert "assignment_variables" in profile.format_table()
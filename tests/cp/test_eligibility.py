@@ -0,0 +1,90 @@
+from datetime import date
+
+from scheduling.domain import (
+    Availability,
+    AvailabilityType,
+    Employee,
+    PlanningMonth,
+    PlanningUnitMembership,
+    SchedulingDataset,
+    StaffLevel,
+)
+from scheduling.solver.cp_sat.eligibility import build_eligibility_matrix
+from scheduling.solver.index import build_schedule_index
+
+DATES = (date(2024, 11, 1), date(2024, 11, 2), date(2024, 11, 3))
+EMPLOYEE = Employee(employee_id=1, display_name="Employee 1", staff_level=StaffLevel.PROFESSIONAL)
+
+
+def _membership(*, valid_from: date, valid_until: date | None, staff_level: StaffLevel) -> PlanningUnitMembership:
+    return PlanningUnitMembership(
+        planning_unit_id=1,
+        employee_id=EMPLOYEE.employee_id,
+        valid_from=valid_from,
+        valid_until=valid_until,
+        staff_level=staff_level,
+        is_home=True,
+        is_replacement=False,
+    )
+
+
+def test_combines_memberships_and_availability() -> None:
+    dataset = SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(),
+        plans=(),
+        shifts=(),
+        employees=(EMPLOYEE,),
+        planning_unit_memberships=(
+            _membership(valid_from=date(2024, 10, 1), valid_until=None, staff_level=StaffLevel.PROFESSIONAL),
+            _membership(valid_from=date(2024, 11, 2), valid_until=date(2024, 11, 2), staff_level=StaffLevel.ASSISTANT),
+        ),
+        availability=(
+            Availability(
+                employee_id=1,
+                date=DATES[1],
+                availability_type=AvailabilityType.AVAILABLE_ONLY,
+                shift_ids=(2,),
+            ),
+            Availability(employee_id=1, date=DATES[2], availability_type=AvailabilityType.VACATION),
+        ),
+    )
+
+    matrix = build_eligibility_matrix(
+        employees=dataset.employees,
+        planning_unit_ids=(1,),
+        dates=DATES,
+        shift_ids=(1, 2),
+        index=build_schedule_index(dataset),
+    )
+
+    assert list(matrix.slots()) == [
+        (1, 1, DATES[0], 1, StaffLevel.PROFESSIONAL),
+        (1, 1, DATES[0], 2, StaffLevel.PROFESSIONAL),
+        (1, 1, DATES[1], 2, StaffLevel.ASSISTANT),
+        (1, 1, DATES[1], 2, StaffLevel.PROFESSIONAL),
+    ]
+
+
+def test_ignores_memberships_outside_requested_units() -> None:
+    dataset = SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(),
+        plans=(),
+        shifts=(),
+        employees=(EMPLOYEE,),
+        planning_unit_memberships=(
+            _membership(valid_from=date(2024, 11, 1), valid_until=None, staff_level=StaffLevel.PROFESSIONAL),
+        ),
+    )
+
+    matrix = build_eligibility_matrix(
+        employees=dataset.employees,
+        planning_unit_ids=(2,),
+        dates=DATES,
+        shift_ids=(1,),
+        index=build_schedule_index(dataset),
+    )
+
+    assert matrix.eligible.shape == (0, 3, 1, len(StaffLevel))
+    assert list(matrix.slots()) == []
@@ -0,0 +1,91 @@
+from datetime import date
+
+from scheduling.domain import (
+    Assignment,
+    AssignmentType,
+    Employee,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+)
+from scheduling.solver.cp_sat.context import create_context
+from scheduling.solver.cp_sat.hints import add_assignment_hint, build_assignment_hint
+from scheduling.solver.cp_sat.variables import create_assignment_variables
+from scheduling.solver.warm_start import WarmStartCache
+
+EMPLOYEE = Employee(employee_id=1, display_name="Employee 1", staff_level=StaffLevel.PROFESSIONAL)
+
+
+def _dataset(*, year: int = 2024, month: int = 11) -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=year, month=month),
+        planning_units=(PlanningUnit(planning_unit_id=1, display_name="Station 1", type=PlanningUnitType.STATION),),
+        plans=(),
+        shifts=(
+            Shift(
+                shift_id=1,
+                code="F",
+                type=ShiftType.EARLY,
+                staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+                start_minute=360,
+                end_minute=840,
+                net_work_minutes=460,
+            ),
+        ),
+        employees=(EMPLOYEE,),
+        planning_unit_memberships=(
+            PlanningUnitMembership(
+                planning_unit_id=1,
+                employee_id=EMPLOYEE.employee_id,
+                valid_from=date(2024, 1, 1),
+                valid_until=None,
+                staff_level=StaffLevel.PROFESSIONAL,
+                is_home=True,
+                is_replacement=False,
+            ),
+        ),
+    )
+
+
+def _assignment(day: date, *, shift_id: int = 1) -> Assignment:
+    return Assignment(
+        employee_id=EMPLOYEE.employee_id,
+        planning_unit_id=1,
+        date=day,
+        shift_id=shift_id,
+        assignment_type=AssignmentType.GENERATED,
+    )
+
+
+def test_hint_covers_every_assignment_variable() -> None:
+    ctx = create_context(_dataset())
+    create_assignment_variables(ctx)
+
+    hint = build_assignment_hint(ctx, (_assignment(date(2024, 11, 4)), _assignment(date(2024, 11, 5), shift_id=9)))
+    add_assignment_hint(ctx, hint)
+
+    solution_hint = ctx.model.proto.solution_hint
+    hinted = dict(zip(solution_hint.vars, solution_hint.values, strict=True))
+    worked_key = (EMPLOYEE.employee_id, 1, date(2024, 11, 4), 1, StaffLevel.PROFESSIONAL)
+
+    assert hint.unmatched_count == 1
+    assert len(hinted) == len(ctx.assignment_variables)
+    assert hinted.pop(ctx.assignment_variables[worked_key].index) == 1
+    assert set(hinted.values()) == {0}
+
+
+def test_warm_start_cache_evicts_least_recently_used() -> None:
+    cache = WarmStartCache(max_entries=1)
+    november, december = _dataset(), _dataset(month=12)
+
+    cache.put(november, (_assignment(date(2024, 11, 4)),))
+    cache.put(december, ())
+
+    assert cache.get(november) is None
+    assert cache.get(december) == ()
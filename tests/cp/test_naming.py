@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+from ortools.sat.python import cp_model
+
+from scheduling.solver.cp_sat.builder import create_cp_sat_model_builder
+from scheduling.solver.cp_sat.inspection import inspect_cp_sat_model
+from scheduling.solver.cp_sat.naming import ModelNames, ModelNaming
+from scheduling.synthetic import SyntheticDatasetSpec, generate_datasets
+
+
+def _day_name(employee_id: int, day: date) -> str:
+    return f"works__emp_{employee_id}__date_{day:%Y%m%d}"
+
+
+def _build(mode: ModelNaming) -> tuple[ModelNames, cp_model.IntVar]:
+    names = ModelNames(model=cp_model.CpModel(), mode=mode)
+    variable = names.new_bool_var(_day_name, 1, date(2024, 11, 1))
+    names.name_constraint(names.model.add(variable == 1), _day_name, 2, date(2024, 11, 2))
+
+    return names, variable
+
+
+def test_named_mode_writes_names_into_the_model() -> None:
+    names, variable = _build(ModelNaming.NAMED)
+
+    inspection = inspect_cp_sat_model(model=names.model, names=names)
+
+    assert variable.name == "works__emp_1__date_20241101"
+    assert inspection.constraint_names == ("works__emp_2__date_20241102",)
+    assert inspection.unnamed_constraint_count == 0
+
+
+@pytest.mark.parametrize("mode", [ModelNaming.KEYED, ModelNaming.ANONYMOUS])
+def test_unnamed_modes_do_not_report_unnamed_constraints(mode: ModelNaming) -> None:
+    names, variable = _build(mode)
+
+    inspection = inspect_cp_sat_model(model=names.model, names=names)
+
+    assert variable.name == ""
+    assert inspection.unnamed_constraint_count == 0
+
+
+def test_keyed_mode_resolves_names_from_side_table() -> None:
+    names, variable = _build(ModelNaming.KEYED)
+
+    inspection = inspect_cp_sat_model(model=names.model, names=names)
+
+    assert names.variable_name(variable.index) == "works__emp_1__date_20241101"
+    assert inspection.constraint_names == ("works__emp_2__date_20241102",)
+
+
+def test_anonymous_mode_keeps_no_side_table() -> None:
+    names, variable = _build(ModelNaming.ANONYMOUS)
+
+    assert names.variable_name(variable.index) is None
+    assert names.constraint_name(0) is None
+
+
+def test_anonymous_build_names_no_variables_or_constraints() -> None:
+    (dataset,) = generate_datasets(SyntheticDatasetSpec(planning_units=2, employees_per_unit=10))
+
+    model = create_cp_sat_model_builder(model_naming=ModelNaming.ANONYMOUS).build(dataset).ctx.model
+    inspection = inspect_cp_sat_model(model=model)
+
+    assert inspection.proto_variable_count
+    assert inspection.proto_constraint_count
+    assert not any(model.get_int_var_from_proto_index(index).name for index in range(inspection.proto_variable_count))
+    assert set(inspection.constraint_names) == {"<unnamed>"}
@@ -0,0 +1,105 @@
+from datetime import date
+
+from scheduling.domain import (
+    Assignment,
+    AssignmentType,
+    Employee,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+)
+from scheduling.solver.cp_sat.context import create_context
+from scheduling.solver.cp_sat.hints import build_assignment_hint
+from scheduling.solver.cp_sat.neighborhood import fix_outside_neighborhood
+from scheduling.solver.cp_sat.variables import create_assignment_variables
+from scheduling.solver.models import Neighborhood
+
+EMPLOYEES = tuple(
+    Employee(employee_id=employee_id, display_name=f"Employee {employee_id}", staff_level=StaffLevel.PROFESSIONAL)
+    for employee_id in (1, 2)
+)
+DATASET = SchedulingDataset(
+    planning_month=PlanningMonth(year=2024, month=11),
+    planning_units=(PlanningUnit(planning_unit_id=1, display_name="Station 1", type=PlanningUnitType.STATION),),
+    plans=(),
+    shifts=(
+        Shift(
+            shift_id=1,
+            code="F",
+            type=ShiftType.EARLY,
+            staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+            start_minute=360,
+            end_minute=840,
+            net_work_minutes=460,
+        ),
+    ),
+    employees=EMPLOYEES,
+    planning_unit_memberships=tuple(
+        PlanningUnitMembership(
+            planning_unit_id=1,
+            employee_id=employee.employee_id,
+            valid_from=date(2024, 1, 1),
+            valid_until=None,
+            staff_level=StaffLevel.PROFESSIONAL,
+            is_home=True,
+            is_replacement=False,
+        )
+        for employee in EMPLOYEES
+    ),
+)
+PREVIOUS = (
+    Assignment(
+        employee_id=2,
+        planning_unit_id=1,
+        date=date(2024, 11, 20),
+        shift_id=1,
+        assignment_type=AssignmentType.GENERATED,
+    ),
+)
+
+
+def test_free_dates_expand_by_radius() -> None:
+    neighborhood = Neighborhood(
+        previous_assignments=(),
+        employee_ids=(),
+        dates=(date(2024, 11, 1), date(2024, 11, 10)),
+        radius_days=1,
+    )
+
+    assert neighborhood.free_dates() == {
+        date(2024, 10, 31),
+        date(2024, 11, 1),
+        date(2024, 11, 2),
+        date(2024, 11, 9),
+        date(2024, 11, 10),
+        date(2024, 11, 11),
+    }
+
+
+def test_only_variables_outside_neighborhood_are_fixed() -> None:
+    ctx = create_context(DATASET)
+    create_assignment_variables(ctx)
+    neighborhood = Neighborhood(
+        previous_assignments=PREVIOUS,
+        employee_ids=(1,),
+        dates=(date(2024, 11, 10),),
+        radius_days=1,
+    )
+
+    fixed = fix_outside_neighborhood(ctx, neighborhood, build_assignment_hint(ctx, PREVIOUS))
+
+    domains = {
+        (employee_id, assignment_date): variable.domain.flattened_intervals()
+        for (employee_id, _, assignment_date, _, _), variable in ctx.assignment_variables.items()
+    }
+    assert fixed == 30 - 3
+    assert domains[(1, date(2024, 11, 20))] == [0, 1]
+    assert domains[(2, date(2024, 11, 10))] == [0, 1]
+    assert domains[(2, date(2024, 11, 20))] == [1, 1]
+    assert domains[(2, date(2024, 11, 21))] == [0, 0]
@@ -0,0 +1,76 @@
+from collections.abc import Callable
+
+from ortools.sat.python import cp_model
+
+from scheduling.domain import PlanningMonth, SchedulingDataset
+from scheduling.solver.cp_sat.context import SolverContext, create_context
+from scheduling.solver.cp_sat.sequences import (
+    SequenceCost,
+    add_rotation_cost,
+    add_run_cost,
+    run_window_weights,
+)
+
+
+def _dataset() -> SchedulingDataset:
+    return SchedulingDataset(planning_month=PlanningMonth(year=2024, month=11), planning_units=(), plans=())
+
+
+def _minimum(add_cost: Callable[[SolverContext], SequenceCost]) -> float:
+    ctx = create_context(dataset=_dataset())
+    cost = add_cost(ctx)
+    ctx.model.minimize(cost.expression)
+    solver = cp_model.CpSolver()
+
+    assert solver.solve(ctx.model) == cp_model.OPTIMAL
+    assert cost.lower_bound <= solver.objective_value <= cost.upper_bound
+
+    return solver.objective_value
+
+
+def _run_cost(days: str, cost: Callable[[int], int]) -> float:
+    return _minimum(
+        lambda ctx: add_run_cost(
+            ctx,
+            [ctx.model.new_constant(int(day == "x")) for day in days],
+            cost,
+            name="runs",
+        )
+    )
+
+
+def _rotation_cost(days: str) -> float:
+    # "i" is worked but outside the rotation.
+    return _minimum(
+        lambda ctx: add_rotation_cost(
+            ctx,
+            [[ctx.model.new_constant(int(day == symbol)) for symbol in "abc"] for day in days],
+            [ctx.model.new_constant(int(day != ".")) for day in days],
+            max_gap=2,
+            name="rotation",
+        )
+    )
+
+
+def test_run_window_weights_skip_lengths_without_weight() -> None:
+    assert run_window_weights(lambda run_length: max(run_length - 5, 0), 30) == {6: 1}
+    assert run_window_weights(lambda run_length: abs(min(run_length, 8) - 3), 30) == {1: 2, 2: -3, 4: 2, 9: -1}
+
+
+def test_run_cost_charges_every_run_including_open_ends() -> None:
+    def distance_from_three(run_length: int) -> int:
+        return abs(min(run_length, 8) - 3)
+
+    assert _run_cost("xx.xxx.x", distance_from_three) == 1 + 0 + 2
+    assert _run_cost("xxxxxxxxxxx..xxxxx", distance_from_three) == 5 + 2
+    assert _run_cost("........", distance_from_three) == 0
+
+
+def test_rotation_cost_scores_steps_to_the_closest_worked_day_in_reach() -> None:
+    assert _rotation_cost("abc") == -2
+    assert _rotation_cost("ac") == 0
+    assert _rotation_cost("cbca") == 1 - 1 + 1
+    assert _rotation_cost("a..b") == -1
+    assert _rotation_cost("a...b") == 0
+    assert _rotation_cost("a.ib") == 0
+    assert _rotation_cost("c..a..b") == 1 - 1
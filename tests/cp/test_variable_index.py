@@ -0,0 +1,132 @@
+from datetime import date
+
+from scheduling.domain import (
+    Employee,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+)
+from scheduling.solver.cp_sat.context import create_context
+from scheduling.solver.cp_sat.inspection import inspect_cp_sat_model
+from scheduling.solver.cp_sat.variables import create_assignment_variables
+
+PLANNING_UNIT = PlanningUnit(
+    planning_unit_id=1,
+    display_name="Station 1",
+    type=PlanningUnitType.STATION,
+)
+
+EARLY_SHIFT = Shift(
+    shift_id=1,
+    code="F",
+    type=ShiftType.EARLY,
+    staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+    start_minute=360,
+    end_minute=840,
+    net_work_minutes=460,
+)
+
+NIGHT_SHIFT = Shift(
+    shift_id=3,
+    code="N",
+    type=ShiftType.NIGHT,
+    staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+    start_minute=1290,
+    end_minute=375,
+    net_work_minutes=525,
+)
+
+EMPLOYEES = tuple(
+    Employee(employee_id=employee_id, display_name=f"Employee {employee_id}", staff_level=StaffLevel.PROFESSIONAL)
+    for employee_id in (2, 1)
+)
+
+MEMBERSHIPS = tuple(
+    PlanningUnitMembership(
+        planning_unit_id=PLANNING_UNIT.planning_unit_id,
+        employee_id=employee.employee_id,
+        valid_from=date(2024, 11, 1),
+        valid_until=date(2024, 11, 30),
+        staff_level=StaffLevel.PROFESSIONAL,
+        is_home=True,
+        is_replacement=False,
+    )
+    for employee in EMPLOYEES
+)
+
+
+def _dataset() -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(PLANNING_UNIT,),
+        plans=(),
+        shifts=(EARLY_SHIFT, NIGHT_SHIFT),
+        employees=EMPLOYEES,
+        planning_unit_memberships=MEMBERSHIPS,
+    )
+
+
+def test_groups_every_variable_once_per_view() -> None:
+    ctx = create_context(dataset=_dataset())
+    create_assignment_variables(ctx)
+
+    variable_index = ctx.variable_index
+
+    assert variable_index.variable_count == len(ctx.assignment_variables) == 2 * 30 * 2
+    assert variable_index.employee_ids == (1, 2)
+    assert len(variable_index.by_employee[1]) == 60
+    assert len(variable_index.by_employee_date[(1, date(2024, 11, 5))]) == 2
+    assert len(variable_index.by_employee_date_shift_type[(1, date(2024, 11, 5), ShiftType.NIGHT)]) == 1
+    assert len(variable_index.by_demand[(1, date(2024, 11, 5), 1, StaffLevel.PROFESSIONAL)]) == 2
+    assert len(variable_index.by_unit_week_shift[(1, (2024, 45), 1)]) == 7
+
+
+def test_index_is_memoized_until_variables_change() -> None:
+    ctx = create_context(dataset=_dataset())
+    create_assignment_variables(ctx)
+
+    first = ctx.variable_index
+    assert ctx.variable_index is first
+
+    key = (3, 1, date(2024, 11, 5), 1, StaffLevel.PROFESSIONAL)
+    ctx.assignment_variables[key] = ctx.model.new_bool_var("extra")
+
+    assert ctx.variable_index is not first
+    assert ctx.variable_index.employee_ids == (1, 2, 3)
+
+
+def test_derived_literals_are_created_once_per_key() -> None:
+    ctx = create_context(dataset=_dataset())
+    create_assignment_variables(ctx)
+    day = date(2024, 11, 5)
+    constraint_count = inspect_cp_sat_model(model=ctx.model).proto_constraint_count
+
+    works = ctx.derived.works(1, day)
+
+    assert ctx.derived.works(1, day) is works
+    assert ctx.derived.free(1, day) is ctx.derived.free(1, day)
+    assert inspect_cp_sat_model(model=ctx.model).proto_constraint_count == constraint_count + 1
+    assert (
+        ctx.derived.works_type(1, day, ShiftType.NIGHT)
+        is ctx.variable_index.by_employee_date_shift_type[(1, day, ShiftType.NIGHT)][0]
+    )
+
+
+def test_derived_literals_follow_the_assignment_variables() -> None:
+    ctx = create_context(dataset=_dataset())
+    create_assignment_variables(ctx)
+    day = date(2024, 11, 5)
+
+    first = ctx.derived
+    assert ctx.derived.works(3, day).index == ctx.model.new_constant(0).index
+
+    ctx.assignment_variables[(3, 1, day, 1, StaffLevel.PROFESSIONAL)] = ctx.model.new_bool_var("extra")
+
+    assert ctx.derived is not first
+    assert ctx.derived.works(3, day).index == ctx.assignment_variables[(3, 1, day, 1, StaffLevel.PROFESSIONAL)].index
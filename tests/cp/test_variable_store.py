@@ -0,0 +1,81 @@
+from datetime import date
+
+import pytest
+from ortools.sat.python import cp_model
+
+from scheduling.domain import StaffLevel
+from scheduling.solver.cp_sat.variable_store import AssignmentVariableStore
+
+DATES = (date(2024, 11, 1), date(2024, 11, 2))
+
+
+def _store() -> AssignmentVariableStore:
+    return AssignmentVariableStore(model=cp_model.CpModel(), dates=DATES, shift_ids=(1, 2))
+
+
+def test_behaves_like_a_mapping() -> None:
+    store = _store()
+    key = (7, 1, DATES[1], 2, StaffLevel.PROFESSIONAL)
+    variable = store.model.new_bool_var("assign")
+
+    store[key] = variable
+
+    assert len(store) == 1
+    assert key in store
+    assert store[key].index == variable.index
+    assert list(store) == [key]
+    assert [(stored_key, stored.index) for stored_key, stored in store.items()] == [(key, variable.index)]
+
+    del store[key]
+
+    assert len(store) == 0
+    assert key not in store
+    with pytest.raises(KeyError):
+        store[key]
+
+
+def test_grows_axes_for_unknown_coordinates() -> None:
+    store = _store()
+    inside = (1, 1, DATES[0], 1, StaffLevel.PROFESSIONAL)
+    outside = (2, 5, date(2024, 12, 1), 9, StaffLevel.TRAINEE)
+
+    for position in range(40):
+        store[(100 + position, 1, DATES[0], 1, StaffLevel.PROFESSIONAL)] = store.model.new_bool_var(f"row_{position}")
+    store[inside] = store.model.new_bool_var("inside")
+    store[outside] = store.model.new_bool_var("outside")
+
+    assert len(store) == 42
+    assert store[outside].name == "outside"
+    assert store.variable_indices.shape == (42, 3, 3, len(StaffLevel))
+    assert int(store.valid.sum()) == 42
+
+
+def test_keys_with_value_selects_active_variables() -> None:
+    store = _store()
+    first = (1, 1, DATES[0], 1, StaffLevel.PROFESSIONAL)
+    second = (1, 1, DATES[1], 2, StaffLevel.PROFESSIONAL)
+    store[first] = store.model.new_bool_var("first")
+    store[second] = store.model.new_bool_var("second")
+
+    solution = [0, 0]
+    solution[store[second].index] = 1
+
+    assert store.keys_with_value(solution) == (second,)
+
+
+def test_cells_decode_keys_and_variables_in_store_order() -> None:
+    store = _store()
+    keys = [
+        (2, 1, DATES[1], 1, StaffLevel.PROFESSIONAL),
+        (1, 3, DATES[0], 2, StaffLevel.ASSISTANT),
+        (1, 1, DATES[1], 2, StaffLevel.PROFESSIONAL),
+    ]
+    for position, key in enumerate(keys):
+        store[key] = store.model.new_bool_var(f"assign_{position}")
+
+    cells = store.cells()
+
+    assert cells.keys() == [cells.key(position) for position in range(len(cells))]
+    assert sorted(cells.keys()) == sorted(keys)
+    assert [store[key].name for key in cells.keys()] == [variable.name for variable in cells.variables()]
+    assert [variable.index for variable in store.values()] == [variable.index for _, variable in store.items()]
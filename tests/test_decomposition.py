@@ -0,0 +1,269 @@
+from dataclasses import replace
+from datetime import date
+
+import pytest
+from ortools.sat.python import cp_model
+from pydantic import SecretStr
+
+from scheduling.domain import (
+    Assignment,
+    AssignmentType,
+    DemandRequirement,
+    Employee,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+)
+from scheduling.settings import Settings
+from scheduling.solver.config import ObjectiveConfig
+from scheduling.solver.cp_sat.builder import CpSatModelBuilder, create_cp_sat_model_builder
+from scheduling.solver.cp_sat.objectives.temporary_balance_generated_assignments import (
+    TemporaryBalanceGeneratedAssignments,
+)
+from scheduling.solver.decomposition import component_dataset, merge_solutions, planning_unit_components
+from scheduling.solver.index import build_schedule_index
+from scheduling.solver.models import Solution, SolutionStatus, SolveProgress
+from scheduling.solver.service import SolverService, component_settings
+from scheduling.synthetic import SyntheticDatasetSpec, generate_datasets
+
+SETTINGS = Settings(
+    db_server="unused",
+    db_name="unused",
+    db_user="unused",
+    db_password=SecretStr("unused"),
+    solver_max_time_seconds=5,
+    solver_num_search_workers=1,
+    solver_progress_assignments=True,
+)
+
+
+def _membership(employee_id: int, planning_unit_id: int) -> PlanningUnitMembership:
+    return PlanningUnitMembership(
+        planning_unit_id=planning_unit_id,
+        employee_id=employee_id,
+        valid_from=date(2024, 11, 1),
+        valid_until=None,
+        staff_level=StaffLevel.PROFESSIONAL,
+        is_home=True,
+        is_replacement=False,
+    )
+
+
+def _dataset(memberships: tuple[tuple[int, int], ...] = ((1, 1), (2, 2))) -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=tuple(
+            PlanningUnit(planning_unit_id=unit_id, display_name=f"Station {unit_id}", type=PlanningUnitType.STATION)
+            for unit_id in (1, 2, 3)
+        ),
+        plans=(),
+        shifts=(
+            Shift(
+                shift_id=1,
+                code="F",
+                type=ShiftType.EARLY,
+                staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+                start_minute=360,
+                end_minute=840,
+                net_work_minutes=460,
+            ),
+        ),
+        employees=tuple(
+            Employee(
+                employee_id=employee_id, display_name=f"Employee {employee_id}", staff_level=StaffLevel.PROFESSIONAL
+            )
+            for employee_id in (1, 2)
+        ),
+        planning_unit_memberships=tuple(
+            _membership(employee_id, planning_unit_id) for employee_id, planning_unit_id in memberships
+        ),
+    )
+
+
+def _uneven_dataset() -> SchedulingDataset:
+    """Station 1 with one employee and station 2 with two, each staffed on some days."""
+    dataset = _dataset(((1, 1), (2, 2), (3, 2)))
+
+    return dataset.model_copy(
+        update={
+            "employees": tuple(
+                Employee(
+                    employee_id=employee_id, display_name=f"Employee {employee_id}", staff_level=StaffLevel.PROFESSIONAL
+                )
+                for employee_id in (1, 2, 3)
+            ),
+            "demand_requirements": tuple(
+                DemandRequirement(
+                    planning_unit_id=planning_unit_id,
+                    date=date(2024, 11, day),
+                    shift_id=1,
+                    staff_level=StaffLevel.PROFESSIONAL,
+                    required_count=required_count,
+                )
+                for planning_unit_id, required_count, days in ((1, 1, range(4, 7)), (2, 2, range(4, 9)))
+                for day in days
+            ),
+        }
+    )
+
+
+def _model_builder(*, balance: bool) -> CpSatModelBuilder:
+    """The default builder, with the objective that couples all employees switched on or off."""
+    builder = create_cp_sat_model_builder()
+    objectives = builder.config.objectives | {
+        TemporaryBalanceGeneratedAssignments.id: ObjectiveConfig(enabled=balance, weight=1)
+    }
+
+    return replace(builder, config=builder.config.model_copy(update={"objectives": objectives}))
+
+
+def _solve(
+    dataset: SchedulingDataset, *, model_builder: CpSatModelBuilder, decompose: bool
+) -> tuple[Solution, float, bool]:
+    """Solution, final objective value, and whether the components were solved separately."""
+    progress: list[SolveProgress] = []
+    service = SolverService(
+        settings=SETTINGS.model_copy(update={"solver_decompose_components": decompose}),
+        model_builder=model_builder,
+    )
+
+    try:
+        solution = service.solve(dataset, on_progress=progress.append)
+        decomposed = service._component_pool is not None  # pyright: ignore[reportPrivateUsage]
+    finally:
+        service.close()
+
+    return solution, progress[-1].objective_value, decomposed
+
+
+def _single_model_objective(
+    dataset: SchedulingDataset, *, model_builder: CpSatModelBuilder, assignments: tuple[Assignment, ...]
+) -> float:
+    """Objective of the whole dataset's single model with the given assignments fixed."""
+    build_result = model_builder.build(dataset)
+    model = build_result.ctx.model
+    assigned = {(assignment.employee_id, assignment.date, assignment.shift_id) for assignment in assignments}
+
+    for key, variables in build_result.ctx.variable_index.by_employee_date_shift.items():
+        model.add(sum(variables) == int(key in assigned))
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = 1
+
+    assert solver.solve(model) == cp_model.OPTIMAL
+    return solver.objective_value
+
+
+def _components(dataset: SchedulingDataset) -> tuple[tuple[int, ...], ...]:
+    return planning_unit_components(dataset, build_schedule_index(dataset))
+
+
+def test_units_sharing_an_employee_form_one_component() -> None:
+    assert _components(_dataset()) == ((1,), (2,), (3,))
+    assert _components(_dataset(((1, 1), (2, 2), (2, 3)))) == ((1,), (2, 3))
+    assert _components(_dataset(((1, 1), (1, 2), (2, 2), (2, 3)))) == ((1, 2, 3),)
+
+
+def test_component_dataset_keeps_units_members_and_their_records() -> None:
+    (dataset,) = generate_datasets(SyntheticDatasetSpec(planning_units=2, employees_per_unit=6))
+
+    component = component_dataset(dataset, (2,))
+
+    assert {unit.planning_unit_id for unit in component.planning_units} == {2}
+    assert {employee.employee_id for employee in component.employees} == set(range(7, 13))
+    assert {demand.planning_unit_id for demand in component.demand_requirements} == {2}
+    assert {account.employee_id for account in component.monthly_work_accounts} == set(range(7, 13))
+    assert {weights.planning_unit_id for weights in component.objective_weights} == {2}
+    assert component.shifts == dataset.shifts
+
+
+def test_merged_status_is_the_worst_component_status() -> None:
+    assignment = Assignment(
+        employee_id=1,
+        planning_unit_id=1,
+        date=date(2024, 11, 1),
+        shift_id=1,
+        assignment_type=AssignmentType.GENERATED,
+    )
+    optimal = Solution(status=SolutionStatus.OPTIMAL, assignments=(assignment,))
+    feasible = Solution(status=SolutionStatus.FEASIBLE)
+    infeasible = Solution(status=SolutionStatus.INFEASIBLE)
+
+    assert merge_solutions([optimal, optimal]).status == SolutionStatus.OPTIMAL
+    assert merge_solutions([optimal, feasible]) == Solution(status=SolutionStatus.FEASIBLE, assignments=(assignment,))
+    assert merge_solutions([optimal, infeasible]) == Solution(status=SolutionStatus.INFEASIBLE)
+
+
+def test_component_solves_split_the_search_workers() -> None:
+    settings = SETTINGS.model_copy(update={"solver_num_search_workers": 8})
+
+    assert component_settings(settings, concurrent_components=2).solver_num_search_workers == 4
+    assert component_settings(settings, concurrent_components=3).solver_num_search_workers == 2
+    assert component_settings(settings, concurrent_components=16).solver_num_search_workers == 1
+
+
+def test_only_separable_objectives_allow_decomposition() -> None:
+    assert not create_cp_sat_model_builder().separable
+    assert not _model_builder(balance=True).separable
+    assert _model_builder(balance=False).separable
+
+
+@pytest.mark.integration
+def test_solver_solves_components_separately_and_merges_them() -> None:
+    dataset = _dataset()
+    progress: list[SolveProgress] = []
+    model_builder = _model_builder(balance=False)
+    service = SolverService(settings=SETTINGS, model_builder=model_builder)
+
+    try:
+        decomposed = service.solve(dataset, on_progress=progress.append)
+        pool = service._component_pool  # pyright: ignore[reportPrivateUsage]
+        repeated = service.solve(dataset)
+
+        assert pool is not None
+        assert service._component_pool is pool  # pyright: ignore[reportPrivateUsage]
+    finally:
+        service.close()
+
+    monolithic = SolverService(
+        settings=SETTINGS.model_copy(update={"solver_decompose_components": False}),
+        model_builder=model_builder,
+    ).solve(dataset)
+
+    assert decomposed.status == monolithic.status == repeated.status == SolutionStatus.OPTIMAL
+    assert decomposed.assignments == monolithic.assignments
+    assert progress
+    assert progress[-1].assignments is not None
+    assert sorted(progress[-1].assignments, key=lambda assignment: assignment.date) == sorted(
+        decomposed.assignments, key=lambda assignment: assignment.date
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("balance", [True, False])
+def test_uneven_components_solve_to_the_single_model_objective(balance: bool) -> None:
+    dataset = _uneven_dataset()
+    model_builder = _model_builder(balance=balance)
+
+    decomposed, decomposed_objective, was_decomposed = _solve(dataset, model_builder=model_builder, decompose=True)
+    monolithic, monolithic_objective, _ = _solve(dataset, model_builder=model_builder, decompose=False)
+
+    assert was_decomposed is not balance
+    assert decomposed.status == monolithic.status == SolutionStatus.OPTIMAL
+    assert decomposed_objective == monolithic_objective
+    # The month has several optimal schedules, so the separately solved
+    # components need not pick the single model's one, but theirs must score
+    # the same in the single model.
+    assert (
+        _single_model_objective(dataset, model_builder=model_builder, assignments=decomposed.assignments)
+        == monolithic_objective
+    )
+
+    if not was_decomposed:
+        assert decomposed.assignments == monolithic.assignments
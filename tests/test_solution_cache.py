@@ -0,0 +1,75 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from scheduling.domain import Assignment, AssignmentType, Employee, PlanningMonth, SchedulingDataset, StaffLevel
+from scheduling.settings import Settings
+from scheduling.solver import fingerprint as fingerprint_module
+from scheduling.solver.config import create_base_solver_config
+from scheduling.solver.fingerprint import solve_fingerprint
+from scheduling.solver.models import Solution, SolutionStatus
+from scheduling.solver.solution_cache import SolutionCache
+
+SETTINGS = Settings(db_server="unused", db_name="unused", db_user="unused", db_password=SecretStr("unused"))
+EMPLOYEES = tuple(
+    Employee(employee_id=employee_id, display_name=f"Employee {employee_id}", staff_level=StaffLevel.PROFESSIONAL)
+    for employee_id in (1, 2)
+)
+SOLUTION = Solution(
+    status=SolutionStatus.OPTIMAL,
+    assignments=(
+        Assignment(
+            employee_id=1,
+            planning_unit_id=1,
+            date=date(2024, 11, 4),
+            shift_id=1,
+            assignment_type=AssignmentType.GENERATED,
+        ),
+    ),
+)
+
+
+def _dataset(employees: tuple[Employee, ...]) -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(),
+        plans=(),
+        employees=employees,
+    )
+
+
+def test_fingerprint_ignores_record_order_but_not_solver_inputs() -> None:
+    config = create_base_solver_config()
+    fingerprint = solve_fingerprint(_dataset(EMPLOYEES), config=config, settings=SETTINGS)
+
+    assert solve_fingerprint(_dataset(EMPLOYEES[::-1]), config=config, settings=SETTINGS) == fingerprint
+    assert solve_fingerprint(_dataset(EMPLOYEES[:1]), config=config, settings=SETTINGS) != fingerprint
+    assert (
+        solve_fingerprint(
+            _dataset(EMPLOYEES),
+            config=config,
+            settings=SETTINGS.model_copy(update={"solver_random_seed": 7}),
+        )
+        != fingerprint
+    )
+
+
+def test_fingerprint_changes_with_the_model_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = create_base_solver_config()
+    fingerprint = solve_fingerprint(_dataset(EMPLOYEES), config=config, settings=SETTINGS)
+
+    monkeypatch.setattr(fingerprint_module, "MODEL_VERSION", fingerprint_module.MODEL_VERSION + 1)
+
+    assert solve_fingerprint(_dataset(EMPLOYEES), config=config, settings=SETTINGS) != fingerprint
+
+
+def test_disk_tier_survives_memory_eviction_and_restart(tmp_path: Path) -> None:
+    cache = SolutionCache(max_entries=1, directory=tmp_path)
+    cache.put("first", SOLUTION)
+    cache.put("second", Solution(status=SolutionStatus.FEASIBLE))
+
+    assert cache.get("first") == SOLUTION
+    assert SolutionCache(max_entries=1, directory=tmp_path).get("second") == Solution(status=SolutionStatus.FEASIBLE)
+    assert SolutionCache(max_entries=1).get("first") is None
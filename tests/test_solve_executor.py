@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+from pydantic import SecretStr
+
+from scheduling.api.solve.executor import ProcessSolveExecutor, SolveWorkerError
+from scheduling.domain import (
+    Employee,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+)
+from scheduling.settings import Settings
+from scheduling.solver.models import SolutionStatus
+
+SETTINGS = Settings(
+    db_server="unused",
+    db_name="unused",
+    db_user="unused",
+    db_password=SecretStr("unused"),
+    solver_max_time_seconds=5,
+    solver_num_search_workers=1,
+)
+
+
+def _dataset() -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(PlanningUnit(planning_unit_id=1, display_name="Station 1", type=PlanningUnitType.STATION),),
+        plans=(),
+        shifts=(
+            Shift(
+                shift_id=1,
+                code="F",
+                type=ShiftType.EARLY,
+                staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+                start_minute=360,
+                end_minute=840,
+                net_work_minutes=460,
+            ),
+        ),
+        employees=(Employee(employee_id=1, display_name="Employee 1", staff_level=StaffLevel.PROFESSIONAL),),
+        planning_unit_memberships=(
+            PlanningUnitMembership(
+                planning_unit_id=1,
+                employee_id=1,
+                valid_from=date(2024, 11, 1),
+                valid_until=None,
+                staff_level=StaffLevel.PROFESSIONAL,
+                is_home=True,
+                is_replacement=False,
+            ),
+        ),
+    )
+
+
+@pytest.mark.integration
+def test_process_executor_solves_and_recycles_workers() -> None:
+    executor = ProcessSolveExecutor(settings=SETTINGS, workers=1, max_jobs_per_worker=1)
+
+    try:
+        first = executor.solve(_dataset())
+        second = executor.solve(_dataset())
+    finally:
+        executor.close()
+
+    assert first.status in {SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE}
+    assert second == first
+
+
+@pytest.mark.integration
+def test_process_executor_replaces_worker_after_time_limit() -> None:
+    executor = ProcessSolveExecutor(settings=SETTINGS, workers=1, max_jobs_per_worker=10, timeout_seconds=0)
+
+    try:
+        with pytest.raises(SolveWorkerError, match="time limit"):
+            executor.solve(_dataset())
+    finally:
+        executor.close()
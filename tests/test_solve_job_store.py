@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+from scheduling.api.solve.job_models import SolveCommand, SolveJobStatus
+from scheduling.api.solve.job_store import InMemorySolveJobStore, SqliteSolveJobStore
+from scheduling.domain import Assignment, AssignmentType, PlanningMonth
+from scheduling.solver.models import Solution, SolutionStatus
+
+COMMAND = SolveCommand(planning_unit_ids=(77,), planning_month=PlanningMonth(year=2024, month=11))
+
+
+def test_sqlite_store_shares_job_lifecycle_between_instances(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    api_worker = SqliteSolveJobStore(path=path)
+    other_worker = SqliteSolveJobStore(path=path)
+    solution = Solution(
+        status=SolutionStatus.OPTIMAL,
+        assignments=(
+            Assignment(
+                employee_id=101,
+                planning_unit_id=77,
+                date=date(2024, 11, 2),
+                shift_id=1,
+                assignment_type=AssignmentType.GENERATED,
+            ),
+        ),
+    )
+
+    job = api_worker.create(COMMAND)
+    api_worker.mark_running(job.job_id)
+    api_worker.mark_succeeded(job.job_id, solution)
+
+    stored = other_worker.get(job.job_id)
+
+    assert stored is not None
+    assert stored.status == SolveJobStatus.SUCCEEDED
+    assert stored.command == COMMAND
+    assert stored.created_at == job.created_at
+    assert stored.started_at is not None
+    assert stored.result == solution
+
+
+def test_sqlite_store_evicts_finished_jobs_after_ttl(tmp_path: Path) -> None:
+    store = SqliteSolveJobStore(path=tmp_path / "jobs.sqlite3", finished_job_ttl=timedelta(0))
+
+    running = store.create(COMMAND)
+    store.mark_running(running.job_id)
+    failed = store.create(COMMAND)
+    store.mark_failed(failed.job_id, "RuntimeError: boom")
+
+    assert store.get(failed.job_id) is None
+    assert store.get(running.job_id) is not None
+
+
+def test_in_memory_store_evicts_finished_jobs_after_ttl() -> None:
+    store = InMemorySolveJobStore(finished_job_ttl=timedelta(0))
+
+    job = store.create(COMMAND)
+    store.mark_failed(job.job_id, "RuntimeError: boom")
+
+    assert store.get(job.job_id) is None
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import uuid
+from datetime import date
+
+import pytest
+from fastapi.sse import ServerSentEvent
+from pydantic import SecretStr
+
+from scheduling.api.solve import router
+from scheduling.api.solve.job_models import SolveCommand, SolveJob
+from scheduling.api.solve.job_store import InMemorySolveJobStore
+from scheduling.api.solve.queue import SolveQueue
+from scheduling.api.solve.router import stream_solve_task_events
+from scheduling.domain import (
+    Employee,
+    PlanningMonth,
+    PlanningUnit,
+    PlanningUnitMembership,
+    PlanningUnitType,
+    SchedulingDataset,
+    Shift,
+    ShiftType,
+    StaffingDemandRole,
+    StaffLevel,
+)
+from scheduling.settings import Settings
+from scheduling.solver.cancellation import SolveCancellation
+from scheduling.solver.cp_sat.builder import create_cp_sat_model_builder
+from scheduling.solver.models import Solution, SolutionStatus, SolveProgress
+from scheduling.solver.service import SolverService
+
+SETTINGS = Settings(
+    db_server="unused",
+    db_name="unused",
+    db_user="unused",
+    db_password=SecretStr("unused"),
+    solver_max_time_seconds=5,
+    solver_num_search_workers=1,
+    solver_progress_assignments=True,
+)
+
+
+def _dataset() -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=PlanningMonth(year=2024, month=11),
+        planning_units=(PlanningUnit(planning_unit_id=1, display_name="Station 1", type=PlanningUnitType.STATION),),
+        plans=(),
+        shifts=(
+            Shift(
+                shift_id=1,
+                code="F",
+                type=ShiftType.EARLY,
+                staffing_role=StaffingDemandRole.REQUIRED_MINIMUM,
+                start_minute=360,
+                end_minute=840,
+                net_work_minutes=460,
+            ),
+        ),
+        employees=(Employee(employee_id=1, display_name="Employee 1", staff_level=StaffLevel.PROFESSIONAL),),
+        planning_unit_memberships=(
+            PlanningUnitMembership(
+                planning_unit_id=1,
+                employee_id=1,
+                valid_from=date(2024, 11, 1),
+                valid_until=None,
+                staff_level=StaffLevel.PROFESSIONAL,
+                is_home=True,
+                is_replacement=False,
+            ),
+        ),
+    )
+
+
+@pytest.mark.integration
+def test_solver_reports_improving_solutions() -> None:
+    service = SolverService(settings=SETTINGS, model_builder=create_cp_sat_model_builder())
+    progress: list[SolveProgress] = []
+
+    solution = service.solve(_dataset(), on_progress=progress.append)
+
+    assert progress
+    assert [update.solution_count for update in progress] == list(range(1, len(progress) + 1))
+    assert progress[-1].assignments == solution.assignments
+
+
+@pytest.mark.integration
+def test_solver_skips_the_search_when_cancelled_before_it_starts() -> None:
+    service = SolverService(
+        settings=SETTINGS.model_copy(update={"solver_max_time_seconds": 60}),
+        model_builder=create_cp_sat_model_builder(),
+    )
+    cancellation = SolveCancellation()
+    cancellation.cancel()
+
+    solution = service.solve(_dataset(), cancellation=cancellation)
+
+    assert solution.status == SolutionStatus.UNKNOWN
+    assert not solution.assignments
+
+
+def test_events_stream_progress_until_job_finishes() -> None:
+    store = InMemorySolveJobStore()
+    queue = SolveQueue(
+        job_store=store,
+        run=lambda job_id, command, cancellation: Solution(status=SolutionStatus.OPTIMAL),
+        workers=1,
+        max_size=1,
+    )
+    job = store.create(SolveCommand(planning_unit_ids=(1,), planning_month=PlanningMonth(year=2024, month=11)))
+    store.mark_running(job.job_id)
+    store.record_progress(
+        job.job_id,
+        SolveProgress(solution_count=3, objective_value=12, best_objective_bound=10, gap=2 / 12, wall_time_seconds=0.5),
+    )
+    finished = store.mark_succeeded(job.job_id, Solution(status=SolutionStatus.FEASIBLE))
+
+    async def collect() -> list[ServerSentEvent]:
+        return [event async for event in stream_solve_task_events(job=finished, job_store=store, solve_queue=queue)]
+
+    events = asyncio.run(collect())
+
+    assert [event.event for event in events] == ["status", "progress", "done"]
+    assert events[1].id == "3"
+
+
+def test_events_poll_the_job_store_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(router, "_EVENT_POLL_SECONDS", 0)
+    poll_threads: list[threading.Thread] = []
+
+    class JobStore(InMemorySolveJobStore):
+        def get(self, job_id: uuid.UUID) -> SolveJob | None:
+            poll_threads.append(threading.current_thread())
+            self.mark_succeeded(job_id, Solution(status=SolutionStatus.OPTIMAL))
+            return super().get(job_id)
+
+    store = JobStore()
+    queue = SolveQueue(
+        job_store=store,
+        run=lambda job_id, command, cancellation: Solution(status=SolutionStatus.OPTIMAL),
+        workers=1,
+        max_size=1,
+    )
+    job = store.create(SolveCommand(planning_unit_ids=(1,), planning_month=PlanningMonth(year=2024, month=11)))
+    running = store.mark_running(job.job_id)
+
+    async def collect() -> list[ServerSentEvent]:
+        return [event async for event in stream_solve_task_events(job=running, job_store=store, solve_queue=queue)]
+
+    events = asyncio.run(collect())
+
+    assert [event.event for event in events] == ["status", "status", "done"]
+    assert poll_threads
+    assert threading.main_thread() not in poll_threads
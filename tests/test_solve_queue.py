@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+from scheduling.api.solve.job_models import SolveCommand, SolveJobStatus
+from scheduling.api.solve.job_store import InMemorySolveJobStore, SqliteSolveJobStore
+from scheduling.api.solve.queue import SolveQueue, SolveQueueFullError
+from scheduling.domain import PlanningMonth
+from scheduling.solver.cancellation import SolveCancellation
+from scheduling.solver.models import Solution, SolutionStatus
+
+
+def _command(planning_unit_id: int) -> SolveCommand:
+    return SolveCommand(planning_unit_ids=(planning_unit_id,), planning_month=PlanningMonth(year=2024, month=11))
+
+
+def test_queue_orders_by_priority_and_rejects_when_full() -> None:
+    solved: list[int] = []
+    release = threading.Event()
+
+    def run(job_id: uuid.UUID, command: SolveCommand, cancellation: SolveCancellation) -> Solution:
+        del job_id, cancellation
+
+        release.wait(timeout=5)
+        solved.append(command.planning_unit_ids[0])
+        return Solution(status=SolutionStatus.OPTIMAL, assignments=())
+
+    async def scenario() -> None:
+        store = InMemorySolveJobStore()
+        queue = SolveQueue(job_store=store, run=run, workers=1, max_size=2)
+        queue.start()
+
+        running = queue.submit(_command(1))
+        await asyncio.sleep(0.05)
+
+        low = queue.submit(_command(2))
+        high = queue.submit(_command(3), priority=5)
+
+        assert queue.position(running.job_id) is None
+        assert queue.position(high.job_id) == 1
+        assert queue.position(low.job_id) == 2
+
+        with pytest.raises(SolveQueueFullError):
+            queue.submit(_command(4))
+
+        release.set()
+        while any(_status(store, job.job_id) != SolveJobStatus.SUCCEEDED for job in (running, low, high)):
+            await asyncio.sleep(0.01)
+
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert solved == [1, 3, 2]
+
+
+def test_stop_fails_jobs_that_never_started() -> None:
+    async def scenario() -> None:
+        store = InMemorySolveJobStore()
+        queue = SolveQueue(
+            job_store=store,
+            run=lambda job_id, command, cancellation: Solution(status=SolutionStatus.OPTIMAL, assignments=()),
+            workers=1,
+            max_size=4,
+        )
+
+        job = queue.submit(_command(1))
+        await queue.stop()
+
+        stored = store.get(job.job_id)
+        assert stored is not None
+        assert stored.status == SolveJobStatus.FAILED
+
+    asyncio.run(scenario())
+
+
+def test_stop_fails_running_jobs_in_a_durable_store(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    started = threading.Event()
+
+    def run(job_id: uuid.UUID, command: SolveCommand, cancellation: SolveCancellation) -> Solution:
+        del job_id, command
+
+        started.set()
+        stopped = threading.Event()
+        with cancellation.on_cancel(stopped.set):
+            stopped.wait(timeout=5)
+
+        return Solution(status=SolutionStatus.FEASIBLE, assignments=())
+
+    async def scenario() -> uuid.UUID:
+        queue = SolveQueue(job_store=SqliteSolveJobStore(path=path), run=run, workers=1, max_size=1)
+        queue.start()
+
+        job = queue.submit(_command(1))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+
+        await queue.stop()
+        return job.job_id
+
+    job_id = asyncio.run(scenario())
+
+    stored = SqliteSolveJobStore(path=path).get(job_id)
+    assert stored is not None
+    assert stored.status == SolveJobStatus.FAILED
+
+
+def test_cancel_frees_waiting_slot_and_keeps_running_incumbent() -> None:
+    def run(job_id: uuid.UUID, command: SolveCommand, cancellation: SolveCancellation) -> Solution:
+        del job_id, command
+
+        stopped = threading.Event()
+        with cancellation.on_cancel(stopped.set):
+            stopped.wait(timeout=5)
+
+        return Solution(status=SolutionStatus.FEASIBLE, assignments=())
+
+    async def scenario() -> None:
+        store = InMemorySolveJobStore()
+        queue = SolveQueue(job_store=store, run=run, workers=1, max_size=1)
+        queue.start()
+
+        running = queue.submit(_command(1))
+        await asyncio.sleep(0.05)
+        waiting = queue.submit(_command(2))
+
+        assert queue.cancel(waiting.job_id)
+        assert _status(store, waiting.job_id) == SolveJobStatus.CANCELLED
+        queue.submit(_command(3))
+
+        assert queue.cancel(running.job_id)
+        while _status(store, running.job_id) == SolveJobStatus.RUNNING:
+            await asyncio.sleep(0.01)
+
+        cancelled = store.get(running.job_id)
+        assert cancelled is not None
+        assert cancelled.status == SolveJobStatus.CANCELLED
+        assert cancelled.result is not None
+        assert cancelled.result.status == SolutionStatus.FEASIBLE
+        assert not queue.cancel(running.job_id)
+
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def _status(store: InMemorySolveJobStore, job_id: uuid.UUID) -> SolveJobStatus | None:
+    job = store.get(job_id)
+    return job.status if job is not None else None
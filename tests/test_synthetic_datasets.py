@@ -0,0 +1,38 @@
+from scheduling.domain import PlanningMonth
+from scheduling.synthetic import SyntheticDatasetSpec, generate_datasets
+from scheduling.validation import validate_scheduling_dataset
+
+
+def test_generation_is_deterministic_and_valid() -> None:
+    spec = SyntheticDatasetSpec(
+        planning_units=2,
+        employees_per_unit=12,
+        months=2,
+        first_month=PlanningMonth(year=2024, month=12),
+    )
+
+    datasets = generate_datasets(spec)
+
+    assert datasets == generate_datasets(spec)
+    assert datasets != generate_datasets(spec.model_copy(update={"seed": 1}))
+    assert [dataset.planning_month for dataset in datasets] == [
+        PlanningMonth(year=2024, month=12),
+        PlanningMonth(year=2025, month=1),
+    ]
+
+    for dataset in datasets:
+        validate_scheduling_dataset(dataset)
+        assert len(dataset.employees) == 24
+        assert {requirement.planning_unit_id for requirement in dataset.demand_requirements} == {1, 2}
+
+
+def test_densities_and_demand_level_scale_the_month() -> None:
+    (empty,) = generate_datasets(SyntheticDatasetSpec(wish_density=0, availability_density=0, demand_level=0))
+    (dense,) = generate_datasets(SyntheticDatasetSpec(wish_density=1, availability_density=0, demand_level=2))
+    (default,) = generate_datasets(SyntheticDatasetSpec())
+
+    assert (empty.wishes, empty.availability, empty.demand_requirements) == ((), (), ())
+    assert len(dense.wishes) == 30 * 30
+    assert sum(requirement.required_count for requirement in dense.demand_requirements) == 2 * sum(
+        requirement.required_count for requirement in default.demand_requirements
+    )
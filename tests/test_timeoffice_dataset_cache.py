@@ -0,0 +1,87 @@
+from scheduling.domain import Employee, PlanningMonth, SchedulingDataset, StaffLevel
+from scheduling.timeoffice.dataset_cache import TimeOfficeDatasetCache
+
+NOVEMBER = PlanningMonth(year=2024, month=11)
+DECEMBER = PlanningMonth(year=2024, month=12)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _dataset(*employee_ids: int, planning_month: PlanningMonth = NOVEMBER) -> SchedulingDataset:
+    return SchedulingDataset(
+        planning_month=planning_month,
+        planning_units=(),
+        plans=(),
+        employees=tuple(
+            Employee(employee_id=employee_id, display_name=f"Employee {employee_id}", staff_level=StaffLevel.ASSISTANT)
+            for employee_id in employee_ids
+        ),
+    )
+
+
+def _size(dataset: SchedulingDataset) -> int:
+    return len(dataset.model_dump_json(exclude_computed_fields=True))
+
+
+def test_hits_until_ttl_expires_regardless_of_unit_order() -> None:
+    clock = _Clock()
+    cache = TimeOfficeDatasetCache(ttl_seconds=60, max_bytes=1_000_000, clock=clock)
+    first, second = _dataset(1), _dataset(2)
+
+    assert cache.get_or_fetch((1, 2), NOVEMBER, lambda: first) is first
+    assert cache.get_or_fetch((2, 1), NOVEMBER, lambda: second) is first
+    assert cache.peek((1, 2), DECEMBER) is None
+
+    clock.now = 60
+    assert cache.get_or_fetch((1, 2), NOVEMBER, lambda: second) is second
+    assert (cache.stats().hits, cache.stats().misses) == (1, 2)
+
+
+def test_evicts_least_recently_used_beyond_memory_budget() -> None:
+    datasets = {planning_unit_id: _dataset(planning_unit_id) for planning_unit_id in (1, 2, 3)}
+    cache = TimeOfficeDatasetCache(ttl_seconds=60, max_bytes=2 * _size(datasets[1]))
+
+    cache.get_or_fetch((1,), NOVEMBER, lambda: datasets[1])
+    cache.get_or_fetch((2,), NOVEMBER, lambda: datasets[2])
+    cache.peek((1,), NOVEMBER)
+    cache.get_or_fetch((3,), NOVEMBER, lambda: datasets[3])
+
+    assert cache.peek((1,), NOVEMBER) is datasets[1]
+    assert cache.peek((2,), NOVEMBER) is None
+    assert cache.stats().evictions == 1
+
+
+def test_invalidation_drops_unit_month_and_employee_datasets() -> None:
+    cache = TimeOfficeDatasetCache(ttl_seconds=60, max_bytes=1_000_000)
+    cache.get_or_fetch((1,), NOVEMBER, lambda: _dataset(10))
+    cache.get_or_fetch((1,), DECEMBER, lambda: _dataset(10, planning_month=DECEMBER))
+    cache.get_or_fetch((2,), NOVEMBER, lambda: _dataset(10, 20))
+    cache.get_or_fetch((3,), NOVEMBER, lambda: _dataset(30))
+
+    cache.invalidate(planning_unit_id=1, planning_month=NOVEMBER, employee_id=10)
+
+    assert cache.peek((1,), NOVEMBER) is None
+    assert cache.peek((2,), NOVEMBER) is None
+    assert cache.peek((1,), DECEMBER) is not None
+    assert cache.peek((3,), NOVEMBER) is not None
+
+    cache.invalidate(planning_unit_id=1)
+    assert cache.peek((1,), DECEMBER) is None
+
+
+def test_fetch_overlapping_invalidation_is_not_stored() -> None:
+    cache = TimeOfficeDatasetCache(ttl_seconds=60, max_bytes=1_000_000)
+
+    def fetch_during_write() -> SchedulingDataset:
+        cache.invalidate(planning_unit_id=1)
+        return _dataset(1)
+
+    cache.get_or_fetch((1,), NOVEMBER, fetch_during_write)
+
+    assert cache.peek((1,), NOVEMBER) is None
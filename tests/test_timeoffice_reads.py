@@ -0,0 +1,112 @@
+import threading
+from dataclasses import replace
+
+from sqlalchemy import Connection, create_engine
+from timeoffice_fakes import (
+    NOVEMBER,
+    FakeSundayWorkHistoryReader,
+    FakeWishReader,
+    create_fake_readers,
+    create_fake_service,
+)
+
+from scheduling.domain import PlanningMonth, SchedulingDataset
+from scheduling.timeoffice.facts import STATION_77_ID
+from scheduling.timeoffice.reading import collect_roster_rows
+from scheduling.timeoffice.reading.sunday_work import TimeOfficeSundayHistoryRow
+from scheduling.timeoffice.reading.wishes import TimeOfficeWishRow
+
+
+def test_concurrent_reads_return_the_sequential_sources() -> None:
+    engine = create_engine("sqlite://")
+    readers = create_fake_readers()
+
+    with engine.connect() as connection:
+        sequential = readers.read_sources(
+            connection=connection,
+            selected_planning_unit_ids=(STATION_77_ID,),
+            planning_month=NOVEMBER,
+            fold_roster=collect_roster_rows,
+        )
+
+    concurrent = readers.read_sources_concurrently(
+        engine=engine,
+        max_workers=4,
+        selected_planning_unit_ids=(STATION_77_ID,),
+        planning_month=NOVEMBER,
+        fold_roster=collect_roster_rows,
+    )
+
+    assert concurrent == sequential
+    assert sequential.roster
+    assert sequential.wish_rows
+
+
+def test_concurrent_reads_overlap_on_separate_connections() -> None:
+    # Both reads must be in flight at the same time to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    connections: list[int] = []
+
+    def wait_for_other_read(connection: Connection) -> None:
+        connections.append(id(connection.connection.dbapi_connection))
+        barrier.wait()
+
+    class WishReader(FakeWishReader):
+        def read_rows(
+            self,
+            *,
+            connection: Connection,
+            plan_ids: tuple[int, ...],
+            planning_unit_ids: tuple[int, ...],
+            employee_ids: tuple[int, ...],
+            planning_month: PlanningMonth,
+        ) -> tuple[TimeOfficeWishRow, ...]:
+            wait_for_other_read(connection)
+            return super().read_rows(
+                connection=connection,
+                plan_ids=plan_ids,
+                planning_unit_ids=planning_unit_ids,
+                employee_ids=employee_ids,
+                planning_month=planning_month,
+            )
+
+    class SundayWorkHistoryReader(FakeSundayWorkHistoryReader):
+        def read_rows(
+            self,
+            *,
+            connection: Connection,
+            employee_ids: tuple[int, ...],
+            planning_month: PlanningMonth,
+        ) -> tuple[TimeOfficeSundayHistoryRow, ...]:
+            wait_for_other_read(connection)
+            return super().read_rows(connection=connection, employee_ids=employee_ids, planning_month=planning_month)
+
+    readers = replace(create_fake_readers(), wishes=WishReader(), sunday_work_history=SundayWorkHistoryReader())
+
+    sources = readers.read_sources_concurrently(
+        engine=create_engine("sqlite://"),
+        max_workers=4,
+        selected_planning_unit_ids=(STATION_77_ID,),
+        planning_month=NOVEMBER,
+        fold_roster=collect_roster_rows,
+    )
+
+    assert sources.wish_rows
+    assert sources.sunday_history_rows
+    assert len(set(connections)) == 2
+
+
+def test_chunked_roster_reads_map_to_the_unchunked_dataset() -> None:
+    def fetch(roster_chunk_size: int) -> SchedulingDataset:
+        service = create_fake_service(
+            engine=create_engine("sqlite://"),
+            readers=create_fake_readers(roster_chunk_size=roster_chunk_size),
+        )
+        return service.fetch_dataset(planning_unit_ids=(STATION_77_ID,), planning_month=NOVEMBER)
+
+    unchunked = fetch(10_000)
+
+    assert unchunked.assignments
+    assert unchunked.availability
+    assert fetch(1) == unchunked
+    assert fetch(2) == unchunked
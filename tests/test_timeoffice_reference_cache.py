@@ -0,0 +1,62 @@
+from dataclasses import FrozenInstanceError
+from typing import cast
+
+import pytest
+from sqlalchemy import Connection
+from timeoffice_fakes import FakeShiftReader
+
+from scheduling.timeoffice.facts import TIMEOFFICE_FACTS
+from scheduling.timeoffice.reading.cache import ReferenceCacheStats, ReferenceSource, TimeOfficeReferenceCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    cache = TimeOfficeReferenceCache(ttl_seconds=10, clock=clock)
+
+    assert cache.get_or_read(ReferenceSource.SHIFTS, (), lambda: (1,)) == (1,)
+    assert cache.get_or_read(ReferenceSource.SHIFTS, (), lambda: (2,)) == (1,)
+
+    clock.now = 10
+    assert cache.get_or_read(ReferenceSource.SHIFTS, (), lambda: (3,)) == (3,)
+    assert cache.stats()[ReferenceSource.SHIFTS] == ReferenceCacheStats(hits=1, misses=2, invalidations=0, entries=1)
+
+
+def test_invalidation_drops_only_its_source() -> None:
+    cache = TimeOfficeReferenceCache(ttl_seconds=60)
+    cache.get_or_read(ReferenceSource.DEMAND, (1,), lambda: ("old",))
+    cache.get_or_read(ReferenceSource.SHIFTS, (), lambda: ("shift",))
+
+    cache.invalidate(ReferenceSource.DEMAND)
+
+    assert cache.get_or_read(ReferenceSource.DEMAND, (1,), lambda: ("new",)) == ("new",)
+    assert cache.get_or_read(ReferenceSource.SHIFTS, (), lambda: ("other",)) == ("shift",)
+
+
+def test_read_overlapping_invalidation_is_not_stored() -> None:
+    cache = TimeOfficeReferenceCache(ttl_seconds=60)
+
+    def read_during_write() -> tuple[str, ...]:
+        cache.invalidate(ReferenceSource.OBJECTIVE_WEIGHTS)
+        return ("stale",)
+
+    assert cache.get_or_read(ReferenceSource.OBJECTIVE_WEIGHTS, (1,), read_during_write) == ("stale",)
+    assert cache.get_or_read(ReferenceSource.OBJECTIVE_WEIGHTS, (1,), lambda: ("fresh",)) == ("fresh",)
+
+
+def test_cached_shift_rows_cannot_be_changed_by_a_caller() -> None:
+    cache = TimeOfficeReferenceCache(ttl_seconds=60)
+    reader = FakeShiftReader(facts=TIMEOFFICE_FACTS, reference_cache=cache)
+    (row, *_) = reader.read_rows(connection=cast(Connection, None))
+
+    with pytest.raises(FrozenInstanceError):
+        row.shift_code = "X"  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert reader.read_rows(connection=cast(Connection, None))[0] is row
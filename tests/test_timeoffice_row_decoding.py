@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from scheduling.timeoffice.reading.personnel import TimeOfficePlanningUnitMembershipRow
+from scheduling.timeoffice.reading.roster import TimeOfficeRosterRow
+from scheduling.timeoffice.reading.types import decode_rows, validate_rows
+
+
+def _roster_row(**overrides: Any) -> dict[str, Any]:
+    return {
+        "plan_id": 1,
+        "employee_id": 7,
+        "roster_date": datetime(2024, 11, 4),
+        "work_shift_id": 2,
+        "work_shift_code": " F ",
+        "global_absence_shift_id": None,
+        "absence_shift_id": " ",
+        "resolved_absence_shift_id": None,
+        "resolved_absence_code": "",
+        "planning_unit_id": 77,
+    } | overrides
+
+
+def _membership_row(**overrides: Any) -> dict[str, Any]:
+    return {
+        "planning_unit_id": 77,
+        "employee_id": 7,
+        "membership_profession_id": 3,
+        "membership_profession_code": None,
+        "valid_from": datetime(2024, 1, 1),
+        "valid_until": None,
+        "is_home": True,
+        "is_replacement": False,
+    } | overrides
+
+
+def test_decoding_cleans_columns_like_validation() -> None:
+    raw_rows = [_roster_row(), _roster_row(employee_id=8, work_shift_code=None, global_absence_shift_id=5)]
+
+    rows = decode_rows(TimeOfficeRosterRow, raw_rows)
+
+    assert rows == validate_rows(TimeOfficeRosterRow, raw_rows)
+    assert (rows[0].work_shift_code, rows[0].absence_shift_id, rows[0].resolved_absence_code) == ("F", None, None)
+
+
+def test_lax_column_falls_back_to_row_validation() -> None:
+    rows = decode_rows(TimeOfficePlanningUnitMembershipRow, [_membership_row(is_home=1, is_replacement=0)])
+
+    assert (rows[0].is_home, rows[0].is_replacement) == (True, False)
+
+
+@pytest.mark.parametrize(
+    "raw_row",
+    [
+        _roster_row(employee_id="7"),
+        _roster_row(work_shift_id=None, work_shift_code=None),
+        _roster_row(unexpected=1),
+    ],
+)
+def test_invalid_rows_raise_validation_errors(raw_row: dict[str, Any]) -> None:
+    with pytest.raises(ValidationError):
+        decode_rows(TimeOfficeRosterRow, [raw_row])
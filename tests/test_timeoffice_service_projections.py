@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import create_engine
+from timeoffice_fakes import NOVEMBER, create_fake_readers, create_fake_service
+
+from scheduling.domain import SchedulingDataset
+from scheduling.timeoffice.facts import STATION_77_ID
+from scheduling.timeoffice.service import TimeOfficeService, WishesAndAvailability
+
+
+@pytest.fixture
+def service() -> TimeOfficeService:
+    return create_fake_service(engine=create_engine("sqlite://"), readers=create_fake_readers())
+
+
+@pytest.fixture
+def dataset(service: TimeOfficeService) -> SchedulingDataset:
+    return service.fetch_dataset(planning_unit_ids=(STATION_77_ID,), planning_month=NOVEMBER)
+
+
+def test_fetch_employees_matches_the_dataset(service: TimeOfficeService, dataset: SchedulingDataset) -> None:
+    employees = service.fetch_employees(planning_unit_id=STATION_77_ID, planning_month=NOVEMBER)
+
+    assert employees
+    assert employees == dataset.employees
+
+
+def test_fetch_wishes_and_availability_matches_the_dataset(
+    service: TimeOfficeService,
+    dataset: SchedulingDataset,
+) -> None:
+    projection = service.fetch_wishes_and_availability(planning_unit_id=STATION_77_ID, planning_month=NOVEMBER)
+
+    assert projection.wishes
+    assert projection.availability
+    assert projection == WishesAndAvailability(
+        employees=dataset.employees,
+        wishes=dataset.wishes,
+        availability=dataset.availability,
+    )
+
+
+def test_fetch_demand_requirements_matches_the_dataset(service: TimeOfficeService, dataset: SchedulingDataset) -> None:
+    demand_requirements = service.fetch_demand_requirements(planning_unit_id=STATION_77_ID, planning_month=NOVEMBER)
+
+    assert demand_requirements
+    assert demand_requirements == dataset.demand_requirements
+
+
+def test_fetch_objective_weights_matches_the_dataset(service: TimeOfficeService, dataset: SchedulingDataset) -> None:
+    objective_weights = service.fetch_objective_weights(planning_unit_id=STATION_77_ID, planning_month=NOVEMBER)
+
+    assert objective_weights
+    assert objective_weights == dataset.objective_weights
@@ -0,0 +1,94 @@
+import threading
+from pathlib import Path
+
+from sqlalchemy import Connection, create_engine, text
+from timeoffice_fakes import NOVEMBER, create_fake_readers, create_fake_service
+
+from scheduling.domain import SolverObjectiveWeights
+from scheduling.timeoffice.facts import STATION_77_ID
+from scheduling.timeoffice.reading.cache import TimeOfficeReferenceCache
+from scheduling.timeoffice.reading.objective_weights import TimeOfficeObjectiveWeightRow, TimeOfficeWeightsReader
+from scheduling.timeoffice.remapping.objective_weights import map_objective_weights_to_timeoffice_rows
+from scheduling.timeoffice.service import TimeOfficeService
+from scheduling.timeoffice.writing.objective_weights import TimeOfficeWeightsWriter
+
+
+class _TableWeightsReader(TimeOfficeWeightsReader):
+    def _read_rows(
+        self,
+        *,
+        connection: Connection,
+        planning_unit_ids: tuple[int, ...],
+    ) -> tuple[TimeOfficeObjectiveWeightRow, ...]:
+        rows = connection.execute(text("SELECT planning_unit_id, objective_name, weight FROM objective_weights"))
+        return tuple(
+            TimeOfficeObjectiveWeightRow.model_validate(row)
+            for row in rows.mappings()
+            if row["planning_unit_id"] in planning_unit_ids
+        )
+
+
+class _ReadDuringWriteWeightsWriter(TimeOfficeWeightsWriter):
+    """Writes to the plain test table and reads through the service before the commit."""
+
+    def __init__(self) -> None:
+        self.service: TimeOfficeService | None = None
+        self.read_during_write: tuple[SolverObjectiveWeights, ...] = ()
+
+    def replace_objective_weights(
+        self,
+        *,
+        connection: Connection,
+        planning_unit_id: int,
+        objective_weights: SolverObjectiveWeights,
+    ) -> None:
+        connection.execute(
+            text("DELETE FROM objective_weights WHERE planning_unit_id = :planning_unit_id"),
+            {"planning_unit_id": planning_unit_id},
+        )
+        connection.execute(
+            text("INSERT INTO objective_weights VALUES (:planning_unit_id, :objective_name, :weight)"),
+            [row.model_dump() for row in map_objective_weights_to_timeoffice_rows(objective_weights)],
+        )
+
+        def read() -> None:
+            assert self.service is not None
+            self.read_during_write = self.service.fetch_objective_weights(
+                planning_unit_id=planning_unit_id,
+                planning_month=NOVEMBER,
+            )
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        reader.join(timeout=5)
+
+
+def test_read_during_a_weights_write_does_not_outlive_the_commit(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'timeoffice.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE objective_weights (planning_unit_id INT, objective_name TEXT, weight INT)")
+        )
+        connection.execute(text(f"INSERT INTO objective_weights VALUES ({STATION_77_ID}, 'fairness', 5)"))
+
+    reference_cache = TimeOfficeReferenceCache(ttl_seconds=600)
+    writer = _ReadDuringWriteWeightsWriter()
+    service = create_fake_service(
+        engine=engine,
+        readers=create_fake_readers(
+            reference_cache=reference_cache,
+            weights=_TableWeightsReader(reference_cache=reference_cache),
+        ),
+        reference_cache=reference_cache,
+        objective_weights_writer=writer,
+    )
+    writer.service = service
+
+    service.replace_objective_weights(
+        planning_unit_id=STATION_77_ID,
+        objective_weights=SolverObjectiveWeights(planning_unit_id=STATION_77_ID, fairness=9),
+    )
+
+    assert [weights.fairness for weights in writer.read_during_write] == [5]
+    (weights,) = service.fetch_objective_weights(planning_unit_id=STATION_77_ID, planning_month=NOVEMBER)
+    assert weights.fairness == 9
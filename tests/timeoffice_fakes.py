@@ -0,0 +1,379 @@
+"""In-memory TimeOffice readers for service and reader tests.
+
+The fakes keep the real reader classes and their reference caching and only
+replace the SQL queries with fixed rows for station 77 in November 2024.
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import Connection, Engine
+
+from scheduling.domain import PlanningMonth
+from scheduling.timeoffice.facts import (
+    EARLY_SHIFT_ID,
+    INTERMEDIATE_SHIFT_ID,
+    LATE_SHIFT_ID,
+    NIGHT_SHIFT_ID,
+    STATION_77_ID,
+    STATION_78_ID,
+    TIMEOFFICE_FACTS,
+)
+from scheduling.timeoffice.reading.cache import TimeOfficeReferenceCache
+from scheduling.timeoffice.reading.container import TimeOfficeReaders
+from scheduling.timeoffice.reading.demand import TimeOfficeDemandReader, TimeOfficeDemandRow
+from scheduling.timeoffice.reading.objective_weights import TimeOfficeObjectiveWeightRow, TimeOfficeWeightsReader
+from scheduling.timeoffice.reading.options import TimeOfficeOptionsReader
+from scheduling.timeoffice.reading.personnel import (
+    TimeOfficeEmployeeRow,
+    TimeOfficePersonnelReader,
+    TimeOfficePlanningUnitMembershipRow,
+    TimeOfficePlanPersonnelRow,
+)
+from scheduling.timeoffice.reading.planning_units import TimeOfficePlanningUnitReader, TimeOfficePlanningUnitRow
+from scheduling.timeoffice.reading.roster import TimeOfficeRosterReader, TimeOfficeRosterRow
+from scheduling.timeoffice.reading.shifts import TimeOfficeShiftReader, TimeOfficeShiftRow
+from scheduling.timeoffice.reading.sunday_work import TimeOfficeSundayHistoryRow, TimeOfficeSundayWorkHistoryReader
+from scheduling.timeoffice.reading.wishes import TimeOfficeWishReader, TimeOfficeWishRow
+from scheduling.timeoffice.reading.work_accounts import (
+    TimeOfficeMonthlyWorkAccountReader,
+    TimeOfficeMonthlyWorkAccountRow,
+)
+from scheduling.timeoffice.service import TimeOfficeService
+from scheduling.timeoffice.writing.demand import TimeOfficeDemandWriter
+from scheduling.timeoffice.writing.objective_weights import TimeOfficeWeightsWriter
+from scheduling.timeoffice.writing.roster import TimeOfficeAvailabilityWriter
+from scheduling.timeoffice.writing.solution import TimeOfficeSolutionWriter
+from scheduling.timeoffice.writing.wishes import TimeOfficeWishWriter
+
+NOVEMBER = PlanningMonth(year=2024, month=11)
+PLAN_ID = 500
+OTHER_PLAN_ID = 600
+
+PLANNING_UNIT_ROWS = (
+    TimeOfficePlanningUnitRow(planning_unit_id=STATION_77_ID, plan_id=PLAN_ID, plan_planning_unit_id=STATION_77_ID),
+)
+
+PLAN_PERSONNEL_ROWS = tuple(
+    TimeOfficePlanPersonnelRow(plan_id=PLAN_ID, planning_unit_id=STATION_77_ID, employee_id=employee_id)
+    for employee_id in (1, 2, 3)
+)
+
+MEMBERSHIP_ROWS = tuple(
+    TimeOfficePlanningUnitMembershipRow(
+        planning_unit_id=STATION_77_ID,
+        employee_id=employee_id,
+        membership_profession_id=profession_id,
+        membership_profession_code=profession_code,
+        valid_from=datetime(2024, 1, 1),
+        valid_until=None,
+        is_home=True,
+        is_replacement=False,
+    )
+    for employee_id, profession_id, profession_code in (
+        (1, 10, "81302-005"),
+        (2, 20, "81301-010"),
+        (3, 10, "81302-005"),
+    )
+)
+
+EMPLOYEE_ROWS = (
+    TimeOfficeEmployeeRow(
+        employee_id=1,
+        employee_profession_id=10,
+        employee_profession_code="81302-005",
+        first_name="Ada",
+        last_name="Albers",
+    ),
+    TimeOfficeEmployeeRow(
+        employee_id=2,
+        employee_profession_id=20,
+        employee_profession_code="81301-010",
+        first_name="Ben",
+        last_name="Brandt",
+    ),
+    TimeOfficeEmployeeRow(
+        employee_id=3,
+        employee_profession_id=10,
+        employee_profession_code="81302-005",
+        first_name="Cleo",
+        last_name="Conrad",
+    ),
+)
+
+SHIFT_ROWS = tuple(
+    TimeOfficeShiftRow(
+        shift_id=shift_id,
+        shift_code=code,
+        shift_type_id=TIMEOFFICE_FACTS.work_shift_type_id,
+        segment_start=datetime(2024, 1, 1, start_hour),
+        segment_end=datetime(2024, 1, 1, start_hour + 7, 40),
+        segment_minutes=460,
+    )
+    for shift_id, code, start_hour in (
+        (EARLY_SHIFT_ID, "F", 6),
+        (LATE_SHIFT_ID, "S", 13),
+        (NIGHT_SHIFT_ID, "N", 16),
+        (INTERMEDIATE_SHIFT_ID, "Z", 9),
+    )
+)
+
+
+def _work(employee_id: int, day: int, shift_id: int, code: str, *, plan_id: int, unit_id: int) -> TimeOfficeRosterRow:
+    return TimeOfficeRosterRow(
+        plan_id=plan_id,
+        employee_id=employee_id,
+        roster_date=datetime(2024, 11, day),
+        work_shift_id=shift_id,
+        work_shift_code=code,
+        global_absence_shift_id=None,
+        absence_shift_id=None,
+        resolved_absence_shift_id=None,
+        resolved_absence_code=None,
+        planning_unit_id=unit_id,
+    )
+
+
+def _absence(employee_id: int, day: int, code: str) -> TimeOfficeRosterRow:
+    return TimeOfficeRosterRow(
+        plan_id=PLAN_ID,
+        employee_id=employee_id,
+        roster_date=datetime(2024, 11, day),
+        work_shift_id=None,
+        work_shift_code=None,
+        global_absence_shift_id=4000,
+        absence_shift_id=None,
+        resolved_absence_shift_id=4000,
+        resolved_absence_code=code,
+        planning_unit_id=STATION_77_ID,
+    )
+
+
+ROSTER_ROWS = (
+    _work(1, 4, EARLY_SHIFT_ID, "F", plan_id=PLAN_ID, unit_id=STATION_77_ID),
+    _work(1, 4, EARLY_SHIFT_ID, "F", plan_id=PLAN_ID, unit_id=STATION_77_ID),
+    _absence(1, 10, "U"),
+    _work(2, 5, 2953, "N2_", plan_id=OTHER_PLAN_ID, unit_id=STATION_78_ID),
+    _work(2, 20, LATE_SHIFT_ID, "S", plan_id=PLAN_ID, unit_id=STATION_77_ID),
+    _absence(2, 21, "SC"),
+    _absence(3, 12, "FR"),
+    _work(3, 13, NIGHT_SHIFT_ID, "N", plan_id=PLAN_ID, unit_id=STATION_77_ID),
+)
+
+WISH_ROWS = (
+    TimeOfficeWishRow(
+        employee_id=3,
+        wish_date=datetime(2024, 11, 15),
+        plan_id=PLAN_ID,
+        planning_unit_id=STATION_77_ID,
+        work_shift_id=None,
+        work_shift_code=None,
+        work_shift_name=None,
+        global_absence_shift_id=1089,
+        global_absence_shift_code="FR",
+        global_absence_shift_name="Frei",
+        absence_shift_id=None,
+        absence_shift_code=None,
+        absence_shift_name=None,
+        resolved_absence_shift_id=1089,
+        resolved_absence_code="FR",
+        resolved_absence_name="Frei",
+    ),
+)
+
+SUNDAY_HISTORY_ROWS = (
+    TimeOfficeSundayHistoryRow(employee_id=1, worked_sundays=12),
+    TimeOfficeSundayHistoryRow(employee_id=3, worked_sundays=4),
+)
+
+MONTHLY_WORK_ACCOUNT_ROWS = (
+    TimeOfficeMonthlyWorkAccountRow(employee_id=1, month=11, target_hours=160.0, actual_hours=152.5),
+    TimeOfficeMonthlyWorkAccountRow(employee_id=2, month=11, target_hours=120.0, actual_hours=None),
+    TimeOfficeMonthlyWorkAccountRow(employee_id=3, month=11, target_hours=80.0, actual_hours=80.0),
+)
+
+DEMAND_ROWS = (
+    TimeOfficeDemandRow(
+        planning_unit_id=STATION_77_ID,
+        weekday_name="Montag",
+        staff_level="Fachkraft",
+        shift_id=EARLY_SHIFT_ID,
+        minimum_count=2,
+    ),
+    TimeOfficeDemandRow(
+        planning_unit_id=STATION_77_ID,
+        weekday_name="Samstag",
+        staff_level="Hilfskraft",
+        shift_id=NIGHT_SHIFT_ID,
+        minimum_count=1,
+    ),
+)
+
+OBJECTIVE_WEIGHT_ROWS = (
+    TimeOfficeObjectiveWeightRow(planning_unit_id=STATION_77_ID, objective_name="fairness", weight=5),
+)
+
+
+def _for_employees[RowT: TimeOfficeEmployeeRow | TimeOfficeRosterRow | TimeOfficeWishRow](
+    rows: tuple[RowT, ...],
+    employee_ids: tuple[int, ...],
+) -> tuple[RowT, ...]:
+    return tuple(row for row in rows if row.employee_id in employee_ids)
+
+
+class FakePlanningUnitReader(TimeOfficePlanningUnitReader):
+    def read_rows(
+        self,
+        *,
+        connection: Connection,
+        selected_planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> tuple[TimeOfficePlanningUnitRow, ...]:
+        return tuple(row for row in PLANNING_UNIT_ROWS if row.planning_unit_id in selected_planning_unit_ids)
+
+
+class FakePersonnelReader(TimeOfficePersonnelReader):
+    def read_plan_personnel_rows(
+        self,
+        *,
+        connection: Connection,
+        plan_ids: tuple[int, ...],
+    ) -> tuple[TimeOfficePlanPersonnelRow, ...]:
+        return tuple(row for row in PLAN_PERSONNEL_ROWS if row.plan_id in plan_ids)
+
+    def read_membership_rows(
+        self,
+        *,
+        connection: Connection,
+        planning_unit_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> tuple[TimeOfficePlanningUnitMembershipRow, ...]:
+        return tuple(row for row in MEMBERSHIP_ROWS if row.planning_unit_id in planning_unit_ids)
+
+    def read_employee_rows(
+        self,
+        *,
+        connection: Connection,
+        employee_ids: tuple[int, ...],
+    ) -> tuple[TimeOfficeEmployeeRow, ...]:
+        return _for_employees(EMPLOYEE_ROWS, employee_ids)
+
+
+class FakeShiftReader(TimeOfficeShiftReader):
+    def _read_rows(self, *, connection: Connection) -> tuple[TimeOfficeShiftRow, ...]:
+        return SHIFT_ROWS
+
+
+class FakeRosterReader(TimeOfficeRosterReader):
+    def read_row_chunks(
+        self,
+        *,
+        connection: Connection,
+        employee_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> Iterator[tuple[TimeOfficeRosterRow, ...]]:
+        rows = _for_employees(ROSTER_ROWS, employee_ids)
+
+        for start in range(0, len(rows), self._chunk_size):
+            yield rows[start : start + self._chunk_size]
+
+
+class FakeWishReader(TimeOfficeWishReader):
+    def read_rows(
+        self,
+        *,
+        connection: Connection,
+        plan_ids: tuple[int, ...],
+        planning_unit_ids: tuple[int, ...],
+        employee_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> tuple[TimeOfficeWishRow, ...]:
+        return _for_employees(WISH_ROWS, employee_ids)
+
+
+class FakeSundayWorkHistoryReader(TimeOfficeSundayWorkHistoryReader):
+    def read_rows(
+        self,
+        *,
+        connection: Connection,
+        employee_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> tuple[TimeOfficeSundayHistoryRow, ...]:
+        return tuple(row for row in SUNDAY_HISTORY_ROWS if row.employee_id in employee_ids)
+
+
+class FakeMonthlyWorkAccountReader(TimeOfficeMonthlyWorkAccountReader):
+    def read_rows(
+        self,
+        *,
+        connection: Connection,
+        employee_ids: tuple[int, ...],
+        planning_month: PlanningMonth,
+    ) -> tuple[TimeOfficeMonthlyWorkAccountRow, ...]:
+        return tuple(row for row in MONTHLY_WORK_ACCOUNT_ROWS if row.employee_id in employee_ids)
+
+
+class FakeDemandReader(TimeOfficeDemandReader):
+    def _read_minimal_staffing(
+        self,
+        *,
+        connection: Connection,
+        planning_unit_ids: tuple[int, ...],
+    ) -> tuple[TimeOfficeDemandRow, ...]:
+        return tuple(row for row in DEMAND_ROWS if row.planning_unit_id in planning_unit_ids)
+
+
+class FakeWeightsReader(TimeOfficeWeightsReader):
+    def _read_rows(
+        self,
+        *,
+        connection: Connection,
+        planning_unit_ids: tuple[int, ...],
+    ) -> tuple[TimeOfficeObjectiveWeightRow, ...]:
+        return tuple(row for row in OBJECTIVE_WEIGHT_ROWS if row.planning_unit_id in planning_unit_ids)
+
+
+def create_fake_readers(
+    *,
+    reference_cache: TimeOfficeReferenceCache | None = None,
+    roster_chunk_size: int = 10_000,
+    weights: TimeOfficeWeightsReader | None = None,
+) -> TimeOfficeReaders:
+    facts = TIMEOFFICE_FACTS
+
+    return TimeOfficeReaders(
+        options=TimeOfficeOptionsReader(facts=facts, reference_cache=reference_cache),
+        planning_units=FakePlanningUnitReader(facts=facts),
+        personnel=FakePersonnelReader(),
+        shifts=FakeShiftReader(facts=facts, reference_cache=reference_cache),
+        roster=FakeRosterReader(chunk_size=roster_chunk_size),
+        wishes=FakeWishReader(),
+        sunday_work_history=FakeSundayWorkHistoryReader(),
+        monthly_work_accounts=FakeMonthlyWorkAccountReader(facts=facts),
+        demand=FakeDemandReader(reference_cache=reference_cache),
+        weights=weights if weights is not None else FakeWeightsReader(reference_cache=reference_cache),
+    )
+
+
+def create_fake_service(
+    *,
+    engine: Engine,
+    readers: TimeOfficeReaders,
+    reference_cache: TimeOfficeReferenceCache | None = None,
+    objective_weights_writer: TimeOfficeWeightsWriter | None = None,
+) -> TimeOfficeService:
+    facts = TIMEOFFICE_FACTS
+
+    return TimeOfficeService(
+        facts=facts,
+        engine=engine,
+        readers=readers,
+        solution_writer=TimeOfficeSolutionWriter(),
+        wish_writer=TimeOfficeWishWriter(target_planning_status_id=facts.target_planning_status_id),
+        demand_writer=TimeOfficeDemandWriter(),
+        objective_weights_writer=(
+            objective_weights_writer if objective_weights_writer is not None else TimeOfficeWeightsWriter()
+        ),
+        availability_writer=TimeOfficeAvailabilityWriter(),
+        reference_cache=reference_cache,
+    )